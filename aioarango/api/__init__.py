@@ -8,8 +8,11 @@ __all__ = [
     "StandardCollection",
     "VertexCollection",
     "EdgeCollection",
+    "AsyncDatabase",
+    "BatchDatabase",
     "Database",
     "StandardDatabase",
+    "TransactionDatabase",
 ]
 
 from .api_endpoint import Endpoint  # must be the top import
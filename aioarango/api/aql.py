@@ -6,7 +6,7 @@ from aioarango.connection import Connection
 from aioarango.executor import API_Executor
 from aioarango.typings import Result, Json, Jsons
 from .cursor import Cursor
-from ..enums import AQLCacheMode
+from ..enums import AQLCacheMode, APIContextType
 from ..errors import ArangoServerError, ErrorType
 from ..models import AQLQuery, QueryOptimizerRule, AQLTrackingData, AQLCacheProperties, AQLQueryCacheEntry
 
@@ -195,6 +195,7 @@ class AQL:
         intermediate_commit_count: Optional[int] = None,
         skip_inaccessible_cols: Optional[bool] = None,
         allow_dirty_read: bool = False,
+        prefetch: int = 0,
     ) -> Result[Cursor]:
         """
         Execute the query and return the result cursor.
@@ -339,6 +340,9 @@ class AQL:
             This feature is only available in the "Enterprise Edition".
         allow_dirty_read : bool, default : False
             Allow reads from followers in a cluster.
+        prefetch : int, default : 0
+            Number of batches the returned cursor requests from the server in the background while the current batch
+            is being consumed. `0` disables prefetching.
 
         Returns
         -------
@@ -377,11 +381,15 @@ class AQL:
             skip_inaccessible_cols=skip_inaccessible_cols,
             allow_dirty_read=allow_dirty_read,
         )
+        if self._executor.context == APIContextType.ASYNC:
+            # the cursor body is not available until the async job is done.
+            return cursor_body
 
         return Cursor(
             self._connection,
             self._executor,
             cursor_body,
+            prefetch=prefetch,
         )
 
     async def validate(
@@ -1,18 +1,20 @@
-from typing import Optional, List, Union, TYPE_CHECKING
+import asyncio
+from typing import Optional, List, Sequence, Union, TYPE_CHECKING, Iterable, AsyncIterable, Set
 
 if TYPE_CHECKING:
     from aioarango.api import Cursor
 
-from aioarango.api_methods import CollectionsMethods, IndexesMethods, DocumentsMethods
+from aioarango.api_methods import CollectionsMethods, IndexesMethods, DocumentsMethods, BulkMethods
 from aioarango.connection import Connection
-from aioarango.enums import MethodType
+from aioarango.enums import MethodType, OverwriteMode, ImportType, ImportOnDuplicate
 from aioarango.errors import ArangoServerError, ErrorType, DocumentRevisionMisMatchError, DocumentRevisionMatchError
 from aioarango.executor import API_Executor
-from aioarango.models import ArangoCollection, ComputedValue, Request, Response
+from aioarango.models import ArangoCollection, ComputedValue, Request, Response, ImportResult
 from aioarango.models.index import (
     BaseArangoIndex,
 )
 from aioarango.typings import Result, Json, ArangoIndex
+from aioarango.utils.iter_utils import iter_chunks
 
 
 class BaseCollection:
@@ -25,6 +27,7 @@ class BaseCollection:
         "_executor",
         "_collections_api",
         "_documents_api",
+        "_bulk_api",
         "_index_api",
         "_name",
         "_id_prefix",
@@ -46,6 +49,7 @@ class BaseCollection:
 
         self._collections_api = CollectionsMethods(connection, executor)
         self._documents_api = DocumentsMethods(connection, executor)
+        self._bulk_api = BulkMethods(connection, executor)
         self._index_api = IndexesMethods(connection, executor)
 
     @property
@@ -637,3 +641,399 @@ class BaseCollection:
     #################################
     # Document Management
     #################################
+
+    async def insert_many(
+        self,
+        documents: Sequence[Json],
+        return_new: bool = False,
+        return_old: bool = False,
+        wait_for_sync: Optional[bool] = None,
+        silent: bool = False,
+        overwrite: bool = False,
+        overwrite_mode: Optional[OverwriteMode] = None,
+        keep_none: Optional[bool] = None,
+        merge: Optional[bool] = None,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        """
+        Insert multiple documents in one request.
+
+        Parameters
+        ----------
+        documents : list of Json
+            List of new documents to insert. If they contain the `_key` or `_id` fields, the values are used as the keys of the new documents
+            (auto-generated otherwise). Any `_rev` field is ignored.
+        return_new : bool, default : False
+            Include bodies of the new documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        return_old : bool, default : False
+            Include body of the old documents if replaced. Applies only when value of **overwrite** is set to True.
+        wait_for_sync : bool, optional
+            Block until operation is synchronized to disk.
+        silent : bool, default : False
+            If set to `True`, no document metadata is returned. This can be used to save resources.
+        overwrite : bool, default : False
+            If set to `True`, operation does not fail on duplicate keys and the existing documents are replaced.
+        overwrite_mode : OverwriteMode, optional
+            Overwrite behavior used when the document key exists already. Implicitly sets the value of parameter `overwrite`.
+        keep_none : bool, optional
+            If set to `True`, fields with value `None` are retained in the document. Otherwise, they are removed completely. Applies only when
+            **overwrite_mode** is set to "update" (update-insert).
+        merge : bool, optional
+            If set to `True` (default), sub-dictionaries are merged instead of the new one overwriting the old one. Applies only when
+            **overwrite_mode** is set to "update" (update-insert).
+
+        Returns
+        -------
+        bool | list
+            List of document metadata (e.g. document keys, revisions) and `ArangoServerError` objects in the same order as the given documents,
+            or `True` if parameter **silent** was set to `True`.
+
+        Raises
+        ------
+        aioarango.errors.DocumentParseError
+            If `key` and `ID` are missing from a document body.
+        aioarango.errors.ArangoServerError
+            If the whole insert fails.
+        """
+        if not documents:
+            return True if silent else []
+
+        return await self._documents_api.create_multiple_documents(
+            collection_name=self.name,
+            id_prefix=self.id_prefix,
+            documents=documents,
+            return_new=return_new,
+            return_old=return_old,
+            wait_for_sync=wait_for_sync,
+            silent=silent,
+            overwrite=overwrite,
+            overwrite_mode=overwrite_mode,
+            keep_none=keep_none,
+            merge=merge,
+        )
+
+    async def get_many(
+        self,
+        documents: Sequence[Union[str, Json]],
+        allow_dirty_read: bool = False,
+    ) -> Result[List[Optional[Json]]]:
+        """
+        Return multiple documents in one request.
+
+        Parameters
+        ----------
+        documents : list of str or Json
+            List of document keys, IDs or bodies. Document bodies must contain the "_id" or "_key" fields.
+        allow_dirty_read : bool, default : False
+            Whether to allow reads from followers in a cluster.
+
+        Returns
+        -------
+        list
+            Documents in the same order as the given documents. Documents that are not found are set to `None`.
+
+        Raises
+        ------
+        aioarango.errors.DocumentParseError
+            If `key` and `ID` are missing from a document body.
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+        """
+        if not documents:
+            return []
+
+        response = await self._documents_api.read_multiple_documents(
+            collection_name=self.name,
+            id_prefix=self.id_prefix,
+            documents=documents,
+            allow_dirty_read=allow_dirty_read,
+        )
+
+        results = []
+        for doc_or_error in response:
+            if isinstance(doc_or_error, ArangoServerError):
+                if doc_or_error.arango_error.type == ErrorType.ARANGO_DOCUMENT_NOT_FOUND:
+                    results.append(None)
+                    continue
+
+                raise doc_or_error
+
+            results.append(doc_or_error)
+
+        return results
+
+    async def update_many(
+        self,
+        documents: Sequence[Json],
+        return_new: bool = False,
+        return_old: bool = False,
+        check_for_revisions_match: Optional[bool] = True,
+        keep_none: Optional[bool] = None,
+        merge: Optional[bool] = True,
+        wait_for_sync: Optional[bool] = None,
+        silent: bool = False,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        """
+        Partially update multiple documents in one request.
+
+        Parameters
+        ----------
+        documents : list of Json
+            Partial or full document bodies. Each of them must contain the "_id" or "_key" field.
+        return_new : bool, default : False
+            Include bodies of the new documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        return_old : bool, default : False
+            Include bodies of the old documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        check_for_revisions_match : bool, default : True
+            If set to `True`, revisions of **documents** (if given) are compared against the revisions of target documents.
+        keep_none : bool, optional
+            If set to `True`, fields with value `None` are retained in the documents. Otherwise, they are removed completely.
+        merge : bool, default : True
+            If set to `True`, sub-dictionaries are merged instead of the new ones overwriting the old ones.
+        wait_for_sync : bool, optional
+            Block until operation is synchronized to disk.
+        silent : bool, default : False
+            If set to `True`, no document metadata is returned. This can be used to save resources.
+
+        Returns
+        -------
+        bool | list
+            List of document metadata (e.g. document keys, revisions) and `ArangoServerError` objects in the same order as the given documents,
+            or `True` if parameter **silent** was set to `True`.
+
+        Raises
+        ------
+        aioarango.errors.DocumentParseError
+            If `key` and `ID` are missing from a document body.
+        aioarango.errors.ArangoServerError
+            If the whole update fails.
+        """
+        if not documents:
+            return True if silent else []
+
+        return await self._documents_api.update_multiple_documents(
+            collection_name=self.name,
+            id_prefix=self.id_prefix,
+            documents=list(documents),
+            return_new=return_new,
+            return_old=return_old,
+            ignore_revs=not check_for_revisions_match,
+            keep_none=keep_none,
+            merge=merge,
+            wait_for_sync=wait_for_sync,
+            silent=silent,
+        )
+
+    async def replace_many(
+        self,
+        documents: Sequence[Json],
+        return_new: bool = False,
+        return_old: bool = False,
+        check_for_revisions_match: Optional[bool] = True,
+        wait_for_sync: Optional[bool] = None,
+        silent: bool = False,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        """
+        Replace multiple documents in one request.
+
+        Parameters
+        ----------
+        documents : list of Json
+            New document bodies. Each of them must contain the "_id" or "_key" field.
+        return_new : bool, default : False
+            Include bodies of the new documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        return_old : bool, default : False
+            Include bodies of the old documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        check_for_revisions_match : bool, default : True
+            If set to `True`, revisions of **documents** (if given) are compared against the revisions of target documents.
+        wait_for_sync : bool, optional
+            Block until operation is synchronized to disk.
+        silent : bool, default : False
+            If set to `True`, no document metadata is returned. This can be used to save resources.
+
+        Returns
+        -------
+        bool | list
+            List of document metadata (e.g. document keys, revisions) and `ArangoServerError` objects in the same order as the given documents,
+            or `True` if parameter **silent** was set to `True`.
+
+        Raises
+        ------
+        aioarango.errors.DocumentParseError
+            If `key` and `ID` are missing from a document body.
+        aioarango.errors.ArangoServerError
+            If the whole replace fails.
+        """
+        if not documents:
+            return True if silent else []
+
+        return await self._documents_api.replace_multiple_documents(
+            collection_name=self.name,
+            id_prefix=self.id_prefix,
+            documents=documents,
+            check_for_revisions_match=check_for_revisions_match,
+            return_new=return_new,
+            return_old=return_old,
+            wait_for_sync=wait_for_sync,
+            silent=silent,
+        )
+
+    async def delete_many(
+        self,
+        documents: Sequence[Union[str, Json]],
+        return_old: bool = False,
+        check_for_revisions_match: Optional[bool] = True,
+        wait_for_sync: Optional[bool] = None,
+        silent: bool = False,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        """
+        Delete multiple documents in one request.
+
+        Parameters
+        ----------
+        documents : list of str or Json
+            List of document keys, IDs or bodies. Document bodies must contain the "_id" or "_key" fields.
+        return_old : bool, default : False
+            Include bodies of the old documents in the returned metadata. Ignored if parameter **silent** is set to `True`.
+        check_for_revisions_match : bool, default : True
+            If set to `True`, revisions of **documents** (if given) are compared against the revisions of target documents.
+        wait_for_sync : bool, optional
+            Block until operation is synchronized to disk.
+        silent : bool, default : False
+            If set to `True`, no document metadata is returned. This can be used to save resources.
+
+        Returns
+        -------
+        bool | list
+            List of document metadata (e.g. document keys, revisions) and `ArangoServerError` objects in the same order as the given documents,
+            or `True` if parameter **silent** was set to `True`.
+
+        Raises
+        ------
+        aioarango.errors.DocumentParseError
+            If `key` and `ID` are missing from a document body.
+        aioarango.errors.ArangoServerError
+            If the whole delete fails.
+        """
+        if not documents:
+            return True if silent else []
+
+        return await self._documents_api.remove_multiple_documents(
+            collection_name=self.name,
+            id_prefix=self.id_prefix,
+            documents=documents,
+            return_old=return_old,
+            check_for_revisions_match=check_for_revisions_match,
+            wait_for_sync=wait_for_sync,
+            silent=silent,
+        )
+
+    async def import_bulk(
+        self,
+        documents: Union[Iterable[Json], AsyncIterable[Json]],
+        import_type: ImportType = ImportType.DOCUMENTS,
+        on_duplicate: Optional[ImportOnDuplicate] = None,
+        from_prefix: Optional[str] = None,
+        to_prefix: Optional[str] = None,
+        overwrite: Optional[bool] = None,
+        wait_for_sync: Optional[bool] = None,
+        complete: Optional[bool] = None,
+        details: Optional[bool] = None,
+        batch_size: int = 1000,
+        concurrency: int = 1,
+    ) -> Result[ImportResult]:
+        """
+        Import documents into the collection using the bulk import API.
+
+        Documents are consumed lazily from `documents` and sent to the server in chunks of `batch_size` documents, so
+        the whole dataset never has to be kept in memory.
+
+        Parameters
+        ----------
+        documents : iterable or async iterable of Json
+            Documents to import. It can be a generator, so the documents are created while they are being imported.
+        import_type : ImportType, default : ImportType.DOCUMENTS
+            Format of the request bodies. It can be either `documents` (JSON lines), `array` or `auto`.
+        on_duplicate : ImportOnDuplicate, optional
+            Controls what action is carried out in case of a unique key constraint violation. It can be either
+            `error` (default), `update`, `replace` or `ignore`.
+        from_prefix : str, optional
+            Prefix prepended to the values of the `_from` attributes of the edges, so only the keys need to be given.
+        to_prefix : str, optional
+            Prefix prepended to the values of the `_to` attributes of the edges, so only the keys need to be given.
+        overwrite : bool, optional
+            If set to `True`, all the documents of the collection are removed before the import. Only the first chunk is
+            imported with this option.
+        wait_for_sync : bool, optional
+            Block until the operation is synchronized to disk.
+        complete : bool, optional
+            If set to `True`, a chunk is not imported at all if any of its documents cannot be imported.
+        details : bool, optional
+            If set to `True`, the result includes the details of the documents that could not be imported.
+        batch_size : int, default : 1000
+            Number of documents to send in each request.
+        concurrency : int, default : 1
+            Maximum number of chunks to import concurrently. A value of `1` imports the chunks one after another.
+
+        Returns
+        -------
+        ImportResult
+            Aggregated result of importing all the chunks.
+
+        Raises
+        ------
+        ValueError
+            If `batch_size` or `concurrency` have invalid values.
+        aioarango.errors.ArangoServerError
+            If the import of any chunk fails.
+        """
+        if batch_size is None or batch_size < 1:
+            raise ValueError(f"`batch_size` has invalid value: `{batch_size}`")
+
+        if concurrency is None or concurrency < 1:
+            raise ValueError(f"`concurrency` has invalid value: `{concurrency}`")
+
+        result = ImportResult()
+        pending: Set[asyncio.Task] = set()
+        is_first_chunk = True
+
+        async def import_chunk(
+            chunk: List[Json],
+            overwrite_: Optional[bool],
+        ) -> ImportResult:
+            return await self._bulk_api.import_documents(
+                collection_name=self.name,
+                documents=chunk,
+                import_type=import_type,
+                from_prefix=from_prefix,
+                to_prefix=to_prefix,
+                overwrite=overwrite_,
+                wait_for_sync=wait_for_sync,
+                on_duplicate=on_duplicate,
+                complete=complete,
+                details=details,
+            )
+
+        try:
+            async for chunk in iter_chunks(documents, batch_size):
+                if is_first_chunk:
+                    # the collection must be truncated only once and before any other chunk is imported.
+                    is_first_chunk = False
+                    result.merge(await import_chunk(chunk, overwrite))
+                    continue
+
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        result.merge(task.result())
+
+                pending.add(asyncio.create_task(import_chunk(chunk, None)))
+
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                for task in done:
+                    result.merge(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return result
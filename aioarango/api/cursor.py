@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from collections import deque
 from types import TracebackType
 from typing import Any, Deque, Optional, Sequence, Type
 
 from ..api_methods import CursorsMethods
 from ..connection import Connection
+from ..enums import APIContextType
 from ..errors import CursorCountError, CursorEmptyError, CursorStateError, ArangoServerError
 from ..executor import API_Executor
 from ..models import CursorStats
@@ -20,6 +22,11 @@ class Cursor:
     are *stateful* as they store the fetched items in-memory. They must not be
     shared across threads without proper locking mechanism.
 
+    If **prefetch** is set, up to that many batches are requested from the server in the background while the current
+    batch is being consumed. Batches are still requested one after another, since a server-side cursor cannot serve
+    concurrent requests. Prefetching is only done in the default API context, since requests of a stream transaction
+    must not overlap and requests of a batch are not sent until the batch is committed.
+
     """
 
     __slots__ = [
@@ -33,6 +40,11 @@ class Cursor:
         "_warnings",
         "_has_more",
         "_batch",
+        "_prefetch",
+        "_prefetched_batches",
+        "_prefetch_task",
+        "_fetched_has_more",
+        "_prefetch_error",
     ]
 
     def __init__(
@@ -41,6 +53,7 @@ class Cursor:
         executor: API_Executor,
         init_data: Json,
         cursor_type: str = "cursor",
+        prefetch: int = 0,
     ):
         self._api = CursorsMethods(connection, executor)
 
@@ -54,6 +67,16 @@ class Cursor:
         self._warnings = None
         self._update(init_data)
 
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
+        self._prefetch = prefetch if executor.context == APIContextType.DEFAULT else 0
+        self._prefetched_batches: Deque[Json] = deque()
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._fetched_has_more = self._has_more
+        self._prefetch_error: Optional[BaseException] = None
+        self._start_prefetching()
+
     def _update(
         self,
         data: Json,
@@ -298,10 +321,52 @@ class Cursor:
 
         return self._batch.popleft()
 
+    def _start_prefetching(self) -> None:
+        """
+        Start requesting the next batches in the background if prefetching is enabled and there is room for them.
+        """
+        if not self._prefetch or self._id is None or not self._fetched_has_more or self._prefetch_error is not None:
+            return
+
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            return
+
+        if len(self._prefetched_batches) >= self._prefetch:
+            return
+
+        self._prefetch_task = asyncio.create_task(self._prefetch_batches())
+
+    async def _prefetch_batches(self) -> None:
+        while self._fetched_has_more and len(self._prefetched_batches) < self._prefetch:
+            data = await self._api.read_cursor_next_batch(self._id, self._type)
+            self._fetched_has_more = bool(data.get("hasMore", False))
+            self._prefetched_batches.append(data)
+
+    async def _stop_prefetching(self) -> None:
+        """
+        Cancel the background request of the next batches, if there is one, and wait for it to stop.
+        """
+        task = self._prefetch_task
+        self._prefetch_task = None
+        if task is None or task.done():
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # the cursor is being closed, so the error of the batch which is not going to be consumed is irrelevant.
+            pass
+
     async def fetch(self) -> Json:
         """
         Fetch the next batch from server and update the cursor.
 
+        If prefetching is enabled, the next batch is taken from the batches that have already been requested in the
+        background, and the next ones are requested afterwards.
+
         Returns
         -------
         Json
@@ -319,9 +384,31 @@ class Cursor:
         if self._id is None:
             raise CursorStateError("cursor ID not set")
 
-        response = await self._api.read_cursor_next_batch(self._id, self._type)
+        while not self._prefetched_batches and self._prefetch_task is not None and not self._prefetch_task.done():
+            # `asyncio.wait` does not cancel the background task if the consumer is cancelled.
+            await asyncio.wait((self._prefetch_task,))
+
+        if self._prefetch_task is not None and self._prefetch_task.done():
+            task = self._prefetch_task
+            self._prefetch_task = None
+            if not task.cancelled() and task.exception() is not None:
+                # the failed batch must not be requested again, otherwise, it would be skipped silently.
+                self._prefetch_error = task.exception()
 
-        return self._update(response)
+        if self._prefetch_error is not None and not self._prefetched_batches:
+            # the batches that have been fetched before the error are consumed first.
+            raise self._prefetch_error
+
+        if self._prefetched_batches:
+            response = self._prefetched_batches.popleft()
+        else:
+            response = await self._api.read_cursor_next_batch(self._id, self._type)
+            self._fetched_has_more = bool(response.get("hasMore", False))
+
+        result = self._update(response)
+        self._start_prefetching()
+
+        return result
 
     async def close(
         self,
@@ -354,6 +441,9 @@ class Cursor:
         if self._id is None:
             return None
 
+        await self._stop_prefetching()
+        self._prefetched_batches.clear()
+
         try:
             response = await self._api.delete_cursor(self._id, self._type)
         except ArangoServerError as e:
@@ -1,2 +1,5 @@
+from .async_database import AsyncDatabase
+from .batch_database import BatchDatabase
 from .database import Database
 from .standard_database import StandardDatabase
+from .transaction_database import TransactionDatabase
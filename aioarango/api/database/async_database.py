@@ -0,0 +1,23 @@
+from .database import Database
+from ...connection import Connection
+from ...executor import AsyncAPIExecutor
+
+
+class AsyncDatabase(Database):
+    """
+    Database API wrapper tailored specifically for async execution.
+
+    API requests of this database, and of the collection, graph and AQL API wrappers returned by it, are queued on the
+    server and return immediately. If `return_result` is set to `True`, they return an `AsyncJob` that can be used to
+    retrieve the result later, otherwise, they return `None` and the results are discarded by the server.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        return_result: bool,
+    ):
+        super().__init__(connection, AsyncAPIExecutor(connection, return_result))
+
+    def __repr__(self) -> str:
+        return f"<AsyncDatabase {self.name}>"
@@ -0,0 +1,29 @@
+from .database import Database
+from ...connection import Connection
+from ...executor import BatchAPIExecutor
+
+
+class BatchDatabase(Database):
+    """
+    Database API wrapper tailored specifically for batch execution.
+
+    API requests of this database, and of the collection, graph and AQL API wrappers returned by it, that are issued
+    concurrently are sent to the server together in one batch request, so independent requests only need one HTTP
+    round-trip. It can be used as an async context manager, which commits the remaining queued requests on exit.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        max_batch_size: int = 100,
+    ):
+        super().__init__(connection, BatchAPIExecutor(connection, max_batch_size))
+
+    def __repr__(self) -> str:
+        return f"<BatchDatabase {self.name}>"
+
+    async def __aenter__(self) -> "BatchDatabase":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._executor.close()
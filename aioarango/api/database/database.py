@@ -5,10 +5,10 @@ from aioarango.api.collection import StandardCollection
 from aioarango.api.graph import Graph
 from aioarango.api_methods import APIMethods
 from aioarango.connection import Connection
-from aioarango.enums import ShardingMethod, CollectionType, KeyOptionsType, ShardingStrategy
+from aioarango.enums import ShardingMethod, CollectionType, KeyOptionsType, ShardingStrategy, AsyncJobStatus
 from aioarango.errors import ArangoServerError, ErrorType
 from aioarango.executor import API_Executor
-from aioarango.models import ArangoCollection, User, ComputedValue, GraphInfo
+from aioarango.models import ArangoCollection, User, ComputedValue, GraphInfo, TransactionInfo
 from aioarango.models.key_options_input import KeyOptionsInput
 from aioarango.typings import Result, Json
 
@@ -633,6 +633,27 @@ class Database:
     # Document Management #
     #######################
 
+    ##########################
+    # Transaction Management #
+    ##########################
+
+    async def transactions(self) -> Result[List[TransactionInfo]]:
+        """
+        Return the stream transactions currently running on the server.
+
+        Returns
+        -------
+        list
+            Information of the running transactions.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+
+        """
+        return await self._api.list_running_stream_transactions()
+
     ###################
     # Task Management #
     ###################
@@ -649,6 +670,60 @@ class Database:
     # Async Job Management #
     ########################
 
+    async def async_jobs(
+        self,
+        status: AsyncJobStatus,
+        count: Optional[int] = None,
+    ) -> Result[List[str]]:
+        """
+        Return the IDs of the async jobs with the given status.
+
+        Parameters
+        ----------
+        status : AsyncJobStatus
+            Status of the jobs to return. It can be either `pending` or `done`.
+        count : int, optional
+            Maximum number of job IDs to return.
+
+        Returns
+        -------
+        list
+            List of job IDs.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+
+        """
+        return await self._api.list_async_job_results(status, count)
+
+    async def clear_async_jobs(
+        self,
+        threshold: Optional[int] = None,
+    ) -> Result[bool]:
+        """
+        Delete the results of the async jobs from the server.
+
+        Parameters
+        ----------
+        threshold : int, optional
+            If given, only the results of the jobs that were created before this UNIX timestamp are deleted. Otherwise,
+            all the results are deleted.
+
+        Returns
+        -------
+        bool
+            `True` if the deletion was successful.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the deletion fails.
+
+        """
+        return await self._api.delete_async_job_results(threshold)
+
     ###################
     # View Management #
     ###################
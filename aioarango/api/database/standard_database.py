@@ -1,6 +1,12 @@
+from typing import Optional
+
+from .async_database import AsyncDatabase
+from .batch_database import BatchDatabase
 from .database import Database
+from .transaction_database import TransactionDatabase
 from ...connection import Connection
 from ...executor import DefaultAPIExecutor
+from ...typings import Fields
 
 
 class StandardDatabase(Database):
@@ -13,3 +19,99 @@ class StandardDatabase(Database):
 
     def __repr__(self) -> str:
         return f"<StandardDatabase {self.name}>"
+
+    def begin_async_execution(
+        self,
+        return_result: bool = True,
+    ) -> AsyncDatabase:
+        """
+        Return a database API wrapper that executes the API requests asynchronously on the server.
+
+        Parameters
+        ----------
+        return_result : bool, default : True
+            If set to `True`, API requests return `AsyncJob` objects that can be used to retrieve the results from the
+            server later. Otherwise, the requests are executed as fire-and-forget, and they return `None`.
+
+        Returns
+        -------
+        AsyncDatabase
+            Database API wrapper specifically for async execution.
+
+        """
+        return AsyncDatabase(self._connection, return_result)
+
+    def begin_batch_execution(
+        self,
+        max_batch_size: int = 100,
+    ) -> BatchDatabase:
+        """
+        Return a database API wrapper that sends the concurrently issued API requests to the server in batches.
+
+        Parameters
+        ----------
+        max_batch_size : int, default : 100
+            Maximum number of API requests to send in one batch request.
+
+        Returns
+        -------
+        BatchDatabase
+            Database API wrapper specifically for batch execution.
+
+        """
+        return BatchDatabase(self._connection, max_batch_size)
+
+    def begin_transaction(
+        self,
+        read: Optional[Fields] = None,
+        write: Optional[Fields] = None,
+        exclusive: Optional[Fields] = None,
+        wait_for_sync: Optional[bool] = None,
+        allow_implicit: Optional[bool] = None,
+        lock_timeout: Optional[int] = None,
+        max_transaction_size: Optional[int] = None,
+    ) -> TransactionDatabase:
+        """
+        Return a database API wrapper for a new stream transaction.
+
+        Notes
+        -----
+        - The transaction is started on the server once the returned database is entered as an async context manager
+          or its `begin` method is called.
+
+
+        Parameters
+        ----------
+        read : str or list of str, optional
+            Name(s) of collections read during transaction. Read-only collections are added lazily but should be
+            declared if possible to avoid deadlocks.
+        write : str or list of str, optional
+            Name(s) of collections written to during transaction with shared access.
+        exclusive : str or list of str, optional
+            Name(s) of collections written to during transaction with exclusive access.
+        wait_for_sync : bool, optional
+            Block until the transaction is synchronized to disk once it is committed.
+        allow_implicit : bool, optional
+            Allow reading from undeclared collections.
+        lock_timeout : int, optional
+            Timeout for waiting on collection locks. If not given, a default value is used. Setting it to `0` disables
+            the timeout.
+        max_transaction_size : int, optional
+            Max transaction size in bytes.
+
+        Returns
+        -------
+        TransactionDatabase
+            Database API wrapper specifically for the stream transaction.
+
+        """
+        return TransactionDatabase(
+            connection=self._connection,
+            read=read,
+            write=write,
+            exclusive=exclusive,
+            wait_for_sync=wait_for_sync,
+            allow_implicit=allow_implicit,
+            lock_timeout=lock_timeout,
+            max_transaction_size=max_transaction_size,
+        )
@@ -0,0 +1,211 @@
+from typing import Optional
+
+from .database import Database
+from ...api_methods import TransactionsMethods
+from ...connection import Connection
+from ...enums import TransactionStatus
+from ...errors import TransactionStateError
+from ...executor import DefaultAPIExecutor, TransactionAPIExecutor
+from ...models import TransactionInfo
+from ...typings import Fields, Result
+
+
+class TransactionDatabase(Database):
+    """
+    Database API wrapper tailored specifically for stream transactions.
+
+    Collection, graph and AQL API wrappers returned by this database execute their requests inside the transaction.
+    The transaction is started with `begin`, and it is committed or aborted with `commit` or `abort`. It can also be
+    used as an async context manager, which begins the transaction on entry, and commits it on exit, or aborts it if
+    an exception was raised inside the block.
+    """
+
+    __slots__ = [
+        "_transactions_api",
+        "_read",
+        "_write",
+        "_exclusive",
+        "_wait_for_sync",
+        "_allow_implicit",
+        "_lock_timeout",
+        "_max_transaction_size",
+        "_status",
+    ]
+
+    def __init__(
+        self,
+        connection: Connection,
+        read: Optional[Fields] = None,
+        write: Optional[Fields] = None,
+        exclusive: Optional[Fields] = None,
+        wait_for_sync: Optional[bool] = None,
+        allow_implicit: Optional[bool] = None,
+        lock_timeout: Optional[int] = None,
+        max_transaction_size: Optional[int] = None,
+    ):
+        super().__init__(connection, TransactionAPIExecutor(connection))
+
+        # requests for managing the transaction itself must not carry the transaction header
+        self._transactions_api = TransactionsMethods(connection, DefaultAPIExecutor(connection))
+
+        self._read = read
+        self._write = write
+        self._exclusive = exclusive
+        self._wait_for_sync = wait_for_sync
+        self._allow_implicit = allow_implicit
+        self._lock_timeout = lock_timeout
+        self._max_transaction_size = max_transaction_size
+        self._status: Optional[TransactionStatus] = None
+
+    def __repr__(self) -> str:
+        return f"<TransactionDatabase {self.name}>"
+
+    async def __aenter__(self) -> "TransactionDatabase":
+        if self._status is None:
+            await self.begin()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._status != TransactionStatus.RUNNING:
+            return
+
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.abort()
+
+    @property
+    def transaction_id(self) -> Optional[str]:
+        """
+        Return the transaction ID.
+
+        Returns
+        -------
+        str, optional
+            Transaction ID, or `None` if the transaction has not been started yet.
+
+        """
+        return self._executor.transaction_id
+
+    @property
+    def transaction_status(self) -> Optional[TransactionStatus]:
+        """
+        Return the last known status of the transaction.
+
+        Returns
+        -------
+        TransactionStatus, optional
+            Status of the transaction, or `None` if the transaction has not been started yet.
+
+        """
+        return self._status
+
+    async def begin(self) -> Result[TransactionInfo]:
+        """
+        Begin the transaction.
+
+        Returns
+        -------
+        TransactionInfo
+            Information of the started transaction.
+
+        Raises
+        ------
+        aioarango.errors.TransactionStateError
+            If the transaction has already been started.
+        aioarango.errors.ArangoServerError
+            If the transaction could not be started.
+
+        """
+        if self._status is not None:
+            raise TransactionStateError(f"transaction has already been started: `{self.transaction_id}`")
+
+        transaction_info = await self._transactions_api.begin_stream_transaction(
+            read=self._read,
+            write=self._write,
+            exclusive=self._exclusive,
+            wait_for_sync=self._wait_for_sync,
+            allow_implicit=self._allow_implicit,
+            lock_timeout=self._lock_timeout,
+            max_transaction_size=self._max_transaction_size,
+        )
+        self._executor.transaction_id = transaction_info.id
+        self._status = transaction_info.status
+
+        return transaction_info
+
+    async def status(self) -> Result[TransactionStatus]:
+        """
+        Return the status of the transaction from the server.
+
+        Returns
+        -------
+        TransactionStatus
+            Status of the transaction.
+
+        Raises
+        ------
+        aioarango.errors.TransactionStateError
+            If the transaction has not been started yet.
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+
+        """
+        if self.transaction_id is None:
+            raise TransactionStateError("transaction has not been started")
+
+        transaction_info = await self._transactions_api.get_stream_transaction_status(self.transaction_id)
+        self._status = transaction_info.status
+
+        return self._status
+
+    async def commit(self) -> Result[bool]:
+        """
+        Commit the transaction.
+
+        Returns
+        -------
+        bool
+            `True` if the transaction was committed successfully.
+
+        Raises
+        ------
+        aioarango.errors.TransactionStateError
+            If the transaction has not been started yet.
+        aioarango.errors.ArangoServerError
+            If the commit fails.
+
+        """
+        if self.transaction_id is None:
+            raise TransactionStateError("transaction has not been started")
+
+        transaction_info = await self._transactions_api.commit_stream_transaction(self.transaction_id)
+        self._status = transaction_info.status
+
+        return self._status == TransactionStatus.COMMITTED
+
+    async def abort(self) -> Result[bool]:
+        """
+        Abort the transaction.
+
+        Returns
+        -------
+        bool
+            `True` if the transaction was aborted successfully.
+
+        Raises
+        ------
+        aioarango.errors.TransactionStateError
+            If the transaction has not been started yet.
+        aioarango.errors.ArangoServerError
+            If the abort fails.
+
+        """
+        if self.transaction_id is None:
+            raise TransactionStateError("transaction has not been started")
+
+        transaction_info = await self._transactions_api.abort_stream_transaction(self.transaction_id)
+        self._status = transaction_info.status
+
+        return self._status == TransactionStatus.ABORTED
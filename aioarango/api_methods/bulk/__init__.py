@@ -1,2 +1,7 @@
-class BulkMethods:
+from .import_documents import ImportDocuments
+
+
+class BulkMethods(
+    ImportDocuments,
+):
     pass
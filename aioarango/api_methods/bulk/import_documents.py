@@ -0,0 +1,136 @@
+from typing import Optional, Sequence
+
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType, ImportType, ImportOnDuplicate
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response, ImportResult
+from aioarango.typings import Result, Json, Params
+
+
+class ImportDocuments(Endpoint):
+    error_types = (
+        ErrorType.HTTP_BAD_PARAMETER,
+        ErrorType.ARANGO_DATA_SOURCE_NOT_FOUND,
+        ErrorType.ARANGO_CONFLICT,
+        ErrorType.HTTP_SERVER_ERROR,
+    )
+    status_codes = (
+        201,
+        # is returned if all documents could be imported successfully.
+        400,
+        # is returned if type contains an invalid value, no collection is specified, the documents are incorrectly
+        # encoded, or the request is malformed.
+        404,
+        # is returned if collection or the _from or _to attributes of an imported edge refer to an unknown collection.
+        409,
+        # is returned if the import would trigger a unique key violation and complete is set to true.
+        500,
+        # is returned if the server cannot auto-generate a document key (out of keys error) for a document with no
+        # user-defined key.
+    )
+
+    async def import_documents(
+        self,
+        collection_name: str,
+        documents: Sequence[Json],
+        import_type: ImportType = ImportType.DOCUMENTS,
+        from_prefix: Optional[str] = None,
+        to_prefix: Optional[str] = None,
+        overwrite: Optional[bool] = None,
+        wait_for_sync: Optional[bool] = None,
+        on_duplicate: Optional[ImportOnDuplicate] = None,
+        complete: Optional[bool] = None,
+        details: Optional[bool] = None,
+    ) -> Result[ImportResult]:
+        """
+        Load JSON data and store it as documents into the specified collection.
+
+        Notes
+        -----
+        - With `documents` import type, the documents are sent as JSON lines, one document per line, so the server
+          does not need to parse the whole request body as one JSON array.
+
+        Parameters
+        ----------
+        collection_name : str
+            Name of the collection to import the documents into.
+        documents : sequence of Json
+            Documents to import.
+        import_type : ImportType, default : ImportType.DOCUMENTS
+            Format of the request body. It can be either `documents` (JSON lines), `array` or `auto`.
+        from_prefix : str, optional
+            Optional prefix for the values in `_from` attributes. If specified, the value is automatically prepended to
+            each `_from` input value. This allows specifying just the keys for `_from`.
+        to_prefix : str, optional
+            Optional prefix for the values in `_to` attributes. If specified, the value is automatically prepended to
+            each `_to` input value. This allows specifying just the keys for `_to`.
+        overwrite : bool, optional
+            If this parameter has a value of `true`, then all data in the collection will be removed prior to the
+            import. Note that any existing index definitions will be preserved.
+        wait_for_sync : bool, optional
+            Wait until documents have been synced to disk before returning.
+        on_duplicate : ImportOnDuplicate, optional
+            Controls what action is carried out in case of a unique key constraint violation. It can be either
+            `error` (default), `update`, `replace` or `ignore`.
+        complete : bool, optional
+            If set to `true`, it will make the whole import fail if any error occurs. Otherwise, the import will
+            continue even if some documents cannot be imported.
+        details : bool, optional
+            If set to `true`, the result will include an attribute `details` with details about documents that could not
+            be imported.
+
+        Returns
+        -------
+        Result
+            Result of the import.
+
+        Raises
+        ------
+        ValueError
+            If `collection_name` has invalid value.
+        aioarango.errors.ArangoServerError
+            If the import fails.
+        """
+        if collection_name is None or not len(collection_name):
+            raise ValueError(f"`collection_name` has invalid value: `{collection_name}`")
+
+        params: Params = {
+            "collection": collection_name,
+            "type": import_type.value,
+        }
+        if from_prefix is not None:
+            params["fromPrefix"] = from_prefix
+        if to_prefix is not None:
+            params["toPrefix"] = to_prefix
+        if overwrite is not None:
+            params["overwrite"] = overwrite
+        if wait_for_sync is not None:
+            params["waitForSync"] = wait_for_sync
+        if on_duplicate is not None:
+            params["onDuplicate"] = on_duplicate.value
+        if complete is not None:
+            params["complete"] = complete
+        if details is not None:
+            params["details"] = details
+
+        if import_type == ImportType.DOCUMENTS:
+            data = "\n".join(self._connection.serialize_json(document) for document in documents)
+        else:
+            data = self._connection.serialize_json(list(documents))
+
+        request = Request(
+            method_type=MethodType.POST,
+            endpoint="/_api/import",
+            params=params,
+            data=data,
+            write=collection_name,
+        )
+
+        def response_handler(response: Response) -> ImportResult:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 201
+            return ImportResult.parse_obj(response.body)
+
+        return await self.execute(request, response_handler)
@@ -1,2 +1,17 @@
-class JobMethods:
+from .cancel_async_job import CancelAsyncJob
+from .delete_async_job_result import DeleteAsyncJobResult
+from .delete_async_job_results import DeleteAsyncJobResults
+from .get_async_job_result import GetAsyncJobResult
+from .get_async_job_status import GetAsyncJobStatus
+from .list_async_job_results import ListAsyncJobResults
+
+
+class JobMethods(
+    CancelAsyncJob,
+    DeleteAsyncJobResult,
+    DeleteAsyncJobResults,
+    GetAsyncJobResult,
+    GetAsyncJobStatus,
+    ListAsyncJobResults,
+):
     pass
@@ -0,0 +1,62 @@
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result
+
+
+class CancelAsyncJob(Endpoint):
+    error_types = (
+        ErrorType.HTTP_BAD_PARAMETER,
+        ErrorType.HTTP_NOT_FOUND,
+    )
+    status_codes = (
+        200,
+        # cancel has been initiated.
+        400,
+        # is returned if no job-id was specified in the request.
+        404,
+        # is returned if the job was not found or already deleted or fetched from the job result list.
+    )
+
+    async def cancel_async_job(
+        self,
+        job_id: str,
+    ) -> Result[bool]:
+        """
+        Cancel a currently running async job. The job is cancelled on the server as soon as possible, so it can still
+        be finished before the cancellation takes effect.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the async job.
+
+        Returns
+        -------
+        Result
+            `True` if the cancellation was initiated successfully.
+
+        Raises
+        ------
+        ValueError
+            If the `job_id` has invalid value.
+        aioarango.errors.ArangoServerError
+            If the cancellation fails.
+        """
+        if job_id is None or not len(job_id):
+            raise ValueError(f"`job_id` has invalid value: `{job_id}`")
+
+        request = Request(
+            method_type=MethodType.PUT,
+            endpoint=f"/_api/job/{job_id}/cancel",
+        )
+
+        def response_handler(response: Response) -> bool:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return True
+
+        return await self.execute(request, response_handler)
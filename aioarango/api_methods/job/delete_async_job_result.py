@@ -0,0 +1,61 @@
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result
+
+
+class DeleteAsyncJobResult(Endpoint):
+    error_types = (
+        ErrorType.HTTP_BAD_PARAMETER,
+        ErrorType.HTTP_NOT_FOUND,
+    )
+    status_codes = (
+        200,
+        # is returned if the deletion operation was carried out successfully.
+        400,
+        # is returned if no job-id was specified in the request.
+        404,
+        # is returned if the job was not found or already deleted or fetched from the job result list.
+    )
+
+    async def delete_async_job_result(
+        self,
+        job_id: str,
+    ) -> Result[bool]:
+        """
+        Delete the result of an async job from the list of the results of the server.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the async job.
+
+        Returns
+        -------
+        Result
+            `True` if the deletion was successful.
+
+        Raises
+        ------
+        ValueError
+            If the `job_id` has invalid value.
+        aioarango.errors.ArangoServerError
+            If the deletion fails.
+        """
+        if job_id is None or not len(job_id):
+            raise ValueError(f"`job_id` has invalid value: `{job_id}`")
+
+        request = Request(
+            method_type=MethodType.DELETE,
+            endpoint=f"/_api/job/{job_id}",
+        )
+
+        def response_handler(response: Response) -> bool:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return True
+
+        return await self.execute(request, response_handler)
@@ -0,0 +1,62 @@
+from typing import Optional
+
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result, Params
+
+
+class DeleteAsyncJobResults(Endpoint):
+    error_types = (ErrorType.HTTP_BAD_PARAMETER,)
+    status_codes = (
+        200,
+        # is returned if the deletion operation was carried out successfully.
+        400,
+        # is returned if an invalid job type was specified in the request.
+    )
+
+    async def delete_async_job_results(
+        self,
+        threshold: Optional[int] = None,
+    ) -> Result[bool]:
+        """
+        Delete the results of the async jobs from the list of the results of the server.
+
+        Parameters
+        ----------
+        threshold : int, optional
+            If given, only the results of the jobs that were created before this UNIX timestamp are deleted. Otherwise,
+            all the results are deleted.
+
+        Returns
+        -------
+        Result
+            `True` if the deletion was successful.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the deletion fails.
+        """
+        if threshold is None:
+            endpoint = "/_api/job/all"
+            params: Optional[Params] = None
+        else:
+            endpoint = "/_api/job/expired"
+            params = {"stamp": threshold}
+
+        request = Request(
+            method_type=MethodType.DELETE,
+            endpoint=endpoint,
+            params=params,
+        )
+
+        def response_handler(response: Response) -> bool:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return True
+
+        return await self.execute(request, response_handler)
@@ -0,0 +1,70 @@
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result
+
+
+class GetAsyncJobResult(Endpoint):
+    error_types = (
+        ErrorType.HTTP_BAD_PARAMETER,
+        ErrorType.HTTP_NOT_FOUND,
+    )
+    status_codes = (
+        204,
+        # is returned if the job requested via job-id is still in the queue of pending (or not yet finished) jobs.
+        # In this case, no x-arango-async-id HTTP header will be returned.
+        400,
+        # is returned if no job-id was specified in the request. In this case, no x-arango-async-id HTTP header will
+        # be returned.
+        404,
+        # is returned if the job was not found or already deleted or fetched from the job result list. In this case,
+        # no x-arango-async-id HTTP header will be returned.
+    )
+
+    async def get_async_job_result(
+        self,
+        job_id: str,
+    ) -> Result[Response]:
+        """
+        Return the result of an already finished async job. The result is removed from the list of the results of the
+        server afterwards.
+
+        Notes
+        -----
+        - The returned response is the response of the original request of the job, so it must be processed by the
+          response handler of that request.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the async job.
+
+        Returns
+        -------
+        Result
+            Response of the original request of the job, or the response with status code `204` if the job is still
+            pending.
+
+        Raises
+        ------
+        ValueError
+            If the `job_id` has invalid value.
+        aioarango.errors.ArangoServerError
+            If the job was not found.
+        """
+        if job_id is None or not len(job_id):
+            raise ValueError(f"`job_id` has invalid value: `{job_id}`")
+
+        request = Request(
+            method_type=MethodType.PUT,
+            endpoint=f"/_api/job/{job_id}",
+        )
+
+        def response_handler(response: Response) -> Response:
+            if response.status_code in (400, 404) and not any(key.lower() == "x-arango-async-id" for key in response.headers):
+                raise ArangoServerError(response, request)
+
+            return response
+
+        return await self.execute(request, response_handler)
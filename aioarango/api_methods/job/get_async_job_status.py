@@ -0,0 +1,61 @@
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType, AsyncJobStatus
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result
+
+
+class GetAsyncJobStatus(Endpoint):
+    error_types = (ErrorType.HTTP_NOT_FOUND,)
+    status_codes = (
+        200,
+        # is returned if the job requested via job-id has been executed and its result is ready to fetch.
+        204,
+        # is returned if the job requested via job-id is still in the queue of pending (or not yet finished) jobs.
+        404,
+        # is returned if the job was not found or already deleted or fetched from the job result list.
+    )
+
+    async def get_async_job_status(
+        self,
+        job_id: str,
+    ) -> Result[AsyncJobStatus]:
+        """
+        Return the processing status of an async job.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the async job.
+
+        Returns
+        -------
+        Result
+            Status of the async job.
+
+        Raises
+        ------
+        ValueError
+            If the `job_id` has invalid value.
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+        """
+        if job_id is None or not len(job_id):
+            raise ValueError(f"`job_id` has invalid value: `{job_id}`")
+
+        request = Request(
+            method_type=MethodType.GET,
+            endpoint=f"/_api/job/{job_id}",
+        )
+
+        def response_handler(response: Response) -> AsyncJobStatus:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            if response.status_code == 204:
+                return AsyncJobStatus.PENDING
+
+            # status_code 200
+            return AsyncJobStatus.DONE
+
+        return await self.execute(request, response_handler)
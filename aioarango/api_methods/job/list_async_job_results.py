@@ -0,0 +1,66 @@
+from typing import Optional, List
+
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType, AsyncJobStatus
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response
+from aioarango.typings import Result, Params
+
+
+class ListAsyncJobResults(Endpoint):
+    error_types = (ErrorType.HTTP_BAD_PARAMETER,)
+    status_codes = (
+        200,
+        # is returned if the list can be compiled successfully.
+        400,
+        # is returned if type is not specified or has an invalid value.
+    )
+
+    async def list_async_job_results(
+        self,
+        status: AsyncJobStatus,
+        count: Optional[int] = None,
+    ) -> Result[List[str]]:
+        """
+        Return the IDs of the async jobs with the given status.
+
+        Parameters
+        ----------
+        status : AsyncJobStatus
+            Status of the jobs to return. It can be either `pending` or `done`.
+        count : int, optional
+            Maximum number of job IDs to return. If not given, a server-defined value is used.
+
+        Returns
+        -------
+        Result
+            List of job IDs.
+
+        Raises
+        ------
+        ValueError
+            If the `status` has invalid value.
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+        """
+        if status is None:
+            raise ValueError(f"`status` has invalid value: `{status}`")
+
+        params: Params = {}
+        if count is not None:
+            params["count"] = count
+
+        request = Request(
+            method_type=MethodType.GET,
+            endpoint=f"/_api/job/{status.value}",
+            params=params,
+        )
+
+        def response_handler(response: Response) -> List[str]:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return response.body
+
+        return await self.execute(request, response_handler)
@@ -1,2 +1,15 @@
-class TransactionsMethods:
+from .abort_stream_transaction import AbortStreamTransaction
+from .begin_stream_transaction import BeginStreamTransaction
+from .commit_stream_transaction import CommitStreamTransaction
+from .get_stream_transaction_status import GetStreamTransactionStatus
+from .list_running_stream_transactions import ListRunningStreamTransactions
+
+
+class TransactionsMethods(
+    AbortStreamTransaction,
+    BeginStreamTransaction,
+    CommitStreamTransaction,
+    GetStreamTransactionStatus,
+    ListRunningStreamTransactions,
+):
     pass
@@ -0,0 +1,106 @@
+from typing import Optional
+
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response, TransactionInfo
+from aioarango.typings import Result, Json, Fields
+
+
+class BeginStreamTransaction(Endpoint):
+    error_types = (
+        ErrorType.TRANSACTION_INTERNAL,
+        ErrorType.ARANGO_DATA_SOURCE_NOT_FOUND,
+    )
+    status_codes = (
+        201,
+        # If the transaction is running on the server, HTTP 201 will be returned.
+        400,
+        # If the transaction specification is either missing or malformed, the server will respond with HTTP 400.
+        404,
+        # If the transaction specification contains an unknown collection, the server will respond with HTTP 404.
+    )
+
+    async def begin_stream_transaction(
+        self,
+        read: Optional[Fields] = None,
+        write: Optional[Fields] = None,
+        exclusive: Optional[Fields] = None,
+        wait_for_sync: Optional[bool] = None,
+        allow_implicit: Optional[bool] = None,
+        lock_timeout: Optional[int] = None,
+        max_transaction_size: Optional[int] = None,
+    ) -> Result[TransactionInfo]:
+        """
+        Begin a server-side stream transaction.
+
+        Notes
+        -----
+        - The transaction ID returned by this endpoint must be sent in the `x-arango-trx-id` header of the requests
+          that are supposed to be executed inside the transaction.
+
+        - The transaction is either committed or aborted using the transaction ID. Idle transactions are aborted by the
+          server after a server-controlled timeout.
+
+
+        Parameters
+        ----------
+        read : str or list of str, optional
+            Name(s) of collections read during transaction. Read-only collections are added lazily but should be
+            declared if possible to avoid deadlocks.
+        write : str or list of str, optional
+            Name(s) of collections written to during transaction with shared access.
+        exclusive : str or list of str, optional
+            Name(s) of collections written to during transaction with exclusive access.
+        wait_for_sync : bool, optional
+            Block until the transaction is synchronized to disk once it is committed.
+        allow_implicit : bool, optional
+            Allow reading from undeclared collections.
+        lock_timeout : int, optional
+            Timeout for waiting on collection locks. If not given, a default value is used. Setting it to `0` disables
+            the timeout.
+        max_transaction_size : int, optional
+            Max transaction size in bytes.
+
+        Returns
+        -------
+        Result
+            Information of the transaction if it was started successfully.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the transaction could not be started.
+        """
+        collections: Json = {}
+        if read is not None:
+            collections["read"] = read
+        if write is not None:
+            collections["write"] = write
+        if exclusive is not None:
+            collections["exclusive"] = exclusive
+
+        data: Json = {"collections": collections}
+        if wait_for_sync is not None:
+            data["waitForSync"] = wait_for_sync
+        if allow_implicit is not None:
+            data["allowImplicit"] = allow_implicit
+        if lock_timeout is not None:
+            data["lockTimeout"] = lock_timeout
+        if max_transaction_size is not None:
+            data["maxTransactionSize"] = max_transaction_size
+
+        request = Request(
+            method_type=MethodType.POST,
+            endpoint="/_api/transaction/begin",
+            data=data,
+        )
+
+        def response_handler(response: Response) -> TransactionInfo:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 201
+            return TransactionInfo.parse_obj(response.body["result"])
+
+        return await self.execute(request, response_handler)
@@ -0,0 +1,63 @@
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError, ErrorType
+from aioarango.models import Request, Response, TransactionInfo
+from aioarango.typings import Result
+
+
+class CommitStreamTransaction(Endpoint):
+    error_types = (
+        ErrorType.TRANSACTION_NOT_FOUND,
+        ErrorType.TRANSACTION_DISALLOWED_OPERATION,
+    )
+    status_codes = (
+        200,
+        # If the transaction was committed, HTTP 200 will be returned.
+        400,
+        # If the transaction cannot be committed, the server will respond with HTTP 400.
+        404,
+        # If the transaction was not found, the server will respond with HTTP 404.
+        409,
+        # If the transaction was already aborted, the server will respond with HTTP 409.
+    )
+
+    async def commit_stream_transaction(
+        self,
+        transaction_id: str,
+    ) -> Result[TransactionInfo]:
+        """
+        Commit a running server-side stream transaction.
+
+        Parameters
+        ----------
+        transaction_id : str
+            ID of the transaction.
+
+        Returns
+        -------
+        Result
+            Information of the transaction if it was committed successfully.
+
+        Raises
+        ------
+        ValueError
+            If the `transaction_id` has invalid value.
+        aioarango.errors.ArangoServerError
+            If commit fails.
+        """
+        if transaction_id is None or not len(transaction_id):
+            raise ValueError(f"`transaction_id` has invalid value: `{transaction_id}`")
+
+        request = Request(
+            method_type=MethodType.PUT,
+            endpoint=f"/_api/transaction/{transaction_id}",
+        )
+
+        def response_handler(response: Response) -> TransactionInfo:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return TransactionInfo.parse_obj(response.body["result"])
+
+        return await self.execute(request, response_handler)
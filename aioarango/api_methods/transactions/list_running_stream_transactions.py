@@ -0,0 +1,45 @@
+from typing import List
+
+from aioarango.api import Endpoint
+from aioarango.enums import MethodType
+from aioarango.errors import ArangoServerError
+from aioarango.models import Request, Response, TransactionInfo
+from aioarango.typings import Result
+
+
+class ListRunningStreamTransactions(Endpoint):
+    error_codes = ()
+    status_codes = (
+        200,
+        # If the list of transactions can be retrieved successfully, HTTP 200 will be returned.
+    )
+
+    async def list_running_stream_transactions(
+        self,
+    ) -> Result[List[TransactionInfo]]:
+        """
+        Return the currently running server-side transactions.
+
+        Returns
+        -------
+        Result
+            List of transactions currently running on the server.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If retrieval fails.
+        """
+        request = Request(
+            method_type=MethodType.GET,
+            endpoint="/_api/transaction",
+        )
+
+        def response_handler(response: Response) -> List[TransactionInfo]:
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            # status_code 200
+            return [TransactionInfo.parse_obj(transaction) for transaction in response.body["transactions"]]
+
+        return await self.execute(request, response_handler)
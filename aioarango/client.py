@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from json import dumps, loads
-from typing import Callable, Union, Sequence, List, Optional
+import asyncio
+import time
+from typing import Callable, Union, Sequence, List, Optional, Any
 
 import aiohttp
 
 from aioarango.api import StandardDatabase
 from aioarango.connection import BasicConnection
-from aioarango.enums import HostResolverType, ConnectionType
+from aioarango.enums import HostResolverType, ConnectionType, ContentType, ContentEncoding
 from aioarango.errors import ServerConnectionError
 from aioarango.http_client import HTTPClient, DefaultHTTPClient
-from aioarango.resolver import HostResolver, SingleHostResolver, RandomHostResolver, RoundRobinHostResolver
+from aioarango.models import ConnectionPoolConfig, ConnectionPoolStats
+from aioarango.resolver import HostResolver, SingleHostResolver, RandomHostResolver, RoundRobinHostResolver, HealthAwareHostResolver
+from aioarango.utils.json_utils import json_dumps, json_loads
 
 
 class ArangoClient:
@@ -20,10 +23,53 @@ class ArangoClient:
         host_resolver_type: HostResolverType = HostResolverType.ROUND_ROBIN,
         resolver_max_tries: Optional[int] = None,
         http_client: Optional[HTTPClient] = None,
-        serializer: Callable[..., str] = lambda x: dumps(x),
-        deserializer: Callable[[str], str] = lambda x: loads(x),
-        request_timeout: int = 60,
+        serializer: Callable[..., Union[str, bytes]] = json_dumps,
+        deserializer: Callable[[Union[bytes, str]], Any] = json_loads,
+        request_timeout: Optional[int] = None,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        content_type: ContentType = ContentType.JSON,
+        compression: Optional[ContentEncoding] = None,
+        compression_threshold: int = 4096,
     ):
+        """
+        Client for connecting to ArangoDB hosts.
+
+        Parameters
+        ----------
+        hosts : str or list of str, default : "http://127.0.0.1:8529"
+            URL(s) of the hosts. Multiple hosts can be passed as a comma separated string as well.
+        host_resolver_type : HostResolverType, default : HostResolverType.ROUND_ROBIN
+            How to choose the host of every request if there are multiple hosts.
+        resolver_max_tries : int, optional
+            Maximum number of tries of every request. Defaults to three times the number of hosts.
+        http_client : HTTPClient, optional
+            HTTP client to use. A `DefaultHTTPClient` is used if it is not set.
+        serializer : Callable, default : json_dumps
+            Serializer of the request payloads. It must produce the format of the **content_type**.
+        deserializer : Callable, default : json_loads
+            Deserializer of the response bodies of the **content_type** format.
+        request_timeout : int, optional
+            Maximum number of seconds to wait for the server to send data of a response. `None` waits forever, so
+            long-running queries are not cut off by the client while the server is still executing them.
+        pool_config : ConnectionPoolConfig, optional
+            Configuration of the connection pools of the default HTTP client.
+        content_type : ContentType, default : ContentType.JSON
+            Content type of the request payloads and the preferred content type of the responses. The **serializer**
+            and **deserializer** must be set to a VelocyPack serializer pair if it is set to `ContentType.VPACK`.
+        compression : ContentEncoding, optional
+            Compress the request payloads larger than **compression_threshold** bytes with this encoding. Compressed
+            responses are always accepted and decompressed by the HTTP client.
+        compression_threshold : int, default : 4096
+            Minimum size of a request payload (in bytes) to be compressed.
+
+        Raises
+        ------
+        ValueError
+            If the content type is VelocyPack but the JSON serializer pair is used.
+        """
+        if content_type == ContentType.VPACK and (serializer is json_dumps or deserializer is json_loads):
+            raise ValueError("A VelocyPack serializer and deserializer must be passed for the `application/x-velocypack` content type")
+
         if isinstance(hosts, str):
             self.hosts = [host.strip("/") for host in hosts.split(",")]
         else:
@@ -33,9 +79,12 @@ class ArangoClient:
         self.serializer = serializer
         self.deserializer = deserializer
         self.request_timeout = request_timeout
+        self.content_type = content_type
+        self.compression = compression
+        self.compression_threshold = compression_threshold
 
         # Initializes the http_client client
-        self.http_client: Optional[HTTPClient] = http_client or DefaultHTTPClient()
+        self.http_client: Optional[HTTPClient] = http_client or DefaultHTTPClient(pool_config)
         self._sessions: List[aiohttp.ClientSession] = [
             self.http_client.create_session(
                 host,
@@ -56,6 +105,11 @@ class ArangoClient:
                 host_count=host_count,
                 max_tries=resolver_max_tries,
             )
+        elif self.host_resolver_type == HostResolverType.HEALTH_AWARE:
+            self._host_resolver = HealthAwareHostResolver(
+                host_count=host_count,
+                max_tries=resolver_max_tries,
+            )
         else:
             self._host_resolver = RoundRobinHostResolver(
                 host_count=host_count,
@@ -73,12 +127,48 @@ class ArangoClient:
     def sessions(self) -> List[aiohttp.ClientSession]:
         return self._sessions
 
-    def close(self):
+    def pool_stats(self) -> List[ConnectionPoolStats]:
+        """
+        Return the statistics of the connection pools of the hosts.
+
+        Returns
+        -------
+        list of ConnectionPoolStats
+            Statistics of the connection pools. Hosts whose HTTP client does not keep track of its pool are skipped.
+        """
+        stats = []
+        for session in self.sessions:
+            session_stats = self.http_client.get_pool_stats(session)
+            if session_stats is not None:
+                stats.append(session_stats)
+
+        return stats
+
+    async def close(
+        self,
+        timeout: Optional[float] = 10.0,
+    ) -> None:
         """
         Close HTTP sessions.
+
+        The requests that are still running are given up to **timeout** seconds to finish before the connections are
+        closed.
+
+        Parameters
+        ----------
+        timeout : float, optional, default : 10.0
+            Maximum number of seconds to wait for the running requests to finish. `None` waits until all of them are
+            finished.
         """
+        started_at = time.monotonic()
+        while any(stats.in_use or stats.waiting for stats in self.pool_stats()):
+            if timeout is not None and time.monotonic() - started_at >= timeout:
+                break
+
+            await asyncio.sleep(0.05)
+
         for session in self.sessions:
-            session.close()
+            await self.http_client.close_session(session)
 
     async def db(
         self,
@@ -100,6 +190,9 @@ class ArangoClient:
                 deserializer=self.deserializer,
                 username=username,
                 password=password,
+                content_type=self.content_type,
+                compression=self.compression,
+                compression_threshold=self.compression_threshold,
             )
         else:
             raise NotImplementedError  # fixme
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 import logging
+import time
+import zlib
 from abc import abstractmethod
-from typing import Sequence, Callable, Any, Optional, Set, Union
+from typing import Sequence, Callable, Any, Optional, Set, Union, Tuple
 
-from aiohttp import ClientSession, BasicAuth
+from aiohttp import ClientSession, BasicAuth, ClientConnectorError
 from requests_toolbelt import MultipartEncoder
 
-from aioarango.enums import MethodType
+from aioarango.enums import MethodType, ContentType, ContentEncoding
 from aioarango.http_client import HTTPClient
 from aioarango.models import Response, Request
 from aioarango.resolver import HostResolver
-from aioarango.typings import Fields, Json
+from aioarango.typings import Fields, Json, Headers
+from aioarango.utils.json_utils import json_dumps, json_loads
 
 
 class BaseConnection:
@@ -24,8 +29,11 @@ class BaseConnection:
         sessions: Sequence[ClientSession],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
-        deserializer: Callable[[str], Any],
+        serializer: Callable[..., Union[str, bytes]],
+        deserializer: Callable[[Union[bytes, str]], Any],
+        content_type: ContentType = ContentType.JSON,
+        compression: Optional[ContentEncoding] = None,
+        compression_threshold: int = 4096,
     ):
 
         self._url_prefixes = [f"{host}/_db/{db_name}" for host in hosts]
@@ -35,6 +43,9 @@ class BaseConnection:
         self.http_client = http_client
         self.serializer = serializer
         self.deserializer = deserializer
+        self.content_type = content_type
+        self.compression = compression
+        self.compression_threshold = compression_threshold
         self._username: Optional[str] = None
 
     @property
@@ -53,9 +64,9 @@ class BaseConnection:
     def serialize(
         self,
         obj: Any,
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
-        Serialize the given object.
+        Serialize the given object with the serializer of the content type of the connection.
 
         Parameters
         ----------
@@ -64,33 +75,68 @@ class BaseConnection:
 
         Returns
         -------
-        str
+        str or bytes
             Serialized string
 
         """
         return self.serializer(obj)
 
+    def serialize_json(
+        self,
+        obj: Any,
+    ) -> str:
+        """
+        Serialize the given object as JSON, regardless of the content type of the connection. This is used for the
+        APIs that only accept JSON (e.g. the parts of a batch request and the import API).
+
+        Parameters
+        ----------
+        obj : Any
+            JSON object to serialize
+
+        Returns
+        -------
+        str
+            Serialized string
+        """
+        if self.content_type == ContentType.JSON:
+            return self.serializer(obj)
+
+        return json_dumps(obj)
+
     def deserialize(
         self,
-        string: str,
+        string: Union[bytes, str],
+        content_type: Optional[ContentType] = None,
     ) -> Any:
         """
         Deserialize the string and return the object.
 
         Parameters
         ----------
-        string : str
-            String to deserialize
+        string : bytes or str
+            String to deserialize. It is passed to the deserializer as is, so it can be parsed without being decoded
+            first.
+        content_type : ContentType, optional
+            Content type of the string. The deserializer of the connection is used if it is not set or matches the
+            content type of the connection, otherwise, the string is deserialized as JSON.
 
         Returns
         -------
         Any
-            Deserialized object
+            Deserialized object, or the decoded string if it cannot be deserialized.
 
         """
+        if content_type is None or content_type == self.content_type:
+            deserializer = self.deserializer
+        else:
+            deserializer = json_loads
+
         try:
-            return self.deserializer(string)
+            return deserializer(string)
         except (ValueError, TypeError):
+            if isinstance(string, (bytes, bytearray)):
+                return string.decode("utf-8", errors="replace")
             return string
 
     def prep_response(
@@ -115,11 +161,11 @@ class BaseConnection:
 
         """
         if deserialize:
-            response.lazy_load(self.deserialize(response.raw_body))
+            response.lazy_load(self.deserialize(response.raw_body, self.get_content_type(response)))
             if isinstance(response.body, dict) and response.status_code == response.error_code == 503:
                 raise ConnectionError  # Fallback to another host
         else:
-            response.body = response.raw_body
+            response.body = response.text
 
         return response
 
@@ -132,6 +178,10 @@ class BaseConnection:
         """
         Execute a request until a valid response has been returned.
 
+        The latency and the outcome of every try are reported to the host resolver, so it can route the next requests
+        to the healthy hosts. Requests are retried on another host if the connection to the host fails or the host
+        is unavailable. Other errors (e.g. timeouts) are raised, since the request might have been processed already.
+
         Parameters
         ----------
         host_index : int
@@ -145,22 +195,30 @@ class BaseConnection:
         -------
 
         """
+        data, headers = self.prepare_body(request)
+
         tries = 0
         indexes_to_filter: Set[int] = set()
         while tries < self.host_resolver.max_tries:
+            started_at = time.monotonic()
+            self.host_resolver.mark_request_started(host_index)
             try:
                 resp = await self.http_client.send_request(
                     session=self.sessions[host_index],
                     method_type=request.method_type,
                     url=self._url_prefixes[host_index] + request.endpoint,
                     params=request.params,
-                    data=self.normalize_data(request.data),
-                    headers=request.headers,
+                    data=data,
+                    headers=headers,
                     auth=auth,
+                    timeout=request.timeout,
                 )
 
-                return self.prep_response(resp, request.deserialize)
-            except ConnectionError:
+                resp = self.prep_response(resp, request.deserialize)
+            except (ConnectionError, ClientConnectorError):
+                # the request has not been processed by the host, so it is safe to send it to another host.
+                self.host_resolver.mark_request_finished(host_index, time.monotonic() - started_at, False)
+
                 url = self._url_prefixes[host_index] + request.endpoint
                 logging.debug(f"ConnectionError: {url}")
 
@@ -170,6 +228,15 @@ class BaseConnection:
 
                 host_index = self.host_resolver.get_host_index(indexes_to_filter)
                 tries += 1
+            except asyncio.CancelledError as e:
+                self.host_resolver.mark_request_finished(host_index, time.monotonic() - started_at, None)
+                raise e
+            except Exception as e:
+                self.host_resolver.mark_request_finished(host_index, time.monotonic() - started_at, False)
+                raise e
+            else:
+                self.host_resolver.mark_request_finished(host_index, time.monotonic() - started_at, resp.status_code < 500)
+                return resp
 
         raise ConnectionAbortedError(f"Can't connect to host(s) within limit ({self.host_resolver.max_tries})")
 
@@ -208,7 +275,7 @@ class BaseConnection:
     def normalize_data(
         self,
         data: Any,
-    ) -> Union[str, MultipartEncoder, None]:
+    ) -> Union[str, bytes, MultipartEncoder, None]:
         """
         Normalize request data.
 
@@ -219,17 +286,94 @@ class BaseConnection:
 
         Returns
         -------
-        str | MultipartEncoder | None
+        str | bytes | MultipartEncoder | None
             Normalized data
 
         """
         if data is None:
             return None
-        elif isinstance(data, (str, MultipartEncoder)):
+        elif isinstance(data, (str, bytes, MultipartEncoder)):
             return data
         else:
             return self.serialize(data)
 
+    def prepare_body(
+        self,
+        request: Request,
+    ) -> Tuple[Union[str, bytes, MultipartEncoder, None], Headers]:
+        """
+        Serialize the payload of the request and compress it if it is large enough, and return it with the headers
+        that describe it.
+
+        Notes
+        -----
+        - Payloads that are already serialized (e.g. JSON lines of the import API) are sent as they are, only the
+          payloads serialized by the connection use the content type of the connection.
+
+        Parameters
+        ----------
+        request : Request
+            HTTP request
+
+        Returns
+        -------
+        tuple
+            Payload and headers of the request.
+
+        """
+        headers = request.headers if request.headers is not None else {}
+        if self.content_type != ContentType.JSON:
+            headers = {**headers, "accept": f"{self.content_type.value}, {ContentType.JSON.value}"}
+
+        data = request.data
+        if data is None or isinstance(data, MultipartEncoder):
+            return data, headers
+
+        if not isinstance(data, (str, bytes)):
+            data = self.serialize(data)
+            if self.content_type != ContentType.JSON:
+                headers = {**headers, "content-type": self.content_type.value}
+
+        if self.compression is not None and len(data) >= self.compression_threshold:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+
+            if self.compression == ContentEncoding.GZIP:
+                data = gzip.compress(data, compresslevel=6)
+            else:
+                data = zlib.compress(data, 6)
+            headers = {**headers, "content-encoding": self.compression.value}
+
+        return data, headers
+
+    @staticmethod
+    def get_content_type(
+        response: Response,
+    ) -> Optional[ContentType]:
+        """
+        Return the content type of the given response.
+
+        Parameters
+        ----------
+        response : Response
+            HTTP response
+
+        Returns
+        -------
+        ContentType, optional
+            Content type of the response, or `None` if it is not one of the supported content types.
+
+        """
+        for key, value in response.headers.items():
+            if key.lower() == "content-type":
+                mime_type = value.split(";", 1)[0].strip().lower()
+                for content_type in ContentType:
+                    if content_type.value == mime_type:
+                        return content_type
+                return None
+
+        return None
+
     async def ping(self) -> int:
         """
         Ping the next host to check if connection is established.
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, Callable, Any
+from typing import Optional, Sequence, Callable, Any, Union
 
 from aiohttp import ClientSession
 
 from aioarango.connection import BaseConnection
+from aioarango.enums import ContentType, ContentEncoding
 from aioarango.http_client import HTTPClient
 from aioarango.models import Response, Request
 from aioarango.resolver import HostResolver
@@ -23,10 +24,13 @@ class BasicConnection(BaseConnection):
         sessions: Sequence[ClientSession],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
-        deserializer: Callable[[str], Any],
+        serializer: Callable[..., Union[str, bytes]],
+        deserializer: Callable[[Union[bytes, str]], Any],
         username: str,
         password: str,
+        content_type: ContentType = ContentType.JSON,
+        compression: Optional[ContentEncoding] = None,
+        compression_threshold: int = 4096,
     ):
         super().__init__(
             hosts,
@@ -36,6 +40,9 @@ class BasicConnection(BaseConnection):
             http_client,
             serializer,
             deserializer,
+            content_type,
+            compression,
+            compression_threshold,
         )
 
         self._url_prefixes = [f"{host}/_db/{db_name}" for host in hosts]
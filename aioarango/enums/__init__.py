@@ -1,14 +1,21 @@
 __all__ = [
     "APIContextType",
     "AQLCacheMode",
+    "AsyncJobStatus",
+    "BatchJobStatus",
+    "CircuitState",
     "AQLQueryState",
     "CollectionStatus",
     "CollectionType",
     "CompressionType",
     "ComputeOnType",
     "ConnectionType",
+    "ContentEncoding",
+    "ContentType",
     "ErrorSource",
     "HostResolverType",
+    "ImportOnDuplicate",
+    "ImportType",
     "IndexType",
     "InvertedIndexFeaturesType",
     "KeyOptionsType",
@@ -17,18 +24,26 @@ __all__ = [
     "ShardingMethod",
     "ShardingStrategy",
     "SortType",
+    "TransactionStatus",
 ]
 
 from .api_context_type import APIContextType
 from .aql_cache_mode import AQLCacheMode
 from .aql_query_state import AQLQueryState
+from .async_job_status import AsyncJobStatus
+from .batch_job_status import BatchJobStatus
+from .circuit_state import CircuitState
 from .collection_status import CollectionStatus
 from .collection_type import CollectionType
 from .compression_type import CompressionType
 from .compute_on_type import ComputeOnType
 from .connection_type import ConnectionType
+from .content_encoding import ContentEncoding
+from .content_type import ContentType
 from .error_source import ErrorSource
 from .host_resolver_type import HostResolverType
+from .import_on_duplicate import ImportOnDuplicate
+from .import_type import ImportType
 from .index_type import IndexType
 from .inverted_index_features_type import InvertedIndexFeaturesType
 from .key_options_type import KeyOptionsType
@@ -37,3 +52,4 @@ from .overwrite_mode import OverwriteMode
 from .sharding_method import ShardingMethod
 from .sharding_strategy import ShardingStrategy
 from .sort_type import SortType
+from .transaction_status import TransactionStatus
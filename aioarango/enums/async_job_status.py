@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class AsyncJobStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class BatchJobStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ContentEncoding(Enum):
+    GZIP = "gzip"
+    DEFLATE = "deflate"
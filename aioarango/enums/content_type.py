@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ContentType(Enum):
+    JSON = "application/json"
+    VPACK = "application/x-velocypack"
@@ -5,3 +5,4 @@ class HostResolverType(Enum):
     SINGLE = "single"
     ROUND_ROBIN = "round_robin"
     RANDOM = "random"
+    HEALTH_AWARE = "health_aware"
@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class ImportOnDuplicate(Enum):
+    ERROR = "error"
+    """
+    will not import the current document because of the unique key constraint violation. This is the default setting.
+    """
+
+    UPDATE = "update"
+    """
+    will update an existing document in the database with the data specified in the request. Attributes of the existing
+    document that are not present in the request will be preserved.
+    """
+
+    REPLACE = "replace"
+    """
+    will replace an existing document in the database with the data specified in the request.
+    """
+
+    IGNORE = "ignore"
+    """
+    will not update an existing document and simply ignore the error caused by a unique key constraint violation.
+    """
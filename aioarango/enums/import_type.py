@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class ImportType(Enum):
+    DOCUMENTS = "documents"
+    """
+    each line in the request body is expected to be an individual JSON-encoded document (JSON lines).
+    """
+
+    ARRAY = "array"
+    """
+    the request body is expected to be a JSON array of documents.
+    """
+
+    AUTO = "auto"
+    """
+    the server tries to automatically determine whether the request body is a JSON array or JSON lines.
+    """
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TransactionStatus(Enum):
+    RUNNING = "running"
+    COMMITTED = "committed"
+    ABORTED = "aborted"
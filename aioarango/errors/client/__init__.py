@@ -1,4 +1,5 @@
 from .arango_client_error import ArangoClientError
+from .async_job_result_error import AsyncJobResultError
 from .batch_job_result_error import BatchJobResultError
 from .batch_state_error import BatchStateError
 from .cursor_count_error import CursorCountError
@@ -7,3 +8,4 @@ from .cursor_state_error import CursorStateError
 from .document_parse_error import DocumentParseError
 from .graph_parse_error import GraphParseError
 from .server_connection_error import ServerConnectionError
+from .transaction_state_error import TransactionStateError
@@ -0,0 +1,5 @@
+from .arango_client_error import ArangoClientError
+
+
+class AsyncJobResultError(ArangoClientError):
+    """Failed to retrieve async job result."""
@@ -0,0 +1,5 @@
+from .arango_client_error import ArangoClientError
+
+
+class TransactionStateError(ArangoClientError):
+    """The transaction object was in a bad state."""
@@ -1,11 +1,15 @@
-from typing import Callable
+from typing import Callable, Optional, TYPE_CHECKING
 
 from aioarango.enums import APIContextType
+from aioarango.errors import ArangoServerError
 from aioarango.models import Request, Response
 from aioarango.typings import T
 from .base_api_executor import BaseAPIExecutor
 from ..connection import Connection
 
+if TYPE_CHECKING:
+    from aioarango.job import AsyncJob
+
 
 class AsyncAPIExecutor(BaseAPIExecutor):
     """Async API Executor."""
@@ -23,11 +27,14 @@ class AsyncAPIExecutor(BaseAPIExecutor):
         self,
         request: Request,
         response_handler: Callable[[Response], T],
-        # ) -> Optional[AsyncJob[T]]: # fixme
-    ) -> T:
+    ) -> Optional["AsyncJob[T]"]:
         """
         Execute an API request asynchronously.
 
+        The request is queued on the server and the server responds as soon as the request is queued. If
+        `return_result` parameter was set to `True` during initialization, the result of the request is stored on the
+        server and can be fetched using the returned job, otherwise, the result is discarded.
+
         Parameters
         ----------
         request : Request
@@ -39,5 +46,25 @@ class AsyncAPIExecutor(BaseAPIExecutor):
         -------
         AsyncJob[T], optional
             Async job or None if `return_result` parameter was set to False during initialization.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the server did not accept the request.
         """
-        pass
+        if request.headers is None:
+            request.headers = Request.normalize_headers(None)
+        request.headers["x-arango-async"] = "store" if self.return_result else "true"
+
+        response = await self.connection.send_request(request)
+        if not response.is_success:
+            raise ArangoServerError(response, request)
+
+        if not self.return_result:
+            return None
+
+        # imported here since `aioarango.job` depends on the API methods, which depend on this module.
+        from aioarango.job import AsyncJob
+
+        job_id = next(value for key, value in response.headers.items() if key.lower() == "x-arango-async-id")
+        return AsyncJob(self.connection, job_id, response_handler)
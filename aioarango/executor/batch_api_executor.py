@@ -1,14 +1,235 @@
+import asyncio
+import uuid
+from typing import Callable, Dict, List, Set, TYPE_CHECKING
+from urllib.parse import urlencode
+
 from aioarango.connection import Connection
-from aioarango.enums import APIContextType
+from aioarango.enums import APIContextType, MethodType
+from aioarango.errors import ArangoServerError, BatchJobResultError
 from aioarango.executor import BaseAPIExecutor
+from aioarango.models import Request, Response
+from aioarango.typings import T
+
+if TYPE_CHECKING:
+    from aioarango.job import BatchJob
 
 
 class BatchAPIExecutor(BaseAPIExecutor):
-    """Batch API executor"""
+    """
+    Batch API executor.
+
+    API requests are queued as batch jobs instead of being sent right away. All the jobs that are queued in the same
+    iteration of the event loop, e.g. the requests of the coroutines passed to `asyncio.gather`, are committed
+    together in one `multipart` request to the `/_api/batch` endpoint, and each job is resolved with its own part of
+    the batch response.
+    """
 
     def __init__(
         self,
         connection: Connection,
+        max_batch_size: int = 100,
     ):
         self.connection = connection
         self.context = APIContextType.BATCH
+        self.max_batch_size = max_batch_size
+
+        self._queue: Dict[str, "BatchJob"] = {}
+        self._next_job_id = 0
+        self._commit_scheduled = False
+        self._commit_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def queued_job_count(self) -> int:
+        return len(self._queue)
+
+    async def execute(
+        self,
+        request: Request,
+        response_handler: Callable[[Response], T],
+    ) -> T:
+        """
+        Queue an API request in the batch and return its result once the batch is committed.
+
+        Parameters
+        ----------
+        request : Request
+            HTTP request
+        response_handler : Callable
+            HTTP response handler
+
+        Returns
+        -------
+        T
+            API execution result
+        """
+        return await self.queue(request, response_handler)
+
+    def queue(
+        self,
+        request: Request,
+        response_handler: Callable[[Response], T],
+    ) -> "BatchJob[T]":
+        """
+        Queue an API request in the batch without waiting for its result.
+
+        Parameters
+        ----------
+        request : Request
+            HTTP request
+        response_handler : Callable
+            HTTP response handler
+
+        Returns
+        -------
+        BatchJob[T]
+            Batch job that is resolved once the batch is committed.
+        """
+        # imported here since `aioarango.job` depends on the API methods, which depend on this module.
+        from aioarango.job import BatchJob
+
+        self._next_job_id += 1
+        job = BatchJob(str(self._next_job_id), request, response_handler)
+        self._queue[job.id] = job
+
+        if len(self._queue) >= self.max_batch_size:
+            self._start_commit()
+        elif not self._commit_scheduled:
+            # let the other coroutines that are ready to run queue their requests before committing the batch.
+            self._commit_scheduled = True
+            asyncio.get_running_loop().call_soon(self._start_commit)
+
+        return job
+
+    def _start_commit(self) -> None:
+        task = asyncio.create_task(self.commit())
+        self._commit_tasks.add(task)
+        task.add_done_callback(self._commit_tasks.discard)
+
+    async def commit(self) -> List["BatchJob"]:
+        """
+        Send the queued jobs to the server in one batch request and resolve them with their responses.
+
+        Returns
+        -------
+        list of BatchJob
+            The committed jobs.
+        """
+        self._commit_scheduled = False
+        if not self._queue:
+            return []
+
+        jobs = list(self._queue.values())
+        self._queue.clear()
+
+        request = self._prep_batch_request(jobs)
+        try:
+            response = await self.connection.send_request(request)
+            if not response.is_success:
+                raise ArangoServerError(response, request)
+
+            responses = self._parse_batch_response(response)
+        except Exception as e:
+            for job in jobs:
+                job.set_exception(e)
+        else:
+            for job in jobs:
+                job_response = responses.get(job.id, None)
+                if job_response is None:
+                    job.set_exception(BatchJobResultError(f"batch response does not contain the result of job `{job.id}`"))
+                else:
+                    job.set_response(job_response)
+
+        return jobs
+
+    async def close(self) -> None:
+        """
+        Commit the remaining queued jobs and wait for all the running commits to finish.
+        """
+        await self.commit()
+        if self._commit_tasks:
+            await asyncio.gather(*self._commit_tasks, return_exceptions=True)
+
+    def _prep_batch_request(
+        self,
+        jobs: List["BatchJob"],
+    ) -> Request:
+        boundary = uuid.uuid4().hex
+
+        parts = []
+        for job in jobs:
+            request = job.request
+            endpoint = request.endpoint
+            if request.params:
+                endpoint = f"{endpoint}?{urlencode(request.params)}"
+
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/x-arango-batchpart",
+                f"Content-Id: {job.id}",
+                "",
+                f"{request.method_type.value.upper()} {endpoint} HTTP/1.1",
+            ]
+            if request.headers:
+                lines.extend(f"{key}: {value}" for key, value in request.headers.items())
+            lines.append("")
+
+            data = request.data
+            if data is not None and not isinstance(data, str):
+                # the parts of a batch request are always JSON
+                data = self.connection.serialize_json(data)
+            lines.append(data if data is not None else "")
+            parts.append("\r\n".join(lines))
+
+        parts.append(f"--{boundary}--")
+
+        return Request(
+            method_type=MethodType.POST,
+            endpoint="/_api/batch",
+            headers={"content-type": f"multipart/form-data; boundary={boundary}"},
+            data="\r\n".join(parts),
+            deserialize=False,
+        )
+
+    def _parse_batch_response(
+        self,
+        response: Response,
+    ) -> Dict[str, Response]:
+        content_type = next((value for key, value in response.headers.items() if key.lower() == "content-type"), "")
+        if "boundary=" not in content_type:
+            raise BatchJobResultError("batch response does not have a multipart boundary")
+
+        boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"')
+
+        responses: Dict[str, Response] = {}
+        for raw_part in response.body.split(f"--{boundary}")[1:]:
+            if raw_part.startswith("--"):
+                # closing boundary
+                break
+
+            part_headers, _, http_message = raw_part.strip("\r\n").partition("\r\n\r\n")
+            job_id = None
+            for line in part_headers.split("\r\n"):
+                key, _, value = line.partition(":")
+                if key.strip().lower() == "content-id":
+                    job_id = value.strip()
+
+            if job_id is None:
+                continue
+
+            head, _, body = http_message.partition("\r\n\r\n")
+            head_lines = head.split("\r\n")
+            headers = {}
+            for line in head_lines[1:]:
+                key, _, value = line.partition(":")
+                headers[key.strip()] = value.strip()
+
+            job_response = Response(
+                method=response.method,
+                url=response.url,
+                headers=headers,
+                status_code=int(head_lines[0].split(" ")[1]),
+                raw_body=body,
+            )
+            responses[job_id] = self.connection.prep_response(job_response)
+
+        return responses
@@ -1,6 +1,11 @@
+from typing import Callable, Optional
+
 from aioarango.connection import Connection
 from aioarango.enums import APIContextType
+from aioarango.errors import TransactionStateError
 from aioarango.executor import BaseAPIExecutor
+from aioarango.models import Request, Response
+from aioarango.typings import T
 
 
 class TransactionAPIExecutor(BaseAPIExecutor):
@@ -9,6 +14,42 @@ class TransactionAPIExecutor(BaseAPIExecutor):
     def __init__(
         self,
         connection: Connection,
+        transaction_id: Optional[str] = None,
     ):
         self.connection = connection
         self.context = APIContextType.TRANSACTION
+        self.transaction_id = transaction_id
+
+    async def execute(
+        self,
+        request: Request,
+        response_handler: Callable[[Response], T],
+    ) -> T:
+        """
+        Execute an API request inside the stream transaction.
+
+        Parameters
+        ----------
+        request : Request
+            HTTP request
+        response_handler : Callable
+            HTTP response handler
+
+        Returns
+        -------
+        T
+            API execution result
+
+        Raises
+        ------
+        aioarango.errors.TransactionStateError
+            If the transaction has not been started or is already finished.
+        """
+        if self.transaction_id is None:
+            raise TransactionStateError("transaction is not running")
+
+        if request.headers is None:
+            request.headers = Request.normalize_headers(None)
+        request.headers["x-arango-trx-id"] = self.transaction_id
+
+        return response_handler(await self.connection.send_request(request))
@@ -4,7 +4,7 @@ from typing import Optional, MutableMapping, Union, Any
 from aiohttp import ClientSession, BasicAuth
 
 from aioarango.enums import MethodType
-from aioarango.models import Response
+from aioarango.models import Response, ConnectionPoolStats
 from aioarango.typings import Headers
 
 
@@ -15,6 +15,7 @@ class BaseHTTPClient(ABC):
     def create_session(
         self,
         host: str,
+        request_timeout: Optional[int] = None,
     ) -> ClientSession:
         """
         Return a new aiohttp client session given the host URL.
@@ -25,6 +26,8 @@ class BaseHTTPClient(ABC):
         ----------
         host : str
             ArangoDB host URL
+        request_timeout : int, optional
+            Maximum number of seconds to wait for the server to send data of a response, `None` waits forever
 
         Returns
         -------
@@ -43,6 +46,7 @@ class BaseHTTPClient(ABC):
         params: Optional[MutableMapping[str, str]] = None,
         data: Union[str, Any, None] = None,
         auth: Optional[BasicAuth] = None,
+        timeout: Optional[float] = None,
     ) -> Response:
         """
         Send an HTTP request.
@@ -65,6 +69,8 @@ class BaseHTTPClient(ABC):
             Request payload
         auth : aiohttp.BasicAuth
             Username and password
+        timeout : float, optional
+            Maximum number of seconds the request may take. If it is not set, the timeouts of the session are used.
 
         Returns
         -------
@@ -72,3 +78,36 @@ class BaseHTTPClient(ABC):
             HTTP Response
         """
         raise NotImplementedError
+
+    def get_pool_stats(
+        self,
+        session: ClientSession,
+    ) -> Optional[ConnectionPoolStats]:
+        """
+        Return the statistics of the connection pool of the given session.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            aiohttp client session object
+
+        Returns
+        -------
+        ConnectionPoolStats, optional
+            Statistics of the connection pool, or `None` if the client does not keep track of them.
+        """
+        return None
+
+    async def close_session(
+        self,
+        session: ClientSession,
+    ) -> None:
+        """
+        Close the given session and all of its connections.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            aiohttp client session object
+        """
+        await session.close()
@@ -1,23 +1,107 @@
-from typing import Optional, MutableMapping, Union, Any
+import time
+from typing import Optional, MutableMapping, Union, Any, Dict
 
 import aiohttp
 
 from aioarango.enums import MethodType
 from aioarango.http_client import BaseHTTPClient
-from aioarango.models import Response
+from aioarango.models import Response, ConnectionPoolConfig, ConnectionPoolStats
 from aioarango.typings import Headers
 
 
+class _PoolWaits:
+    """
+    Keep track of the requests of a session waiting for a free connection of its pool.
+    """
+
+    __slots__ = (
+        "host",
+        "waiting",
+        "total_waits",
+        "total_wait_time",
+    )
+
+    def __init__(
+        self,
+        host: str,
+    ):
+        self.host = host
+        self.waiting = 0
+        self.total_waits = 0
+        self.total_wait_time = 0.0
+
+
 class DefaultHTTPClient(BaseHTTPClient):
     """Default HTTP client implementation."""
 
+    def __init__(
+        self,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+    ):
+        self.pool_config = pool_config or ConnectionPoolConfig()
+        self._pool_waits: Dict[aiohttp.ClientSession, _PoolWaits] = {}
+
     def create_session(
         self,
         host: str,
-        request_timeout: int = 60,
+        request_timeout: Optional[int] = None,
     ) -> aiohttp.ClientSession:
-        self._timeout = aiohttp.ClientTimeout(total=None)  # fixme
-        return aiohttp.ClientSession(timeout=self._timeout)
+        config = self.pool_config
+
+        connector = aiohttp.TCPConnector(
+            limit=config.max_connections,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=config.total_timeout,
+            connect=config.pool_timeout,
+            sock_connect=config.connect_timeout,
+            sock_read=config.read_timeout if config.read_timeout is not None else request_timeout,
+        )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[trace_config],
+        )
+        self._pool_waits[session] = _PoolWaits(host)
+
+        return session
+
+    async def _on_connection_queued_start(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: Any,
+        params: aiohttp.TraceConnectionQueuedStartParams,
+    ) -> None:
+        pool_waits = self._pool_waits.get(session, None)
+        if pool_waits is None:
+            return
+
+        trace_config_ctx.queued_at = time.monotonic()
+        pool_waits.waiting += 1
+        pool_waits.total_waits += 1
+
+    async def _on_connection_queued_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: Any,
+        params: aiohttp.TraceConnectionQueuedEndParams,
+    ) -> None:
+        pool_waits = self._pool_waits.get(session, None)
+        if pool_waits is None:
+            return
+
+        pool_waits.waiting = max(pool_waits.waiting - 1, 0)
+        queued_at = getattr(trace_config_ctx, "queued_at", None)
+        if queued_at is not None:
+            pool_waits.total_wait_time += time.monotonic() - queued_at
 
     async def send_request(
         self,
@@ -28,21 +112,55 @@ class DefaultHTTPClient(BaseHTTPClient):
         params: Optional[MutableMapping[str, str]] = None,
         data: Union[str, Any, None] = None,
         auth: Optional[aiohttp.BasicAuth] = None,
+        timeout: Optional[float] = None,
     ) -> Response:
-        raw_response = await session.request(
+        request_timeout = session.timeout
+        if timeout is not None:
+            request_timeout = aiohttp.ClientTimeout(
+                total=timeout,
+                connect=request_timeout.connect,
+                sock_connect=request_timeout.sock_connect,
+                sock_read=request_timeout.sock_read,
+            )
+
+        async with session.request(
             method=str(method_type.value),
             url=url,
             params=params,
             data=data,
             headers=headers,
             auth=auth,
-            timeout=self._timeout,
-        )
+            timeout=request_timeout,
+        ) as raw_response:
+            return Response(
+                method=method_type,
+                url=url,
+                headers=dict(raw_response.headers),
+                status_code=raw_response.status,
+                raw_body=await raw_response.read(),
+            )
 
-        return Response(
-            method=method_type,
-            url=url,
-            headers=dict(raw_response.headers),
-            status_code=raw_response.status,
-            raw_body=await raw_response.text(),
+    def get_pool_stats(
+        self,
+        session: aiohttp.ClientSession,
+    ) -> Optional[ConnectionPoolStats]:
+        pool_waits = self._pool_waits.get(session, None)
+        if pool_waits is None:
+            return None
+
+        # aiohttp does not expose the number of used and idle connections of the pool publicly. The connector is
+        # detached from the session once the session is closed.
+        connector = session.connector
+        acquired = getattr(connector, "_acquired", ())
+        idle_connections = getattr(connector, "_conns", {})
+
+        return ConnectionPoolStats(
+            host=pool_waits.host,
+            max_connections=connector.limit if connector is not None else self.pool_config.max_connections,
+            in_use=len(acquired),
+            idle=sum(len(connections) for connections in idle_connections.values()),
+            waiting=pool_waits.waiting,
+            total_waits=pool_waits.total_waits,
+            total_wait_time=pool_waits.total_wait_time,
+            closed=session.closed,
         )
@@ -0,0 +1,2 @@
+from .async_job import AsyncJob
+from .batch_job import BatchJob
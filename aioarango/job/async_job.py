@@ -0,0 +1,152 @@
+from typing import Callable, Generic
+
+from aioarango.api_methods import JobMethods
+from aioarango.connection import Connection
+from aioarango.enums import AsyncJobStatus
+from aioarango.errors import ArangoServerError, AsyncJobResultError
+from aioarango.executor import DefaultAPIExecutor
+from aioarango.models import Response
+from aioarango.typings import T, Result
+
+
+class AsyncJob(Generic[T]):
+    """
+    Job for tracking and retrieving the result of an API request that was executed asynchronously on the server.
+    """
+
+    __slots__ = [
+        "_id",
+        "_response_handler",
+        "_job_api",
+    ]
+
+    def __init__(
+        self,
+        connection: Connection,
+        job_id: str,
+        response_handler: Callable[[Response], T],
+    ):
+        self._id = job_id
+        self._response_handler = response_handler
+        self._job_api = JobMethods(connection, DefaultAPIExecutor(connection))
+
+    def __repr__(self) -> str:
+        return f"<AsyncJob {self._id}>"
+
+    @property
+    def id(self) -> str:
+        """
+        Return the async job ID.
+
+        Returns
+        -------
+        str
+            Async job ID.
+
+        """
+        return self._id
+
+    async def status(self) -> Result[AsyncJobStatus]:
+        """
+        Return the async job status from the server.
+
+        Returns
+        -------
+        AsyncJobStatus
+            Status of the async job. It is `pending` if the job is still in the queue of the server or being executed,
+            and `done` if the job is finished and its result is ready to be fetched.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the job was not found, or its result was already fetched or deleted.
+
+        """
+        return await self._job_api.get_async_job_status(self._id)
+
+    async def result(self) -> T:
+        """
+        Return the async job result from the server. The result is deleted from the server once it is fetched.
+
+        Returns
+        -------
+        T
+            Result of the API request that was executed by this job.
+
+        Raises
+        ------
+        aioarango.errors.AsyncJobResultError
+            If the job is still pending.
+        aioarango.errors.ArangoServerError
+            If the job was not found, or its result was already fetched or deleted, or if the API request of the job
+            failed.
+
+        """
+        response = await self._job_api.get_async_job_result(self._id)
+        if response.status_code == 204:
+            raise AsyncJobResultError(f"job `{self._id}` is not done")
+
+        return self._response_handler(response)
+
+    async def cancel(
+        self,
+        ignore_missing: bool = False,
+    ) -> Result[bool]:
+        """
+        Cancel the async job if it is still pending.
+
+        Parameters
+        ----------
+        ignore_missing : bool, default : False
+            Do not raise an exception if the job was not found.
+
+        Returns
+        -------
+        bool
+            `True` if the cancellation was initiated, `False` if the job was not found and `ignore_missing` was set to
+            `True`.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the cancellation fails.
+
+        """
+        try:
+            return await self._job_api.cancel_async_job(self._id)
+        except ArangoServerError as e:
+            if e.http_code == 404 and ignore_missing:
+                return False
+
+            raise e
+
+    async def clear(
+        self,
+        ignore_missing: bool = False,
+    ) -> Result[bool]:
+        """
+        Delete the result of the async job from the server.
+
+        Parameters
+        ----------
+        ignore_missing : bool, default : False
+            Do not raise an exception if the job was not found.
+
+        Returns
+        -------
+        bool
+            `True` if the result was deleted, `False` if the job was not found and `ignore_missing` was set to `True`.
+
+        Raises
+        ------
+        aioarango.errors.ArangoServerError
+            If the deletion fails.
+
+        """
+        try:
+            return await self._job_api.delete_async_job_result(self._id)
+        except ArangoServerError as e:
+            if e.http_code == 404 and ignore_missing:
+                return False
+
+            raise e
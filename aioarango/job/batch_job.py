@@ -0,0 +1,136 @@
+import asyncio
+from typing import Callable, Generic, Generator, Any
+
+from aioarango.enums import BatchJobStatus
+from aioarango.errors import BatchJobResultError
+from aioarango.models import Request, Response
+from aioarango.typings import T
+
+
+class BatchJob(Generic[T]):
+    """
+    Job for tracking and retrieving the result of an API request that is sent to the server as a part of a batch
+    request. The job can be awaited to get its result once the batch is committed.
+    """
+
+    __slots__ = [
+        "_id",
+        "_request",
+        "_response_handler",
+        "_future",
+    ]
+
+    def __init__(
+        self,
+        job_id: str,
+        request: Request,
+        response_handler: Callable[[Response], T],
+    ):
+        self._id = job_id
+        self._request = request
+        self._response_handler = response_handler
+        self._future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def __repr__(self) -> str:
+        return f"<BatchJob {self._id}>"
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self._future.__await__()
+
+    @property
+    def id(self) -> str:
+        """
+        Return the batch job ID.
+
+        Returns
+        -------
+        str
+            Batch job ID.
+
+        """
+        return self._id
+
+    @property
+    def request(self) -> Request:
+        """
+        Return the HTTP request of the batch job.
+
+        Returns
+        -------
+        Request
+            HTTP request
+
+        """
+        return self._request
+
+    def status(self) -> BatchJobStatus:
+        """
+        Return the batch job status.
+
+        Returns
+        -------
+        BatchJobStatus
+            Status of the batch job. It is `pending` if the batch has not been committed yet, and `done` if the result
+            of the job is available.
+
+        """
+        return BatchJobStatus.DONE if self._future.done() else BatchJobStatus.PENDING
+
+    def result(self) -> T:
+        """
+        Return the batch job result.
+
+        Returns
+        -------
+        T
+            Result of the API request of this job.
+
+        Raises
+        ------
+        aioarango.errors.BatchJobResultError
+            If the batch has not been committed yet.
+        aioarango.errors.ArangoServerError
+            If the API request of the job failed.
+
+        """
+        if not self._future.done():
+            raise BatchJobResultError(f"result of job `{self._id}` is not available yet")
+
+        return self._future.result()
+
+    def set_response(
+        self,
+        response: Response,
+    ) -> None:
+        """
+        Process the response of the job's request and resolve the job with it.
+
+        Parameters
+        ----------
+        response : Response
+            HTTP response of the job's request
+
+        """
+        if self._future.done():
+            return
+
+        try:
+            self._future.set_result(self._response_handler(response))
+        except Exception as e:
+            self._future.set_exception(e)
+
+    def set_exception(
+        self,
+        exception: BaseException,
+    ) -> None:
+        """
+        Resolve the job with an exception.
+
+        Parameters
+        ----------
+        exception : BaseException
+            Exception to resolve the job with
+
+        """
+        if not self._future.done():
+            self._future.set_exception(exception)
@@ -8,16 +8,20 @@ __all__ = [
     "CollectionFigures",
     "Indexes",
     "CollectionShardInfo",
+    "ConnectionPoolConfig",
+    "ConnectionPoolStats",
     "ComputedValue",
     "CursorStats",
     "DatabaseInfo",
     "EdgeDefinition",
     "GraphInfo",
+    "ImportResult",
     "KeyOptions",
     "QueryOptimizerRuleFlags",
     "QueryOptimizerRule",
     "Request",
     "Response",
+    "TransactionInfo",
     "User",
     "BaseArangoIndex",
     "EdgeIndex",
@@ -41,13 +45,17 @@ from .arango_collection import ArangoCollection
 from .collection_figures import CollectionFigures, Indexes
 from .collection_shard_info import CollectionShardInfo
 from .computed_value import ComputedValue
+from .connection_pool_config import ConnectionPoolConfig
+from .connection_pool_stats import ConnectionPoolStats
 from .cursor_stats import CursorStats
 from .database_info import DatabaseInfo
 from .edge_definition import EdgeDefinition
 from .graph_info import GraphInfo
+from .import_result import ImportResult
 from .index import *
 from .key_options import KeyOptions
 from .query_optimizer_rule import QueryOptimizerRuleFlags, QueryOptimizerRule
 from .request import Request
 from .response import Response
+from .transaction_info import TransactionInfo
 from .user import User
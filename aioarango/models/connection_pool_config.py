@@ -0,0 +1,37 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ConnectionPoolConfig(BaseModel):
+    """
+    Configuration of the HTTP connection pools used for connecting to the ArangoDB hosts. Every host has its own pool.
+
+    Attributes
+    ----------
+    max_connections : int, default : 100
+        Maximum number of simultaneous connections to each host. `0` means there is no limit.
+    keepalive_timeout : float, default : 15.0
+        Number of seconds an idle connection is kept open in the pool before it is closed.
+    dns_cache_ttl : int, optional, default : 10
+        Number of seconds the resolved addresses of the hosts are cached. `None` caches them forever.
+    pool_timeout : float, optional
+        Maximum number of seconds to wait for a free connection of the pool, including the time it takes to open a
+        new connection. `None` waits forever.
+    connect_timeout : float, optional, default : 10.0
+        Maximum number of seconds it may take to open a new connection to a host.
+    read_timeout : float, optional
+        Maximum number of seconds to wait for the server to send data of a response. If it is not set, the
+        `request_timeout` of the client is used, and there is no limit if that is not set either.
+    total_timeout : float, optional
+        Maximum number of seconds a whole request, including waiting for a connection and reading the response,
+        may take. `None` means there is no limit.
+    """
+
+    max_connections: int = 100
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: Optional[int] = 10
+    pool_timeout: Optional[float] = None
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = None
+    total_timeout: Optional[float] = None
@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+
+
+class ConnectionPoolStats(BaseModel):
+    """
+    Statistics of the HTTP connection pool of a host.
+
+    Attributes
+    ----------
+    host : str
+        URL of the host.
+    max_connections : int
+        Maximum number of simultaneous connections to the host. `0` means there is no limit.
+    in_use : int
+        Number of connections that are currently used by requests.
+    idle : int
+        Number of open connections that are kept alive in the pool for later requests.
+    waiting : int
+        Number of requests that are currently waiting for a free connection.
+    total_waits : int
+        Number of requests that had to wait for a free connection since the pool was created.
+    total_wait_time : float
+        Total number of seconds requests have waited for a free connection since the pool was created.
+    closed : bool
+        Whether the pool is closed.
+    """
+
+    host: str
+    max_connections: int
+    in_use: int
+    idle: int
+    waiting: int
+    total_waits: int
+    total_wait_time: float
+    closed: bool
+
+    def is_exhausted(self) -> bool:
+        """
+        Check whether all the connections of the pool are in use and requests are waiting for a free connection.
+
+        Returns
+        -------
+        bool
+            Whether the pool is exhausted or not.
+        """
+        return self.waiting > 0
@@ -0,0 +1,57 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class ImportResult(BaseModel):
+    """
+    Result of a bulk import.
+
+    Attributes
+    ----------
+    created : int
+        Number of documents imported.
+    errors : int
+        Number of documents that were not imported due to an error.
+    empty : int
+        Number of empty lines found in the input. Only greater than zero for JSON lines input.
+    updated : int
+        Number of updated or replaced documents, in case `onDuplicate` was set to either `update` or `replace`.
+    ignored : int
+        Number of failed but ignored insert operations, in case `onDuplicate` was set to `ignore`.
+    details : list of str
+        Detailed error messages, if `details` was requested.
+    """
+
+    created: int = Field(default=0)
+    errors: int = Field(default=0)
+    empty: int = Field(default=0)
+    updated: int = Field(default=0)
+    ignored: int = Field(default=0)
+    details: List[str] = Field(default_factory=list)
+
+    def merge(
+        self,
+        other: "ImportResult",
+    ) -> "ImportResult":
+        """
+        Add the counters and details of another import result to this one.
+
+        Parameters
+        ----------
+        other : ImportResult
+            Import result to add
+
+        Returns
+        -------
+        ImportResult
+            This import result
+        """
+        self.created += other.created
+        self.errors += other.errors
+        self.empty += other.empty
+        self.updated += other.updated
+        self.ignored += other.ignored
+        self.details.extend(other.details)
+
+        return self
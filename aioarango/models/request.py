@@ -17,6 +17,7 @@ class Request(BaseModel):
     params: Optional[Params]  # URL parameters.
     data: Optional[Any]  # Request payload.
     deserialize: bool = True  # Whether the response body can be deserialized.
+    timeout: Optional[float] = None  # Maximum number of seconds the request may take.
 
     read: Optional[Fields] = None  # Name(s) of collections read during transaction.
     write: Optional[Fields] = None  # Name(s) of collections written to during transaction with shared access.
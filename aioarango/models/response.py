@@ -1,27 +1,71 @@
 from typing import MutableMapping, Union, Optional
 
-from pydantic import BaseModel, Field
-
 from aioarango.enums import MethodType
 from aioarango.errors import error_ref
 from aioarango.errors.error_ref import Error, empty_error
 
 
-class Response(BaseModel):
-    method: MethodType
-    url: str
-    headers: MutableMapping[str, str]
-    status_code: int
-    # status_text = str
-    raw_body: str
-
-    # populated later
-    body: Union[str, bool, int, float, list, dict, None] = Field(default=None)
-    arango_error: Error = Field(default=empty_error)
-    http_error: Error = Field(default=empty_error)
-    error_code: Optional[int] = Field(default=None)
-    error_message: Optional[str] = Field(default=None)
-    is_success: Optional[bool] = Field(default=None)
+class Response:
+    """
+    HTTP response.
+
+    This is a plain `__slots__` class instead of a pydantic model, so the (possibly large) raw body of the response
+    is neither copied nor validated before it is deserialized.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "headers",
+        "status_code",
+        "raw_body",
+        "body",
+        "arango_error",
+        "http_error",
+        "error_code",
+        "error_message",
+        "is_success",
+    )
+
+    def __init__(
+        self,
+        method: MethodType,
+        url: str,
+        headers: MutableMapping[str, str],
+        status_code: int,
+        raw_body: Union[bytes, str],
+    ):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.status_code = status_code
+        self.raw_body = raw_body
+
+        # populated later
+        self.body: Union[str, bool, int, float, list, dict, None] = None
+        self.arango_error: Error = empty_error
+        self.http_error: Error = empty_error
+        self.error_code: Optional[int] = None
+        self.error_message: Optional[str] = None
+        self.is_success: Optional[bool] = None
+
+    def __repr__(self) -> str:
+        return f"<Response {self.method.value} {self.url} [{self.status_code}]>"
+
+    @property
+    def text(self) -> str:
+        """
+        Return the raw body of the response decoded as a string.
+
+        Returns
+        -------
+        str
+            Decoded raw body of the response.
+        """
+        if isinstance(self.raw_body, (bytes, bytearray, memoryview)):
+            return bytes(self.raw_body).decode("utf-8", errors="replace")
+
+        return self.raw_body
 
     def lazy_load(
         self,
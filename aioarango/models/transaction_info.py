@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from aioarango.enums import TransactionStatus
+
+
+class TransactionInfo(BaseModel):
+    """
+    Stream transaction information.
+
+    Attributes
+    ----------
+    id : str
+        ID of the transaction.
+    status : TransactionStatus
+        Status of the transaction. It can be either `running`, `committed` or `aborted`.
+    """
+
+    id: str
+    status: TransactionStatus
@@ -1,5 +1,6 @@
 __all__ = [
     "BaseHostResolver",
+    "HealthAwareHostResolver",
     "RandomHostResolver",
     "RoundRobinHostResolver",
     "SingleHostResolver",
@@ -9,12 +10,14 @@ __all__ = [
 from typing import Union
 
 HostResolver = Union[
+    "HealthAwareHostResolver",
     "RandomBaseHostResolver",
     "RoundRobinBaseHostResolver",
     "SingleBaseHostResolver",
 ]
 
 from .base_resolver import BaseHostResolver
+from .health_aware_host_resolver import HealthAwareHostResolver
 from .random_host_resolver import RandomHostResolver
 from .round_robin_resolver import RoundRobinHostResolver
 from .single_host_resolver import SingleHostResolver
@@ -35,3 +35,38 @@ class BaseHostResolver(BaseModel, ABC):
         indexes_to_filter: Optional[Set[int]] = None,
     ) -> int:
         raise NotImplementedError
+
+    def mark_request_started(
+        self,
+        host_index: int,
+    ) -> None:
+        """
+        Notify the resolver that a request is being sent to the host with the given index.
+
+        Parameters
+        ----------
+        host_index : int
+            Index of the host.
+        """
+        pass
+
+    def mark_request_finished(
+        self,
+        host_index: int,
+        latency: float,
+        success: Optional[bool],
+    ) -> None:
+        """
+        Notify the resolver that a request sent to the host with the given index is finished.
+
+        Parameters
+        ----------
+        host_index : int
+            Index of the host.
+        latency : float
+            Number of seconds it took for the request to finish.
+        success : bool, optional
+            Whether the host handled the request successfully or not. `None` means the request was cancelled by the
+            client, so it does not tell anything about the health of the host.
+        """
+        pass
@@ -0,0 +1,222 @@
+import logging
+import math
+import random
+import time
+from typing import Optional, Set, List
+
+from pydantic import Field, PrivateAttr
+
+from aioarango.enums import CircuitState
+from aioarango.resolver import BaseHostResolver
+
+
+class HostHealth:
+    """
+    Health of a host as seen by the client.
+    """
+
+    __slots__ = (
+        "latency",
+        "last_sample_at",
+        "error_rate",
+        "in_flight",
+        "request_count",
+        "consecutive_failures",
+        "state",
+        "open_timeout",
+        "retry_at",
+        "probing",
+    )
+
+    def __init__(
+        self,
+        open_timeout: float,
+    ):
+        self.latency: Optional[float] = None
+        self.last_sample_at = 0.0
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.request_count = 0
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+        self.open_timeout = open_timeout
+        self.retry_at = 0.0
+        self.probing = False
+
+    def load(
+        self,
+        now: float,
+        decay_time: float,
+    ) -> float:
+        """
+        Return the expected time it takes for this host to handle one more request.
+
+        Parameters
+        ----------
+        now : float
+            Current value of the monotonic clock.
+        decay_time : float
+            Number of seconds it takes for the latency of a host that has not received any requests to decay by a
+            factor of `e`. This makes sure a host that was slow once gets requests again later on.
+
+        Returns
+        -------
+        float
+            Expected latency of the host multiplied by the number of requests it would be handling.
+        """
+        if self.latency is None:
+            return 0.0
+
+        latency = self.latency * math.exp(-max(now - self.last_sample_at, 0.0) / decay_time)
+        return (self.in_flight + 1) * latency
+
+
+class HealthAwareHostResolver(BaseHostResolver):
+    """
+    Latency-aware host resolver.
+
+    The resolver keeps an exponentially weighted moving average (EWMA) of the latency and the error rate of every host.
+    Every request is sent to the less loaded of two randomly chosen healthy hosts ("power of two choices"), where the
+    load of a host is its latency multiplied by the number of requests it would be handling. The latency of a host that
+    does not receive any requests decays over **latency_decay_time** seconds, so it is measured again from time to time.
+
+    Every host has a circuit breaker. A host is ejected (the circuit is opened) after **failure_threshold**
+    consecutive failures, or when its error rate reaches **error_rate_threshold** after at least **min_requests**
+    requests. An ejected host does not receive any requests for **open_timeout** seconds, after that, a single request
+    is sent to it as a probe (the circuit is half-open). The host is taken back in if the probe succeeds, otherwise, it
+    is ejected again for twice as long, up to **max_open_timeout** seconds.
+    """
+
+    latency_alpha: float = Field(default=0.3, gt=0, le=1)
+    error_rate_alpha: float = Field(default=0.1, gt=0, le=1)
+    failure_threshold: int = Field(default=5, gt=0)
+    error_rate_threshold: float = Field(default=0.5, gt=0, le=1)
+    min_requests: int = Field(default=20, ge=0)
+    open_timeout: float = Field(default=5.0, gt=0)
+    max_open_timeout: float = Field(default=60.0, gt=0)
+    latency_decay_time: float = Field(default=10.0, gt=0)
+
+    _hosts: List[HostHealth] = PrivateAttr(default_factory=list)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._hosts = [HostHealth(self.open_timeout) for _ in range(self.host_count)]
+
+    def get_host_health(
+        self,
+        host_index: int,
+    ) -> HostHealth:
+        """
+        Return the health of the host with the given index.
+
+        Parameters
+        ----------
+        host_index : int
+            Index of the host.
+
+        Returns
+        -------
+        HostHealth
+            Health of the host.
+        """
+        return self._hosts[host_index]
+
+    def get_host_index(
+        self,
+        indexes_to_filter: Optional[Set[int]] = None,
+    ) -> int:
+        indexes_to_filter = indexes_to_filter or set()
+        now = time.monotonic()
+
+        indexes = [index for index in range(self.host_count) if index not in indexes_to_filter]
+        if not indexes:
+            indexes = list(range(self.host_count))
+
+        healthy_indexes = []
+        for index in indexes:
+            host = self._hosts[index]
+            if host.state == CircuitState.OPEN and now >= host.retry_at:
+                host.state = CircuitState.HALF_OPEN
+                host.probing = False
+
+            if host.state == CircuitState.HALF_OPEN and not host.probing:
+                # send a single probe to the ejected host before taking it back in
+                host.probing = True
+                return index
+
+            if host.state == CircuitState.CLOSED:
+                healthy_indexes.append(index)
+
+        if not healthy_indexes:
+            # every host is ejected, use the one that is going to be probed first instead of failing the request
+            return min(indexes, key=lambda index: self._hosts[index].retry_at)
+
+        if len(healthy_indexes) == 1:
+            return healthy_indexes[0]
+
+        first_index, second_index = random.sample(healthy_indexes, 2)
+        first_load = self._hosts[first_index].load(now, self.latency_decay_time)
+        second_load = self._hosts[second_index].load(now, self.latency_decay_time)
+
+        return second_index if second_load < first_load else first_index
+
+    def mark_request_started(
+        self,
+        host_index: int,
+    ) -> None:
+        self._hosts[host_index].in_flight += 1
+
+    def mark_request_finished(
+        self,
+        host_index: int,
+        latency: float,
+        success: Optional[bool],
+    ) -> None:
+        host = self._hosts[host_index]
+        host.in_flight = max(host.in_flight - 1, 0)
+
+        if success is None:
+            if host.state == CircuitState.HALF_OPEN:
+                host.probing = False
+            return
+
+        if host.latency is None:
+            host.latency = latency
+        else:
+            host.latency = self.latency_alpha * latency + (1 - self.latency_alpha) * host.latency
+        host.last_sample_at = time.monotonic()
+        host.error_rate = self.error_rate_alpha * (0.0 if success else 1.0) + (1 - self.error_rate_alpha) * host.error_rate
+        host.request_count += 1
+
+        if success:
+            host.consecutive_failures = 0
+            if host.state == CircuitState.HALF_OPEN:
+                logging.info(f"Host #{host_index} is healthy again")
+                host.state = CircuitState.CLOSED
+                host.probing = False
+                host.open_timeout = self.open_timeout
+                host.error_rate = 0.0
+                host.request_count = 0
+            return
+
+        host.consecutive_failures += 1
+        if host.state == CircuitState.HALF_OPEN:
+            self._open(host_index, min(host.open_timeout * 2, self.max_open_timeout))
+        elif host.state == CircuitState.CLOSED:
+            if host.consecutive_failures >= self.failure_threshold or (
+                host.request_count >= self.min_requests and host.error_rate >= self.error_rate_threshold
+            ):
+                self._open(host_index, self.open_timeout)
+
+    def _open(
+        self,
+        host_index: int,
+        open_timeout: float,
+    ) -> None:
+        host = self._hosts[host_index]
+
+        logging.warning(f"Host #{host_index} is ejected for {open_timeout} seconds")
+        host.state = CircuitState.OPEN
+        host.probing = False
+        host.open_timeout = open_timeout
+        host.retry_at = time.monotonic() + open_timeout
@@ -0,0 +1,42 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, List, TypeVar, Union
+
+T = TypeVar("T")
+
+
+async def iter_chunks(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    chunk_size: int,
+) -> AsyncIterator[List[T]]:
+    """
+    Split the items of an iterable or async iterable into chunks lazily.
+
+    Parameters
+    ----------
+    items : iterable or async iterable
+        Items to split.
+    chunk_size : int
+        Maximum number of items in each chunk.
+
+    Yields
+    ------
+    list
+        Chunk of the items. Only the last chunk can have less than `chunk_size` items.
+
+    """
+    chunk: List[T] = []
+
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
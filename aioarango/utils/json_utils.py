@@ -0,0 +1,48 @@
+from json import dumps, loads
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize the given object to a JSON string.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to serialize.
+
+    Returns
+    -------
+    str
+        Serialized JSON string.
+    """
+    return dumps(obj)
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize the given JSON document. `orjson` is used when it is installed, since it parses directly from the
+    buffer without decoding it to a `str` first, otherwise, the standard library `json` module is used.
+
+    Parameters
+    ----------
+    data : bytes or bytearray or memoryview or str
+        JSON document to deserialize.
+
+    Returns
+    -------
+    Any
+        Deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    return loads(data)
@@ -0,0 +1,199 @@
+"""
+Benchmark the client side throughput of aioarango cursors.
+
+The HTTP layer is replaced by an in-memory client that serves pre-built cursor batches, so the numbers only reflect
+the time spent by aioarango in reading, decoding and iterating over the responses, not the server or the network.
+
+The `legacy` pipeline reproduces how responses were handled before: the body is decoded to a `str`, validated by a
+pydantic `Response` model and then parsed with the standard library `json` module. The `current` pipeline reads the
+body as `bytes` and parses it directly with the default deserializer (`orjson` when it is installed).
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/cursor_throughput.py --documents 200000 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, MutableMapping, Optional, Union
+
+from aiohttp import BasicAuth, ClientSession
+from pydantic import BaseModel, Field
+
+from aioarango.api import StandardDatabase
+from aioarango.connection import BasicConnection
+from aioarango.enums import MethodType
+from aioarango.http_client import BaseHTTPClient
+from aioarango.models import Response
+from aioarango.resolver import SingleHostResolver
+from aioarango.utils import json_utils
+
+
+class LegacyResponse(BaseModel):
+    method: MethodType
+    url: str
+    headers: MutableMapping[str, str]
+    status_code: int
+    raw_body: str
+
+    body: Union[str, bool, int, float, list, dict, None] = Field(default=None)
+    error_code: Optional[int] = Field(default=None)
+    error_message: Optional[str] = Field(default=None)
+    is_success: Optional[bool] = Field(default=None)
+
+
+class InMemoryCursorHTTPClient(BaseHTTPClient):
+    """
+    HTTP client serving the batches of a single cursor from memory.
+    """
+
+    def __init__(
+        self,
+        document_count: int,
+        batch_size: int,
+        legacy: bool = False,
+    ):
+        self.legacy = legacy
+        self.batches = []
+
+        batch_count = (document_count + batch_size - 1) // batch_size
+        for batch_index in range(batch_count):
+            start = batch_index * batch_size
+            has_more = batch_index < batch_count - 1
+            body = {
+                "result": [
+                    {
+                        "_key": str(key),
+                        "_id": f"audios/{key}",
+                        "_rev": "_fake_rev",
+                        "title": f"audio title {key}",
+                        "performer": f"performer {key % 1000}",
+                        "duration": key % 600,
+                        "file_size": key * 1024,
+                        "valid_for_inline_search": True,
+                        "tags": ["music", "audio", str(key % 7)],
+                    }
+                    for key in range(start, min(start + batch_size, document_count))
+                ],
+                "hasMore": has_more,
+                "id": "1" if has_more else None,
+                "cached": False,
+                "error": False,
+                "code": 201 if batch_index == 0 else 200,
+            }
+            self.batches.append(json.dumps(body).encode("utf-8"))
+
+        self._next_batch = 0
+
+    def create_session(
+        self,
+        host: str,
+        request_timeout: Optional[int] = None,
+    ) -> Optional[ClientSession]:
+        return None
+
+    async def send_request(
+        self,
+        session: ClientSession,
+        method_type: MethodType,
+        url: str,
+        headers=None,
+        params=None,
+        data=None,
+        auth: Optional[BasicAuth] = None,
+        timeout: Optional[float] = None,
+    ) -> Response:
+        if method_type == MethodType.POST:
+            self._next_batch = 0
+
+        raw_body = self.batches[self._next_batch]
+        self._next_batch += 1
+
+        if self.legacy:
+            legacy_response = LegacyResponse(
+                method=method_type,
+                url=url,
+                headers={"content-type": "application/json"},
+                status_code=200,
+                raw_body=raw_body.decode("utf-8"),
+            )
+            return Response(
+                method=legacy_response.method,
+                url=legacy_response.url,
+                headers=legacy_response.headers,
+                status_code=legacy_response.status_code,
+                raw_body=legacy_response.raw_body,
+            )
+
+        return Response(
+            method=method_type,
+            url=url,
+            headers={"content-type": "application/json"},
+            status_code=200,
+            raw_body=raw_body,
+        )
+
+
+def make_database(
+    http_client: InMemoryCursorHTTPClient,
+    deserializer: Callable[[Union[bytes, str]], Any],
+) -> StandardDatabase:
+    return StandardDatabase(
+        BasicConnection(
+            hosts=["http://127.0.0.1:8529"],
+            host_resolver=SingleHostResolver(host_count=1, max_tries=1),
+            sessions=[None],
+            db_name="benchmark",
+            http_client=http_client,
+            serializer=json_utils.json_dumps,
+            deserializer=deserializer,
+            username="root",
+            password="",
+        )
+    )
+
+
+async def run_pipeline(
+    name: str,
+    db: StandardDatabase,
+    rounds: int,
+) -> None:
+    best = None
+    document_count = 0
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        document_count = 0
+        async with await db.aql.execute("FOR doc IN audios RETURN doc") as cursor:
+            async for _doc in cursor:
+                document_count += 1
+        elapsed = time.perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"{name:<10} {document_count:>10} docs  {best:8.3f} s  {document_count / best:>12,.0f} docs/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"orjson available: {json_utils.orjson is not None}")
+
+    await run_pipeline(
+        "legacy",
+        make_database(InMemoryCursorHTTPClient(args.documents, args.batch_size, legacy=True), json.loads),
+        args.rounds,
+    )
+    await run_pipeline(
+        "current",
+        make_database(InMemoryCursorHTTPClient(args.documents, args.batch_size), json_utils.json_loads),
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
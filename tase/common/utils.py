@@ -1,10 +1,8 @@
-import asyncio
 import collections
 import gettext
 import hashlib
 import json
 import os
-import random
 import re
 import secrets
 import time
@@ -513,7 +511,7 @@ async def download_audio_thumbnails(
         try:
             logger.debug(f"Triggered a thumbnail download for message ID: {message.id}")
 
-            binary_downloaded_thumb_file = await telegram_client._client.download_media(
+            binary_downloaded_thumb_file = await telegram_client.download_media(
                 telegram_thumbnail.file_id,
                 in_memory=True,
                 block=True,
@@ -556,9 +554,6 @@ async def download_audio_thumbnails(
             else:
                 thumbs_download_failed = True
 
-        # Sleep for a while to avoid flood wait errors
-        await asyncio.sleep(random.randint(4, 6))
-
     if thumbs_download_failed:
         await revert_actions()
         logger.error("Could not upload audio thumbnails!")
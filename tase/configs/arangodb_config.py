@@ -1,3 +1,5 @@
+from typing import Optional
+
 from .base_config import BaseConfig
 
 
@@ -7,3 +9,13 @@ class ArangoDBConfig(BaseConfig):
     db_username: str
     db_password: str
     graph_name: str
+
+    max_connections: int = 100
+    keepalive_timeout: float = 15.0
+    connect_timeout: float = 10.0
+    # no limit by default, since the job and migration queries on the large collections can run for a long time
+    request_timeout: Optional[int] = None
+    compress_requests: bool = False
+
+    # number of days the hits that have never been used are kept before they are archived
+    unused_hit_retention_days: int = 30
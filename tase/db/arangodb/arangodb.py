@@ -4,8 +4,10 @@ from pydantic import BaseModel
 
 from aioarango import ArangoClient
 from aioarango.api import StandardDatabase, Graph, AQL
-from aioarango.models import GraphInfo, EdgeDefinition
+from aioarango.enums import HostResolverType, ContentEncoding
+from aioarango.models import GraphInfo, EdgeDefinition, ConnectionPoolConfig
 from tase.configs import ArangoDBConfig
+from tase.db.arangodb.base import BaseCollectionDocument
 from tase.db.arangodb.graph.vertices import vertex_classes
 from .document import document_classes
 from .graph.edges import edge_classes
@@ -28,7 +30,17 @@ class ArangoDB(
         update_indexes: bool = False,
     ):
         # Initialize the client for ArangoDB.
-        self.arango_client = ArangoClient(hosts=arangodb_config.db_host_url)
+        self.arango_client = ArangoClient(
+            hosts=arangodb_config.db_host_url,
+            host_resolver_type=HostResolverType.HEALTH_AWARE,
+            request_timeout=arangodb_config.request_timeout,
+            compression=ContentEncoding.GZIP if arangodb_config.compress_requests else None,
+            pool_config=ConnectionPoolConfig(
+                max_connections=arangodb_config.max_connections,
+                keepalive_timeout=arangodb_config.keepalive_timeout,
+                connect_timeout=arangodb_config.connect_timeout,
+            ),
+        )
         sys_db = await self.arango_client.db(
             "_system",
             username=arangodb_config.db_username,
@@ -47,6 +59,8 @@ class ArangoDB(
         )
 
         self.aql = self.db.aql
+        BaseCollectionDocument.__db__ = self.db
+        BaseCollectionDocument.__async_db__ = self.db.begin_async_execution(return_result=False)
 
         if not await self.db.has_graph(arangodb_config.graph_name):
             self.graph = await self.db.create_graph(GraphInfo(name=arangodb_config.graph_name))
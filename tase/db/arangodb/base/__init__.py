@@ -6,3 +6,5 @@ from .base_collection_document import (
     BaseCollectionAttributes,
 )
 from .base_soft_deletable_document import BaseSoftDeletableDocument
+from .batch import arangodb_batch
+from .transaction import arangodb_transaction
@@ -1,14 +1,23 @@
 import asyncio
+from contextvars import ContextVar
 from enum import Enum
 from itertools import chain
-from typing import Dict, Optional, Any, Type, Union, Tuple, TypeVar, List, Generator
+from typing import Dict, Optional, Any, Type, Union, Tuple, TypeVar, List, Generator, Sequence, Iterable, AsyncIterable, AsyncIterator, AsyncGenerator
 
 from pydantic import BaseModel, Field, ValidationError
 
-from aioarango.api import VertexCollection, EdgeCollection, StandardCollection, AQL, Cursor
-from aioarango.enums import IndexType
-from aioarango.errors import ArangoServerError, DocumentRevisionMisMatchError, DocumentRevisionMatchError, CursorCountError, CollectionUniqueConstraintViolated
-from aioarango.models.index import PersistentIndex
+from aioarango.api import VertexCollection, EdgeCollection, StandardCollection, AQL, Cursor, StandardDatabase, TransactionDatabase, AsyncDatabase, BatchDatabase
+from aioarango.enums import IndexType, ImportOnDuplicate
+from aioarango.errors import (
+    ArangoServerError,
+    DocumentRevisionMisMatchError,
+    DocumentRevisionMatchError,
+    CursorCountError,
+    CollectionUniqueConstraintViolated,
+    ErrorType,
+)
+from aioarango.models import ImportResult
+from aioarango.models.index import PersistentIndex, TTLIndex
 from aioarango.typings import ArangoIndex, Result
 from tase.common.utils import get_now_timestamp
 from tase.errors import NotSoftDeletableSubclass, NotBaseCollectionDocumentInstance
@@ -17,6 +26,12 @@ from tase.my_logger import logger
 TBaseCollectionDocument = TypeVar("TBaseCollectionDocument", bound="BaseCollectionDocument")
 TBaseCollectionAttributes = TypeVar("TBaseCollectionAttributes", bound="BaseCollectionAttributes")
 
+# stream transaction that the database operations of the current context are executed in, if there is one.
+current_transaction_db: ContextVar[Optional[TransactionDatabase]] = ContextVar("current_transaction_db", default=None)
+
+# batch that the concurrent database operations of the current context are sent in, if there is one.
+current_batch_db: ContextVar[Optional[BatchDatabase]] = ContextVar("current_batch_db", default=None)
+
 
 class ToGraphBaseProcessor(BaseModel):
     @classmethod
@@ -284,6 +299,8 @@ class BaseCollectionDocument(BaseCollectionAttributes):
     __collection__: Optional[Union[VertexCollection, EdgeCollection, StandardCollection]]
     __aql__: Optional[AQL]
     __graph_name__: Optional[str]
+    __db__: Optional[StandardDatabase]
+    __async_db__: Optional[AsyncDatabase]
 
     id: Optional[str]
     key: Optional[str]
@@ -295,6 +312,47 @@ class BaseCollectionDocument(BaseCollectionAttributes):
     class Config:
         arbitrary_types_allowed = True
 
+    @classmethod
+    def _get_collection(cls) -> Union[VertexCollection, EdgeCollection, StandardCollection]:
+        """
+        Return the collection API wrapper of this document class. If the current context is running inside a stream
+        transaction, the returned wrapper executes its requests inside that transaction, otherwise, if it is running
+        inside a batch, the requests of the returned wrapper are sent in that batch.
+
+        Returns
+        -------
+        VertexCollection or EdgeCollection or StandardCollection
+            Collection API wrapper
+        """
+        db = current_transaction_db.get() or current_batch_db.get()
+        if db is None:
+            return cls.__collection__
+
+        if isinstance(cls.__collection__, VertexCollection):
+            return db.graph(cls.__graph_name__).vertex_collection(cls.__collection__.name)
+        elif isinstance(cls.__collection__, EdgeCollection):
+            return db.graph(cls.__graph_name__).edge_collection(cls.__collection__.name)
+        else:
+            return db.collection(cls.__collection__.name)
+
+    @classmethod
+    def _get_aql(cls) -> AQL:
+        """
+        Return the AQL API wrapper. If the current context is running inside a stream transaction, the returned
+        wrapper executes its queries inside that transaction, otherwise, if it is running inside a batch, the queries
+        of the returned wrapper are sent in that batch.
+
+        Returns
+        -------
+        AQL
+            AQL API wrapper
+        """
+        db = current_transaction_db.get() or current_batch_db.get()
+        if db is None:
+            return cls.__aql__
+
+        return db.aql
+
     @classmethod
     async def update_indexes(cls):
         """
@@ -323,9 +381,15 @@ class BaseCollectionDocument(BaseCollectionAttributes):
                     logger.info(f"Adding index `{index.name}` to `{cls.__collection__.name}` collection")
                     await cls.__collection__.add_index(index)
                 else:
-                    if current_index_mapping[index.name].custom_version != index.custom_version:
+                    current_index = current_index_mapping[index.name]
+                    if current_index.custom_version != index.custom_version or (
+                        # the expiry time of a TTL index can be changed without changing its version
+                        isinstance(index, TTLIndex)
+                        and current_index.type == IndexType.TTL
+                        and current_index.expiry_time != index.expiry_time
+                    ):
                         logger.info(f"Updating index `{index.name}` in `{cls.__collection__.name}` collection")
-                        await cls.__collection__.delete_index(current_index_mapping[index.name].id, ignore_missing=True)
+                        await cls.__collection__.delete_index(current_index.id, ignore_missing=True)
                         await cls.__collection__.add_index(index)
 
             except Exception as e:
@@ -362,7 +426,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             if graph_doc is None:
                 return None, False
 
-            metadata = await cls.__collection__.insert(graph_doc)
+            metadata = await cls._get_collection().insert(graph_doc)
             doc._update_metadata(metadata)
         except CollectionUniqueConstraintViolated:
             # A unique constraint in this collection has been violated; document key or an unique index.
@@ -401,7 +465,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             return None
 
         try:
-            graph_doc = await cls.__collection__.get(doc_key)
+            graph_doc = await cls._get_collection().get(doc_key)
             return cls.from_collection(graph_doc)
         except DocumentRevisionMisMatchError as e:
             logger.exception(e)
@@ -437,7 +501,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             return None
 
         try:
-            return await cls.__collection__.has(doc_key)
+            return await cls._get_collection().has(doc_key)
         except DocumentRevisionMisMatchError as e:
             # If revisions mismatch.
             caught_error = True
@@ -500,7 +564,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
                 raise NotSoftDeletableSubclass(cls.__name__)
 
         try:
-            async with await cls.__collection__.find(
+            async with await cls._get_collection().find(
                 filters,
                 skip=offset,
                 limit=limit,
@@ -620,7 +684,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
         successful = False
         key = doc.key if isinstance(doc, BaseCollectionDocument) else doc
         try:
-            successful = await cls.__collection__.delete(
+            successful = await cls._get_collection().delete(
                 key,
                 ignore_missing=True,
                 check_for_revisions_match=False,  # fixme
@@ -690,7 +754,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
 
             graph_doc["modified_at"] = get_now_timestamp()
 
-            metadata = await self.__collection__.update(
+            metadata = await self._get_collection().update(
                 graph_doc,
                 check_for_revisions_match=check_for_revisions_match,
                 wait_for_sync=wait_for_sync,
@@ -797,7 +861,7 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             if graph_doc is None:
                 return None, False
 
-            metadata = await cls.__collection__.replace(graph_doc)
+            metadata = await cls._get_collection().replace(graph_doc)
             doc._update_metadata(metadata)
         except DocumentRevisionMisMatchError as e:
             # The expected and actual document revisions mismatched.
@@ -812,6 +876,390 @@ class BaseCollectionDocument(BaseCollectionAttributes):
 
         return doc, successful
 
+    @classmethod
+    async def insert_many(
+        cls: Type[TBaseCollectionDocument],
+        docs: Sequence[TBaseCollectionDocument],
+    ) -> List[Tuple[Optional[TBaseCollectionDocument], bool]]:
+        """
+        Insert multiple objects into the ArangoDB in one request
+
+        Parameters
+        ----------
+        docs : Sequence[TBaseCollectionDocument]
+            Objects to insert into the ArangoDB
+
+        Returns
+        -------
+        list
+            List of tuples in the same order as `docs`. Each tuple contains the document object with returned metadata
+            from ArangoDB and `True` if inserting that document was successful, otherwise `None` and `False`.
+        """
+        results: List[Tuple[Optional[TBaseCollectionDocument], bool]] = [(None, False)] * len(docs)
+
+        indices = []
+        graph_docs = []
+        for idx, doc in enumerate(docs):
+            graph_doc = doc.to_collection() if doc is not None else None
+            if graph_doc is not None:
+                indices.append(idx)
+                graph_docs.append(graph_doc)
+
+        if not graph_docs:
+            return results
+
+        try:
+            response = await cls._get_collection().insert_many(graph_docs)
+        except ArangoServerError as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        except Exception as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        else:
+            for idx, metadata_or_error in zip(indices, response):
+                doc = docs[idx]
+                if isinstance(metadata_or_error, ArangoServerError):
+                    if metadata_or_error.arango_error.type == ErrorType.ARANGO_UNIQUE_CONSTRAINT_VIOLATED:
+                        logger.error(f"[CollectionUniqueConstraintViolated] => {doc.id}")
+                    else:
+                        logger.error(f"{cls.__name__} : {metadata_or_error}")
+                    results[idx] = (doc, False)
+                else:
+                    doc._update_metadata(metadata_or_error)
+                    results[idx] = (doc, True)
+
+        return results
+
+    @classmethod
+    async def get_many(
+        cls: Type[TBaseCollectionDocument],
+        doc_keys: Sequence[str],
+    ) -> List[Optional[TBaseCollectionDocument]]:
+        """
+        Get multiple documents in a collection by their `Key` in one request
+
+        Parameters
+        ----------
+        doc_keys : Sequence[str]
+            Keys of the documents in the collection
+
+        Returns
+        -------
+        list
+            List of documents in the same order as `doc_keys`. Documents that do not exist in the collection or could
+            not be retrieved are `None`.
+        """
+        results: List[Optional[TBaseCollectionDocument]] = [None] * len(doc_keys)
+
+        indices = [idx for idx, doc_key in enumerate(doc_keys) if doc_key]
+        if not indices:
+            return results
+
+        try:
+            response = await cls._get_collection().get_many([doc_keys[idx] for idx in indices])
+        except ArangoServerError as e:
+            logger.exception(e)
+        except Exception as e:
+            logger.exception(e)
+        else:
+            for idx, graph_doc in zip(indices, response):
+                if graph_doc is not None:
+                    results[idx] = cls.from_collection(graph_doc)
+
+        return results
+
+    @classmethod
+    async def update_many(
+        cls: Type[TBaseCollectionDocument],
+        docs: Sequence[Tuple[TBaseCollectionDocument, TBaseCollectionDocument]],
+        reserve_non_updatable_fields: bool = True,
+        check_for_revisions_match: Optional[bool] = True,
+        wait_for_sync: Optional[bool] = None,
+        retry_on_failure: bool = True,
+    ) -> List[bool]:
+        """
+        Update multiple objects in the database in one request
+
+        Parameters
+        ----------
+        docs : Sequence[Tuple[TBaseCollectionDocument, TBaseCollectionDocument]]
+            Pairs of the documents already in the database and the documents used for updating them. The old documents
+            are updated in place if the operation is successful, the same way `update` does.
+        reserve_non_updatable_fields : bool
+            Whether to keep the non-updatable fields from the old documents or not
+        check_for_revisions_match : bool, default: True
+            If set to True, revisions of current documents are compared against the revisions of target documents.
+        wait_for_sync : bool, default: None
+            sync: Block until operation is synchronized to disk. Default to `None`
+        retry_on_failure : bool, default : True
+            Whether to retry the update of a document one by one if it fails due to `revision` mismatch
+
+        Returns
+        -------
+        list
+            List of booleans in the same order as `docs`, indicating whether the update of each document was
+            successful or not.
+
+        Raises
+        ------
+        NotBaseCollectionDocumentInstance
+            If any of the new documents is not instance of `BaseCollectionDocument` class.
+        """
+        results = [False] * len(docs)
+
+        indices = []
+        graph_docs = []
+        for idx, (old_doc, doc) in enumerate(docs):
+            if old_doc is None or doc is None:
+                continue
+
+            if not isinstance(doc, BaseCollectionDocument):
+                raise NotBaseCollectionDocumentInstance(doc.__class__.__name__)
+
+            if reserve_non_updatable_fields:
+                graph_doc = doc._update_metadata_from_old_document(old_doc)._update_non_updatable_fields(old_doc).to_collection()
+            else:
+                graph_doc = doc._update_metadata_from_old_document(old_doc).to_collection()
+            if graph_doc is None:
+                continue
+
+            graph_doc["modified_at"] = get_now_timestamp()
+            indices.append(idx)
+            graph_docs.append(graph_doc)
+
+        if not graph_docs:
+            return results
+
+        try:
+            response = await cls._get_collection().update_many(
+                graph_docs,
+                check_for_revisions_match=check_for_revisions_match,
+                wait_for_sync=wait_for_sync,
+            )
+        except ArangoServerError as e:
+            logger.exception(f"{cls.__name__} : {e}")
+            return results
+        except Exception as e:
+            logger.exception(f"{cls.__name__} : {e}")
+            return results
+
+        failed_indices = []
+        for idx, metadata_or_error in zip(indices, response):
+            old_doc, doc = docs[idx]
+            if isinstance(metadata_or_error, ArangoServerError):
+                logger.error(f"{cls.__name__}: `{old_doc.key}` : DocumentUpdateError")
+                failed_indices.append(idx)
+            else:
+                doc._update_metadata(metadata_or_error)
+                old_doc.__dict__.update(doc.__dict__)
+                results[idx] = True
+
+        if retry_on_failure and failed_indices:
+            # fall back to updating the failed documents one by one, so they are retried with their latest revisions.
+            retry_results = await asyncio.gather(
+                *(
+                    docs[idx][0]._retry_update(
+                        check_for_revisions_match,
+                        docs[idx][1],
+                        reserve_non_updatable_fields,
+                        retry_on_failure,
+                        1,
+                        False,
+                        wait_for_sync,
+                    )
+                    for idx in failed_indices
+                )
+            )
+            for idx, successful in zip(failed_indices, retry_results):
+                results[idx] = successful
+
+        return results
+
+    @classmethod
+    async def replace_many(
+        cls: Type[TBaseCollectionDocument],
+        docs: Sequence[Tuple[TBaseCollectionDocument, TBaseCollectionDocument]],
+    ) -> List[Tuple[Optional[TBaseCollectionDocument], bool]]:
+        """
+        Replace multiple objects in the database with the new ones in one request
+
+        Parameters
+        ----------
+        docs : Sequence[Tuple[TBaseCollectionDocument, TBaseCollectionDocument]]
+            Pairs of the documents already in the database and the documents used for replacing them
+
+        Returns
+        -------
+        list
+            List of tuples in the same order as `docs`. Each tuple contains the replaced document and whether the
+            operation was successful for that document.
+
+        Raises
+        ------
+        NotBaseCollectionDocumentInstance
+            If any of the new documents is not instance of `BaseCollectionDocument` class.
+        """
+        results: List[Tuple[Optional[TBaseCollectionDocument], bool]] = [(None, False)] * len(docs)
+
+        indices = []
+        graph_docs = []
+        for idx, (old_doc, doc) in enumerate(docs):
+            if old_doc is None or doc is None:
+                continue
+
+            if not isinstance(doc, BaseCollectionDocument):
+                raise NotBaseCollectionDocumentInstance(doc.__class__.__name__)
+
+            graph_doc = doc._update_metadata_from_old_document(old_doc)._update_non_updatable_fields(old_doc).to_collection()
+            if graph_doc is None:
+                continue
+
+            indices.append(idx)
+            graph_docs.append(graph_doc)
+
+        if not graph_docs:
+            return results
+
+        try:
+            response = await cls._get_collection().replace_many(graph_docs)
+        except ArangoServerError as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        except Exception as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        else:
+            for idx, metadata_or_error in zip(indices, response):
+                doc = docs[idx][1]
+                if isinstance(metadata_or_error, ArangoServerError):
+                    logger.error(f"{cls.__name__} : {metadata_or_error}")
+                    results[idx] = (doc, False)
+                else:
+                    doc._update_metadata(metadata_or_error)
+                    results[idx] = (doc, True)
+
+        return results
+
+    @classmethod
+    async def delete_many(
+        cls: Type[TBaseCollectionDocument],
+        docs: Sequence[Union[TBaseCollectionDocument, str]],
+    ) -> List[bool]:
+        """
+        Delete multiple objects in ArangoDB in one request
+
+        Parameters
+        ----------
+        docs : Sequence[TBaseCollectionDocument or str]
+            Objects to delete from the ArangoDB or the Keys of the documents to be deleted
+
+        Returns
+        -------
+        list
+            List of booleans in the same order as `docs`, indicating whether deleting each document was successful or
+            not. Documents that do not exist in the collection are considered deleted.
+        """
+        results = [False] * len(docs)
+
+        indices = []
+        keys = []
+        for idx, doc in enumerate(docs):
+            key = doc.key if isinstance(doc, BaseCollectionDocument) else doc
+            if key:
+                indices.append(idx)
+                keys.append(key)
+
+        if not keys:
+            return results
+
+        try:
+            response = await cls._get_collection().delete_many(
+                keys,
+                check_for_revisions_match=False,
+            )
+        except ArangoServerError as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        except Exception as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        else:
+            for idx, metadata_or_error in zip(indices, response):
+                if isinstance(metadata_or_error, ArangoServerError):
+                    if metadata_or_error.arango_error.type == ErrorType.ARANGO_DOCUMENT_NOT_FOUND:
+                        results[idx] = True
+                    else:
+                        logger.error(f"{cls.__name__} : {metadata_or_error}")
+                else:
+                    results[idx] = True
+
+        return results
+
+    @classmethod
+    async def bulk_import(
+        cls: Type[TBaseCollectionDocument],
+        docs: Union[Iterable[TBaseCollectionDocument], AsyncIterable[TBaseCollectionDocument]],
+        on_duplicate: ImportOnDuplicate = ImportOnDuplicate.ERROR,
+        batch_size: int = 1000,
+        concurrency: int = 1,
+        wait_for_sync: Optional[bool] = None,
+    ) -> Optional[ImportResult]:
+        """
+        Import objects into the ArangoDB using the bulk import API. This is meant for backfills and migrations, where
+        inserting the documents one by one is too slow.
+
+        Parameters
+        ----------
+        docs : Iterable[TBaseCollectionDocument] or AsyncIterable[TBaseCollectionDocument]
+            Objects to import. It can be a generator, so the objects are created while they are being imported and the
+            whole dataset never has to be kept in memory.
+        on_duplicate : ImportOnDuplicate, default : ImportOnDuplicate.ERROR
+            What to do if a document with the same key already exists in the collection.
+        batch_size : int, default : 1000
+            Number of documents to send in each request.
+        concurrency : int, default : 1
+            Maximum number of requests to run concurrently.
+        wait_for_sync : bool, optional
+            Block until the operation is synchronized to disk.
+
+        Returns
+        -------
+        ImportResult, optional
+            Aggregated result of the import if it was successful, otherwise, return `None`.
+        """
+        if docs is None:
+            return None
+
+        async def graph_docs() -> AsyncIterator[Dict[str, Any]]:
+            if isinstance(docs, AsyncIterable):
+                async for doc in docs:
+                    graph_doc = doc.to_collection() if doc is not None else None
+                    if graph_doc is not None:
+                        yield graph_doc
+            else:
+                for doc in docs:
+                    graph_doc = doc.to_collection() if doc is not None else None
+                    if graph_doc is not None:
+                        yield graph_doc
+
+        try:
+            result = await cls.__collection__.import_bulk(
+                graph_docs(),
+                on_duplicate=on_duplicate,
+                wait_for_sync=wait_for_sync,
+                details=True,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+        except ArangoServerError as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        except Exception as e:
+            logger.exception(f"{cls.__name__} : {e}")
+        else:
+            if result.errors:
+                logger.error(f"{cls.__name__} : {result.errors} documents could not be imported")
+                for detail in result.details[:10]:
+                    logger.error(detail)
+
+            return result
+
+        return None
+
     def _update_metadata(
         self,
         metadata: Dict[str, str],
@@ -885,6 +1333,8 @@ class BaseCollectionDocument(BaseCollectionAttributes):
         ttl: Optional[int] = None,
         batch_size: Optional[int] = 1000,
         stream: Optional[bool] = None,
+        prefetch: int = 0,
+        count: bool = False,
     ) -> Result[Cursor]:
         """
         Execute a query and return a `Cursor` object if did not catch any errors, otherwise, return `None`.
@@ -919,6 +1369,15 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             without `index` or `COLLECT` are involved that make it necessary to process all
             documents before a partial result can be returned. It is advisable to only use
             this option for "queries without exclusive locks".
+        prefetch : int, default : 0
+            Number of batches to request from the server in the background while the current batch is being consumed.
+            Every background request refreshes the TTL of the cursor, and the cursor must be closed (e.g. by using it
+            as an async context manager) if it is not consumed completely. `0` disables prefetching.
+        count : bool, default : False
+            Whether the total number of results must be calculated and returned with the cursor. Counting forces the
+            server to materialize the full result before the first batch is returned, which also makes **stream**
+            ineffective, so it is only enabled when the count is actually needed.
+
         Returns
         -------
         Result[Cursor]
@@ -929,13 +1388,14 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             if "@graph_name" in query:
                 bind_vars["graph_name"] = cls.__graph_name__
 
-            cursor = await cls.__aql__.execute(
+            cursor = await cls._get_aql().execute(
                 query,
                 bind_vars=bind_vars,
-                count=True,
+                count=count,
                 ttl=ttl,
                 batch_size=batch_size,
                 stream=stream,
+                prefetch=prefetch,
             )
         except CursorCountError as e:
             logger.error(query)
@@ -954,6 +1414,161 @@ class BaseCollectionDocument(BaseCollectionAttributes):
             {},
         )
 
+    @classmethod
+    async def iter_query(
+        cls: Type[TBaseCollectionDocument],
+        query: str,
+        bind_vars: Dict[str, Any],
+        batch_size: int = 1000,
+        ttl: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Execute a query as a streaming cursor without counting its results and yield the results one by one.
+
+        The server only produces the results of the query batch by batch as they are consumed, so large scans do not
+        hold their full result in the memory of the server. Queries that `SORT` without an index or `COLLECT` still
+        need to process all documents before the first batch is returned.
+
+        Parameters
+        ----------
+        query : str
+            Query string to execute
+        bind_vars : dict
+            Dictionary of variables to be bound to the query before running
+        batch_size : int, default : 1000
+            Maximum number of result documents to be transferred from the server to the client in one roundtrip.
+        ttl : int, optional
+            The time-to-live for the cursor (in seconds), it is refreshed every time a batch is fetched.
+        prefetch : int, default : 0
+            Number of batches to request from the server in the background while the current batch is being consumed.
+
+        Yields
+        ------
+        Any
+            Results of the query.
+
+        """
+        async with await cls.execute_query(
+            query,
+            bind_vars=bind_vars,
+            ttl=ttl,
+            batch_size=batch_size,
+            stream=True,
+            prefetch=prefetch,
+            count=False,
+        ) as cursor:
+            async for doc in cursor:
+                yield doc
+
+    @classmethod
+    async def iter_query_by_key(
+        cls: Type[TBaseCollectionDocument],
+        query: str,
+        bind_vars: Dict[str, Any],
+        chunk_size: int = 10000,
+        batch_size: int = 1000,
+        prefetch: int = 0,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Execute a query in chunks using keyset pagination on the `_key` attribute and yield the results one by one.
+
+        Every chunk is executed as a separate short-lived streaming query starting after the last key of the previous
+        chunk, so no cursor is kept open on the server for the whole scan. The query must filter the documents by
+        `doc._key > @last_key`, sort them by `doc._key` in ascending order (which uses the primary index), limit them
+        by `@chunk_size` and return documents containing the `_key` attribute.
+
+        Parameters
+        ----------
+        query : str
+            Query string to execute
+        bind_vars : dict
+            Dictionary of variables to be bound to the query before running, `last_key` and `chunk_size` variables are
+            set by this method.
+        chunk_size : int, default : 10000
+            Number of documents to get in each chunk.
+        batch_size : int, default : 1000
+            Maximum number of result documents to be transferred from the server to the client in one roundtrip.
+        prefetch : int, default : 0
+            Number of batches to request from the server in the background while the current batch is being consumed.
+
+        Yields
+        ------
+        Any
+            Results of the query.
+
+        """
+        last_key = ""
+        while True:
+            chunk_bind_vars = dict(bind_vars)
+            chunk_bind_vars["last_key"] = last_key
+            chunk_bind_vars["chunk_size"] = chunk_size
+
+            doc_count = 0
+            async for doc in cls.iter_query(
+                query,
+                bind_vars=chunk_bind_vars,
+                batch_size=min(batch_size, chunk_size),
+                prefetch=prefetch,
+            ):
+                key = doc.get("_key", None) if isinstance(doc, dict) else None
+                if key is None:
+                    logger.error(f"{cls.__name__}: results of keyset queries must contain the `_key` attribute")
+                    return
+
+                doc_count += 1
+                last_key = key
+                yield doc
+
+            if doc_count < chunk_size:
+                break
+
+    @classmethod
+    async def execute_query_in_background(
+        cls: Type[TBaseCollectionDocument],
+        query: str,
+        bind_vars: Dict[str, Any],
+    ) -> bool:
+        """
+        Queue a query on the server without waiting for it to be executed. The result of the query is discarded, so
+        this is only useful for the write queries whose result is not needed.
+
+        Notes
+        -----
+        - The query is not executed inside the stream transaction of the current context, if there is one.
+
+        Parameters
+        ----------
+        query : str
+            Query string to execute
+        bind_vars : dict
+            Dictionary of variables to be bound to the query before running
+
+        Returns
+        -------
+        bool
+            Whether the query was queued on the server successfully or not.
+
+        """
+        try:
+            if "@graph_name" in query:
+                bind_vars["graph_name"] = cls.__graph_name__
+
+            await cls.__async_db__.aql.execute(
+                query,
+                bind_vars=bind_vars,
+                count=False,
+            )
+        except ArangoServerError as e:
+            logger.error(query)
+            logger.exception(e)
+        except Exception as e:
+            logger.exception(e)
+        else:
+            return True
+
+        return False
+
     ########################################################################
     @classmethod
     def parse(
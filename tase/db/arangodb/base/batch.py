@@ -0,0 +1,40 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from aioarango.api import BatchDatabase
+from .base_collection_document import BaseCollectionDocument, current_batch_db, current_transaction_db
+
+
+@asynccontextmanager
+async def arangodb_batch(
+    max_batch_size: int = 100,
+) -> AsyncIterator[Optional[BatchDatabase]]:
+    """
+    Send the concurrent database operations of the enclosed block to ArangoDB in batch requests.
+
+    The operations of the `BaseCollectionDocument` subclasses that are issued concurrently in the block, e.g. the
+    coroutines passed to `asyncio.gather`, are sent together in one HTTP request instead of one request per
+    operation. If the current context is already running inside a batch or a stream transaction, the operations are
+    executed in that one instead.
+
+    Parameters
+    ----------
+    max_batch_size : int, default : 100
+        Maximum number of operations to send in one batch request.
+
+    Yields
+    ------
+    BatchDatabase, optional
+        Database API wrapper of the batch, or `None` if the operations are executed in a stream transaction.
+    """
+    batch_db = current_batch_db.get()
+    if batch_db is not None or current_transaction_db.get() is not None:
+        yield batch_db
+        return
+
+    async with BaseCollectionDocument.__db__.begin_batch_execution(max_batch_size) as batch_db:
+        token = current_batch_db.set(batch_db)
+        try:
+            yield batch_db
+        finally:
+            current_batch_db.reset(token)
@@ -0,0 +1,73 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Sequence, Type
+
+from aioarango.api import TransactionDatabase
+from .base_collection_document import BaseCollectionDocument, current_transaction_db
+
+
+def _collection_names(document_classes: Optional[Sequence[Type[BaseCollectionDocument]]]) -> Optional[Sequence[str]]:
+    if not document_classes:
+        return None
+
+    return [document_class.__collection_name__ for document_class in document_classes]
+
+
+@asynccontextmanager
+async def arangodb_transaction(
+    write: Optional[Sequence[Type[BaseCollectionDocument]]] = None,
+    read: Optional[Sequence[Type[BaseCollectionDocument]]] = None,
+    exclusive: Optional[Sequence[Type[BaseCollectionDocument]]] = None,
+    allow_implicit: bool = True,
+    wait_for_sync: Optional[bool] = None,
+    lock_timeout: Optional[int] = None,
+) -> AsyncIterator[TransactionDatabase]:
+    """
+    Run the database operations of the enclosed block inside an ArangoDB stream transaction.
+
+    Every operation of the `BaseCollectionDocument` subclasses in the block, including the AQL queries, is executed in
+    the transaction. The transaction is committed when the block finishes, and it is aborted if an exception is raised
+    inside the block. If the current context is already running inside a transaction, that transaction is reused.
+
+    Notes
+    -----
+    - Requests of a stream transaction are executed one after another on the server, so the operations inside the
+      block must not be run concurrently.
+
+    Parameters
+    ----------
+    write : Sequence[Type[BaseCollectionDocument]], optional
+        Document classes whose collections are written to in the transaction.
+    read : Sequence[Type[BaseCollectionDocument]], optional
+        Document classes whose collections are only read in the transaction.
+    exclusive : Sequence[Type[BaseCollectionDocument]], optional
+        Document classes whose collections are written to in the transaction with exclusive access.
+    allow_implicit : bool, default : True
+        Whether to allow reading from the collections that are not declared.
+    wait_for_sync : bool, optional
+        Block until the transaction is synchronized to disk once it is committed.
+    lock_timeout : int, optional
+        Timeout for waiting on collection locks.
+
+    Yields
+    ------
+    TransactionDatabase
+        Database API wrapper of the running transaction.
+    """
+    transaction_db = current_transaction_db.get()
+    if transaction_db is not None:
+        yield transaction_db
+        return
+
+    async with BaseCollectionDocument.__db__.begin_transaction(
+        read=_collection_names(read),
+        write=_collection_names(write),
+        exclusive=_collection_names(exclusive),
+        allow_implicit=allow_implicit,
+        wait_for_sync=wait_for_sync,
+        lock_timeout=lock_timeout,
+    ) as transaction_db:
+        token = current_transaction_db.set(transaction_db)
+        try:
+            yield transaction_db
+        finally:
+            current_transaction_db.reset(token)
@@ -1,14 +1,18 @@
 from .audio import Audio, AudioMethods
+from .audio_hit_daily_count import AudioHitDailyCount, AudioHitDailyCountMethods
 from .base_document import BaseDocument
 from .bot_task import BotTask, BotTaskMethods
 from .downloaded_thumbnail_file import DownloadedThumbnailFile, DownloadedThumbnailFileMethods
+from .hit_resolver import HitResolver, HitResolverMethods
 from .job import Job, JobMethods
 from .rabbitmq_task import RabbitMQTask, RabbitMQTaskMethods
 from .uploaded_thumbnail_file import UploadedThumbnailFile, UploadedThumbnailFileMethods
+from .user_audio_state import UserAudioState, UserAudioStateMethods
 
 
 class ArangoDocumentMethods(
     AudioMethods,
+    AudioHitDailyCountMethods,
     BotTaskMethods,
     DownloadedThumbnailFileMethods,
     JobMethods,
@@ -20,9 +24,12 @@ class ArangoDocumentMethods(
 
 document_classes = [
     Audio,
+    AudioHitDailyCount,
     BotTask,
     DownloadedThumbnailFile,
+    HitResolver,
     Job,
     RabbitMQTask,
     UploadedThumbnailFile,
+    UserAudioState,
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
 import pyrogram
 
@@ -146,6 +146,18 @@ class AudioMethods:
         "   remove audio_doc in @@doc_audios options {ignoreRevs: true}"
     )
 
+    _delete_old_audio_caches_by_chat_id_and_message_ids_query = (
+        "for audio_doc in @@doc_audios"
+        "   filter audio_doc.chat_id == @chat_id and audio_doc.message_id in @message_ids and audio_doc._key not in @excluded_keys"
+        "   remove audio_doc in @@doc_audios options {ignoreRevs: true}"
+    )
+
+    _delete_audio_caches_by_chat_id_and_message_ids_query = (
+        "for audio_doc in @@doc_audios"
+        "   filter audio_doc.chat_id == @chat_id and audio_doc.message_id in @message_ids"
+        "   remove audio_doc in @@doc_audios options {ignoreRevs: true}"
+    )
+
     async def create_audio(
         self,
         telegram_message: pyrogram.types.Message,
@@ -291,6 +303,94 @@ class AudioMethods:
 
         return audio
 
+    async def update_or_create_audios(
+        self,
+        telegram_messages: List[pyrogram.types.Message],
+        telegram_client_id: int,
+        chat_id: int,
+    ) -> List[pyrogram.types.Message]:
+        """
+        Update or create `Audio` documents of a batch of messages belonging to the same chat. The existing documents are
+        fetched, the new ones are inserted and the existing ones are updated with one request each, and the old caches
+        of the messages are removed with one query.
+
+        Parameters
+        ----------
+        telegram_messages : list of pyrogram.types.Message
+            Telegram messages to create the Audio documents from.
+        telegram_client_id : int
+            ID of the telegram client who got these messages.
+        chat_id : int
+            Chat ID these messages belong to.
+
+        Returns
+        -------
+        list of pyrogram.types.Message
+            Messages whose `Audio` documents could not be written.
+        """
+        if not telegram_messages or chat_id is None:
+            return []
+
+        failed_messages = []
+        # messages whose old caches are removed, except for the audio documents written for them
+        written_message_ids = []
+        written_keys = []
+
+        parsed = []
+        for telegram_message in telegram_messages:
+            try:
+                audio = Audio.parse(telegram_message, telegram_client_id, chat_id)
+            except TelegramMessageWithNoAudio:
+                # the message does not contain any valid audio file, so all of its caches are removed
+                written_message_ids.append(telegram_message.id)
+            else:
+                if audio is None:
+                    failed_messages.append(telegram_message)
+                else:
+                    parsed.append((telegram_message, audio))
+
+        existing_audios = await Audio.get_many([audio.key for _, audio in parsed])
+
+        new_items = []
+        existing_items = []
+        for (telegram_message, audio), existing_audio in zip(parsed, existing_audios):
+            if existing_audio is None:
+                new_items.append((telegram_message, audio))
+            else:
+                existing_items.append((telegram_message, existing_audio, audio))
+
+        if new_items:
+            insert_results = await Audio.insert_many([audio for _, audio in new_items])
+            for (telegram_message, _), (audio, successful) in zip(new_items, insert_results):
+                if audio and successful:
+                    written_message_ids.append(telegram_message.id)
+                    written_keys.append(audio.key)
+                else:
+                    failed_messages.append(telegram_message)
+
+        if existing_items:
+            update_results = await Audio.update_many([(existing_audio, audio) for _, existing_audio, audio in existing_items])
+            for (telegram_message, existing_audio, _), updated in zip(existing_items, update_results):
+                if updated:
+                    written_message_ids.append(telegram_message.id)
+                    written_keys.append(existing_audio.key)
+                else:
+                    failed_messages.append(telegram_message)
+
+        if written_message_ids:
+            async with await Audio.execute_query(
+                self._delete_old_audio_caches_by_chat_id_and_message_ids_query,
+                bind_vars={
+                    "@doc_audios": Audio.__collection_name__,
+                    "chat_id": chat_id,
+                    "message_ids": written_message_ids,
+                    "excluded_keys": written_keys,
+                },
+            ) as _:
+                pass
+
+        return failed_messages
+
     async def get_audio_by_key(
         self,
         audio_doc_key: str,
@@ -374,3 +474,32 @@ class AudioMethods:
             bind_vars=bind_vars,
         ) as _:
             pass
+
+    async def delete_audio_caches(
+        self,
+        chat_id: int,
+        message_ids: List[int],
+    ) -> None:
+        """
+        Delete `Audio` documents of the given messages of a chat in one query.
+
+        Parameters
+        ----------
+        chat_id : int
+            ID of the chat the audio documents belong to.
+        message_ids : list of int
+            IDs of the telegram messages containing the audio files.
+
+        """
+        if chat_id is None or not message_ids:
+            return
+
+        async with await Audio.execute_query(
+            self._delete_audio_caches_by_chat_id_and_message_ids_query,
+            bind_vars={
+                "@doc_audios": Audio.__collection_name__,
+                "chat_id": chat_id,
+                "message_ids": list(message_ids),
+            },
+        ) as _:
+            pass
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Optional, List
+
+from aioarango.models import PersistentIndex
+from .base_document import BaseDocument
+from ..enums import HitType
+
+
+class AudioHitDailyCount(BaseDocument):
+    """
+    Number of the archived `Hit` vertices of an `Audio` vertex with a hit type in a day. The hits that have never been
+    used are rolled up into these counts before they are removed, so the hit history of the audios is kept.
+
+    Attributes
+    ----------
+    audio_key : str
+        Key of the `Audio` vertex.
+    day : int
+        UTC timestamp of the start of the day the hits were created in, in milliseconds.
+    hit_type : HitType
+        Type of the counted hits.
+    count : int
+        Number of the archived hits.
+    """
+
+    __collection_name__ = "doc_audio_hit_daily_counts"
+    schema_version = 1
+    __indexes__ = [
+        PersistentIndex(
+            custom_version=1,
+            name="audio_key_day",
+            fields=[
+                "audio_key",
+                "day",
+            ],
+        ),
+        PersistentIndex(
+            custom_version=1,
+            name="day",
+            fields=[
+                "day",
+            ],
+        ),
+    ]
+
+    audio_key: str
+    day: int
+    hit_type: HitType
+    count: int
+
+    @classmethod
+    def parse_key(
+        cls,
+        audio_key: str,
+        day: int,
+        hit_type: HitType,
+    ) -> Optional[str]:
+        if not audio_key or day is None or hit_type is None:
+            return None
+
+        return f"{audio_key}:{day}:{hit_type.value}"
+
+
+class AudioHitDailyCountMethods:
+    _get_audio_hit_daily_counts_query = (
+        "for count_ in @@audio_hit_daily_counts"
+        "   filter count_.audio_key == @audio_key and count_.day >= @start_day and count_.day < @end_day"
+        "   sort count_.day asc"
+        "   return count_"
+    )
+
+    async def get_audio_hit_daily_counts(
+        self,
+        audio_key: str,
+        start_day: int,
+        end_day: int,
+    ) -> List[AudioHitDailyCount]:
+        """
+        Get the daily counts of the archived hits of an audio in a period of time.
+
+        Parameters
+        ----------
+        audio_key : str
+            Key of the `Audio` vertex.
+        start_day : int
+            Timestamp to start the period from, in milliseconds.
+        end_day : int
+            Timestamp to end the period at (exclusive), in milliseconds.
+
+        Returns
+        -------
+        list of AudioHitDailyCount
+            List of the daily counts sorted by their day.
+        """
+        if not audio_key or start_day is None or end_day is None:
+            return []
+
+        res = []
+        async with await AudioHitDailyCount.execute_query(
+            self._get_audio_hit_daily_counts_query,
+            bind_vars={
+                "@audio_hit_daily_counts": AudioHitDailyCount.__collection_name__,
+                "audio_key": audio_key,
+                "start_day": start_day,
+                "end_day": end_day,
+            },
+        ) as cursor:
+            async for doc in cursor:
+                obj = AudioHitDailyCount.from_collection(doc)
+                if obj is not None:
+                    res.append(obj)
+
+        return res
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Optional, Union, TYPE_CHECKING
+
+from pydantic import Field
+
+from aioarango.models import TTLIndex
+from tase.common.utils import get_now_timestamp
+from .base_document import BaseDocument
+from ..enums import HitType, AudioInteractionType
+from ..helpers import HitMetadata
+
+if TYPE_CHECKING:
+    from ..graph.vertices import Audio, Hit, Playlist, Query, User
+
+
+class HitResolver(BaseDocument):
+    """
+    Everything needed to serve the `download_url` of a `Hit` vertex, keyed by the `download_url` itself. It is written
+    once when the hit is created, so resolving a download link costs a single primary key lookup instead of
+    traversing the hit, query and user vertices.
+    """
+
+    __collection_name__ = "doc_hit_resolvers"
+    schema_version = 1
+    __indexes__ = [
+        TTLIndex(
+            custom_version=1,
+            name="expire_at",
+            fields=[
+                "expire_at",
+            ],
+            expiry_time=0,
+        ),
+    ]
+
+    hit_key: str
+    audio_key: Optional[str]
+    playlist_key: Optional[str]
+    query_key: str
+    query_user_key: str
+
+    hit_type: HitType
+    hit_metadata: Optional[HitMetadata]
+
+    # key of the first user who has shared the audio link of this hit
+    link_sender_user_key: Optional[str] = Field(default=None)
+
+    # timestamp in seconds after which the resolver is removed by the TTL index, it is set when its hit is archived.
+    expire_at: Optional[int]
+
+    @classmethod
+    def parse_key(
+        cls,
+        hit: Hit,
+    ) -> Optional[str]:
+        if hit is None or not hit.download_url:
+            return None
+
+        return hit.download_url
+
+    @classmethod
+    def parse(
+        cls,
+        user: User,
+        query: Query,
+        hit: Hit,
+        audio_or_playlist: Union[Audio, Playlist],
+    ) -> Optional[HitResolver]:
+        if user is None or query is None or hit is None or audio_or_playlist is None:
+            return None
+
+        key = cls.parse_key(hit)
+        if key is None:
+            return None
+
+        from tase.db.arangodb.graph.vertices import Audio
+
+        is_audio = audio_or_playlist.__collection_name__ == Audio.__collection_name__
+
+        return HitResolver(
+            key=key,
+            hit_key=hit.key,
+            audio_key=audio_or_playlist.key if is_audio else None,
+            playlist_key=None if is_audio else audio_or_playlist.key,
+            query_key=query.key,
+            query_user_key=user.key,
+            hit_type=hit.hit_type,
+            hit_metadata=hit.metadata,
+        )
+
+
+class HitResolverMethods:
+    _build_hit_resolver_query = (
+        "for hit in @@hits"
+        "   filter hit.download_url == @hit_download_url"
+        "   limit 1"
+        "   let target_id = first("
+        "       for e in @@has"
+        "           filter e._from == hit._id and e.to_kind in [@audios, @playlists]"
+        "           limit 1"
+        "           return e._to"
+        "   )"
+        "   let query_id = first("
+        "       for e in @@has"
+        "           filter e._to == hit._id and e.from_kind == @queries"
+        "           limit 1"
+        "           return e._from"
+        "   )"
+        "   let user_id = first("
+        "       for e in @@has_made"
+        "           filter e._to == query_id"
+        "           limit 1"
+        "           return e._from"
+        "   )"
+        "   let sender_id = first("
+        "       for fh_e in @@from_hit"
+        "           filter fh_e._to == hit._id"
+        "           let interaction = document(fh_e._from)"
+        "           filter interaction.type == @share_link_type"
+        "           for u_e in @@has"
+        "               filter u_e._to == interaction._id and u_e.from_kind == @users"
+        "               limit 1"
+        "               return u_e._from"
+        "   )"
+        "   filter target_id != null and query_id != null and user_id != null"
+        "   let target = parse_identifier(target_id)"
+        "   let values = {"
+        "       hit_key: hit._key,"
+        "       audio_key: target.collection == @audios ? target.key : null,"
+        "       playlist_key: target.collection == @playlists ? target.key : null,"
+        "       query_key: parse_identifier(query_id).key,"
+        "       query_user_key: parse_identifier(user_id).key,"
+        "       hit_type: hit.hit_type,"
+        "       hit_metadata: hit.metadata,"
+        "       link_sender_user_key: sender_id == null ? null : parse_identifier(sender_id).key"
+        "   }"
+        "   upsert {_key: @hit_download_url}"
+        "   insert merge(values, {_key: @hit_download_url, schema_version: @schema_version, created_at: @now, modified_at: @now})"
+        "   update {}"
+        "   in @@hit_resolvers"
+        "   return NEW"
+    )
+
+    _set_hit_link_sender_query = (
+        "for resolver in @@hit_resolvers"
+        "   filter resolver._key == @hit_download_url and resolver.link_sender_user_key == null"
+        "   update resolver with {link_sender_user_key: @user_key, modified_at: @now} in @@hit_resolvers"
+    )
+
+    async def resolve_hit_download_url(
+        self,
+        hit_download_url: str,
+    ) -> Optional[HitResolver]:
+        """
+        Get the resolver of a hit `download_url`. Hits created before the resolvers were introduced do not have one,
+        their resolver is built from the graph and stored the first time they are resolved.
+
+        Parameters
+        ----------
+        hit_download_url : str
+            Download URL of the `Hit` vertex.
+
+        Returns
+        -------
+        HitResolver, optional
+            Resolver of the download URL if the hit exists, otherwise, return `None`.
+        """
+        if not hit_download_url:
+            return None
+
+        resolver = await HitResolver.get(hit_download_url)
+        if resolver is not None:
+            return resolver
+
+        from tase.db.arangodb.graph.edges import FromHit, Has, HasMade
+        from tase.db.arangodb.graph.vertices import Audio, Hit, Playlist, Query, User
+
+        async with await HitResolver.execute_query(
+            self._build_hit_resolver_query,
+            bind_vars={
+                "@hits": Hit.__collection_name__,
+                "@has": Has.__collection_name__,
+                "@has_made": HasMade.__collection_name__,
+                "@from_hit": FromHit.__collection_name__,
+                "@hit_resolvers": HitResolver.__collection_name__,
+                "hit_download_url": hit_download_url,
+                "audios": Audio.__collection_name__,
+                "playlists": Playlist.__collection_name__,
+                "queries": Query.__collection_name__,
+                "users": User.__collection_name__,
+                "share_link_type": AudioInteractionType.SHARE_AUDIO_LINK.value,
+                "schema_version": HitResolver.schema_version,
+                "now": get_now_timestamp(),
+            },
+        ) as cursor:
+            async for doc in cursor:
+                return HitResolver.from_collection(doc)
+
+        return None
+
+    async def set_hit_link_sender(
+        self,
+        hit_download_url: str,
+        user_key: str,
+    ) -> None:
+        """
+        Store the user who has shared the audio link of a hit, the first sender is kept if there is more than one.
+
+        Parameters
+        ----------
+        hit_download_url : str
+            Download URL of the `Hit` vertex.
+        user_key : str
+            Key of the `User` vertex who has shared the link.
+        """
+        if not hit_download_url or not user_key:
+            return
+
+        async with await HitResolver.execute_query(
+            self._set_hit_link_sender_query,
+            bind_vars={
+                "@hit_resolvers": HitResolver.__collection_name__,
+                "hit_download_url": hit_download_url,
+                "user_key": user_key,
+                "now": get_now_timestamp(),
+            },
+        ) as _:
+            pass
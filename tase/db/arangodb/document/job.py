@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Collection, Optional, Tuple
 
 from pydantic import Field
 
 from aioarango.models import PersistentIndex
+from tase.my_logger import logger
 from .base_document import BaseDocument
-from ..enums import JobType
+from ..enums import JobType, JobWindowStatus
 
 
 class Job(BaseDocument):
@@ -36,11 +37,20 @@ class Job(BaseDocument):
         ),
     ]
 
+    # number of runs a window is resumed in before the keys that keep failing in it are given up on
+    __max_window_attempts__ = 5
+
     is_active: bool = Field(default=True)
 
     job_type: JobType
     last_run_at: int = Field(default=0)
 
+    # the window `[last_run_at, window_end)` that is being processed, it is kept until the window is fully applied, so
+    # a crashed run resumes the same window instead of counting it again.
+    window_end: Optional[int]
+    window_status: JobWindowStatus = Field(default=JobWindowStatus.APPLIED)
+    window_attempt_count: int = Field(default=0)
+
     @classmethod
     def parse_key(
         cls,
@@ -82,6 +92,94 @@ class Job(BaseDocument):
 
         return await self.update(self_copy, reserve_non_updatable_fields=False)
 
+    async def start_window(
+        self,
+        now: int,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Start processing the window from the last run of this job until `now`. If the window of a previous run has not
+        been applied completely, that window is returned instead, so it can be resumed. Every start of a window is
+        counted as an attempt of that window.
+
+        Parameters
+        ----------
+        now : int
+            Timestamp to end the window at if there is no pending window.
+
+        Returns
+        -------
+        tuple of int, optional
+            Start and end timestamps of the window if the operation was successful, otherwise, return `None`.
+
+        """
+        self_copy: Job = self.copy(deep=True)
+        if self.window_status == JobWindowStatus.PENDING and self.window_end is not None:
+            self_copy.window_attempt_count += 1
+        else:
+            if now is None:
+                return None
+
+            self_copy.window_end = now
+            self_copy.window_status = JobWindowStatus.PENDING
+            self_copy.window_attempt_count = 1
+
+        if not await self.update(self_copy, reserve_non_updatable_fields=False):
+            return None
+
+        return self.last_run_at, self.window_end
+
+    async def finish_window(self) -> bool:
+        """
+        Mark the pending window of this job as applied and move the last run of the job to the end of the window.
+
+        Returns
+        -------
+        bool
+            Whether the operation was successful or not.
+
+        """
+        if self.window_status != JobWindowStatus.PENDING or self.window_end is None:
+            return False
+
+        self_copy: Job = self.copy(deep=True)
+        self_copy.last_run_at = self.window_end
+        self_copy.window_status = JobWindowStatus.APPLIED
+        self_copy.window_attempt_count = 0
+
+        return await self.update(self_copy, reserve_non_updatable_fields=False)
+
+    def can_finish_window(
+        self,
+        failed_keys: Collection[str],
+    ) -> bool:
+        """
+        Check whether the pending window can be finished after applying it. A window with failed keys is kept pending,
+        so it is resumed on the next run, unless it has already been attempted `__max_window_attempts__` times, in which
+        case the failed keys are given up on and the window moves forward.
+
+        Parameters
+        ----------
+        failed_keys : collection of str
+            Keys of the documents that could not be updated in this window.
+
+        Returns
+        -------
+        bool
+            Whether the window can be finished or not.
+
+        """
+        if not failed_keys:
+            return True
+
+        if self.window_attempt_count < self.__max_window_attempts__:
+            return False
+
+        logger.error(
+            f"Giving up on `{len(failed_keys)}` keys of job `{self.key}` after {self.window_attempt_count} attempts of the window ending at "
+            f"`{self.window_end}`: {', '.join(failed_keys)}"
+        )
+        return True
+
     async def update_last_run(
         self,
         last_run_at: int,
@@ -135,3 +233,12 @@ class JobMethods:
 
     async def get_count_hits_job(self) -> Optional[Job]:
         return await self.get_or_create_job(JobType.COUNT_HITS)
+
+    async def get_archive_hits_job(self) -> Optional[Job]:
+        return await self.get_or_create_job(JobType.ARCHIVE_HITS)
+
+    async def get_backfill_has_edge_kinds_job(self) -> Optional[Job]:
+        return await self.get_or_create_job(JobType.BACKFILL_HAS_EDGE_KINDS)
+
+    async def get_backfill_user_audio_states_job(self) -> Optional[Job]:
+        return await self.get_or_create_job(JobType.BACKFILL_USER_AUDIO_STATES)
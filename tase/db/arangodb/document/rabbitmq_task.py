@@ -6,6 +6,7 @@ from typing import Optional
 from pydantic import Field
 
 from aioarango.models import PersistentIndex
+from tase.common.utils import get_now_timestamp
 from .base_document import BaseDocument
 from ..enums import RabbitMQTaskStatus, RabbitMQTaskType
 
@@ -121,6 +122,122 @@ class RabbitMQTaskMethods:
         "   return NEW"
     )
 
+    _update_rabbitmq_task_status_query = (
+        "for doc_task in @@rabbitmq_tasks"
+        "   filter doc_task._key == @key and doc_task.status in @status_list"
+        "   update doc_task with {"
+        "       status: @new_status,"
+        "       modified_at: @modified_at"
+        "   } in @@rabbitmq_tasks options {mergeObjects: true}"
+    )
+
+    _set_rabbitmq_task_final_status_query = (
+        "for doc_task in @@rabbitmq_tasks"
+        "   filter doc_task._key == @key and doc_task.status in @status_list"
+        "   update doc_task with {"
+        "       status: @new_status,"
+        "       modified_at: @modified_at"
+        "   } in @@rabbitmq_tasks options {mergeObjects: true}"
+        "   return NEW"
+    )
+
+    async def update_rabbitmq_task_status_in_background(
+        self,
+        key: str,
+        status: RabbitMQTaskStatus,
+    ) -> bool:
+        """
+        Update the status of a `RabbitMQTask` without waiting for the update to be applied in the database.
+
+        Since the queued updates might be applied in any order, the status of a task is only moved forward, a finished
+        task is never updated, and a task in a worker is not moved back to the queue. The final status of a task must
+        be set with `update_rabbitmq_task_status` instead.
+
+        Parameters
+        ----------
+        key : str
+            Key of the task to update
+        status : RabbitMQTaskStatus
+            New status of the task
+
+        Returns
+        -------
+        bool
+            Whether the update was queued successfully or not.
+        """
+        if key is None or status is None:
+            return False
+
+        if status == RabbitMQTaskStatus.IN_WORKER:
+            status_list = [
+                RabbitMQTaskStatus.CREATED.value,
+                RabbitMQTaskStatus.IN_QUEUE.value,
+            ]
+        else:
+            status_list = [
+                RabbitMQTaskStatus.CREATED.value,
+                RabbitMQTaskStatus.IN_QUEUE.value,
+                RabbitMQTaskStatus.IN_WORKER.value,
+            ]
+
+        return await RabbitMQTask.execute_query_in_background(
+            self._update_rabbitmq_task_status_query,
+            bind_vars={
+                "@rabbitmq_tasks": RabbitMQTask.__collection_name__,
+                "key": key,
+                "status_list": status_list,
+                "new_status": status.value,
+                "modified_at": get_now_timestamp(),
+            },
+        )
+
+    async def update_rabbitmq_task_status(
+        self,
+        key: str,
+        status: RabbitMQTaskStatus,
+    ) -> bool:
+        """
+        Set the final status of a `RabbitMQTask` and wait for the update to be applied in the database.
+
+        Since the updates are applied in the order they are called, the later final status of a task replaces the
+        earlier one, e.g. a task that is marked as `DONE` after being marked as `FAILED` ends up as `DONE`.
+
+        Parameters
+        ----------
+        key : str
+            Key of the task to update
+        status : RabbitMQTaskStatus
+            New status of the task
+
+        Returns
+        -------
+        bool
+            Whether the update was successful or not.
+        """
+        if key is None or status is None:
+            return False
+
+        async with await RabbitMQTask.execute_query(
+            self._set_rabbitmq_task_final_status_query,
+            bind_vars={
+                "@rabbitmq_tasks": RabbitMQTask.__collection_name__,
+                "key": key,
+                "status_list": [
+                    RabbitMQTaskStatus.CREATED.value,
+                    RabbitMQTaskStatus.IN_QUEUE.value,
+                    RabbitMQTaskStatus.IN_WORKER.value,
+                    RabbitMQTaskStatus.DONE.value,
+                    RabbitMQTaskStatus.FAILED.value,
+                ],
+                "new_status": status.value,
+                "modified_at": get_now_timestamp(),
+            },
+        ) as cursor:
+            async for _ in cursor:
+                return True
+
+        return False
+
     async def get_rabbitmq_task_by_key(
         self,
         key: str,
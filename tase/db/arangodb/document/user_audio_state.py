@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import collections
+from typing import Optional, Dict, List, TYPE_CHECKING
+
+from pydantic import Field
+
+from aioarango.models import PersistentIndex
+from tase.common.utils import get_now_timestamp
+from tase.my_logger import logger
+from .base_document import BaseDocument
+from ..enums import AudioInteractionType
+
+if TYPE_CHECKING:
+    from ..graph.vertices import User
+
+
+class UserAudioState(BaseDocument):
+    """
+    State of an `Audio` vertex for a `User` vertex, materialized from the interaction vertices and the favorite
+    playlist of the user, so it can be read with a single primary key lookup instead of traversing the graph.
+    """
+
+    __collection_name__ = "doc_user_audio_states"
+    schema_version = 1
+    __indexes__ = [
+        PersistentIndex(
+            custom_version=1,
+            name="audio_key",
+            fields=[
+                "audio_key",
+            ],
+        ),
+    ]
+
+    # types of the audio interactions without any playlist that are kept in the state
+    __state_interaction_types__ = (
+        AudioInteractionType.LIKE_AUDIO,
+        AudioInteractionType.DISLIKE_AUDIO,
+        AudioInteractionType.DOWNLOAD_AUDIO,
+    )
+
+    user_key: str
+    audio_key: str
+
+    liked: bool = Field(default=False)
+    disliked: bool = Field(default=False)
+    favorited: bool = Field(default=False)
+    download_count: int = Field(default=0)
+
+    @classmethod
+    def parse_key(
+        cls,
+        user_key: str,
+        audio_key: str,
+    ) -> Optional[str]:
+        if not user_key or not audio_key:
+            return None
+
+        return f"{user_key}:{audio_key}"
+
+    @classmethod
+    def get_interaction_changes(
+        cls,
+        interaction_type: AudioInteractionType,
+        is_active: bool,
+    ) -> Dict[str, object]:
+        """
+        Get the changes an audio interaction makes to the state of the audio for the user who made it.
+
+        Parameters
+        ----------
+        interaction_type : AudioInteractionType
+            Type of the interaction.
+        is_active : bool
+            Whether the interaction is active or not.
+
+        Returns
+        -------
+        dict
+            Keyword arguments for `update_user_audio_state` method, it is empty if the interaction does not change the
+            state.
+        """
+        if interaction_type == AudioInteractionType.LIKE_AUDIO:
+            return {"liked": is_active}
+        elif interaction_type == AudioInteractionType.DISLIKE_AUDIO:
+            return {"disliked": is_active}
+        elif interaction_type in (AudioInteractionType.DOWNLOAD_AUDIO, AudioInteractionType.REDOWNLOAD_AUDIO):
+            return {"download_count_delta": 1} if is_active else {}
+
+        return {}
+
+    def is_interacted(
+        self,
+        interaction_type: AudioInteractionType,
+    ) -> bool:
+        """
+        Check whether the user has an active interaction of the given type with the audio.
+
+        Parameters
+        ----------
+        interaction_type : AudioInteractionType
+            Type of the interaction to check, it must be one of the types in `__state_interaction_types__`.
+
+        Returns
+        -------
+        bool
+            Whether the audio is interacted by the user or not.
+        """
+        if interaction_type == AudioInteractionType.LIKE_AUDIO:
+            return self.liked
+        elif interaction_type == AudioInteractionType.DISLIKE_AUDIO:
+            return self.disliked
+        elif interaction_type == AudioInteractionType.DOWNLOAD_AUDIO:
+            return self.download_count > 0
+
+        return False
+
+
+class UserAudioStateMethods:
+    _update_user_audio_state_query = (
+        "upsert {_key: @key}"
+        "   insert {"
+        "       _key: @key,"
+        "       user_key: @user_key,"
+        "       audio_key: @audio_key,"
+        "       liked: @liked == true,"
+        "       disliked: @disliked == true,"
+        "       favorited: @favorited == true,"
+        "       download_count: max([@download_count_delta, 0]),"
+        "       schema_version: @schema_version,"
+        "       created_at: @now,"
+        "       modified_at: @now"
+        "   }"
+        "   update {"
+        "       liked: @liked == null ? OLD.liked : @liked,"
+        "       disliked: @disliked == null ? OLD.disliked : @disliked,"
+        "       favorited: @favorited == null ? OLD.favorited : @favorited,"
+        "       download_count: max([OLD.download_count + @download_count_delta, 0]),"
+        "       modified_at: @now"
+        "   }"
+        "   in @@user_audio_states"
+        "   return NEW"
+    )
+
+    _get_user_audio_states_by_keys_query = "return document(@@user_audio_states, @keys)"
+
+    _unfavorite_audio_for_all_users_query = (
+        "for state in @@user_audio_states"
+        "   filter state.audio_key == @audio_key and state.favorited"
+        "   update state with {favorited: false, modified_at: @now} in @@user_audio_states"
+    )
+
+    _get_last_user_key_query = "for user in @@users" "   sort user._key desc" "   limit 1" "   return user._key"
+
+    _backfill_user_audio_states_query = (
+        "for user in @@users"
+        "   filter user._key > @last_key"
+        "   sort user._key asc"
+        "   limit @chunk_size"
+        "   let interactions = ("
+        "       for int_e in @@has"
+        "           filter int_e._from == user._id and int_e.to_kind == @interactions"
+        "           let interaction = document(int_e._to)"
+        "           filter interaction.type in @interaction_types"
+        "           for aud_e in @@has"
+        "               filter aud_e._from == interaction._id and aud_e.to_kind == @audios"
+        "               collect audio_key = parse_identifier(aud_e._to).key into group_ = interaction"
+        "               return {"
+        "                   audio_key,"
+        "                   liked: length(group_[* filter CURRENT.type == @like_type and CURRENT.is_active]) > 0,"
+        "                   disliked: length(group_[* filter CURRENT.type == @dislike_type and CURRENT.is_active]) > 0,"
+        "                   download_count: length(group_[* filter CURRENT.type in @download_types and CURRENT.is_active])"
+        "               }"
+        "   )"
+        "   let favorite_audio_keys = ("
+        "       for pl_e in @@has"
+        "           filter pl_e._from == user._id and pl_e.to_kind == @playlists"
+        "           let playlist = document(pl_e._to)"
+        "           filter playlist.is_favorite and not playlist.is_soft_deleted"
+        "           for aud_e in @@has"
+        "               filter aud_e._from == playlist._id and aud_e.to_kind == @audios"
+        "               return parse_identifier(aud_e._to).key"
+        "   )"
+        "   let written = ("
+        "       for audio_key in union_distinct(interactions[*].audio_key, favorite_audio_keys)"
+        "           let state = first(interactions[* filter CURRENT.audio_key == audio_key])"
+        "           let key = concat(user._key, ':', audio_key)"
+        "           let values = {"
+        "               liked: state.liked == true,"
+        "               disliked: state.disliked == true,"
+        "               favorited: audio_key in favorite_audio_keys,"
+        "               download_count: state.download_count || 0,"
+        "               modified_at: @now"
+        "           }"
+        "           upsert {_key: key}"
+        "           insert merge(values, {_key: key, user_key: user._key, audio_key, schema_version: @schema_version, created_at: @now})"
+        "           update values"
+        "           in @@user_audio_states"
+        "           return true"
+        "   )"
+        "   return {_key: user._key}"
+    )
+
+    async def update_user_audio_state(
+        self,
+        user_key: str,
+        audio_key: str,
+        *,
+        liked: Optional[bool] = None,
+        disliked: Optional[bool] = None,
+        favorited: Optional[bool] = None,
+        download_count_delta: int = 0,
+    ) -> Optional[UserAudioState]:
+        """
+        Atomically update the state of an audio for a user, the state document is created if it does not exist. The
+        flags that are not given are kept unchanged.
+
+        Parameters
+        ----------
+        user_key : str
+            Key of the `User` vertex.
+        audio_key : str
+            Key of the `Audio` vertex.
+        liked : bool, optional
+            Whether the user likes the audio.
+        disliked : bool, optional
+            Whether the user dislikes the audio.
+        favorited : bool, optional
+            Whether the audio is in the favorite playlist of the user.
+        download_count_delta : int, default : 0
+            Number to add to the download count of the audio by the user.
+
+        Returns
+        -------
+        UserAudioState, optional
+            Updated state if the operation was successful, otherwise, return `None`.
+        """
+        key = UserAudioState.parse_key(user_key, audio_key)
+        if key is None:
+            return None
+
+        async with await UserAudioState.execute_query(
+            self._update_user_audio_state_query,
+            bind_vars={
+                "@user_audio_states": UserAudioState.__collection_name__,
+                "key": key,
+                "user_key": user_key,
+                "audio_key": audio_key,
+                "liked": liked,
+                "disliked": disliked,
+                "favorited": favorited,
+                "download_count_delta": download_count_delta,
+                "schema_version": UserAudioState.schema_version,
+                "now": get_now_timestamp(),
+            },
+        ) as cursor:
+            async for doc in cursor:
+                return UserAudioState.from_collection(doc)
+
+        logger.error(f"Could not update the state of audio `{audio_key}` for user `{user_key}`")
+        return None
+
+    async def get_user_audio_state(
+        self,
+        user: User,
+        audio_key: str,
+    ) -> Optional[UserAudioState]:
+        """
+        Get the state of an audio for a user.
+
+        Parameters
+        ----------
+        user : User
+            User to get the state for.
+        audio_key : str
+            Key of the `Audio` vertex.
+
+        Returns
+        -------
+        UserAudioState, optional
+            State of the audio for the user if the user has interacted with it, otherwise, return `None`.
+        """
+        if user is None:
+            return None
+
+        key = UserAudioState.parse_key(user.key, audio_key)
+        if key is None:
+            return None
+
+        return await UserAudioState.get(key)
+
+    async def get_user_audio_states(
+        self,
+        user: User,
+        audio_keys: List[str],
+    ) -> Dict[str, UserAudioState]:
+        """
+        Get the states of a list of audios for a user in one query.
+
+        Parameters
+        ----------
+        user : User
+            User to get the states for.
+        audio_keys : list of str
+            Keys of the `Audio` vertices.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the audio keys to their states, the audios the user has not interacted with are not
+            included.
+        """
+        if user is None or not audio_keys:
+            return {}
+
+        res = collections.OrderedDict()
+        async with await UserAudioState.execute_query(
+            self._get_user_audio_states_by_keys_query,
+            bind_vars={
+                "@user_audio_states": UserAudioState.__collection_name__,
+                "keys": [UserAudioState.parse_key(user.key, audio_key) for audio_key in audio_keys],
+            },
+        ) as cursor:
+            async for docs in cursor:
+                for doc in docs:
+                    state = UserAudioState.from_collection(doc)
+                    if state is not None:
+                        res[state.audio_key] = state
+
+        return res
+
+    async def unfavorite_audio_for_all_users(
+        self,
+        audio_key: str,
+    ) -> None:
+        """
+        Mark an audio as not favorited in the states of all users, it is used when the audio is removed from all the
+        playlists.
+
+        Parameters
+        ----------
+        audio_key : str
+            Key of the `Audio` vertex.
+        """
+        if not audio_key:
+            return
+
+        async with await UserAudioState.execute_query(
+            self._unfavorite_audio_for_all_users_query,
+            bind_vars={
+                "@user_audio_states": UserAudioState.__collection_name__,
+                "audio_key": audio_key,
+                "now": get_now_timestamp(),
+            },
+        ) as _:
+            pass
+
+    async def backfill_user_audio_states(
+        self,
+        chunk_size: int = 1000,
+    ) -> Optional[int]:
+        """
+        Build the states of audios for all users from their interaction vertices and favorite playlists. The users are
+        processed in chunks ordered by their keys, and every state is written with absolute values, so running it again
+        does not count any interaction twice. It should only be run until it has been completed once, see
+        `get_backfill_user_audio_states_job`.
+
+        Parameters
+        ----------
+        chunk_size : int, default : 1000
+            Number of users to process in each chunk.
+
+        Returns
+        -------
+        int, optional
+            Number of processed users if all the users were processed, otherwise, return `None`.
+
+        """
+        from tase.db.arangodb.graph.edges import Has
+        from tase.db.arangodb.graph.vertices import Audio, AudioInteraction, Playlist, User
+
+        logger.info("Started backfilling the states of audios for users")
+
+        user_count = 0
+        last_user_key = None
+        async for doc in User.iter_query_by_key(
+            self._backfill_user_audio_states_query,
+            bind_vars={
+                "@users": User.__collection_name__,
+                "@has": Has.__collection_name__,
+                "@user_audio_states": UserAudioState.__collection_name__,
+                "interactions": AudioInteraction.__collection_name__,
+                "audios": Audio.__collection_name__,
+                "playlists": Playlist.__collection_name__,
+                "interaction_types": [
+                    AudioInteractionType.LIKE_AUDIO.value,
+                    AudioInteractionType.DISLIKE_AUDIO.value,
+                    AudioInteractionType.DOWNLOAD_AUDIO.value,
+                    AudioInteractionType.REDOWNLOAD_AUDIO.value,
+                ],
+                "like_type": AudioInteractionType.LIKE_AUDIO.value,
+                "dislike_type": AudioInteractionType.DISLIKE_AUDIO.value,
+                "download_types": [
+                    AudioInteractionType.DOWNLOAD_AUDIO.value,
+                    AudioInteractionType.REDOWNLOAD_AUDIO.value,
+                ],
+                "schema_version": UserAudioState.schema_version,
+                "now": get_now_timestamp(),
+            },
+            chunk_size=chunk_size,
+        ):
+            user_count += 1
+            last_user_key = doc["_key"]
+
+        # a failed chunk ends the iteration early, so the backfill is only completed if it has reached the last user.
+        async with await User.execute_query(
+            self._get_last_user_key_query,
+            bind_vars={
+                "@users": User.__collection_name__,
+            },
+        ) as cursor:
+            async for key in cursor:
+                if key != last_user_key:
+                    logger.error(f"Backfilled the states of audios for {user_count} users, but stopped before the last user")
+                    return None
+
+        logger.info(f"Finished backfilling the states of audios for {user_count} users")
+        return user_count
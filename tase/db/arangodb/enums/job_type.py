@@ -8,3 +8,8 @@ class JobType(Enum):
     COUNT_PUBLIC_PLAYLIST_INTERACTION_TYPE = 2
     COUNT_PUBLIC_PLAYLIST_SUBSCRIPTIONS_TYPE = 3
     COUNT_HITS = 4
+    ARCHIVE_HITS = 5
+
+    # migrations, the job is deactivated once the migration has been completed
+    BACKFILL_HAS_EDGE_KINDS = 6
+    BACKFILL_USER_AUDIO_STATES = 7
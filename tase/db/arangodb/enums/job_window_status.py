@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class JobWindowStatus(Enum):
+    UNKNOWN = 0
+
+    PENDING = 1
+    APPLIED = 2
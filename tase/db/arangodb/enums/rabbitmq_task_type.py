@@ -13,6 +13,8 @@ class RabbitMQTaskType(Enum):
     SHUTDOWN_TASK = 5
     FORWARD_MESSAGE_TASK = 6
     UPLOAD_AUDIO_THUMBNAIL_TASK = 7
+    INDEX_CHANNELS_TASK = 8
+    CALCULATE_CHANNEL_SCORES_TASK = 9
 
     CHECK_USERNAMES_JOB = 100
     CHECK_USERNAMES_WITH_UNCHECKED_MENTIONS_JOB = 101
@@ -25,3 +27,5 @@ class RabbitMQTaskType(Enum):
     COUNT_PUBLIC_PLAYLIST_SUBSCRIPTIONS_JOB = 108
     COUNT_HITS_JOB = 109
     UPLOAD_AUDIO_THUMBNAILS_JOB = 110
+    REPAIR_PLAYLIST_AUDIO_COUNTS_JOB = 111
+    ARCHIVE_HITS_JOB = 112
@@ -1,3 +1,4 @@
+from tase.db.arangodb.document import HitResolverMethods, UserAudioStateMethods
 from tase.db.arangodb.graph.edges import ArangoEdgeMethods
 from tase.db.arangodb.graph.vertices import ArangoVertexMethods
 
@@ -5,5 +6,9 @@ from tase.db.arangodb.graph.vertices import ArangoVertexMethods
 class ArangoGraphMethods(
     ArangoVertexMethods,
     ArangoEdgeMethods,
+    # the states and the hit resolvers are stored in document collections, but they are kept in sync with the graph by
+    # the vertex methods.
+    HitResolverMethods,
+    UserAudioStateMethods,
 ):
     pass
@@ -169,7 +169,7 @@ class BaseEdge(BaseCollectionDocument):
                 return None, False
 
             # fixme: this method hasn't been implemented in `aioarango` yet.
-            metadata = await cls.__collection__.link(
+            metadata = await cls._get_collection().link(
                 from_vertex=from_vertex.id,
                 to_vertex=to_vertex.id,
                 data=graph_doc,
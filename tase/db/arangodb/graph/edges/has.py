@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Optional, Union
 
+from aioarango.models import PersistentIndex
+from tase.my_logger import logger
 from .base_edge import BaseEdge, EdgeEndsValidator
 from ..vertices import (
     User,
@@ -22,6 +24,38 @@ from ..vertices import (
 class Has(BaseEdge):
     __collection_name__ = "has"
     schema_version = 1
+    __indexes__ = [
+        # vertex-centric indexes, so traversals only read the edges going to (or coming from) the vertex collection
+        # they need instead of all the edges of the start vertex.
+        PersistentIndex(
+            custom_version=1,
+            name="from_to_kind",
+            fields=[
+                "_from",
+                "to_kind",
+            ],
+        ),
+        PersistentIndex(
+            custom_version=1,
+            name="to_from_kind",
+            fields=[
+                "_to",
+                "from_kind",
+            ],
+        ),
+        # serves the keyset pagination of the newest edges of a vertex, both for filtering after the cursor and for
+        # sorting, so a page does not need to sort all the edges before it.
+        PersistentIndex(
+            custom_version=1,
+            name="from_to_kind_created_at",
+            fields=[
+                "_from",
+                "to_kind",
+                "created_at",
+                "_to",
+            ],
+        ),
+    ]
 
     __from_vertex_collections__ = (
         User,
@@ -46,6 +80,10 @@ class Has(BaseEdge):
         ThumbnailFile,
     )
 
+    # name of the vertex collections at both ends of the edge
+    from_kind: Optional[str]
+    to_kind: Optional[str]
+
     @classmethod
     @EdgeEndsValidator
     def parse(
@@ -63,8 +101,71 @@ class Has(BaseEdge):
             key=key,
             from_node=from_vertex,
             to_node=to_vertex,
+            from_kind=from_vertex.__collection_name__,
+            to_kind=to_vertex.__collection_name__,
         )
 
 
 class HasMethods:
-    pass
+    _has_edges_without_kinds_query = "for edge in @@has" "   filter edge.from_kind == null or edge.to_kind == null" "   limit 1" "   return true"
+
+    _backfill_has_edge_kinds_query = (
+        "for edge in @@has"
+        "   filter edge._key > @last_key"
+        "   sort edge._key asc"
+        "   filter edge.from_kind == null or edge.to_kind == null"
+        "   limit @chunk_size"
+        "   update edge with {"
+        "       from_kind: parse_identifier(edge._from).collection,"
+        "       to_kind: parse_identifier(edge._to).collection"
+        "   } in @@has options {ignoreRevs: true}"
+        "   return {_key: NEW._key}"
+    )
+
+    async def backfill_has_edge_kinds(
+        self,
+        chunk_size: int = 5000,
+    ) -> Optional[int]:
+        """
+        Set the `from_kind` and `to_kind` attributes of the `Has` edges without them from their `_from` and `_to`
+        attributes. The edges are updated in chunks ordered by their keys, so this can be run on a large collection
+        without holding a long-running transaction, and it is safe to run it again. Since it scans the whole collection,
+        it should only be run until it has been completed once, see `get_backfill_has_edge_kinds_job`.
+
+        Parameters
+        ----------
+        chunk_size : int, default : 5000
+            Number of edges to update in each chunk.
+
+        Returns
+        -------
+        int, optional
+            Number of updated edges if all the edges have their kinds afterwards, otherwise, return `None`.
+
+        """
+        logger.info("Started backfilling the kinds of `has` edges")
+
+        updated_count = 0
+        async for _ in Has.iter_query_by_key(
+            self._backfill_has_edge_kinds_query,
+            bind_vars={
+                "@has": Has.__collection_name__,
+            },
+            chunk_size=chunk_size,
+        ):
+            updated_count += 1
+
+        # a failed chunk ends the iteration early, so the edges are checked once more before the backfill is reported
+        # as completed.
+        async with await Has.execute_query(
+            self._has_edges_without_kinds_query,
+            bind_vars={
+                "@has": Has.__collection_name__,
+            },
+        ) as cursor:
+            if not cursor.empty():
+                logger.error(f"Backfilled the kinds of {updated_count} `has` edges, but some edges are still without them")
+                return None
+
+        logger.info(f"Finished backfilling the kinds of {updated_count} `has` edges")
+        return updated_count
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import collections
 import copy
 from typing import Optional, List, Generator, TYPE_CHECKING, Deque, Tuple
@@ -15,6 +14,7 @@ from tase.common.utils import (
     get_now_timestamp,
     find_hashtags_in_text,
 )
+from tase.db.arangodb.base import arangodb_transaction
 from tase.db.db_utils import (
     get_telegram_message_media_type,
     parse_audio_key,
@@ -33,7 +33,7 @@ from .audio_interaction import AudioInteraction
 from .base_vertex import BaseVertex
 from .hit import Hit
 from .user import User
-from ...helpers import BitRateType
+from ...helpers import BitRateType, EdgeCursor
 
 if TYPE_CHECKING:
     from .. import ArangoGraphMethods
@@ -612,43 +612,46 @@ class Audio(BaseVertex):
 
 class AudioMethods:
     _get_audio_from_hit_query = (
-        "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}" "   return v"
+        "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}" "   filter e.to_kind == @audios" "   return v"
     )
 
     _check_audio_validity_for_inline_mode_by_hit_download_url = (
         "for hit in @@hits"
         "   filter hit.download_url == @hit_download_url"
         "   for v,e in 1..1 outbound hit graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "       filter e.to_kind == @audios"
         "       limit 1"
         "       return v.valid_for_inline_search"
     )
 
-    _get_audio_by_hit_download_url = (
-        "for hit in @@hits"
-        "   filter hit.download_url == @hit_download_url"
-        "   for v,e in 1..1 outbound hit graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
-        "       limit 1"
-        "       return v"
-    )
-
     _get_user_download_history_query = (
-        "for dl_v,dl_e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@interactions]}"
+        "for dl_e in @@has"
+        "   filter dl_e._from == @start_vertex and dl_e.to_kind == @interactions"
+        "   filter @cursor_created_at == null or dl_e.created_at <= @cursor_created_at"
+        "   filter @cursor_created_at == null or dl_e.created_at < @cursor_created_at or dl_e._to < @cursor_to"
+        "   sort dl_e.created_at DESC, dl_e._to DESC"
+        "   let dl_v = document(dl_e._to)"
         "   filter dl_v.type == @interaction_type"
-        "   sort dl_e.created_at DESC"
         "   for aud_v,has_e in 1..1 outbound dl_v graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "       filter has_e.to_kind == @audios"
         "       filter not aud_v.is_deleted or aud_v.type in @archived_lst"
-        "       limit @offset, @limit"
-        "       return aud_v"
+        "       limit @limit"
+        "       return {audio: aud_v, created_at: dl_e.created_at, vertex_key: dl_v._key}"
     )
 
     _get_user_download_history_inline_query = (
-        "for dl_v,dl_e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@interactions]}"
+        "for dl_e in @@has"
+        "   filter dl_e._from == @start_vertex and dl_e.to_kind == @interactions"
+        "   filter @cursor_created_at == null or dl_e.created_at <= @cursor_created_at"
+        "   filter @cursor_created_at == null or dl_e.created_at < @cursor_created_at or dl_e._to < @cursor_to"
+        "   sort dl_e.created_at DESC, dl_e._to DESC"
+        "   let dl_v = document(dl_e._to)"
         "   filter dl_v.type == @interaction_type"
-        "   sort dl_e.created_at DESC"
         "   for aud_v,has_e in 1..1 outbound dl_v graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "       filter has_e.to_kind == @audios"
         "       filter (not aud_v.is_deleted or aud_v.type in @archived_lst) and aud_v.valid_for_inline_search == true"
-        "       limit @offset, @limit"
-        "       return aud_v"
+        "       limit @limit"
+        "       return {audio: aud_v, created_at: dl_e.created_at, vertex_key: dl_v._key}"
     )
 
     _get_audios_by_keys = "return document(@@audios, @audio_keys)"
@@ -679,11 +682,24 @@ class AudioMethods:
     )
 
     _remove_audio_from_all_playlists_query = (
-        "for v,e in 1..1 inbound @audio_vertex_id graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@playlists]}"
-        "   remove e in @@has_"
+        "let playlist_keys = ("
+        "   for v,e in 1..1 inbound @audio_vertex_id graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@playlists]}"
+        "       filter e.from_kind == @playlists"
+        "       remove e in @@has_"
+        "       return v._key"
+        ")"
+        "for playlist in @@playlists"
+        "   filter playlist._key in playlist_keys"
+        "   update playlist with {audio_count: max([playlist.audio_count - 1, 0])} in @@playlists"
     )
 
-    _iter_audios_query = "for audio in @@audios" "   filter audio.modified_at <= @now" "   sort audio.created_at asc" "   return audio"
+    _iter_audios_query = (
+        "for audio in @@audios"
+        "   filter audio._key > @last_key and audio.modified_at <= @now"
+        "   sort audio._key asc"
+        "   limit @chunk_size"
+        "   return audio"
+    )
 
     _get_new_indexed_audios_count_query = (
         "for audio in @@audios"
@@ -701,7 +717,8 @@ class AudioMethods:
         "for interaction in @@interactions"
         "   filter interaction.type == @interaction_type and interaction.created_at < @now"
         "   sort interaction.created_at desc"
-        "   for v_audio in 1..1 outbound interaction graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@audios]}"
+        "   for v_audio, v_audio_edge in 1..1 outbound interaction graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@audios]}"
+        "       filter v_audio_edge.to_kind == @audios"
         "       filter not v_audio.is_deleted and (not has(v_audio, 'type') or v_audio.type == @not_archived_type)"
         "       collect temp = v_audio.chat_id into chat_audios = v_audio"
         "       return chat_audios"
@@ -717,7 +734,8 @@ class AudioMethods:
     _get_audio_by_thumb_file_unique_id = (
         "for thumbnail_vertex in @@thumbnails"
         "   filter thumbnail_vertex.file_unique_id == @file_unique_id"
-        "   for audio_vertex in 1..1 inbound thumbnail_vertex graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@audios]}"
+        "   for audio_vertex, audio_vertex_edge in 1..1 inbound thumbnail_vertex graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@audios]}"
+        "       filter audio_vertex_edge.from_kind == @audios"
         "       return audio_vertex"
     )
 
@@ -755,52 +773,84 @@ class AudioMethods:
         if telegram_message is None:
             return None
 
+        from tase.db.arangodb.graph.edges import FileRef, ForwardedFrom, Has, HasHashtag, SentBy, ViaBot
+
         try:
-            audio, successful = await Audio.insert(Audio.parse(telegram_message, chat_id, audio_type, chat_scores))
-        except TelegramMessageWithNoAudio as e:
+            audio = Audio.parse(telegram_message, chat_id, audio_type, chat_scores)
+        except TelegramMessageWithNoAudio:
             # this message doesn't contain any valid audio file
             await self.mark_old_audio_vertices_as_deleted(chat_id, telegram_message.id)
-        except Exception as e:
-            logger.exception(e)
-        else:
-            if audio and successful:
-                from tase.db.arangodb.graph.edges import HasHashtag
-                from tase.db.arangodb.graph.edges import Has
+            return None
+
+        if audio is None:
+            return None
+
+        try:
+            # the vertices that are shared between audios are created before the transaction, since concurrent
+            # transactions creating the same vertex conflict with each other.
+            thumbnail_vertex = None
+            hashtag_vertices = []
+            try:
+                hashtags = audio.find_hashtags()
+            except ValueError:
+                pass
+            else:
+                if telegram_message.audio and telegram_message.audio.thumbs:
+                    for index, telegram_thumbnail in enumerate(telegram_message.audio.thumbs):
+                        thumbnail_vertex = await self.get_or_create_thumbnail(index=index, telegram_thumbnail=telegram_thumbnail)
+                    if not thumbnail_vertex:
+                        raise Exception(f"Could not create a `Thumbnail` vertex for audio with key: `{audio.key}`")
+
+                for hashtag, start_index, mention_source in hashtags:
+                    hashtag_vertex = await self.get_or_create_hashtag(hashtag)
+                    if hashtag_vertex:
+                        hashtag_vertices.append((hashtag_vertex, start_index, mention_source))
+
+            chat = await self.get_or_create_chat(telegram_message.chat)
+            file = await self.get_or_create_file(telegram_message)
+
+            forwarded_from = None
+            if audio.is_forwarded:
+                if telegram_message.forward_from:
+                    forwarded_from = await self.get_or_create_user(telegram_message.forward_from)
+                elif telegram_message.forward_from_chat:
+                    forwarded_from = await self.get_or_create_chat(telegram_message.forward_from_chat)
+
+            bot = await self.get_or_create_user(telegram_message.via_bot) if audio.via_bot else None
+
+            # the audio vertex and its own edges are created atomically, so a failure in creating any of them does not
+            # leave a partially connected audio vertex behind.
+            async with arangodb_transaction(
+                write=[
+                    Audio,
+                    FileRef,
+                    ForwardedFrom,
+                    Has,
+                    HasHashtag,
+                    SentBy,
+                    ViaBot,
+                ],
+            ):
+                audio, successful = await Audio.insert(audio)
+                if not audio or not successful:
+                    # raising aborts the transaction, so nothing done in it so far is committed.
+                    raise Exception(f"Could not create the `Audio` vertex of message `{telegram_message.id}` in chat `{chat_id}`")
 
                 audio: Audio = audio
-                try:
-                    hashtags = audio.find_hashtags()
-                except ValueError:
-                    pass
-                else:
-                    if telegram_message.audio and telegram_message.audio.thumbs:
-                        for index, telegram_thumbnail in enumerate(telegram_message.audio.thumbs):
-                            thumbnail_vertex = await self.get_or_create_thumbnail(index=index, telegram_thumbnail=telegram_thumbnail)
-                        if not thumbnail_vertex:
-                            raise Exception(f"Could not create a `Thumbnail` vertex for audio with key: `{audio.key}`")
-
-                        if not await Has.get_or_create_edge(audio, thumbnail_vertex):
-                            raise EdgeCreationFailed(Has.__class__.__name__)
-
-                    for hashtag, start_index, mention_source in hashtags:
-                        hashtag_vertex = await self.get_or_create_hashtag(hashtag)
-
-                        if hashtag_vertex:
-                            has_hashtag = await HasHashtag.get_or_create_edge(
-                                audio,
-                                hashtag_vertex,
-                                mention_source,
-                                start_index,
-                            )
-                            if has_hashtag is None:
-                                raise EdgeCreationFailed(HasHashtag.__class__.__name__)
-                        else:
-                            pass
-
-                chat = await self.get_or_create_chat(telegram_message.chat)
-                try:
-                    from tase.db.arangodb.graph.edges import SentBy
+                if thumbnail_vertex is not None and not await Has.get_or_create_edge(audio, thumbnail_vertex):
+                    raise EdgeCreationFailed(Has.__class__.__name__)
+
+                for hashtag_vertex, start_index, mention_source in hashtag_vertices:
+                    has_hashtag = await HasHashtag.get_or_create_edge(
+                        audio,
+                        hashtag_vertex,
+                        mention_source,
+                        start_index,
+                    )
+                    if has_hashtag is None:
+                        raise EdgeCreationFailed(HasHashtag.__class__.__name__)
 
+                try:
                     sent_by_edge = await SentBy.get_or_create_edge(audio, chat)
                     if sent_by_edge is None:
                         raise EdgeCreationFailed(SentBy.__class__.__name__)
@@ -808,33 +858,25 @@ class AudioMethods:
                     pass
 
                 # since checking for audio file validation is done above, there is no need to it again.
-                await self._create_file_with_file_ref_edge(telegram_message, audio)
-
-                if audio.is_forwarded:
-                    if telegram_message.forward_from:
-                        forwarded_from = await self.get_or_create_user(telegram_message.forward_from)
-                    elif telegram_message.forward_from_chat:
-                        forwarded_from = await self.get_or_create_chat(telegram_message.forward_from_chat)
-                    else:
-                        forwarded_from = None
-
-                    if forwarded_from is not None:
-                        try:
-                            from tase.db.arangodb.graph.edges import ForwardedFrom
-
-                            forwarded_from_edge = await ForwardedFrom.get_or_create_edge(audio, forwarded_from)
-                            if forwarded_from_edge is None:
-                                raise EdgeCreationFailed(ForwardedFrom.__class__.__name__)
-                        except (InvalidFromVertex, InvalidToVertex):
-                            pass
-
-                    # todo: the `forwarded_from` edge from `audio` to the `original audio` must be checked later
-
-                if audio.via_bot:
-                    bot = await self.get_or_create_user(telegram_message.via_bot)
+                try:
+                    file_ref_edge = await FileRef.get_or_create_edge(audio, file)
+                    if file_ref_edge is None:
+                        raise EdgeCreationFailed(FileRef.__class__.__name__)
+                except (InvalidFromVertex, InvalidToVertex):
+                    pass
+
+                if forwarded_from is not None:
                     try:
-                        from tase.db.arangodb.graph.edges import ViaBot
+                        forwarded_from_edge = await ForwardedFrom.get_or_create_edge(audio, forwarded_from)
+                        if forwarded_from_edge is None:
+                            raise EdgeCreationFailed(ForwardedFrom.__class__.__name__)
+                    except (InvalidFromVertex, InvalidToVertex):
+                        pass
 
+                # todo: the `forwarded_from` edge from `audio` to the `original audio` must be checked later
+
+                if bot is not None:
+                    try:
                         via_bot_edge = await ViaBot.get_or_create_edge(audio, bot)
                         if via_bot_edge is None:
                             raise EdgeCreationFailed(ViaBot.__class__.__name__)
@@ -842,6 +884,10 @@ class AudioMethods:
                         pass
 
                 return audio
+        except EdgeCreationFailed:
+            raise
+        except Exception as e:
+            logger.exception(e)
 
         return None
 
@@ -1156,7 +1202,7 @@ class AudioMethods:
         return False
 
     async def get_audio_from_hit_download_url(
-        self,
+        self: ArangoGraphMethods,
         hit_download_url: str = None,
     ) -> Optional[Audio]:
         """
@@ -1176,31 +1222,21 @@ class AudioMethods:
         if not hit_download_url:
             return None
 
-        from tase.db.arangodb.graph.edges import Has
-
-        async with await Audio.execute_query(
-            self._get_audio_by_hit_download_url,
-            bind_vars={
-                "@hits": Hit.__collection_name__,
-                "hit_download_url": hit_download_url,
-                "audios": Audio.__collection_name__,
-                "has": Has.__collection_name__,
-            },
-        ) as cursor:
-            async for doc in cursor:
-                return Audio.from_collection(doc)
+        resolver = await self.resolve_hit_download_url(hit_download_url)
+        if resolver is None or not resolver.audio_key:
+            return None
 
-        return None
+        return await Audio.get(resolver.audio_key)
 
     async def get_user_download_history(
         self,
         user: User,
         only_include_valid_audios_for_inline_search: bool = False,
-        offset: int = 0,
+        cursor: Optional[EdgeCursor] = None,
         limit: int = 15,
-    ) -> Deque[Audio]:
+    ) -> Tuple[Deque[Audio], Optional[EdgeCursor]]:
         """
-        Get `User` download history.
+        Get `User` download history, newest downloads first.
 
         Parameters
         ----------
@@ -1208,42 +1244,51 @@ class AudioMethods:
             User to get the download history
         only_include_valid_audios_for_inline_search : bool, default : False
             Whether to only get audio files that are valid to be shown in inline mode
-        offset : int, default : 0
-            Offset to get the download history query after
+        cursor : EdgeCursor, optional
+            Cursor returned with the previous page to get the download history after, the first page is returned if
+            it is not given.
         limit : int, default : 15
             Number of `Audio`s to query
 
         Returns
         -------
-        deque
-            Audios that the given user has downloaded
+        tuple
+            Audios that the given user has downloaded and the cursor to get the next page with, the cursor is `None`
+            if this is the last page.
 
         """
         if user is None:
-            return collections.deque()
+            return collections.deque(), None
 
         from tase.db.arangodb.graph.edges import Has
 
         res = collections.deque()
+        next_cursor = None
+        row_count = 0
         async with await Audio.execute_query(
             self._get_user_download_history_inline_query if only_include_valid_audios_for_inline_search else self._get_user_download_history_query,
             bind_vars={
                 "start_vertex": user.id,
                 "has": Has.__collection_name__,
+                "@has": Has.__collection_name__,
                 "audios": Audio.__collection_name__,
                 "interactions": AudioInteraction.__collection_name__,
                 "interaction_type": AudioInteractionType.DOWNLOAD_AUDIO.value,
                 "archived_lst": [AudioType.ARCHIVED.value, AudioType.UPLOADED.value, AudioType.SENT_BY_USERS.value],
-                "offset": offset,
+                "cursor_created_at": cursor.created_at if cursor else None,
+                "cursor_to": f"{AudioInteraction.__collection_name__}/{cursor.vertex_key}" if cursor else None,
                 "limit": limit,
             },
-        ) as cursor:
-            async for doc in cursor:
-                obj = Audio.from_collection(doc)
+        ) as query_cursor:
+            async for doc in query_cursor:
+                row_count += 1
+                next_cursor = EdgeCursor.parse_from_db_object(doc)
+
+                obj = Audio.from_collection(doc["audio"])
                 if obj:
                     res.append(obj)
 
-        return res
+        return res, next_cursor if row_count >= limit else None
 
     async def get_audios_from_keys(
         self,
@@ -1283,7 +1328,7 @@ class AudioMethods:
         return res
 
     async def remove_audio_from_all_playlists(
-        self,
+        self: ArangoGraphMethods,
         audio_vertex_id: str,
     ) -> None:
         """
@@ -1308,10 +1353,13 @@ class AudioMethods:
                 "@has_": Has.__collection_name__,
                 "has": Has.__collection_name__,
                 "playlists": Playlist.__collection_name__,
+                "@playlists": Playlist.__collection_name__,
             },
         ) as _:
             pass
 
+        await self.unfavorite_audio_for_all_users(audio_vertex_id.split("/", 1)[-1])
+
     async def mark_chat_audios_as_deleted(
         self,
         chat_id: int,
@@ -1420,7 +1468,7 @@ class AudioMethods:
         if excluded_key:
             bind_vars["excluded_key"] = excluded_key
 
-        coroutines = collections.deque()
+        audio_vertex_ids = collections.deque()
 
         async with await Audio.execute_query(
             self._mark_old_audios_as_deleted_by_chat_id_and_message_id_with_excluded_key
@@ -1430,10 +1478,12 @@ class AudioMethods:
         ) as cursor:
             async for doc in cursor:
                 if "_id" in doc:
-                    coroutines.append(self.remove_audio_from_all_playlists(doc["_id"]))
+                    audio_vertex_ids.append(doc["_id"])
 
-        if coroutines:
-            await asyncio.gather(*coroutines)
+        # the audios are removed from the playlists one after another, so this can also run inside a stream
+        # transaction, which does not accept concurrent requests.
+        for audio_vertex_id in audio_vertex_ids:
+            await self.remove_audio_from_all_playlists(audio_vertex_id)
 
     async def iter_audios(
         self,
@@ -1442,17 +1492,17 @@ class AudioMethods:
         if now is None:
             return
 
-        async with await Audio.execute_query(
+        async for doc in Audio.iter_query_by_key(
             self._iter_audios_query,
             bind_vars={
                 "@audios": Audio.__collection_name__,
                 "now": now,
             },
-        ) as cursor:
-            async for doc in cursor:
-                obj = Audio.from_collection(doc)
-                if obj:
-                    yield obj
+            prefetch=2,
+        ):
+            obj = Audio.from_collection(doc)
+            if obj:
+                yield obj
 
     async def get_audio_by_key(
         self,
@@ -1518,7 +1568,7 @@ class AudioMethods:
         from tase.db.arangodb.graph.edges import Has
 
         res = collections.deque()
-        async with await Audio.execute_query(
+        async for audio_doc_lst in Audio.iter_query(
             self._get_not_archived_downloaded_audios,
             bind_vars={
                 "@interactions": AudioInteraction.__collection_name__,
@@ -1528,25 +1578,25 @@ class AudioMethods:
                 "interaction_type": AudioInteractionType.DOWNLOAD_AUDIO.value,
                 "not_archived_type": AudioType.NOT_ARCHIVED.value,
             },
-        ) as cursor:
-            async for audio_doc_lst in cursor:
-                group = collections.deque()
-                group_keys = set()
+            prefetch=2,
+        ):
+            group = collections.deque()
+            group_keys = set()
 
-                if not audio_doc_lst:
-                    continue
+            if not audio_doc_lst:
+                continue
 
-                for audio_doc in audio_doc_lst:
-                    if not audio_doc:
-                        continue
+            for audio_doc in audio_doc_lst:
+                if not audio_doc:
+                    continue
 
-                    if audio_doc["_key"] not in group_keys:
-                        _audio = Audio.from_collection(audio_doc)
-                        group.append(_audio)
-                        group_keys.add(_audio.key)
+                if audio_doc["_key"] not in group_keys:
+                    _audio = Audio.from_collection(audio_doc)
+                    group.append(_audio)
+                    group_keys.add(_audio.key)
 
-                if group:
-                    res.append(group)
+            if group:
+                res.append(group)
 
         return res
 
@@ -96,10 +96,12 @@ class AudioInteraction(BaseVertex):
 
 class AudioInteractionMethods:
     _is_audio_interacted_by_user_query = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type and v_int.is_active == true"
         "   let has_audio = ("
-        "       for v_aud in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "       for v_aud, v_aud_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "           filter v_aud_edge.to_kind == @audios"
         "           filter v_aud._key == @audio_key"
         "           return true"
         "   )"
@@ -108,15 +110,18 @@ class AudioInteractionMethods:
     )
 
     _is_audio_interacted_by_user_query1 = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type and v_int.is_active == true"
         "   let has_audio = ("
-        "       for v_aud in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "       for v_aud, v_aud_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "           filter v_aud_edge.to_kind == @audios"
         "           filter v_aud._key == @audio_key"
         "           return true"
         "   )"
         "   let has_playlist = ("
-        "       for v_playlist in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "       for v_playlist, v_playlist_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "           filter v_playlist_edge.to_kind == @playlists"
         "           filter v_playlist._key == @playlist_key"
         "           return true"
         "   )"
@@ -125,10 +130,12 @@ class AudioInteractionMethods:
     )
 
     _get_audio_interaction_by_user_query = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type"
         "   let has_audio = ("
-        "       for v_aud in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "       for v_aud, v_aud_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "           filter v_aud_edge.to_kind == @audios"
         "           filter v_aud._key == @audio_key"
         "           return true"
         "   )"
@@ -137,15 +144,18 @@ class AudioInteractionMethods:
     )
 
     _get_audio_interaction_by_user_query1 = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type"
         "   let has_audio = ("
-        "       for v_aud in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "       for v_aud, v_aud_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "           filter v_aud_edge.to_kind == @audios"
         "           filter v_aud._key == @audio_key"
         "           return true"
         "   )"
         "   let has_playlist = ("
-        "       for v_playlist in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "       for v_playlist, v_playlist_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "           filter v_playlist_edge.to_kind == @playlists"
         "           filter v_playlist._key == @playlist_key"
         "           return true"
         "   )"
@@ -157,6 +167,7 @@ class AudioInteractionMethods:
         "for interaction in @@interactions"
         "   filter interaction.modified_at >= @last_run_at and interaction.modified_at < @now"
         "   for v,e in 1..1 outbound interaction graph @graph_name options {order: 'dfs', edgeCollections:[@has], vertexCollections:[@vertices]}"
+        "       filter e.to_kind == @vertices"
         "       collect audio_key = v._key, interaction_type = interaction.type, is_active= interaction.is_active"
         "       aggregate count_ = length(0)"
         "       sort count_ desc, interaction_type asc"
@@ -289,6 +300,15 @@ class AudioInteractionMethods:
             logger.error("ValueError: Could not create `has` edge from `User` vertex to `Interaction` vertex")
             return None
 
+        from tase.db.arangodb.document import UserAudioState
+
+        state_changes = UserAudioState.get_interaction_changes(type_, interaction.is_active)
+        if state_changes:
+            await self.update_user_audio_state(user.key, audio.key, **state_changes)
+
+        if type_ == AudioInteractionType.SHARE_AUDIO_LINK:
+            await self.set_hit_link_sender(audio_hit_download_url, user.key)
+
         # try:
         #     FromBot.get_or_create_edge(download, bot)
         # except (InvalidFromVertex, InvalidToVertex):
@@ -455,6 +475,13 @@ class AudioInteractionMethods:
             from tase.db.arangodb.graph.edges import Has
 
             successful = await interaction_vertex.toggle(is_active)
+            if successful and not playlist_key:
+                from tase.db.arangodb.document import UserAudioState
+
+                state_changes = UserAudioState.get_interaction_changes(interaction_type, interaction_vertex.is_active)
+                if state_changes:
+                    await self.update_user_audio_state(user.key, audio.key, **state_changes)
+
             return successful, has_interacted
         else:
             # An interaction is created only if the status of the interaction is `is_active` and the `create_if_not_exists` parameter has been set to `True`.
@@ -532,11 +559,11 @@ class AudioInteractionMethods:
             raise ValueError(f"`{interaction_type}` must be given with a `playlist_key`!")
 
         if hit_download_url:
-            hit = await self.find_hit_by_download_url(hit_download_url)
-            if hit is None:
+            resolver = await self.resolve_hit_download_url(hit_download_url)
+            if resolver is None:
                 raise HitDoesNotExists(hit_download_url)
 
-            audio = await self.get_audio_from_hit(hit)
+            audio = await self.get_audio_by_key(resolver.audio_key) if resolver.audio_key else None
             if audio is None:
                 raise HitNoLinkedAudio(hit_download_url)
         else:
@@ -544,6 +571,13 @@ class AudioInteractionMethods:
             if audio is None:
                 raise AudioVertexDoesNotExist(audio_vertex_key)
 
+        from tase.db.arangodb.document import UserAudioState
+
+        if not playlist_key and interaction_type in UserAudioState.__state_interaction_types__:
+            # the interactions without any playlist are read from the materialized state of the audio for the user.
+            state = await self.get_user_audio_state(user, audio.key)
+            return state is not None and state.is_interacted(interaction_type)
+
         from tase.db.arangodb.graph.edges import Has
         from tase.db.arangodb.graph.vertices import Audio, Playlist
 
@@ -594,7 +628,7 @@ class AudioInteractionMethods:
 
         res = collections.deque()
 
-        async with await AudioInteraction.execute_query(
+        async for doc in AudioInteraction.iter_query(
             self._count_audio_interactions_query,
             bind_vars={
                 "@interactions": AudioInteraction.__collection_name__,
@@ -603,10 +637,10 @@ class AudioInteractionMethods:
                 "has": Has.__collection_name__,
                 "vertices": Audio.__collection_name__,
             },
-        ) as cursor:
-            async for doc in cursor:
-                obj = AudioInteractionCount.parse(doc)
-                if obj is not None:
-                    res.append(obj)
+            prefetch=2,
+        ):
+            obj = AudioInteractionCount.parse(doc)
+            if obj is not None:
+                res.append(obj)
 
         return list(res)
@@ -22,6 +22,7 @@ from ...helpers import (
     AudioIndexerMetadata,
     AudioDocIndexerMetadata,
     UsernameExtractorMetadata,
+    ChannelMessageCounts,
 )
 
 
@@ -141,6 +142,7 @@ class Chat(BaseVertex):
         "audio_indexer_metadata",
         "audio_doc_indexer_metadata",
         "username_extractor_metadata",
+        "message_counts",
     )
 
     chat_id: int
@@ -170,6 +172,7 @@ class Chat(BaseVertex):
     audio_indexer_metadata: Optional[AudioIndexerMetadata]
     audio_doc_indexer_metadata: Optional[AudioDocIndexerMetadata]
     username_extractor_metadata: Optional[UsernameExtractorMetadata]
+    message_counts: Optional[ChannelMessageCounts]
 
     @classmethod
     def parse_key(
@@ -409,6 +412,35 @@ class Chat(BaseVertex):
             retry_on_failure=True,
         )
 
+    async def update_message_counts(
+        self,
+        message_counts: ChannelMessageCounts,
+    ) -> bool:
+        """
+        Updates the cached message counters of the chat
+
+        Parameters
+        ----------
+        message_counts : ChannelMessageCounts
+            New message counters
+
+        Returns
+        -------
+        bool
+            Whether the update was successful or not
+        """
+        if message_counts is None:
+            return False
+
+        self_copy: Chat = self.copy(deep=True)
+        self_copy.message_counts = message_counts
+
+        return await self.update(
+            self_copy,
+            reserve_non_updatable_fields=False,
+            retry_on_failure=True,
+        )
+
     async def update_audio_doc_indexer_score(
         self,
         score: float,
@@ -496,6 +528,7 @@ class ChatMethods:
 
     _get_chat_username_with_edge_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@usernames]}"
+        "   filter e.to_kind == @usernames"
         "   return {username:v, edge:e}"
     )
 
@@ -968,16 +1001,14 @@ class ChatMethods:
         # todo: only public channels can be indexed for now. add support for other types if necessary
         chat_type = ChatType.CHANNEL.value
 
-        async with await Chat.execute_query(
+        async for doc in Chat.iter_query(
             self._get_chats_sorted_by_audio_indexer_score_query if only_include_indexed_chats else self._get_not_indexed_chats_sorted_by_members_count_query,
-            stream=True,
             bind_vars={
                 "@chats": Chat.__collection_name__,
                 "chat_type": chat_type,
             },
-        ) as cursor:
-            async for doc in cursor:
-                yield Chat.from_collection(doc)
+        ):
+            yield Chat.from_collection(doc)
 
     async def get_chats_sorted_by_audio_doc_indexer_score(self) -> AsyncGenerator[Chat, None]:
         """
@@ -4,8 +4,8 @@ import asyncio
 import collections
 from typing import Optional, TYPE_CHECKING, List, Deque, Set, Union
 
-from aioarango.models import PersistentIndex
-from tase.common.utils import generate_token_urlsafe, async_timed
+from aioarango.models import PersistentIndex, TTLIndex
+from tase.common.utils import generate_token_urlsafe, async_timed, get_now_timestamp
 from tase.db.helpers import SearchMetaData
 from tase.errors import InvalidFromVertex, InvalidToVertex, EdgeCreationFailed
 from tase.my_logger import logger
@@ -63,6 +63,14 @@ class Hit(BaseVertex):
             ],
             unique=True,
         ),
+        TTLIndex(
+            custom_version=1,
+            name="expire_at",
+            fields=[
+                "expire_at",
+            ],
+            expiry_time=0,
+        ),
     ]
 
     hit_type: HitType
@@ -74,6 +82,9 @@ class Hit(BaseVertex):
 
     download_url: Optional[str]
 
+    # timestamp in seconds after which the hit is removed by the TTL index, it is only set once the hit is archived.
+    expire_at: Optional[int]
+
     def __getattr__(self, item):
         if item == "metadata":
             return None
@@ -121,12 +132,91 @@ class HitMethods:
         "for hit in @@hits"
         "   filter hit.created_at >= @last_run_at and hit.created_at < @now"
         "   for v,e in 1..1 outbound hit graph @graph_name options {order: 'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "       filter e.to_kind == @audios"
         "       collect audio_key = v._key, hit_type = hit.hit_type"
         "       aggregate count_ = length(0)"
         "       sort count_ desc, hit_type asc"
         "   return {audio_key, hit_type, count_}"
     )
 
+    _get_archivable_queries_query = (
+        "for query in @@queries"
+        "   filter query.created_at >= @start and query.created_at < @end and query.expire_at == null"
+        "   filter query.created_at > @last_created_at or (query.created_at == @last_created_at and query._key > @last_key)"
+        "   sort query.created_at asc, query._key asc"
+        "   limit @chunk_size"
+        "   let hits = ("
+        "       for q_e in @@has"
+        "           filter q_e._from == query._id and q_e.to_kind == @hits"
+        "           let hit = document(q_e._to)"
+        "           let is_used = hit != null and length(for fh_e in @@from_hit filter fh_e._to == hit._id limit 1 return true) > 0"
+        "           let target_edges = (for t_e in @@has filter t_e._from == q_e._to return t_e)"
+        "           return {"
+        "               hit_key: hit._key,"
+        "               download_url: hit.download_url,"
+        "               hit_type: hit.hit_type,"
+        "               day: hit == null ? null : floor(hit.created_at / @day_length) * @day_length,"
+        "               audio_key: first(target_edges[* filter CURRENT.to_kind == @audios return parse_identifier(CURRENT._to).key]),"
+        "               edge_keys: append([q_e._key], target_edges[*]._key),"
+        "               is_used"
+        "           }"
+        "   )"
+        "   let archived_hits = hits[* filter not CURRENT.is_used]"
+        "   let is_archived = length(archived_hits) == length(hits)"
+        "   let has_made_keys = (for e in @@has_made filter e._to == query._id return e._key)"
+        "   let to_bot_keys = (for e in @@to_bot filter e._from == query._id return e._key)"
+        "   return {"
+        "       _key: query._key,"
+        "       created_at: query.created_at,"
+        "       is_archived,"
+        "       hits: archived_hits,"
+        "       has_made_keys: is_archived ? has_made_keys : [],"
+        "       to_bot_keys: is_archived ? to_bot_keys : []"
+        "   }"
+    )
+
+    _archive_hits_query = (
+        "let counts_ = ("
+        "   for count_ in @counts"
+        "       upsert {_key: count_._key}"
+        "       insert merge(count_, {schema_version: @schema_version, created_at: @now, modified_at: @now})"
+        "       update {count: OLD.count + count_.count, modified_at: @now}"
+        "       in @@audio_hit_daily_counts"
+        "       return true"
+        ")"
+        "let hits_ = ("
+        "   for key in @hit_keys"
+        "       update {_key: key, expire_at: @expire_at} in @@hits options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "let resolvers_ = ("
+        "   for key in @resolver_keys"
+        "       update {_key: key, expire_at: @expire_at} in @@hit_resolvers options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "let queries_ = ("
+        "   for key in @query_keys"
+        "       update {_key: key, expire_at: @expire_at} in @@queries options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "let has_ = ("
+        "   for key in @has_keys"
+        "       remove {_key: key} in @@has options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "let has_made_ = ("
+        "   for key in @has_made_keys"
+        "       remove {_key: key} in @@has_made options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "let to_bot_ = ("
+        "   for key in @to_bot_keys"
+        "       remove {_key: key} in @@to_bot options {ignoreErrors: true}"
+        "       return true"
+        ")"
+        "return length(hits_)"
+    )
+
     @async_timed()
     async def generate_hit_download_urls(
         self,
@@ -325,7 +415,7 @@ class HitMethods:
 
         res = collections.deque()
 
-        async with await Hit.execute_query(
+        async for doc in Hit.iter_query(
             self._count_hits_query,
             bind_vars={
                 "@hits": Hit.__collection_name__,
@@ -334,10 +424,157 @@ class HitMethods:
                 "has": Has.__collection_name__,
                 "audios": Audio.__collection_name__,
             },
-        ) as cursor:
-            async for doc in cursor:
-                obj = HitCount.parse(doc)
-                if obj is not None:
-                    res.append(obj)
+            prefetch=2,
+        ):
+            obj = HitCount.parse(doc)
+            if obj is not None:
+                res.append(obj)
 
         return list(res)
+
+    async def archive_unused_hits(
+        self,
+        start: int,
+        end: int,
+        chunk_size: int = 500,
+    ) -> Optional[int]:
+        """
+        Archive the `Query` vertices created in `[start, end)` along with their `Hit` vertices that have never been used.
+
+        The hits without any interaction are rolled up into the daily hit counts of their audios, then they are marked
+        with an `expire_at` timestamp, so the TTL index of their collection removes them in the background. The
+        `has` edges of these hits would be left orphaned by the TTL index, so they are removed here. A query is
+        archived the same way once none of its hits is kept, along with its `has_made` and `to_bot` edges. The edges of
+        the hits that have already been removed are cleaned up as well.
+
+        The queries are processed in chunks ordered by their creation time, and every chunk is archived with a single
+        query, so an interrupted run can be resumed without counting any hit twice.
+
+        Parameters
+        ----------
+        start : int
+            Timestamp to start archiving the queries from.
+        end : int
+            Timestamp to archive the queries until (exclusive).
+        chunk_size : int, default : 500
+            Number of queries to process in each chunk.
+
+        Returns
+        -------
+        int, optional
+            Number of archived hits if the operation was successful, otherwise, return `None`.
+        """
+        if start is None or end is None:
+            return None
+
+        from tase.db.arangodb.document import AudioHitDailyCount, HitResolver
+        from tase.db.arangodb.graph.edges import FromHit, Has, HasMade, ToBot
+        from tase.db.arangodb.graph.vertices import Audio, Query
+
+        archived_hit_count = 0
+        last_created_at = start
+        last_key = ""
+
+        while True:
+            rows = collections.deque()
+            async with await Query.execute_query(
+                self._get_archivable_queries_query,
+                bind_vars={
+                    "@queries": Query.__collection_name__,
+                    "@has": Has.__collection_name__,
+                    "@has_made": HasMade.__collection_name__,
+                    "@to_bot": ToBot.__collection_name__,
+                    "@from_hit": FromHit.__collection_name__,
+                    "hits": Hit.__collection_name__,
+                    "audios": Audio.__collection_name__,
+                    "start": start,
+                    "end": end,
+                    "last_created_at": last_created_at,
+                    "last_key": last_key,
+                    "chunk_size": chunk_size,
+                    "day_length": 86400000,
+                },
+            ) as cursor:
+                async for doc in cursor:
+                    rows.append(doc)
+
+            if not rows:
+                break
+
+            counts = {}
+            hit_keys = []
+            resolver_keys = []
+            query_keys = []
+            has_keys = []
+            has_made_keys = []
+            to_bot_keys = []
+
+            for row in rows:
+                if row["is_archived"]:
+                    query_keys.append(row["_key"])
+                has_made_keys.extend(row["has_made_keys"])
+                to_bot_keys.extend(row["to_bot_keys"])
+
+                for hit in row["hits"]:
+                    has_keys.extend(hit["edge_keys"])
+                    if hit["hit_key"] is None:
+                        # the hit has already been removed, only its orphaned edges are left.
+                        continue
+
+                    hit_keys.append(hit["hit_key"])
+                    if hit["download_url"]:
+                        resolver_keys.append(hit["download_url"])
+
+                    if hit["audio_key"]:
+                        hit_type = HitType(hit["hit_type"])
+                        key = AudioHitDailyCount.parse_key(hit["audio_key"], hit["day"], hit_type)
+                        if key not in counts:
+                            counts[key] = {
+                                "_key": key,
+                                "audio_key": hit["audio_key"],
+                                "day": hit["day"],
+                                "hit_type": hit_type.value,
+                                "count": 0,
+                            }
+                        counts[key]["count"] += 1
+
+            now = get_now_timestamp()
+            successful = False
+            async with await Hit.execute_query(
+                self._archive_hits_query,
+                bind_vars={
+                    "@audio_hit_daily_counts": AudioHitDailyCount.__collection_name__,
+                    "@hits": Hit.__collection_name__,
+                    "@hit_resolvers": HitResolver.__collection_name__,
+                    "@queries": Query.__collection_name__,
+                    "@has": Has.__collection_name__,
+                    "@has_made": HasMade.__collection_name__,
+                    "@to_bot": ToBot.__collection_name__,
+                    "counts": list(counts.values()),
+                    "hit_keys": hit_keys,
+                    "resolver_keys": resolver_keys,
+                    "query_keys": query_keys,
+                    "has_keys": has_keys,
+                    "has_made_keys": has_made_keys,
+                    "to_bot_keys": to_bot_keys,
+                    "schema_version": AudioHitDailyCount.schema_version,
+                    "now": now,
+                    # TTL indexes expect the timestamps in seconds
+                    "expire_at": now // 1000,
+                },
+            ) as cursor:
+                async for archived_count in cursor:
+                    archived_hit_count += archived_count
+                    successful = True
+
+            if not successful:
+                logger.error(f"Could not archive the hits of the queries created in [{start}, {end})")
+                return None
+
+            last_created_at = rows[-1]["created_at"]
+            last_key = rows[-1]["_key"]
+
+            if len(rows) < chunk_size:
+                break
+
+        return archived_hit_count
@@ -21,14 +21,14 @@ from tase.errors import (
 from tase.my_logger import logger
 from .base_vertex import BaseVertex
 from .user import User
-from ...helpers import PublicPlaylistSubscriptionCount
+from ...helpers import PublicPlaylistSubscriptionCount, EdgeCursor
 
 if TYPE_CHECKING:
     from .. import ArangoGraphMethods
     from .audio import Audio
     from .hit import Hit
 
-from ...base import BaseSoftDeletableDocument
+from ...base import BaseSoftDeletableDocument, arangodb_transaction
 from ...enums import TelegramAudioType, AudioType, MentionSource
 
 
@@ -52,7 +52,10 @@ class Playlist(BaseVertex, BaseSoftDeletableDocument):
         ),
     ]
 
-    __non_updatable_fields__ = ("is_favorite",)
+    __non_updatable_fields__ = (
+        "is_favorite",
+        "audio_count",
+    )
 
     owner_user_id: int
 
@@ -63,6 +66,9 @@ class Playlist(BaseVertex, BaseSoftDeletableDocument):
     is_favorite: bool = Field(default=False)
     is_public: bool = Field(default=False)
 
+    # number of audios in this playlist, it is only updated along with the `has` edges from this playlist to audios.
+    audio_count: int = Field(default=0)
+
     async def update_title(
         self,
         title: str,
@@ -85,7 +91,7 @@ class Playlist(BaseVertex, BaseSoftDeletableDocument):
 
         self_copy = self.copy(deep=True)
         self_copy.title = title
-        return await self.update(self_copy, reserve_non_updatable_fields=False)
+        return await self.update(self_copy, reserve_non_updatable_fields=True)
 
     async def update_description(
         self,
@@ -109,7 +115,7 @@ class Playlist(BaseVertex, BaseSoftDeletableDocument):
 
         self_copy = self.copy(deep=True)
         self_copy.description = description
-        return await self.update(self_copy, reserve_non_updatable_fields=False)
+        return await self.update(self_copy, reserve_non_updatable_fields=True)
 
     async def update_last_modified_date(self):
         """
@@ -158,6 +164,7 @@ class Playlist(BaseVertex, BaseSoftDeletableDocument):
 class PlaylistMethods:
     _get_user_playlist_by_title_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   filter v.is_soft_deleted == not @filter_out and v.title == @title"
         "   limit 1"
         "   return v"
@@ -165,6 +172,7 @@ class PlaylistMethods:
 
     _get_user_playlist_by_key_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   filter v.is_soft_deleted == @is_soft_deleted and v._key == @key"
         "   limit 1"
         "   return v"
@@ -172,6 +180,7 @@ class PlaylistMethods:
 
     _get_user_playlist_by_key_query1 = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   filter v._key == @key"
         "   limit 1"
         "   return v"
@@ -179,6 +188,7 @@ class PlaylistMethods:
 
     _get_user_favorite_playlist_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   filter v.is_favorite == @is_favorite"
         "   limit 1"
         "   return v"
@@ -186,6 +196,7 @@ class PlaylistMethods:
 
     _get_user_playlists_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   sort v.rank ASC, v.modified_at DESC"
         "   limit @offset, @limit"
         "   return v"
@@ -200,64 +211,63 @@ class PlaylistMethods:
 
     _get_user_valid_playlists_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
+        "   filter v.is_favorite or v.audio_count < @playlist_capacity"
         "   sort v.rank ASC, v.modified_at DESC"
-        "   let playlist_length=("
-        "       for audio_v in 1..1 outbound v._id graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
-        "           collect with count into length"
-        "           return length"
-        "   )"
-        "   filter v.is_favorite or playlist_length[0] < @playlist_capacity"
         "   limit @offset, @limit"
         "   return v"
     )
 
     _get_user_playlists_count_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "   filter e.to_kind == @playlists"
         "   filter v.is_public == @is_public"
         "   COLLECT WITH COUNT INTO playlist_count"
         "   return playlist_count"
     )
 
     _get_playlist_audios_query = (
-        "for audio_v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "for e in @@has"
+        "   filter e._from == @start_vertex and e.to_kind == @audios"
+        "   filter @cursor_created_at == null or e.created_at <= @cursor_created_at"
+        "   filter @cursor_created_at == null or e.created_at < @cursor_created_at or e._to < @cursor_to"
+        "   sort e.created_at DESC, e._to DESC"
+        "   let audio_v = document(e._to)"
         "   filter not audio_v.is_deleted or audio_v.type in @archived_lst"
-        "   sort e.created_at DESC"
-        "   limit @offset, @limit"
-        "   return audio_v"
+        "   limit @limit"
+        "   return {audio: audio_v, created_at: e.created_at, vertex_key: parse_identifier(e._to).key}"
     )
 
     _get_playlist_audios_for_inline_query = (
-        "for audio_v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@audios]}"
+        "for e in @@has"
+        "   filter e._from == @start_vertex and e.to_kind == @audios"
+        "   filter @cursor_created_at == null or e.created_at <= @cursor_created_at"
+        "   filter @cursor_created_at == null or e.created_at < @cursor_created_at or e._to < @cursor_to"
+        "   sort e.created_at DESC, e._to DESC"
+        "   let audio_v = document(e._to)"
         "   filter (not audio_v.is_deleted or audio_v.type in @archived_lst) and audio_v.valid_for_inline_search == true"
-        "   sort e.created_at DESC"
-        "   limit @offset, @limit"
-        "   return audio_v"
+        "   limit @limit"
+        "   return {audio: audio_v, created_at: e.created_at, vertex_key: parse_identifier(e._to).key}"
     )
 
     _get_audio_playlists_query = (
         "let playlist_keys=("
         "   for v,e in 1..1 outbound @user_id graph @graph_name options {order:'dfs', edgeCollections:[@has],vertexCollections:[@playlists]}"
+        "       filter e.to_kind == @playlists"
         "       return v._key"
         ")"
         "for v,e in 1..1 inbound @start_vertex graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "   filter e.from_kind == @playlists"
         "   sort v.rank ASC, v.modified_at DESC"
         "   filter v.is_soft_deleted == false and v._key in playlist_keys"
         "   limit @offset, @limit"
         "   return v"
     )
 
-    _audio_in_favorite_playlist_query = (
-        "for v_pl in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
-        "   filter v_pl.is_favorite == true"
-        "   for v_aud in 1..1 outbound v_pl._id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
-        "       filter v_aud._key == @audio_key"
-        "       return true"
-    )
-
     _get_playlists_by_keys = "return document(@@playlists, @playlist_keys)"
 
     _get_playlist_from_hit_query = (
-        "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@playlists]}" "   return v"
+        "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@playlists]}" "   filter e.to_kind == @playlists" "   return v"
     )
 
     _count_public_playlist_subscriptions_query = (
@@ -272,7 +282,8 @@ class PlaylistMethods:
     )
 
     _check_audio_is_in_playlist_query = (
-        "for audio in 1..1 outbound @playlist_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "for audio, audio_edge in 1..1 outbound @playlist_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "   filter audio_edge.to_kind == @audios"
         "   filter audio._key == @audio_key"
         "   return true"
     )
@@ -289,6 +300,32 @@ class PlaylistMethods:
         "   return true"
     )
 
+    _increment_playlist_audio_count_query = (
+        "for playlist in @@playlists"
+        "   filter playlist._key == @playlist_key"
+        "   update playlist with {audio_count: max([playlist.audio_count + @delta, 0])} in @@playlists"
+        "   return NEW.audio_count"
+    )
+
+    _repair_playlist_audio_counts_query = (
+        "for playlist in @@playlists"
+        "   filter playlist._key > @last_key"
+        "   sort playlist._key asc"
+        "   limit @chunk_size"
+        "   let audio_count = first("
+        "       for edge in @@has"
+        "           filter edge._from == playlist._id and edge.to_kind == @audios"
+        "           collect with count into count_"
+        "           return count_"
+        "   )"
+        "   let repaired = ("
+        "       filter playlist.audio_count != audio_count"
+        "       update playlist with {audio_count} in @@playlists"
+        "       return true"
+        "   )"
+        "   return {_key: playlist._key, repaired: length(repaired) > 0}"
+    )
+
     async def has_user_subscribed_to_playlist(
         self,
         user: User,
@@ -465,6 +502,7 @@ class PlaylistMethods:
                 "subscribe_to": SubscribeTo.__collection_name__,
                 "users": User.__collection_name__,
             },
+            prefetch=2,
         ) as cursor:
             async for doc in cursor:
                 obj = PublicPlaylistSubscriptionCount.parse(doc)
@@ -1062,7 +1100,6 @@ class PlaylistMethods:
             return []
 
         from tase.db.arangodb.graph.edges import Has
-        from tase.db.arangodb.graph.vertices import Audio
 
         res = collections.deque()
         async with await Playlist.execute_query(
@@ -1071,7 +1108,6 @@ class PlaylistMethods:
                 "start_vertex": user.id,
                 "has": Has.__collection_name__,
                 "playlists": Playlist.__collection_name__,
-                "audios": Audio.__collection_name__,
                 "playlist_capacity": playlist_capacity,
                 "offset": offset,
                 "limit": limit,
@@ -1171,6 +1207,78 @@ class PlaylistMethods:
             raise InvalidAudioForInlineMode(audio.key)
         return playlist, audio
 
+    async def _increment_playlist_audio_count(
+        self,
+        playlist: Playlist,
+        delta: int,
+    ) -> None:
+        """
+        Atomically add the given delta to the audio count of a `Playlist` vertex. The count never goes below zero.
+
+        Parameters
+        ----------
+        playlist : Playlist
+            Playlist to update the audio count of.
+        delta : int
+            Number to add to the audio count of the playlist.
+
+        Raises
+        ------
+        PlaylistNotFound
+            If the audio count of the playlist could not be updated.
+        """
+        async with await Playlist.execute_query(
+            self._increment_playlist_audio_count_query,
+            bind_vars={
+                "@playlists": Playlist.__collection_name__,
+                "playlist_key": playlist.key,
+                "delta": delta,
+            },
+        ) as cursor:
+            async for audio_count in cursor:
+                playlist.audio_count = audio_count
+                return
+
+        # raising here aborts the enclosing transaction, so the `has` edge is not changed without the count.
+        raise PlaylistNotFound(playlist.key)
+
+    async def repair_playlist_audio_counts(
+        self,
+        chunk_size: int = 5000,
+    ) -> int:
+        """
+        Recompute the audio count of all `Playlist` vertices from their `has` edges to `Audio` vertices and fix the
+        ones that have drifted. The playlists are processed in chunks ordered by their keys.
+
+        Parameters
+        ----------
+        chunk_size : int, default : 5000
+            Number of playlists to process in each chunk.
+
+        Returns
+        -------
+        int
+            Number of playlists whose audio count was repaired.
+
+        """
+        from tase.db.arangodb.graph.edges import Has
+        from tase.db.arangodb.graph.vertices import Audio
+
+        repaired_count = 0
+        async for doc in Playlist.iter_query_by_key(
+            self._repair_playlist_audio_counts_query,
+            bind_vars={
+                "@playlists": Playlist.__collection_name__,
+                "@has": Has.__collection_name__,
+                "audios": Audio.__collection_name__,
+            },
+            chunk_size=chunk_size,
+        ):
+            if doc["repaired"]:
+                repaired_count += 1
+
+        return repaired_count
+
     async def add_audio_to_playlist(
         self: ArangoGraphMethods,
         user: User,
@@ -1212,21 +1320,29 @@ class PlaylistMethods:
 
         from tase.db.arangodb.graph.edges import Has
 
-        has_edge = await Has.get(Has.parse_key(playlist, audio))
-        if has_edge is not None:
-            # Audio is already on the playlist
-            return True, False
-        else:
-            try:
-                has_edge = await Has.get_or_create_edge(playlist, audio)
-            except (InvalidFromVertex, InvalidToVertex):
-                logger.error("ValueError: Could not create the `has` from `Playlist` vertex to `Audio` vertex")
-                return False, False
+        # the edge and the audio count of the playlist are updated atomically, so the count never drifts from the
+        # number of `has` edges.
+        from tase.db.arangodb.document import UserAudioState
+
+        async with arangodb_transaction(write=[Has, Playlist, UserAudioState]):
+            has_edge = await Has.get(Has.parse_key(playlist, audio))
+            if has_edge is not None:
+                # Audio is already on the playlist
+                return True, False
             else:
-                if has_edge:
-                    return True, True
-                else:
+                try:
+                    has_edge = await Has.get_or_create_edge(playlist, audio)
+                except (InvalidFromVertex, InvalidToVertex):
+                    logger.error("ValueError: Could not create the `has` from `Playlist` vertex to `Audio` vertex")
                     return False, False
+                else:
+                    if has_edge:
+                        await self._increment_playlist_audio_count(playlist, 1)
+                        if playlist.is_favorite:
+                            await self.update_user_audio_state(user.key, audio.key, favorited=True)
+                        return True, True
+                    else:
+                        return False, False
 
     async def remove_audio_from_playlist(
         self: ArangoGraphMethods,
@@ -1277,37 +1393,44 @@ class PlaylistMethods:
         from tase.db.arangodb.graph.edges import Has
         from tase.db.arangodb.graph.edges import Had
 
-        has_edge = await Has.get(Has.parse_key(playlist, audio))
-        if has_edge is not None:
-            # Audio is already on the playlist
-            deleted = await has_edge.delete()
-            if not deleted:
-                raise EdgeDeletionFailed(Has.__class__.__name__)
+        from tase.db.arangodb.document import UserAudioState
 
-            try:
-                had_edge = await Had.update_or_create_edge(playlist, audio, has=has_edge, deleted_at=remove_timestamp)
-            except (InvalidFromVertex, InvalidToVertex):
-                logger.error("ValueError: Could not create the `had` from `Playlist` vertex to `Audio` vertex")
-                return False, False
-            else:
-                if had_edge:
-                    return True, True
-                else:
+        async with arangodb_transaction(write=[Had, Has, Playlist, UserAudioState]):
+            has_edge = await Has.get(Has.parse_key(playlist, audio))
+            if has_edge is not None:
+                # Audio is already on the playlist
+                deleted = await has_edge.delete()
+                if not deleted:
+                    raise EdgeDeletionFailed(Has.__class__.__name__)
+
+                await self._increment_playlist_audio_count(playlist, -1)
+                if playlist.is_favorite:
+                    await self.update_user_audio_state(user.key, audio.key, favorited=False)
+
+                try:
+                    had_edge = await Had.update_or_create_edge(playlist, audio, has=has_edge, deleted_at=remove_timestamp)
+                except (InvalidFromVertex, InvalidToVertex):
+                    logger.error("ValueError: Could not create the `had` from `Playlist` vertex to `Audio` vertex")
                     return False, False
-        else:
-            # Audio does not belong to the playlist
-            return True, False
+                else:
+                    if had_edge:
+                        return True, True
+                    else:
+                        return False, False
+            else:
+                # Audio does not belong to the playlist
+                return True, False
 
     @async_timed()
     async def get_playlist_audios(
         self: ArangoGraphMethods,
         playlist_key: str,
         only_include_valid_inline_audios: bool = False,
-        offset: int = 0,
+        cursor: Optional[EdgeCursor] = None,
         limit: int = 15,
-    ) -> Deque[Audio]:
+    ) -> Tuple[Deque[Audio], Optional[EdgeCursor]]:
         """
-        Get `Playlist` audios.
+        Get `Playlist` audios, the most recently added audios first.
 
         Parameters
         ----------
@@ -1315,15 +1438,17 @@ class PlaylistMethods:
             Playlist key to get the audios from
         only_include_valid_inline_audios : bool, default : False
             Whether to only get audio files that are valid to be shown in inline mode
-        offset : int, default : 0
-            Offset to get the audios query after
+        cursor : EdgeCursor, optional
+            Cursor returned with the previous page to get the audios after, the first page is returned if it is not
+            given.
         limit : int, default : 15
             Number of `Audio`s to query
 
         Returns
         -------
-        Deque
-            Audios that belong to the given playlist
+        tuple
+            Audios that belong to the given playlist and the cursor to get the next page with, the cursor is `None`
+            if this is the last page.
 
         Raises
         ------
@@ -1331,31 +1456,38 @@ class PlaylistMethods:
             If user does not have a playlist with the given playlist_key
         """
         if not playlist_key:
-            return collections.deque()
+            return collections.deque(), None
 
         from tase.db.arangodb.graph.edges import Has
         from tase.db.arangodb.graph.vertices import Audio
 
         res = collections.deque()
+        next_cursor = None
+        row_count = 0
 
         async with await Playlist.execute_query(
             self._get_playlist_audios_for_inline_query if only_include_valid_inline_audios else self._get_playlist_audios_query,
             bind_vars={
                 "start_vertex": f"{Playlist.__collection_name__}/{playlist_key}",
-                "has": Has.__collection_name__,
+                "@has": Has.__collection_name__,
                 "audios": Audio.__collection_name__,
                 "archived_lst": [AudioType.ARCHIVED.value, AudioType.UPLOADED.value, AudioType.SENT_BY_USERS.value],
-                "offset": offset,
+                "cursor_created_at": cursor.created_at if cursor else None,
+                "cursor_to": f"{Audio.__collection_name__}/{cursor.vertex_key}" if cursor else None,
                 "limit": limit,
             },
-        ) as cursor:
-            async for doc in cursor:
-                if not doc:
+        ) as query_cursor:
+            async for doc in query_cursor:
+                row_count += 1
+                # the cursor is built from the edge, so a page ending with an audio that no longer exists still has one
+                next_cursor = EdgeCursor.parse_from_db_object(doc)
+
+                if not doc["audio"]:
                     continue
 
-                res.append(Audio.from_collection(doc))
+                res.append(Audio.from_collection(doc["audio"]))
 
-        return res
+        return res, next_cursor if row_count >= limit else None
 
     async def get_audio_playlists(
         self: ArangoGraphMethods,
@@ -1472,20 +1604,8 @@ class PlaylistMethods:
         if audio.audio_type != TelegramAudioType.AUDIO_FILE:
             raise InvalidAudioForInlineMode(audio.key)
 
-        from tase.db.arangodb.graph.edges import Has
-        from tase.db.arangodb.graph.vertices import Audio
-
-        async with await Playlist.execute_query(
-            self._audio_in_favorite_playlist_query,
-            bind_vars={
-                "user_id": user.id,
-                "audio_key": audio.key,
-                "has": Has.__collection_name__,
-                "playlists": Playlist.__collection_name__,
-                "audios": Audio.__collection_name__,
-            },
-        ) as cursor:
-            return not cursor.empty()
+        state = await self.get_user_audio_state(user, audio.key)
+        return state is not None and state.favorited
 
     async def toggle_favorite_playlist(
         self,
@@ -91,9 +91,11 @@ class PlaylistInteraction(BaseVertex):
 
 class PlaylistInteractionMethods:
     _get_playlist_audio_interaction_by_user_query = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type"
-        "   for v_aud in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "   for v_aud, v_aud_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@audios]}"
+        "       filter v_aud_edge.to_kind == @audios"
         "       filter v_aud._key == @audio_key"
         "       return v_int"
     )
@@ -109,9 +111,11 @@ class PlaylistInteractionMethods:
     # )
 
     _get_playlist_interaction_by_user_query = (
-        "for v_int in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "for v_int, v_int_edge in 1..1 outbound @user_id graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@interactions]}"
+        "   filter v_int_edge.to_kind == @interactions"
         "   filter v_int.type == @interaction_type"
-        "   for v_playlist in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "   for v_playlist, v_playlist_edge in 1..1 outbound v_int graph @graph_name options {order : 'dfs', edgeCollections : [@has], vertexCollections : [@playlists]}"
+        "       filter v_playlist_edge.to_kind == @playlists"
         "       filter v_playlist._key == @playlist_key"
         "       return v_int"
     )
@@ -121,6 +125,7 @@ class PlaylistInteractionMethods:
         "   filter interaction.modified_at >= @last_run_at and interaction.modified_at < @now"
         "   filter (interaction.created_at > @last_run_at and interaction.is_active) or (@last_run_at == 0) or (@last_run_at > 0 and interaction.created_at < @last_run_at)"
         "   for v,e in 1..1 outbound interaction graph @graph_name options {order: 'dfs', edgeCollections:[@has], vertexCollections:[@vertices]}"
+        "       filter e.to_kind == @vertices"
         "       filter v.is_public"
         "       collect playlist_key = v._key, interaction_type = interaction.type, is_active= interaction.is_active"
         "       aggregate count_ = length(0)"
@@ -322,6 +327,7 @@ class PlaylistInteractionMethods:
                 "has": Has.__collection_name__,
                 "vertices": Playlist.__collection_name__,
             },
+            prefetch=2,
         ) as cursor:
             async for doc in cursor:
                 obj = PlaylistInteractionCount.parse(doc)
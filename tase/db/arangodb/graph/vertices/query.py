@@ -5,7 +5,7 @@ from typing import Optional, Union, List, Tuple, TYPE_CHECKING, Deque
 
 import pyrogram
 
-from aioarango.models import PersistentIndex
+from aioarango.models import PersistentIndex, TTLIndex
 from tase.common.utils import get_now_timestamp, async_timed
 from tase.db.helpers import SearchMetaData
 from tase.errors import InvalidToVertex, InvalidFromVertex, EdgeCreationFailed
@@ -41,6 +41,14 @@ class Query(BaseVertex):
                 "query_date",
             ],
         ),
+        TTLIndex(
+            custom_version=1,
+            name="expire_at",
+            fields=[
+                "expire_at",
+            ],
+            expiry_time=0,
+        ),
     ]
 
     query: str
@@ -49,6 +57,9 @@ class Query(BaseVertex):
     inline_metadata: Optional[InlineQueryMetadata]
     elastic_metadata: Optional[ElasticQueryMetadata]
 
+    # timestamp in seconds after which the query is removed by the TTL index, it is only set once the query is archived.
+    expire_at: Optional[int]
+
     @classmethod
     def parse_key(
         cls,
@@ -103,6 +114,7 @@ class Query(BaseVertex):
 class QueryMethods:
     _get_query_hits_query = (
         "for v,e in 1..1 outbound @start_vertex graph @graph_name options {order:'dfs', edgeCollections:[@has], vertexCollections:[@hits]}"
+        "   filter e.to_kind == @hits"
         "   sort v.created_at asc"
         "   return v"
     )
@@ -269,7 +281,10 @@ class QueryMethods:
             else:
                 hit_type = HitType.NON_INLINE_AUDIO_SEARCH
 
+            from tase.db.arangodb.document import HitResolver
+
             hits = collections.deque()
+            hit_resolvers = collections.deque()
 
             if search_metadata_list is None or not len(search_metadata_list):
                 search_metadata_list = (None for _ in range(len(audio_or_playlist_vertices)))
@@ -299,6 +314,7 @@ class QueryMethods:
                     raise Exception("Could not create `hit` vertex")
 
                 hits.append(hit)
+                hit_resolvers.append(HitResolver.parse(user, db_query, hit, audio_or_playlist_vertex))
 
                 try:
                     has_hit_edge = await Has.get_or_create_edge(db_query, hit)
@@ -308,6 +324,10 @@ class QueryMethods:
                     if has_hit_edge is None:
                         raise EdgeCreationFailed(Has.__class__.__name__)
 
+            # the resolvers of all hits are written in one request, so the download links of this query can be
+            # resolved without traversing the graph.
+            await HitResolver.insert_many(list(hit_resolvers))
+
             return db_query, list(hits)
 
         return None, None
@@ -90,6 +90,7 @@ class Thumbnail(BaseVertex):
 class ThumbnailMethods:
     _get_audio_vertex_thumbnails_with_edge_query = (
         "for v, e in 1..1 outbound @vertex_id graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@thumbnails]}"
+        "   filter e.to_kind == @thumbnails"
         "   sort e.created_at asc"
         "   return {vertex: v, edge: e}"
     )
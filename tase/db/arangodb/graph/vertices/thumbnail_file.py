@@ -81,7 +81,8 @@ class ThumbnailFileMethods:
     _get_thumbnail_files_of_an_thumbnail_vertex_query = (
         "for thumbnail_v in @@thumbnails"
         "   filter thumbnail_v.file_unique_id == @thumbnail_file_unique_id"
-        "   for thumb_file_v in 1..1 outbound thumbnail_v graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@thumbnail_files]}"
+        "   for thumb_file_v, thumb_file_v_edge in 1..1 outbound thumbnail_v graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@thumbnail_files]}"
+        "       filter thumb_file_v_edge.to_kind == @thumbnail_files"
         "       return distinct thumb_file_v"
     )
 
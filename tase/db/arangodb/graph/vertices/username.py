@@ -142,6 +142,7 @@ class UsernameMethods:
         "   limit @limit_"
         "   let mentioned_chat = ("
         "       for chat, e in 1..1 inbound username graph @graph_name options {order: 'dfs', edgeCollections: [@has], vertexCollections: [@chats]}"
+        "           filter e.from_kind == @chats"
         "           return chat"
         "       )"
         "   return {username_:username, mentioned_chat_:mentioned_chat[0], count_:unchecked_mentions_count[0]}"
@@ -8,6 +8,8 @@ from .audio_interaction_count import AudioInteractionCount
 from .audio_keyboard_status import AudioKeyboardStatus
 from .base_indexer_metadata import BaseIndexerMetadata
 from .bit_rate_type import BitRateType
+from .channel_message_counts import ChannelMessageCounts
+from .edge_cursor import EdgeCursor
 from .elastic_query_metadata import ElasticQueryMetadata
 from .hit_count import HitCount
 from .hit_metadata import BaseHitMetadata, AudioHitMetadata, PlaylistAudioHitMetadata, PlaylistHitMetadata, HitMetadata
@@ -26,31 +26,22 @@ class AudioKeyboardStatus(BaseModel):
         if db is None or ((hit_download_url is None or not len(hit_download_url)) and audio_vertex_key is None):
             return None
 
-        from tase.db.arangodb.enums import AudioInteractionType
+        from tase.errors import HitNoLinkedAudio, AudioVertexDoesNotExist
 
-        valid_for_inline = await db.graph.is_audio_valid_for_inline_mode(
-            hit_download_url=hit_download_url,
-            audio_vertex_key=audio_vertex_key,
-        )
+        if hit_download_url:
+            audio_vertex = await db.graph.get_audio_from_hit_download_url(hit_download_url)
+            if audio_vertex is None:
+                raise HitNoLinkedAudio(hit_download_url)
+        else:
+            audio_vertex = await db.graph.get_audio_by_key(audio_vertex_key)
+            if audio_vertex is None:
+                raise AudioVertexDoesNotExist(audio_vertex_key)
+
+        # all the flags are read from the materialized state of the audio for the user with a single lookup.
+        state = await db.graph.get_user_audio_state(from_user, audio_vertex.key)
 
         return AudioKeyboardStatus(
-            is_liked=await db.graph.audio_is_interacted_by_user(
-                from_user,
-                AudioInteractionType.LIKE_AUDIO,
-                hit_download_url=hit_download_url,
-                audio_vertex_key=audio_vertex_key,
-            ),
-            is_disliked=await db.graph.audio_is_interacted_by_user(
-                from_user,
-                AudioInteractionType.DISLIKE_AUDIO,
-                hit_download_url=hit_download_url,
-                audio_vertex_key=audio_vertex_key,
-            ),
-            is_in_favorite_playlist=await db.graph.audio_in_favorite_playlist(
-                from_user,
-                hit_download_url=hit_download_url,
-                audio_vertex_key=audio_vertex_key,
-            )
-            if valid_for_inline
-            else None,
+            is_liked=state is not None and state.liked,
+            is_disliked=state is not None and state.disliked,
+            is_in_favorite_playlist=(state is not None and state.favorited) if audio_vertex.valid_for_inline_search else None,
         )
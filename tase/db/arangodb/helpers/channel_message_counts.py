@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from tase.common.utils import get_now_timestamp
+from tase.db.arangodb.base import BaseCollectionAttributes
+
+
+class ChannelMessageCounts(BaseCollectionAttributes):
+    """
+    This class is used to cache the raw message counters of a channel that its score is calculated from, and is not
+    vertex by itself
+    """
+
+    all_messages_count: int = Field(default=0)
+    audio_count: int = Field(default=0)
+    photo_video_count: int = Field(default=0)
+    document_count: int = Field(default=0)
+    audio_video_note_count: int = Field(default=0)
+    gif_count: int = Field(default=0)
+    link_count: int = Field(default=0)
+    location_count: int = Field(default=0)
+    chat_photo_count: int = Field(default=0)
+    contact_count: int = Field(default=0)
+
+    counted_at: int = Field(default_factory=get_now_timestamp)
+
+    @property
+    def media_count(self) -> int:
+        return (
+            self.audio_count
+            + self.photo_video_count
+            + self.document_count
+            + self.audio_video_note_count
+            + self.gif_count
+            + self.link_count
+            + self.location_count
+            + self.chat_photo_count
+            + self.contact_count
+        )
+
+    def is_expired(
+        self,
+        ttl: int,
+    ) -> bool:
+        """
+        Check whether these counters are older than the given TTL or not.
+
+        Parameters
+        ----------
+        ttl : int
+            Time to live of the counters in milliseconds.
+
+        Returns
+        -------
+        bool
+            Whether the counters must be counted again or not.
+        """
+        return get_now_timestamp() - self.counted_at > ttl
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class EdgeCursor(BaseModel):
+    """
+    Position of an item in a list ordered by the creation date of its edge (newest first), used for keyset
+    pagination. Ties in the creation date are broken by the key of the vertex the edge points to.
+    """
+
+    created_at: int
+    vertex_key: str
+
+    def serialize(self) -> str:
+        return f"{self.created_at}_{self.vertex_key}"
+
+    @classmethod
+    def parse(
+        cls,
+        cursor: Optional[str],
+    ) -> Optional[EdgeCursor]:
+        if not cursor:
+            return None
+
+        created_at, sep, vertex_key = cursor.partition("_")
+        if not sep or not vertex_key or not created_at.isdigit():
+            return None
+
+        return EdgeCursor(
+            created_at=int(created_at),
+            vertex_key=vertex_key,
+        )
+
+    @classmethod
+    def parse_from_db_object(
+        cls,
+        db_object: dict,
+    ) -> Optional[EdgeCursor]:
+        if db_object is None or not len(db_object):
+            return None
+
+        created_at = db_object.get("created_at", None)
+        vertex_key = db_object.get("vertex_key", None)
+
+        if created_at is not None and vertex_key is not None:
+            return EdgeCursor(
+                created_at=created_at,
+                vertex_key=vertex_key,
+            )
+
+        return None
@@ -0,0 +1,489 @@
+"""
+Explain-based audit of the AQL queries of the graph and document layers.
+
+Every class-level AQL string of the `*Methods` classes is explained on the server with sample bind variables. Full
+collection scans and in-memory sorts in the execution plans are reported along with the persistent indexes that would
+let the optimizer avoid them. The report is deterministic (it does not include estimated costs), so it can be committed
+and diffed in review.
+
+Usage::
+
+    python -m tase.db.arangodb.index_advisor --config ../tase_config.json --output index_report.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field
+
+from aioarango.errors import ArangoServerError
+from tase.configs import TASEConfig
+from tase.db.arangodb.arangodb import ArangoDB
+from tase.db.arangodb.base import BaseCollectionDocument
+from tase.db.arangodb.document import ArangoDocumentMethods, document_classes
+from tase.db.arangodb.graph import ArangoGraphMethods
+from tase.db.arangodb.graph.edges import edge_classes
+from tase.db.arangodb.graph.vertices import vertex_classes
+
+_query_start_pattern = re.compile(r"^\s*(for|let|return|upsert|insert|update|replace|remove|with)\b", re.IGNORECASE)
+_bind_var_pattern = re.compile(r"@(@?)([A-Za-z_][A-Za-z0-9_]*)")
+
+_equality_comparisons = ("compare ==", "compare in")
+_range_comparisons = ("compare <", "compare <=", "compare >", "compare >=")
+
+
+class ProposedIndex(BaseModel):
+    collection: str
+    fields: Tuple[str, ...]
+    declared_index_name: Optional[str]
+
+    def __str__(self) -> str:
+        fields = ", ".join(self.fields)
+        s = f"`{self.collection}` [{fields}]"
+        if self.declared_index_name:
+            s += f" (declared as `{self.declared_index_name}`, check that it exists on the server)"
+
+        return s
+
+
+class QueryAudit(BaseModel):
+    owner: str
+    name: str
+    error: Optional[str]
+    issues: List[str] = Field(default_factory=list)
+    used_indexes: List[str] = Field(default_factory=list)
+    proposed_indexes: List[ProposedIndex] = Field(default_factory=list)
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.owner}.{self.name}"
+
+
+class IndexAdvisor:
+    """
+    Collect the registered AQL queries, explain them and propose persistent indexes for them.
+
+    Parameters
+    ----------
+    graph_name : str
+        Name of the graph the traversals of the queries run on.
+    """
+
+    # owner classes of the queries
+    __methods_classes__ = (ArangoGraphMethods, ArangoDocumentMethods)
+
+    # bind variables naming a collection with a name other than the collection name itself
+    __collection_bind_var_aliases__ = {
+        "rabbitmq_tasks": "tase.db.arangodb.document.rabbitmq_task.RabbitMQTask",
+        "thumbnail_docs": "tase.db.arangodb.document.downloaded_thumbnail_file.DownloadedThumbnailFile",
+        "has_": "tase.db.arangodb.graph.edges.has.Has",
+        "chat": "tase.db.arangodb.graph.vertices.chat.Chat",
+        "interactions": "tase.db.arangodb.graph.vertices.audio_interaction.AudioInteraction",
+        "vertices": "tase.db.arangodb.graph.vertices.audio.Audio",
+        "user_audio_states": "tase.db.arangodb.document.user_audio_state.UserAudioState",
+        "hit_resolvers": "tase.db.arangodb.document.hit_resolver.HitResolver",
+        "audio_hit_daily_counts": "tase.db.arangodb.document.audio_hit_daily_count.AudioHitDailyCount",
+    }
+    # bind variables whose collection depends on the class the query belongs to
+    __owner_collection_bind_var_aliases__ = {
+        ("PlaylistInteractionMethods", "interactions"): "tase.db.arangodb.graph.vertices.playlist_interaction.PlaylistInteraction",
+        ("PlaylistInteractionMethods", "vertices"): "tase.db.arangodb.graph.vertices.playlist.Playlist",
+    }
+
+    def __init__(
+        self,
+        graph_name: str,
+    ):
+        self.graph_name = graph_name
+
+        self._document_classes: Dict[str, Type[BaseCollectionDocument]] = {}
+        self._collection_names: Dict[str, str] = {}
+        for document_class in chain(vertex_classes, edge_classes, document_classes):
+            self._document_classes[f"{document_class.__module__}.{document_class.__name__}"] = document_class
+            self._collection_names.setdefault(document_class.__collection_name__, document_class.__collection_name__)
+
+        for alias, class_path in self.__collection_bind_var_aliases__.items():
+            document_class = self._document_classes.get(class_path, None)
+            if document_class is not None:
+                self._collection_names[alias] = document_class.__collection_name__
+
+    def collect_queries(self) -> List[Tuple[str, str, str]]:
+        """
+        Collect the AQL queries defined as class attributes of the `*Methods` classes.
+
+        Returns
+        -------
+        list of tuple
+            List of tuples containing the name of the class defining the query, the name of the attribute and the query
+            string, sorted by the class and attribute names.
+        """
+        queries = {}
+        for methods_class in self.__methods_classes__:
+            for cls in methods_class.__mro__:
+                if not cls.__name__.endswith("Methods") or cls in self.__methods_classes__:
+                    continue
+
+                owner = f"{cls.__module__.split('.')[-2]}.{cls.__name__}"
+                for attr_name, attr_value in vars(cls).items():
+                    if isinstance(attr_value, str) and "@" in attr_value and _query_start_pattern.match(attr_value):
+                        queries[(owner, attr_name)] = attr_value
+
+        return [(owner, name, query) for (owner, name), query in sorted(queries.items())]
+
+    def get_sample_bind_vars(
+        self,
+        owner: str,
+        query: str,
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Create sample bind variables for the given query. The values only need to have the right type for the query
+        to be explained, they do not need to match any documents.
+
+        Parameters
+        ----------
+        owner : str
+            Name of the class defining the query.
+        query : str
+            Query to create the bind variables for.
+
+        Returns
+        -------
+        tuple
+            Dictionary of bind variables and the list of collection bind variables that could not be resolved.
+        """
+        bind_vars = {}
+        unresolved = []
+        owner_class_name = owner.split(".")[-1]
+
+        for is_collection, name in sorted(set(_bind_var_pattern.findall(query))):
+            if name == "graph_name":
+                bind_vars[name] = self.graph_name
+                continue
+
+            collection_name = None
+            class_path = self.__owner_collection_bind_var_aliases__.get((owner_class_name, name), None)
+            if class_path is not None and class_path in self._document_classes:
+                collection_name = self._document_classes[class_path].__collection_name__
+            elif name in self._collection_names:
+                collection_name = self._collection_names[name]
+
+            if is_collection:
+                if collection_name is None:
+                    unresolved.append(f"@@{name}")
+                else:
+                    bind_vars[f"@{name}"] = collection_name
+            elif collection_name is not None:
+                bind_vars[name] = collection_name
+            else:
+                bind_vars[name] = self._get_sample_value(name, query)
+
+        return bind_vars, unresolved
+
+    @classmethod
+    def _get_sample_value(
+        cls,
+        name: str,
+        query: str,
+    ) -> Any:
+        if re.search(rf"\b(outbound|inbound|any)\s+@{name}\b", query, re.IGNORECASE):
+            # start vertex of a traversal
+            return "vertices/0"
+
+        if re.search(rf"\blimit\s+(@\w+\s*,\s*)?@{name}\b", query, re.IGNORECASE):
+            return 1
+
+        if name.startswith("is_") or name in ("filter_out", "not_archived"):
+            return False
+
+        if name.endswith(("_lst", "_list", "_keys", "_ids", "commands", "counts")):
+            return []
+
+        if name.endswith(("_at", "_id", "_type", "type", "status", "scope", "count", "capacity")) or name in ("now", "checkpoint"):
+            return 0
+
+        return "sample"
+
+    async def audit_query(
+        self,
+        owner: str,
+        name: str,
+        query: str,
+    ) -> QueryAudit:
+        """
+        Explain the given query and find the full collection scans and the in-memory sorts of its execution plan.
+
+        Parameters
+        ----------
+        owner : str
+            Name of the class defining the query.
+        name : str
+            Name of the attribute holding the query.
+        query : str
+            Query to audit.
+
+        Returns
+        -------
+        QueryAudit
+            Audit of the query.
+        """
+        audit = QueryAudit(owner=owner, name=name)
+
+        bind_vars, unresolved = self.get_sample_bind_vars(owner, query)
+        if unresolved:
+            audit.error = f"unknown collection bind variables: {', '.join(unresolved)}"
+            return audit
+
+        try:
+            plan = await BaseCollectionDocument.__db__.aql.explain(query, bind_vars=bind_vars)
+        except ArangoServerError as e:
+            audit.error = f"explain failed: {e}"
+            return audit
+
+        self._analyze_plan(plan, audit)
+        return audit
+
+    def _analyze_plan(
+        self,
+        plan: dict,
+        audit: QueryAudit,
+    ) -> None:
+        nodes = plan.get("nodes", [])
+        expressions = {node["outVariable"]["id"]: node.get("expression", {}) for node in nodes if node.get("type") == "CalculationNode"}
+        filter_expressions = [expressions[node["inVariable"]["id"]] for node in nodes if node.get("type") == "FilterNode" and node["inVariable"]["id"] in expressions]
+        sort_expressions = [
+            expressions.get(element["inVariable"]["id"], {}) for node in nodes if node.get("type") == "SortNode" for element in node.get("elements", [])
+        ]
+
+        for node in nodes:
+            node_type = node.get("type")
+            if node_type == "EnumerateCollectionNode" and not node.get("random", False):
+                collection = node.get("collection")
+                variable = node.get("outVariable", {})
+
+                equalities, ranges = [], []
+                for expression in chain(filter_expressions, [node["filter"]] if node.get("filter") else []):
+                    self._collect_conditions(expression, variable.get("id"), equalities, ranges)
+                sorts = [path for path in (self._get_attribute_path(expression, variable.get("id")) for expression in sort_expressions) if path]
+
+                conditions = [f"{path} ==" for path in equalities] + [f"{path} range" for path in ranges] + [f"sort {path}" for path in sorts]
+                audit.issues.append(
+                    f"full collection scan of `{collection}` (`for {variable.get('name')}`)"
+                    + (f": {', '.join(conditions)}" if conditions else ", no filters on the collection")
+                )
+
+                fields = list(dict.fromkeys(equalities + (ranges[:1] if ranges else sorts)))
+                if fields:
+                    audit.proposed_indexes.append(self._propose_index(collection, tuple(fields)))
+
+            elif node_type == "SortNode":
+                paths = []
+                for element in node.get("elements", []):
+                    expression = expressions.get(element["inVariable"]["id"], None)
+                    path = self._format_expression(expression) if expression else None
+                    paths.append(f"{path or element['inVariable'].get('name')} {'asc' if element.get('ascending', True) else 'desc'}")
+                audit.issues.append(f"in-memory sort: {', '.join(paths)}")
+
+            elif node_type == "IndexNode":
+                for index in node.get("indexes", []):
+                    audit.used_indexes.append(f"`{node.get('collection')}` {index.get('type')} [{', '.join(index.get('fields', []))}]")
+
+            elif node_type == "TraversalNode":
+                for index in node.get("indexes", {}).get("base", []):
+                    audit.used_indexes.append(f"traversal {index.get('type')} [{', '.join(index.get('fields', []))}]")
+
+        audit.used_indexes = sorted(set(audit.used_indexes))
+
+    def _propose_index(
+        self,
+        collection: str,
+        fields: Tuple[str, ...],
+    ) -> ProposedIndex:
+        declared_index_name = None
+        for document_class in self._document_classes.values():
+            if document_class.__collection_name__ != collection:
+                continue
+
+            for index in chain(document_class.__base_indexes__, document_class.__indexes__ or []):
+                index_fields = tuple(getattr(index, "fields", None) or ())
+                if index_fields[: len(fields)] == fields:
+                    declared_index_name = index.name
+                    break
+
+        return ProposedIndex(
+            collection=collection,
+            fields=fields,
+            declared_index_name=declared_index_name,
+        )
+
+    @classmethod
+    def _collect_conditions(
+        cls,
+        expression: dict,
+        variable_id: int,
+        equalities: List[str],
+        ranges: List[str],
+    ) -> None:
+        expression_type = expression.get("type")
+        sub_nodes = expression.get("subNodes", [])
+
+        if expression_type in ("logical and", "n-ary and"):
+            for sub_node in sub_nodes:
+                cls._collect_conditions(sub_node, variable_id, equalities, ranges)
+            return
+
+        if len(sub_nodes) != 2 or (expression_type not in _equality_comparisons and expression_type not in _range_comparisons):
+            return
+
+        lhs, rhs = sub_nodes
+        path = cls._get_attribute_path(lhs, variable_id)
+        if path is None and expression_type != "compare in":
+            lhs, rhs = rhs, lhs
+            path = cls._get_attribute_path(lhs, variable_id)
+
+        if path is None or cls._references(rhs, variable_id):
+            return
+
+        if expression_type in _equality_comparisons:
+            equalities.append(path)
+        else:
+            ranges.append(path)
+
+    @classmethod
+    def _get_attribute_path(
+        cls,
+        expression: dict,
+        variable_id: int,
+    ) -> Optional[str]:
+        names = []
+        while expression.get("type") == "attribute access":
+            names.append(expression.get("name"))
+            expression = (expression.get("subNodes") or [{}])[0]
+
+        if names and expression.get("type") == "reference" and expression.get("id") == variable_id:
+            return ".".join(reversed(names))
+
+        return None
+
+    @classmethod
+    def _references(
+        cls,
+        expression: dict,
+        variable_id: int,
+    ) -> bool:
+        if expression.get("type") == "reference" and expression.get("id") == variable_id:
+            return True
+
+        return any(cls._references(sub_node, variable_id) for sub_node in expression.get("subNodes", []))
+
+    @classmethod
+    def _format_expression(
+        cls,
+        expression: dict,
+    ) -> Optional[str]:
+        names = []
+        while expression.get("type") == "attribute access":
+            names.append(expression.get("name"))
+            expression = (expression.get("subNodes") or [{}])[0]
+
+        if expression.get("type") == "reference":
+            return ".".join(chain([expression.get("name")], reversed(names)))
+
+        return None
+
+    async def audit(self) -> List[QueryAudit]:
+        """
+        Audit all the registered queries.
+
+        Returns
+        -------
+        list of QueryAudit
+            Audits of the queries sorted by their owner and name.
+        """
+        return [await self.audit_query(owner, name, query) for owner, name, query in self.collect_queries()]
+
+    @classmethod
+    def format_report(
+        cls,
+        audits: List[QueryAudit],
+    ) -> str:
+        """
+        Format the given audits as a markdown report.
+
+        Parameters
+        ----------
+        audits : list of QueryAudit
+            Audits to format.
+
+        Returns
+        -------
+        str
+            Markdown report.
+        """
+        lines = ["# AQL index advisor report", ""]
+
+        proposals: Dict[str, List[str]] = {}
+        proposed_indexes: Dict[str, ProposedIndex] = {}
+        for audit in audits:
+            if not audit.error and not audit.issues:
+                continue
+
+            lines.append(f"## {audit.full_name}")
+            lines.append("")
+            if audit.error:
+                lines.append(f"- error: {audit.error}")
+            lines.extend(f"- {issue}" for issue in audit.issues)
+            lines.extend(f"- uses index: {used_index}" for used_index in audit.used_indexes)
+            for proposed_index in audit.proposed_indexes:
+                lines.append(f"- proposed index: {proposed_index}")
+                proposals.setdefault(str(proposed_index), []).append(audit.full_name)
+                proposed_indexes[str(proposed_index)] = proposed_index
+            lines.append("")
+
+        lines.append("## Proposed indexes")
+        lines.append("")
+        if not proposals:
+            lines.append("- none")
+        for key in sorted(proposals, key=lambda k: (proposed_indexes[k].collection, proposed_indexes[k].fields)):
+            lines.append(f"- {key}: {', '.join(sorted(set(proposals[key])))}")
+        lines.append("")
+
+        clean_count = sum(1 for audit in audits if not audit.error and not audit.issues)
+        lines.append(f"{len(audits)} queries audited, {clean_count} without issues.")
+        lines.append("")
+
+        return "\n".join(lines)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", required=True, help="path of the TASE config file")
+    parser.add_argument("--output", default=None, help="path of the report file, the report is printed if not set")
+    args = parser.parse_args()
+
+    with open(args.config, "r") as f:
+        tase_config = TASEConfig.parse_obj(json.load(f))
+
+    arangodb = ArangoDB()
+    await arangodb.initialize(tase_config.arango_db_config)
+
+    try:
+        advisor = IndexAdvisor(tase_config.arango_db_config.graph_name)
+        report = IndexAdvisor.format_report(await advisor.audit())
+    finally:
+        await arangodb.arango_client.close()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -35,3 +35,5 @@ class ElasticsearchDatabase:
                 else:
                     if not created:
                         logger.error(f"Could not create the {index_cls.__index_name__} Index")
+            elif not await index_cls.update_index_mappings():
+                logger.error(f"Could not update the mappings of the {index_cls.__index_name__} Index")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import collections
 import copy
 from itertools import chain
-from typing import Optional, Tuple, Deque, List
+from typing import Optional, Tuple, Deque, List, Iterable, Dict
 
 import pyrogram
 from decouple import config
@@ -80,6 +81,7 @@ class Audio(BaseDocument):
             "is_deleted": {"type": "boolean"},
             "deleted_at": {"type": "long"},
             "is_edited": {"type": "boolean"},
+            "counter_windows": {"type": "object", "enabled": False},
         }
     }
 
@@ -107,6 +109,31 @@ class Audio(BaseDocument):
         "message_caption",
     ]
 
+    __interaction_counter_fields__ = {
+        AudioInteractionType.DOWNLOAD_AUDIO: "downloads",
+        AudioInteractionType.REDOWNLOAD_AUDIO: "redownloads",
+        AudioInteractionType.SHARE_AUDIO: "shares",
+        AudioInteractionType.SHARE_AUDIO_LINK: "link_shares",
+        AudioInteractionType.LIKE_AUDIO: "likes",
+        AudioInteractionType.DISLIKE_AUDIO: "dislikes",
+        AudioInteractionType.ADD_TO_FAVORITE_PLAYLIST: "favorite_playlists",
+        AudioInteractionType.ADD_TO_PRIVATE_PLAYLIST: "private_playlists",
+        AudioInteractionType.ADD_TO_PUBLIC_PLAYLIST: "public_playlists",
+    }
+    # interactions that can be undone, their inactive counts are subtracted from the counters.
+    __reversible_interaction_types__ = (
+        AudioInteractionType.LIKE_AUDIO,
+        AudioInteractionType.DISLIKE_AUDIO,
+        AudioInteractionType.ADD_TO_FAVORITE_PLAYLIST,
+        AudioInteractionType.ADD_TO_PRIVATE_PLAYLIST,
+        AudioInteractionType.ADD_TO_PUBLIC_PLAYLIST,
+    )
+    __hit_counter_fields__ = {
+        HitType.NON_INLINE_AUDIO_SEARCH: "search_hits",
+        HitType.INLINE_AUDIO_SEARCH: "search_hits",
+        HitType.INLINE_AUDIO_COMMAND: "non_search_hits",
+    }
+
     chat_id: int
     message_id: int
     message_caption: Optional[str]
@@ -657,6 +684,60 @@ class Audio(BaseDocument):
             retry_on_conflict=True,
         )
 
+    @classmethod
+    def get_counter_deltas(
+        cls,
+        interaction_counts: Optional[Iterable[AudioInteractionCount]] = None,
+        hit_counts: Optional[Iterable[HitCount]] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Merge the given interaction and hit counts into the deltas of the counter fields of every audio, so that every
+        audio is updated only once, no matter how many counts it has.
+
+        Parameters
+        ----------
+        interaction_counts : Iterable[AudioInteractionCount], optional
+            Interaction counts to merge.
+        hit_counts : Iterable[HitCount], optional
+            Hit counts to merge.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the key of every audio to a dictionary mapping the name of its counter fields to the
+            value that must be added to them.
+
+        """
+        deltas: Dict[str, Dict[str, int]] = collections.defaultdict(lambda: collections.defaultdict(int))
+
+        for interaction_count in interaction_counts or ():
+            if interaction_count is None:
+                continue
+
+            field_name = cls.__interaction_counter_fields__.get(interaction_count.interaction_type, None)
+            if field_name is None:
+                continue
+
+            if interaction_count.is_active or interaction_count.interaction_type not in cls.__reversible_interaction_types__:
+                deltas[interaction_count.audio_key][field_name] += interaction_count.count
+            else:
+                deltas[interaction_count.audio_key][field_name] -= interaction_count.count
+
+        for hit_count in hit_counts or ():
+            if hit_count is None:
+                continue
+
+            field_name = cls.__hit_counter_fields__.get(hit_count.hit_type, None)
+            if field_name is None:
+                continue
+
+            deltas[hit_count.audio_key][field_name] += hit_count.count
+
+        return {
+            audio_key: {field_name: delta for field_name, delta in audio_deltas.items() if delta}
+            for audio_key, audio_deltas in deltas.items()
+        }
+
     async def update_by_hit_count(
         self,
         hit_count: HitCount,
@@ -890,6 +971,37 @@ class AudioMethods:
 
         raise AttributeError
 
+    async def increment_audio_counters(
+        self,
+        deltas: Dict[str, Dict[str, int]],
+        window_name: Optional[str] = None,
+        window_id: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Add the given deltas to the counter fields of the `Audio` documents in bulk, without reading them first.
+
+        Parameters
+        ----------
+        deltas : dict
+            Dictionary mapping the key of every audio to a dictionary mapping the name of its counter fields to the
+            value that must be added to them. It can be created with `Audio.get_counter_deltas`.
+        window_name : str, optional
+            Name of the counting window the deltas belong to.
+        window_id : int, optional
+            ID of the counting window the deltas belong to. Audios that have already applied this window are skipped.
+
+        Returns
+        -------
+        list of str
+            Keys of the audios that could not be updated.
+
+        """
+        return await Audio.increment_counters(
+            deltas,
+            window_name=window_name,
+            window_id=window_id,
+        )
+
     async def get_audio_by_id(
         self,
         id: str,
@@ -158,6 +158,34 @@ class BaseDocument(BaseModel):
     __from_index_processors__: Optional[Tuple[FromDocumentBaseProcessor]] = None
 
     __base_non_updatable_fields__: Optional[Tuple[str]] = ("created_at",)
+
+    # painless script for adding deltas to the counter fields of a document, counters never go below zero. When a
+    # window is given, the last window applied to the document is stored in `counter_windows` and the deltas of a
+    # window that has already been applied to the document are skipped.
+    __increment_counters_script__ = (
+        "def windows = ctx._source.counter_windows;"
+        "def applied = null;"
+        "if (params.window_name != null && windows != null) {"
+        "  applied = windows[params.window_name];"
+        "}"
+        "if (applied != null && ((Number) applied).longValue() >= params.window_id) {"
+        "  ctx.op = 'noop';"
+        "} else {"
+        "  for (entry in params.deltas.entrySet()) {"
+        "    def value = ctx._source[entry.getKey()];"
+        "    long updated = (value == null ? 0L : ((Number) value).longValue()) + entry.getValue();"
+        "    ctx._source[entry.getKey()] = updated < 0 ? 0L : updated;"
+        "  }"
+        "  if (params.window_name != null) {"
+        "    if (windows == null) {"
+        "      windows = new HashMap();"
+        "      ctx._source.counter_windows = windows;"
+        "    }"
+        "    windows[params.window_name] = params.window_id;"
+        "  }"
+        "  ctx._source.modified_at = params.modified_at;"
+        "}"
+    )
     __non_updatable_fields__: Optional[Tuple[str]] = None
 
     id: Optional[str]
@@ -340,6 +368,40 @@ class BaseDocument(BaseModel):
         else:
             return True
 
+    @classmethod
+    async def update_index_mappings(
+        cls,
+    ) -> bool:
+        """
+        Add the fields of the mappings that are missing from the existing index in the ElasticSearch. The fields that
+        are already mapped are left untouched, since the mapping of an existing field cannot be changed.
+
+        Returns
+        -------
+        bool
+            Whether the mappings of the index are up-to-date or not
+        """
+        properties = cls.__mappings__.get("properties", None) if cls.__mappings__ else None
+        if not properties:
+            return True
+
+        try:
+            response = await cls.__es__.indices.get_mapping(index=cls.__index_name__)
+            existing_properties = response[cls.__index_name__]["mappings"].get("properties", {})
+
+            missing_properties = {name: mapping for name, mapping in properties.items() if name not in existing_properties}
+            if missing_properties:
+                await cls.__es__.indices.put_mapping(
+                    index=cls.__index_name__,
+                    properties=missing_properties,
+                )
+                logger.info(f"Added `{', '.join(missing_properties.keys())}` fields to the mappings of the {cls.__index_name__} Index")
+        except Exception as e:
+            logger.exception(e)
+            return False
+        else:
+            return True
+
     @classmethod
     async def get(
         cls,
@@ -555,6 +617,98 @@ class BaseDocument(BaseModel):
 
         return successful
 
+    @classmethod
+    async def increment_counters(
+        cls,
+        deltas: Dict[str, Dict[str, int]],
+        chunk_size: int = 500,
+        window_name: Optional[str] = None,
+        window_id: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Add the given deltas to the counter fields of the documents of this index using scripted updates sent through
+        the `_bulk` API. The documents are not read beforehand, and concurrent updates of the same document are
+        resolved by elasticsearch.
+
+        Parameters
+        ----------
+        deltas : dict
+            Dictionary mapping the ID of every document to a dictionary mapping the name of its counter fields to the
+            value that must be added to them. Negative values decrement the counters.
+        chunk_size : int, default : 500
+            Number of documents to update in each `_bulk` request.
+        window_name : str, optional
+            Name of the counting window the deltas belong to, e.g., the key of the job computing them.
+        window_id : int, optional
+            ID of the counting window the deltas belong to. IDs of the windows with the same name must be increasing.
+            If both `window_name` and `window_id` are given, the deltas are only applied to the documents that have not
+            applied this window yet, so the same window can be applied again safely after a failure.
+
+        Returns
+        -------
+        list of str
+            IDs of the documents that could not be updated. Documents that do not exist are skipped and are not
+            considered as failures.
+
+        """
+        failed_ids = []
+        if not deltas:
+            return failed_ids
+
+        modified_at = get_now_timestamp()
+        items = [(id_, doc_deltas) for id_, doc_deltas in deltas.items() if doc_deltas]
+
+        for i in range(0, len(items), chunk_size):
+            chunk = items[i : i + chunk_size]
+
+            operations = []
+            for id_, doc_deltas in chunk:
+                operations.append(
+                    {
+                        "update": {
+                            "_index": cls.__index_name__,
+                            "_id": id_,
+                            "retry_on_conflict": 5,
+                        }
+                    }
+                )
+                operations.append(
+                    {
+                        "script": {
+                            "source": cls.__increment_counters_script__,
+                            "lang": "painless",
+                            "params": {
+                                "deltas": doc_deltas,
+                                "modified_at": modified_at,
+                                "window_name": window_name if window_id is not None else None,
+                                "window_id": window_id if window_id is not None else 0,
+                            },
+                        }
+                    }
+                )
+
+            try:
+                response = await cls.__es__.bulk(
+                    operations=operations,
+                    refresh=False,
+                )
+            except Exception as e:
+                logger.exception(f"{cls.__name__} : {e}")
+                failed_ids.extend(id_ for id_, _ in chunk)
+                continue
+
+            if not response.body.get("errors", False):
+                continue
+
+            for item in response.body.get("items", []):
+                result = item.get("update", {})
+                status = result.get("status", 500)
+                if status >= 300 and status != 404:
+                    logger.error(f"{cls.__name__}: `{result.get('_id', None)}` : {result.get('error', None)}")
+                    failed_ids.append(result.get("_id", None))
+
+        return failed_ids
+
     @classmethod
     async def search(
         cls,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import collections
 from itertools import chain
-from typing import Optional, List, Tuple, Deque
+from typing import Optional, List, Tuple, Deque, Iterable, Dict
 
 from elastic_transport import ObjectApiResponse
 from pydantic import Field
@@ -43,6 +43,7 @@ class Playlist(BaseDocument, BaseSoftDeletableDocument):
             "is_soft_deleted": {"type": "boolean"},
             "soft_deleted_at": {"type": "long"},
             "is_soft_deleted_time_precise": {"type": "boolean"},
+            "counter_windows": {"type": "object", "enabled": False},
         }
     }
 
@@ -62,6 +63,24 @@ class Playlist(BaseDocument, BaseSoftDeletableDocument):
         "description",
     ]
 
+    # mapping of interaction types to the counter fields they are counted in.
+    __interaction_counter_fields__ = {
+        PlaylistInteractionType.DOWNLOAD_PUBLIC_PLAYLIST: "downloads",
+        PlaylistInteractionType.REDOWNLOAD_PUBLIC_PLAYLIST: "redownloads",
+        PlaylistInteractionType.SHARE_PUBLIC_PLAYLIST: "shares",
+        PlaylistInteractionType.DOWNLOAD_AUDIO: "audio_downloads",
+        PlaylistInteractionType.REDOWNLOAD_AUDIO: "audio_redownloads",
+        PlaylistInteractionType.SHARE_AUDIO: "audio_shares",
+        PlaylistInteractionType.SHARE_AUDIO_LINK: "audio_link_shares",
+        PlaylistInteractionType.LIKE_AUDIO: "audio_likes",
+        PlaylistInteractionType.DISLIKE_AUDIO: "audio_dislikes",
+    }
+    # interactions that can be undone, their inactive counts are subtracted from the counters.
+    __reversible_interaction_types__ = (
+        PlaylistInteractionType.LIKE_AUDIO,
+        PlaylistInteractionType.DISLIKE_AUDIO,
+    )
+
     owner_user_id: int
     title: str
     description: Optional[str]
@@ -248,6 +267,59 @@ class Playlist(BaseDocument, BaseSoftDeletableDocument):
             retry_on_conflict=True,
         )
 
+    @classmethod
+    def get_counter_deltas(
+        cls,
+        interaction_counts: Optional[Iterable[PlaylistInteractionCount]] = None,
+        subscription_counts: Optional[Iterable[PublicPlaylistSubscriptionCount]] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Merge the given interaction and subscription counts into the deltas of the counter fields of every playlist,
+        so that every playlist is updated only once, no matter how many counts it has.
+
+        Parameters
+        ----------
+        interaction_counts : Iterable[PlaylistInteractionCount], optional
+            Interaction counts to merge.
+        subscription_counts : Iterable[PublicPlaylistSubscriptionCount], optional
+            Subscription counts to merge.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the key of every playlist to a dictionary mapping the name of its counter fields to the
+            value that must be added to them.
+
+        """
+        deltas: Dict[str, Dict[str, int]] = collections.defaultdict(lambda: collections.defaultdict(int))
+
+        for interaction_count in interaction_counts or ():
+            if interaction_count is None:
+                continue
+
+            field_name = cls.__interaction_counter_fields__.get(interaction_count.interaction_type, None)
+            if field_name is None:
+                continue
+
+            if interaction_count.is_active or interaction_count.interaction_type not in cls.__reversible_interaction_types__:
+                deltas[interaction_count.playlist_key][field_name] += interaction_count.count
+            else:
+                deltas[interaction_count.playlist_key][field_name] -= interaction_count.count
+
+        for subscription_count in subscription_counts or ():
+            if subscription_count is None:
+                continue
+
+            if subscription_count.is_active:
+                deltas[subscription_count.playlist_key]["subscribers"] += subscription_count.count
+            else:
+                deltas[subscription_count.playlist_key]["subscribers"] -= subscription_count.count
+
+        return {
+            playlist_key: {field_name: delta for field_name, delta in playlist_deltas.items() if delta}
+            for playlist_key, playlist_deltas in deltas.items()
+        }
+
     @classmethod
     def get_query(
         cls,
@@ -574,3 +646,34 @@ class PlaylistMethods:
 
         """
         return await Playlist.get(id)
+
+    async def increment_playlist_counters(
+        self,
+        deltas: Dict[str, Dict[str, int]],
+        window_name: Optional[str] = None,
+        window_id: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Add the given deltas to the counter fields of the `Playlist` documents in bulk, without reading them first.
+
+        Parameters
+        ----------
+        deltas : dict
+            Dictionary mapping the key of every playlist to a dictionary mapping the name of its counter fields to the
+            value that must be added to them. It can be created with `Playlist.get_counter_deltas`.
+        window_name : str, optional
+            Name of the counting window the deltas belong to.
+        window_id : int, optional
+            ID of the counting window the deltas belong to. Playlists that have already applied this window are skipped.
+
+        Returns
+        -------
+        list of str
+            Keys of the playlists that could not be updated.
+
+        """
+        return await Playlist.increment_counters(
+            deltas,
+            window_name=window_name,
+            window_id=window_id,
+        )
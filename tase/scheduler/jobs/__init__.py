@@ -1,3 +1,4 @@
+from .archive_hits_job import ArchiveHitsJob
 from .base_job import BaseJob
 from .check_usernames_job import CheckUsernamesJob
 from .check_usernames_with_unchecked_mentions_job import (
@@ -11,9 +12,11 @@ from .dummy_job import DummyJob
 from .extract_usernames_job import ExtractUsernamesJob
 from .forward_audios_job import ForwardAudiosJob
 from .index_audios_job import IndexAudiosJob
+from .repair_playlist_audio_counts_job import RepairPlaylistAudioCountsJob
 from .upload_audio_thumbnails_job import UploadAudioThumbnailsJob
 
 __all__ = [
+    "ArchiveHitsJob",
     "BaseJob",
     "CheckUsernamesJob",
     "CheckUsernamesWithUncheckedMentionsJob",
@@ -25,5 +28,6 @@ __all__ = [
     "ExtractUsernamesJob",
     "ForwardAudiosJob",
     "IndexAudiosJob",
+    "RepairPlaylistAudioCountsJob",
     "UploadAudioThumbnailsJob",
 ]
@@ -0,0 +1,59 @@
+import arrow
+from apscheduler.triggers.interval import IntervalTrigger
+
+from tase.db import DatabaseClient
+from tase.my_logger import logger
+from .base_job import BaseJob
+from ...common.utils import get_now_timestamp
+from ...db.arangodb.enums import RabbitMQTaskType
+from ...telegram.client.client_worker import RabbitMQConsumer
+
+
+class ArchiveHitsJob(BaseJob):
+    type = RabbitMQTaskType.ARCHIVE_HITS_JOB
+    priority = 1
+
+    trigger = IntervalTrigger(
+        hours=24,
+        start_date=arrow.now().shift(minutes=+5).datetime,
+    )
+
+    async def run(
+        self,
+        consumer: RabbitMQConsumer,
+        db: DatabaseClient,
+        telegram_client: "TelegramClient" = None,
+    ):
+        await self.task_in_worker(db)
+
+        job = await db.document.get_archive_hits_job()
+        if job is None or not job.is_active:
+            await self.task_failed(db)
+            return
+
+        retention_days = self.kwargs.get("retention_days", 30)
+
+        # the window ends at the retention period before now, the queries created after that are not touched.
+        window = await job.start_window(get_now_timestamp() - retention_days * 86400000)
+        if window is None:
+            logger.error("Could not start the window of archive hits job document")
+            await self.task_failed(db)
+            return
+
+        window_start, window_end = window
+        try:
+            archived_count = await db.graph.archive_unused_hits(window_start, window_end)
+        except Exception as e:
+            logger.exception(e)
+            await self.task_failed(db)
+            return
+
+        if archived_count is None:
+            # the window is kept pending, so it is resumed on the next run.
+            await self.task_failed(db)
+            return
+
+        logger.info(f"Archived {archived_count} unused hits")
+        if not await job.finish_window():
+            logger.error("Could not update the archive hits job document")
+        await self.task_done(db)
@@ -6,6 +6,7 @@ from tase.db import DatabaseClient
 from .base_job import BaseJob
 from ...common.utils import get_now_timestamp
 from ...db.arangodb.enums import RabbitMQTaskType
+from ...db.elasticsearchdb.models import Audio
 from ...telegram.client.client_worker import RabbitMQConsumer
 
 
@@ -14,7 +15,7 @@ class CountAudioInteractionsJob(BaseJob):
     priority = 2
 
     trigger = IntervalTrigger(
-        hours=1,
+        minutes=5,
         start_date=arrow.now().datetime,
     )
 
@@ -31,24 +32,30 @@ class CountAudioInteractionsJob(BaseJob):
             await self.task_failed(db)
         else:
             if job.is_active:
-                now = get_now_timestamp()
+                window = await job.start_window(get_now_timestamp())
+                if window is None:
+                    logger.error(f"Could not start the window of count interaction job document")
+                    await self.task_failed(db)
+                    return
 
+                window_start, window_end = window
                 interactions_count = await db.graph.count_audio_interactions(
-                    job.last_run_at,
-                    now,
+                    window_start,
+                    window_end,
                 )
 
-                for interaction_count in interactions_count:
-                    es_audio_doc = await db.index.get_audio_by_id(interaction_count.audio_key)
-                    if not es_audio_doc:
-                        continue
-
-                    updated = await es_audio_doc.update_by_interaction_count(interaction_count)
-                    if not updated:
-                        logger.error(f"Could not update interaction count for audio with key : `{interaction_count.audio_key}`")
+                deltas = Audio.get_counter_deltas(interaction_counts=interactions_count)
+                failed_audio_keys = await db.index.increment_audio_counters(
+                    deltas,
+                    window_name=job.key,
+                    window_id=window_end,
+                )
+                for audio_key in failed_audio_keys:
+                    logger.error(f"Could not update interaction count for audio with key : `{audio_key}`")
 
-                updated = await job.update_last_run(now)
-                if not updated:
+                # the window is kept pending if any of the audios could not be updated, so it is resumed on the next run.
+                # audios that have already applied the window are skipped then.
+                if job.can_finish_window(failed_audio_keys) and not await job.finish_window():
                     logger.error(f"Could not count interaction job document")
                 await self.task_done(db)
             else:
@@ -9,6 +9,7 @@ from .base_job import BaseJob
 from ...common.utils import get_now_timestamp
 from ...db.arangodb.enums import RabbitMQTaskType
 from ...db.arangodb.helpers import PlaylistInteractionCount
+from ...db.elasticsearchdb.models import Playlist
 from ...telegram.client.client_worker import RabbitMQConsumer
 
 
@@ -17,7 +18,7 @@ class CountPublicPlaylistInteractionsJob(BaseJob):
     priority = 2
 
     trigger = IntervalTrigger(
-        minutes=1,
+        minutes=5,
         start_date=arrow.now().datetime,
     )
 
@@ -34,28 +35,34 @@ class CountPublicPlaylistInteractionsJob(BaseJob):
             await self.task_failed(db)
         else:
             if job.is_active:
-                now = get_now_timestamp()
+                window = await job.start_window(get_now_timestamp())
+                if window is None:
+                    logger.error(f"Could not start the window of count interaction job document")
+                    await self.task_failed(db)
+                    return
 
+                window_start, window_end = window
                 interactions_count: List[PlaylistInteractionCount] = await db.graph.count_public_playlist_interactions(
-                    job.last_run_at,
-                    now,
+                    window_start,
+                    window_end,
                 )
 
-                for interaction_count in interactions_count:
-                    es_playlist = await db.index.get_playlist_by_id(interaction_count.playlist_key)
-                    if not es_playlist:
-                        continue
-
-                    updated = await es_playlist.update_by_interaction_count(interaction_count)
-                    if not updated:
-                        logger.error(f"Could not update interaction count for playlist with key : `{interaction_count.playlist_key}`")
-
-                job_last_run_at = job.last_run_at
-                updated = await job.update_last_run(now)
-                if updated:
-                    await db.graph.remove_invalid_public_playlist_interactions(job_last_run_at, now)
-                else:
-                    logger.error(f"Could not count interaction job document")
+                deltas = Playlist.get_counter_deltas(interaction_counts=interactions_count)
+                failed_playlist_keys = await db.index.increment_playlist_counters(
+                    deltas,
+                    window_name=job.key,
+                    window_id=window_end,
+                )
+                for playlist_key in failed_playlist_keys:
+                    logger.error(f"Could not update interaction count for playlist with key : `{playlist_key}`")
+
+                # the window is kept pending if any of the playlists could not be updated, so it is resumed on the next
+                # run, the invalid interactions are removed only after they have been counted.
+                if job.can_finish_window(failed_playlist_keys):
+                    if await job.finish_window():
+                        await db.graph.remove_invalid_public_playlist_interactions(window_start, window_end)
+                    else:
+                        logger.error(f"Could not count interaction job document")
 
                 await self.task_done(db)
             else:
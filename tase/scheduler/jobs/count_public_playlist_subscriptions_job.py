@@ -9,6 +9,7 @@ from .base_job import BaseJob
 from ...common.utils import get_now_timestamp
 from ...db.arangodb.enums import RabbitMQTaskType
 from ...db.arangodb.helpers import PublicPlaylistSubscriptionCount
+from ...db.elasticsearchdb.models import Playlist
 from ...telegram.client.client_worker import RabbitMQConsumer
 
 
@@ -17,7 +18,7 @@ class CountPublicPlaylistSubscriptionsJob(BaseJob):
     priority = 2
 
     trigger = IntervalTrigger(
-        minutes=1,
+        minutes=5,
         start_date=arrow.now().datetime,
     )
 
@@ -34,24 +35,29 @@ class CountPublicPlaylistSubscriptionsJob(BaseJob):
             await self.task_failed(db)
         else:
             if job.is_active:
-                now = get_now_timestamp()
+                window = await job.start_window(get_now_timestamp())
+                if window is None:
+                    logger.error(f"Could not start the window of count public playlist subscription job document")
+                    await self.task_failed(db)
+                    return
 
+                window_start, window_end = window
                 subscriptions_count: List[PublicPlaylistSubscriptionCount] = await db.graph.count_public_playlist_subscriptions(
-                    job.last_run_at,
-                    now,
+                    window_start,
+                    window_end,
                 )
 
-                for subscription_count in subscriptions_count:
-                    es_playlist = await db.index.get_playlist_by_id(subscription_count.playlist_key)
-                    if not es_playlist:
-                        continue
-
-                    updated = await es_playlist.update_by_subscription_count(subscription_count)
-                    if not updated:
-                        logger.error(f"Could not update public playlist subscription count for playlist with key : `{subscription_count.playlist_key}`")
+                deltas = Playlist.get_counter_deltas(subscription_counts=subscriptions_count)
+                failed_playlist_keys = await db.index.increment_playlist_counters(
+                    deltas,
+                    window_name=job.key,
+                    window_id=window_end,
+                )
+                for playlist_key in failed_playlist_keys:
+                    logger.error(f"Could not update public playlist subscription count for playlist with key : `{playlist_key}`")
 
-                updated = await job.update_last_run(now)
-                if not updated:
+                # the window is kept pending if any of the playlists could not be updated, so it is resumed on the next run.
+                if job.can_finish_window(failed_playlist_keys) and not await job.finish_window():
                     logger.error(f"Could not count public playlist subscription job document")
                 await self.task_done(db)
             else:
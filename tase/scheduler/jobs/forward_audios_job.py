@@ -1,4 +1,3 @@
-import asyncio
 import collections
 
 import arrow
@@ -40,7 +39,7 @@ class ForwardAudiosJob(BaseJob):
 
             protected_content_message_ids = collections.deque()
             protected_content_message_db_keys = collections.deque()
-            for idx, audio_group in enumerate(audio_groups):
+            for audio_group in audio_groups:
                 current_chat_id = None
                 for audio in audio_group:
                     if not current_chat_id:
@@ -90,7 +89,4 @@ class ForwardAudiosJob(BaseJob):
                 protected_content_message_ids.clear()
                 protected_content_message_db_keys.clear()
 
-                if (idx + 1) % 2 == 0:
-                    await asyncio.sleep(20)
-
         await self.task_done(db)
@@ -0,0 +1,36 @@
+import arrow
+from apscheduler.triggers.interval import IntervalTrigger
+
+from tase.db import DatabaseClient
+from tase.my_logger import logger
+from .base_job import BaseJob
+from ...db.arangodb.enums import RabbitMQTaskType
+from ...telegram.client.client_worker import RabbitMQConsumer
+
+
+class RepairPlaylistAudioCountsJob(BaseJob):
+    type = RabbitMQTaskType.REPAIR_PLAYLIST_AUDIO_COUNTS_JOB
+    priority = 1
+
+    trigger = IntervalTrigger(
+        hours=24,
+        start_date=arrow.now().shift(minutes=+1).datetime,
+    )
+
+    async def run(
+        self,
+        consumer: RabbitMQConsumer,
+        db: DatabaseClient,
+        telegram_client: "TelegramClient" = None,
+    ):
+        await self.task_in_worker(db)
+
+        try:
+            repaired_count = await db.graph.repair_playlist_audio_counts()
+        except Exception as e:
+            logger.exception(e)
+            await self.task_failed(db)
+        else:
+            if repaired_count:
+                logger.info(f"Repaired the audio count of {repaired_count} playlists")
+            await self.task_done(db)
@@ -9,8 +9,15 @@ from decouple import config
 from tase.configs import TASEConfig
 from tase.db import DatabaseClient
 from tase.errors import NotEnoughRamError
+from tase.my_logger import logger
 from tase.scheduler import SchedulerWorkerProcess
-from tase.scheduler.jobs import ForwardAudiosJob, CountPublicPlaylistSubscriptionsJob, CountPublicPlaylistInteractionsJob
+from tase.scheduler.jobs import (
+    ForwardAudiosJob,
+    CountPublicPlaylistSubscriptionsJob,
+    CountPublicPlaylistInteractionsJob,
+    RepairPlaylistAudioCountsJob,
+    ArchiveHitsJob,
+)
 from tase.telegram.client import TelegramClient
 from tase.telegram.client.telegram_client_manager import TelegramClientManager
 
@@ -43,15 +50,33 @@ class TASE:
 
             self.tase_config = tase_config
             if tase_config is not None:
-                self.telegram_client_manager = TelegramClientManager(tase_config)
-                self.telegram_client_manager.start()
-
                 self.database_client = DatabaseClient(
                     elasticsearch_config=tase_config.elastic_config,
                     arangodb_config=tase_config.arango_db_config,
                 )
                 await self.database_client.init_databases(update_arango_indexes=True)
 
+                # set the kinds of the `has` edges created before the traversals started filtering by them, the
+                # migration job is deactivated once all the edges have been updated, so it is not scanned again.
+                backfill_job = await self.database_client.document.get_backfill_has_edge_kinds_job()
+                if backfill_job is None or backfill_job.is_active:
+                    updated_count = await self.database_client.graph.backfill_has_edge_kinds()
+                    if updated_count is not None and backfill_job is not None and not await backfill_job.deactivate():
+                        logger.error("Could not deactivate the backfill has edge kinds job document")
+
+                # build the per-user audio states from the existing interactions before they are read from them, the
+                # migration job is deactivated only after the last user has been processed, so an interrupted
+                # backfill is run again on the next start.
+                backfill_job = await self.database_client.document.get_backfill_user_audio_states_job()
+                if backfill_job is None or backfill_job.is_active:
+                    user_count = await self.database_client.graph.backfill_user_audio_states()
+                    if user_count is not None and backfill_job is not None and not await backfill_job.deactivate():
+                        logger.error("Could not deactivate the backfill user audio states job document")
+
+                # the workers are started after the migrations, since their queries rely on the migrated data
+                self.telegram_client_manager = TelegramClientManager(tase_config)
+                self.telegram_client_manager.start()
+
                 scheduler = SchedulerWorkerProcess(tase_config)
                 scheduler.start()
 
@@ -66,6 +91,13 @@ class TASE:
                     # await ForwardAudiosJob().publish(self.database_client)
                     await CountPublicPlaylistSubscriptionsJob().publish(self.database_client)
                     await CountPublicPlaylistInteractionsJob().publish(self.database_client)
+                    # the first run also sets the audio count of the playlists created before the count was added
+                    await RepairPlaylistAudioCountsJob().publish(self.database_client)
+                    await ArchiveHitsJob(
+                        kwargs={
+                            "retention_days": tase_config.arango_db_config.unused_hit_retention_days,
+                        }
+                    ).publish(self.database_client)
                     # await CountInteractionsJob().publish(self.database_client)
                     # await CountHitsJob().publish(self.database_client)
 
@@ -202,28 +202,16 @@ class BaseTask(BaseModel):
         self,
         db: DatabaseClient,
     ) -> bool:
-        task = await db.document.get_rabbitmq_task_by_key(self.task_key)
-        if task:
-            return await task.update_status(RabbitMQTaskStatus.IN_WORKER)
-
-        return False
+        return await db.document.update_rabbitmq_task_status_in_background(self.task_key, RabbitMQTaskStatus.IN_WORKER)
 
     async def task_done(
         self,
         db: DatabaseClient,
     ) -> bool:
-        task = await db.document.get_rabbitmq_task_by_key(self.task_key)
-        if task:
-            return await task.update_status(RabbitMQTaskStatus.DONE)
-
-        return False
+        return await db.document.update_rabbitmq_task_status(self.task_key, RabbitMQTaskStatus.DONE)
 
     async def task_failed(
         self,
         db: DatabaseClient,
     ) -> bool:
-        task = await db.document.get_rabbitmq_task_by_key(self.task_key)
-        if task:
-            return await task.update_status(RabbitMQTaskStatus.FAILED)
-
-        return False
+        return await db.document.update_rabbitmq_task_status(self.task_key, RabbitMQTaskStatus.FAILED)
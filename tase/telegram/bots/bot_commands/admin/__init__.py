@@ -7,6 +7,7 @@ from .index_channel_command import IndexChannelCommand
 from .promote_user_command import PromoteUserCommand
 from .reindex_all_channels_command import ReindexAllChannelsCommand
 from .reindex_channel_command import ReindexChannelCommand
+from .rescore_all_channels_command import RescoreAllChannelsCommand
 from .shutdown_command import ShutdownCommand
 
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     "PromoteUserCommand",
     "ReindexAllChannelsCommand",
     "ReindexChannelCommand",
+    "RescoreAllChannelsCommand",
     "ShutdownCommand",
 ]
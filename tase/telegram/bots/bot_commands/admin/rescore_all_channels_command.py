@@ -0,0 +1,61 @@
+import pyrogram
+from pydantic import Field
+from pyrogram.enums import ParseMode
+
+from tase.db.arangodb import graph as graph_models
+from tase.db.arangodb.graph.vertices.user import UserRole
+from tase.errors import NotEnoughRamError
+from tase.telegram.tasks import CalculateChannelScoresTask
+from tase.telegram.update_handlers.base import BaseHandler
+from ..base_command import BaseCommand
+from ..bot_command_type import BotCommandType
+
+
+class RescoreAllChannelsCommand(BaseCommand):
+    """
+    Calculate the scores of all indexed public channels again.
+    """
+
+    command_type: BotCommandType = Field(default=BotCommandType.RESCORE_CHANNELS)
+    command_description = "Calculate the scores of all public channels again"
+    required_role_level: UserRole = UserRole.OWNER
+    number_of_required_arguments = 1
+
+    async def command_function(
+        self,
+        client: pyrogram.Client,
+        message: pyrogram.types.Message,
+        handler: BaseHandler,
+        from_user: graph_models.vertices.User,
+        from_callback_query: bool,
+    ) -> None:
+        confirm_message = message.command[1]
+
+        if confirm_message.strip().lower() != "confirm":
+            await message.reply_text(
+                "The `confirm` word must be passed with the command!",
+                quote=True,
+                parse_mode=ParseMode.MARKDOWN,
+            )
+            return
+
+        try:
+            status, created = await CalculateChannelScoresTask().publish(handler.db)
+        except NotEnoughRamError:
+            await message.reply_text(
+                "Calculating channel scores was cancelled due to high memory usage",
+                quote=True,
+                parse_mode=ParseMode.HTML,
+            )
+        else:
+            if status is None:
+                await message.reply_text("internal error")
+            else:
+                if created:
+                    if status.is_active():
+                        await message.reply_text("Started calculating scores of all public channels")
+                else:
+                    if status.is_active():
+                        await message.reply_text("Task for calculating channel scores is already being processed")
+                    else:
+                        await message.reply_text("The task for calculating channel scores is already finished")
@@ -27,6 +27,7 @@ class BotCommandType(Enum):
     INDEX_CHANNEL = "index_channel"
     REINDEX_CHANNEL = "reindex_channel"
     REINDEX_CHANNELS = "reindex_all_channels"
+    RESCORE_CHANNELS = "rescore_all_channels"
     SHUTDOWN_SYSTEM = "shutdown_system"
     CHECK_BOT_STATUS = "check_status"
     EXTRACT_USERNAMES = "extract_usernames"
@@ -15,6 +15,11 @@ class CustomInlineQueryResult(BaseModel):
     last_result_total_item_count: int = Field(default=0)
     countable_items_length: int = Field(default=0)
 
+    # opaque position of the last item of the previous page, used by the inline queries that are paginated by a
+    # cursor instead of an offset.
+    cursor: Optional[str] = Field(default=None)
+    next_cursor: Optional[str] = Field(default=None)
+
     telegram_inline_query: Optional[pyrogram.types.InlineQuery]
 
     class Config:
@@ -34,10 +39,11 @@ class CustomInlineQueryResult(BaseModel):
             self.last_result_total_item_count = 0
 
         if inline_query.offset:
-            last_result_len, last_countable_items_len = inline_query.offset.split(":")
+            last_result_len, last_countable_items_len, *cursor = inline_query.offset.split(":", 2)
 
             self.from_ = int(last_countable_items_len)
             self.last_result_total_item_count = int(last_result_len)
+            self.cursor = cursor[0] if cursor else None
         else:
             self.from_ = 0
             self.last_result_total_item_count = 0
@@ -59,11 +65,22 @@ class CustomInlineQueryResult(BaseModel):
         self,
         only_countable: bool = False,
     ) -> str:
-        return f"{self.from_ + self.countable_items_length if only_countable else len(self.results)}:{self.from_ + self.countable_items_length}"
+        next_offset = f"{self.from_ + self.countable_items_length if only_countable else len(self.results)}:{self.from_ + self.countable_items_length}"
+        if self.next_cursor:
+            next_offset = f"{next_offset}:{self.next_cursor}"
+
+        return next_offset
 
     def is_first_page(self) -> bool:
         return self.from_ == 0 and self.last_result_total_item_count == 0
 
+    def has_next_page_cursor(self) -> bool:
+        """
+        Whether this query is for the first page or for a page after a cursor. A later page without any cursor
+        means the previous page was the last one.
+        """
+        return self.is_first_page() or bool(self.cursor)
+
     def set_results(
         self,
         results: List[pyrogram.types.InlineQueryResult],
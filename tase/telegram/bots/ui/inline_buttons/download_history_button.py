@@ -9,7 +9,7 @@ import pyrogram
 from tase.common.utils import _trans, emoji
 from tase.db.arangodb import graph as graph_models
 from tase.db.arangodb.enums import InlineQueryType, ChatType, AudioInteractionType
-from tase.db.arangodb.helpers import AudioHitMetadata
+from tase.db.arangodb.helpers import AudioHitMetadata, EdgeCursor
 from tase.my_logger import logger
 from tase.telegram.bots.inline import CustomInlineQueryResult
 from tase.telegram.update_handlers.base import BaseHandler
@@ -67,10 +67,15 @@ class DownloadHistoryInlineButton(InlineButton):
         query_date: int,
         inline_button_data: Optional[DownloadHistoryButtonData] = None,
     ):
-        audio_vertices = await handler.db.graph.get_user_download_history(
-            from_user,
-            offset=result.from_,
-        )
+        if result.has_next_page_cursor():
+            audio_vertices, next_cursor = await handler.db.graph.get_user_download_history(
+                from_user,
+                cursor=EdgeCursor.parse(result.cursor),
+            )
+            result.next_cursor = next_cursor.serialize() if next_cursor else None
+        else:
+            # the previous page was the last one
+            audio_vertices = collections.deque()
 
         hit_download_urls = None
         hit_metadata_list = None
@@ -7,7 +7,7 @@ import pyrogram
 from tase.common.utils import _trans, emoji
 from tase.db.arangodb import graph as graph_models
 from tase.db.arangodb.enums import InlineQueryType, ChatType, AudioInteractionType, PlaylistInteractionType
-from tase.db.arangodb.helpers import PlaylistAudioHitMetadata
+from tase.db.arangodb.helpers import PlaylistAudioHitMetadata, EdgeCursor
 from tase.errors import UserDoesNotHasPlaylist
 from tase.my_logger import logger
 from tase.telegram.bots.inline import CustomInlineQueryResult
@@ -110,11 +110,11 @@ class GetPlaylistAudioInlineButton(InlineButton):
             # since the playlist validation has been done in the first page, it is not necessary to redo it.
             playlist_is_valid = True
 
-        if playlist_is_valid:
+        if playlist_is_valid and result.has_next_page_cursor():
             try:
-                audio_vertices = await handler.db.graph.get_playlist_audios(
+                audio_vertices, next_cursor = await handler.db.graph.get_playlist_audios(
                     inline_button_data.playlist_key,
-                    offset=result.from_,
+                    cursor=EdgeCursor.parse(result.cursor),
                 )
             except UserDoesNotHasPlaylist:
                 # since it is already been checked that the playlist belongs to the user, this exception will not occur
@@ -122,6 +122,8 @@ class GetPlaylistAudioInlineButton(InlineButton):
             else:
                 from tase.telegram.bots.ui.inline_items import AudioItem
 
+                result.next_cursor = next_cursor.serialize() if next_cursor else None
+
                 # todo: fix this
                 chats_dict, invalid_audio_keys = await handler.update_audio_cache(audio_vertices)
 
@@ -217,10 +219,10 @@ class GetPlaylistAudioInlineButton(InlineButton):
                 return
 
             if inline_item_info.inline_query_type == InlineQueryType.PRIVATE_PLAYLIST_COMMAND:
-                if await handler.db.graph.get_audio_interaction_by_user(
+                if await handler.db.graph.audio_is_interacted_by_user(
                     from_user,
-                    inline_item_info.hit_download_url,
                     AudioInteractionType.DOWNLOAD_AUDIO,
+                    hit_download_url=inline_item_info.hit_download_url,
                 ):
                     audio_int_type = AudioInteractionType.REDOWNLOAD_AUDIO
                 else:
@@ -237,10 +239,10 @@ class GetPlaylistAudioInlineButton(InlineButton):
                     playlist_int_type = PlaylistInteractionType.DOWNLOAD_AUDIO
 
             elif inline_item_info.inline_query_type == InlineQueryType.PUBLIC_PLAYLIST_COMMAND:
-                if await handler.db.graph.get_audio_interaction_by_user(
+                if await handler.db.graph.audio_is_interacted_by_user(
                     from_user,
-                    inline_item_info.hit_download_url,
                     AudioInteractionType.DOWNLOAD_AUDIO,
+                    hit_download_url=inline_item_info.hit_download_url,
                 ):
                     if inline_item_info.chat_type == ChatType.BOT:
                         audio_int_type = AudioInteractionType.REDOWNLOAD_AUDIO
@@ -1,32 +1,97 @@
+import asyncio
 import math
+from typing import ClassVar, Dict, Iterable, List, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
 from pyrogram.enums import MessagesFilter
 
+from tase.db.arangodb.helpers import ChannelMessageCounts
 from tase.my_logger import logger
 from tase.telegram.client import TelegramClient
 
+if TYPE_CHECKING:
+    from tase.db.arangodb.graph.vertices import Chat
+
 
 class ChannelAnalyzer(BaseModel):
     """
     This class is used to calculate importance scores for telegram channels based on different factors
     """
 
+    # Cached message counters of a chat that are older than this TTL (in milliseconds) are counted again.
+    message_counts_ttl: ClassVar[int] = 24 * 60 * 60 * 1000
+
     @staticmethod
-    async def calculate_score(
+    async def get_message_counts(
         telegram_client: TelegramClient,
         telegram_chat_id: int,
-        chat_members_count: int,
-    ) -> float:
+    ) -> ChannelMessageCounts:
         """
-        Calculate score for a channel
+        Get the message counters of a channel. All the counters are requested at the same time and are paced by the
+        rate limiter of the telegram client.
 
         Parameters
         ----------
         telegram_client : tase.telegram.TelegramClient
             Telegram client being used to get statistics about the channel
         telegram_chat_id : int
-            Channel ID that the score is being calculated for
+            Channel ID to get the counters for
+
+        Returns
+        -------
+        ChannelMessageCounts
+            Message counters of the channel
+        """
+        (
+            all_messages_count,
+            audio_count,
+            photo_video_count,
+            document_count,
+            audio_video_note_count,
+            gif_count,
+            link_count,
+            location_count,
+            chat_photo_count,
+            contact_count,
+        ) = await asyncio.gather(
+            telegram_client.get_chat_history_count(telegram_chat_id),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.AUDIO),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.PHOTO_VIDEO),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.DOCUMENT),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.AUDIO_VIDEO_NOTE),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.ANIMATION),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.URL),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.LOCATION),
+            # telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.PHONE_CALL),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.CHAT_PHOTO),
+            telegram_client.search_messages_count(telegram_chat_id, filter=MessagesFilter.CONTACT),
+        )
+
+        return ChannelMessageCounts(
+            all_messages_count=all_messages_count,
+            audio_count=audio_count,
+            photo_video_count=photo_video_count,
+            document_count=document_count,
+            audio_video_note_count=audio_video_note_count,
+            gif_count=gif_count,
+            link_count=link_count,
+            location_count=location_count,
+            chat_photo_count=chat_photo_count,
+            contact_count=contact_count,
+        )
+
+    @staticmethod
+    def calculate_score_from_counts(
+        message_counts: ChannelMessageCounts,
+        chat_members_count: int,
+    ) -> float:
+        """
+        Calculate score for a channel from its message counters
+
+        Parameters
+        ----------
+        message_counts : ChannelMessageCounts
+            Message counters of the channel
         chat_members_count : int
             Total number of chat's members
 
@@ -34,37 +99,10 @@ class ChannelAnalyzer(BaseModel):
         -------
         Calculated score for the channel
         """
-        all_messages_count = await telegram_client._client.get_chat_history_count(telegram_chat_id)
-        audio_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.AUDIO)
-        photo_video_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.PHOTO_VIDEO)
-        document_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.DOCUMENT)
-        audio_video_note_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.AUDIO_VIDEO_NOTE)
-        gif_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.ANIMATION)
-        link_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.URL)
-        location_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.LOCATION)
-        # phone_call_count = telegram_client._client.search_messages_count(
-        #     chat.id, filter=MessagesFilter.PHONE_CALL
-        # )
-        chat_photo_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.CHAT_PHOTO)
-        contact_count = await telegram_client._client.search_messages_count(telegram_chat_id, filter=MessagesFilter.CONTACT)
-
-        media_count = (
-            audio_count
-            + photo_video_count
-            + document_count
-            + audio_video_note_count
-            + gif_count
-            + link_count
-            + location_count
-            # + phone_call_count
-            + chat_photo_count
-            + contact_count
-        )
-
-        deleted_message_count = all_messages_count - media_count
+        deleted_message_count = message_counts.all_messages_count - message_counts.media_count
 
         try:
-            audio_density = audio_count / (all_messages_count - deleted_message_count - link_count)
+            audio_density = message_counts.audio_count / (message_counts.all_messages_count - deleted_message_count - message_counts.link_count)
         except ZeroDivisionError:
             audio_density = 0.0
 
@@ -74,3 +112,90 @@ class ChannelAnalyzer(BaseModel):
         logger.debug(f"member_density: {member_density}")
 
         return (2 * audio_density + 1 * member_density) / 3
+
+    @staticmethod
+    async def calculate_score(
+        telegram_client: TelegramClient,
+        telegram_chat_id: int,
+        chat_members_count: int,
+        chat: Optional["Chat"] = None,
+    ) -> float:
+        """
+        Calculate score for a channel
+
+        Parameters
+        ----------
+        telegram_client : tase.telegram.TelegramClient
+            Telegram client being used to get statistics about the channel
+        telegram_chat_id : int
+            Channel ID that the score is being calculated for
+        chat_members_count : int
+            Total number of chat's members
+        chat : Chat, optional
+            Chat vertex of the channel. If given, its cached message counters are used while they are not expired, and
+            new counters are cached on it otherwise.
+
+        Returns
+        -------
+        Calculated score for the channel
+        """
+        if chat is not None and chat.message_counts is not None and not chat.message_counts.is_expired(ChannelAnalyzer.message_counts_ttl):
+            message_counts = chat.message_counts
+        else:
+            message_counts = await ChannelAnalyzer.get_message_counts(telegram_client, telegram_chat_id)
+            if chat is not None:
+                await chat.update_message_counts(message_counts)
+
+        return ChannelAnalyzer.calculate_score_from_counts(message_counts, chat_members_count)
+
+    @staticmethod
+    async def calculate_scores(
+        telegram_clients: List[TelegramClient],
+        chats: Iterable["Chat"],
+        max_chats_per_client: int = 3,
+    ) -> Dict[str, float]:
+        """
+        Calculate and update the scores of many channels at once. Channels are split across the given telegram clients
+        and every client scores up to `max_chats_per_client` channels at the same time.
+
+        Parameters
+        ----------
+        telegram_clients : list of tase.telegram.TelegramClient
+            Telegram clients being used to get statistics about the channels
+        chats : iterable of Chat
+            Chat vertices of the channels to score
+        max_chats_per_client : int, default : 3
+            Maximum number of channels each client scores at the same time
+
+        Returns
+        -------
+        dict
+            Mapping of the keys of the successfully scored chats to their new scores
+        """
+        if not telegram_clients:
+            return {}
+
+        semaphores = [asyncio.Semaphore(max(max_chats_per_client, 1)) for _ in telegram_clients]
+        scores: Dict[str, float] = {}
+
+        async def score_chat(
+            idx: int,
+            chat: "Chat",
+        ) -> None:
+            async with semaphores[idx]:
+                try:
+                    score = await ChannelAnalyzer.calculate_score(
+                        telegram_clients[idx],
+                        chat.chat_id,
+                        chat.members_count,
+                        chat=chat,
+                    )
+                    await chat.update_audio_indexer_score(score)
+                except Exception as e:
+                    logger.error(f"Could not calculate score of chat `{chat.title}`: {e}")
+                else:
+                    scores[chat.key] = score
+
+        await asyncio.gather(*(score_chat(idx % len(telegram_clients), chat) for idx, chat in enumerate(chats)))
+
+        return scores
@@ -0,0 +1,9 @@
+from .adaptive_token_bucket import AdaptiveTokenBucket
+from .telegram_method_class import TelegramMethodClass
+from .telegram_rate_limiter import TelegramRateLimiter
+
+__all__ = [
+    "AdaptiveTokenBucket",
+    "TelegramMethodClass",
+    "TelegramRateLimiter",
+]
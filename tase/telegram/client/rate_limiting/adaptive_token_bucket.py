@@ -0,0 +1,95 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to the `FloodWait` errors received from telegram.
+
+    Every successful call increases the rate additively up to `max_rate` and every `FloodWait` error decreases it
+    multiplicatively down to `min_rate`. The bucket is blocked until the `FloodWait` is over, so that no other call of
+    the same class is made in the meantime.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float,
+        max_rate: float,
+        increase_step: float = 0.01,
+        decrease_factor: float = 0.5,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+        self.call_count = 0
+        self.flood_wait_count = 0
+        self.last_flood_wait = 0
+
+        self._lock = asyncio.Lock()
+
+    def _refill(
+        self,
+        now: float,
+    ) -> None:
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.call_count += 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_flood_wait(
+        self,
+        seconds: int,
+    ) -> None:
+        seconds = max(int(seconds or 0), 0)
+        now = time.monotonic()
+
+        self.flood_wait_count += 1
+        self.last_flood_wait = seconds
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+        # no tokens are refilled while the bucket is blocked
+        self.tokens = 0.0
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.updated_at = self.blocked_until
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 4),
+            "tokens": round(self.tokens, 2),
+            "blocked_for": max(0, round(self.blocked_until - time.monotonic())),
+            "call_count": self.call_count,
+            "flood_wait_count": self.flood_wait_count,
+            "last_flood_wait": self.last_flood_wait,
+        }
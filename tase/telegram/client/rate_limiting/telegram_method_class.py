@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class TelegramMethodClass(Enum):
+    """
+    Classes of telegram methods that share the same rate limit.
+    """
+
+    UNKNOWN = 0
+
+    # `get_messages`, `iter_messages` and message counters
+    HISTORY = 1
+    # `get_chat`
+    CHAT = 2
+    # `forward_messages` and re-sending media by their file IDs
+    FORWARD = 3
+    # `download_media`
+    DOWNLOAD = 4
+    # `send_photo`
+    UPLOAD = 5
@@ -0,0 +1,123 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from pyrogram.errors import FloodWait
+
+from tase.my_logger import logger
+from .adaptive_token_bucket import AdaptiveTokenBucket
+from .telegram_method_class import TelegramMethodClass
+
+T = TypeVar("T")
+
+
+class TelegramRateLimiter:
+    """
+    Per-client rate limiter for telegram calls with one `AdaptiveTokenBucket` for every `TelegramMethodClass`.
+
+    The initial rates are conservative and rise with every successful call, so the throughput gets close to the real
+    limit of each method class. `FloodWait` errors lower the rate of the method class they were received for.
+    """
+
+    # method class => (initial rate, capacity, min rate, max rate) in requests per second
+    default_limits: Dict[TelegramMethodClass, tuple] = {
+        TelegramMethodClass.HISTORY: (1.0, 3, 0.05, 10.0),
+        TelegramMethodClass.CHAT: (0.2, 2, 0.01, 2.0),
+        TelegramMethodClass.FORWARD: (0.1, 1, 0.01, 1.0),
+        TelegramMethodClass.DOWNLOAD: (0.5, 3, 0.05, 5.0),
+        TelegramMethodClass.UPLOAD: (0.2, 1, 0.01, 2.0),
+    }
+
+    def __init__(
+        self,
+        client_name: str,
+        limits: Optional[Dict[TelegramMethodClass, tuple]] = None,
+        max_retry_wait: int = 60,
+    ):
+        self.client_name = client_name
+        self.max_retry_wait = max_retry_wait
+
+        limits = {**self.default_limits, **(limits or {})}
+        self.buckets: Dict[TelegramMethodClass, AdaptiveTokenBucket] = {
+            method_class: AdaptiveTokenBucket(
+                rate=rate,
+                capacity=capacity,
+                min_rate=min_rate,
+                max_rate=max_rate,
+            )
+            for method_class, (rate, capacity, min_rate, max_rate) in limits.items()
+        }
+
+    async def call(
+        self,
+        method_class: TelegramMethodClass,
+        func: Callable[..., Awaitable[T]],
+        *args,
+        max_retries: int = 1,
+        **kwargs,
+    ) -> T:
+        """
+        Call the given telegram method once a token of its method class is available.
+
+        Parameters
+        ----------
+        method_class : TelegramMethodClass
+            Class of the method that is being called.
+        func : callable
+            Coroutine function to call.
+        args : tuple
+            Arguments of the function.
+        max_retries : int, default : 1
+            Number of times the call is retried after a `FloodWait` shorter than `max_retry_wait` seconds.
+        kwargs : dict
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        Any
+            Result of the function call.
+
+        Raises
+        ------
+        FloodWait
+            If the `FloodWait` is longer than `max_retry_wait` seconds or the call has been retried `max_retries` times.
+        """
+        bucket = self.buckets.get(method_class, None)
+        if bucket is None:
+            return await func(*args, **kwargs)
+
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                result = await func(*args, **kwargs)
+            except FloodWait as e:
+                self.on_flood_wait(method_class, e.value)
+                if attempt >= max_retries or e.value > self.max_retry_wait:
+                    raise e
+
+                attempt += 1
+            else:
+                bucket.on_success()
+                return result
+
+    def on_flood_wait(
+        self,
+        method_class: TelegramMethodClass,
+        seconds: int,
+    ) -> None:
+        bucket = self.buckets.get(method_class, None)
+        if bucket is None:
+            return
+
+        bucket.on_flood_wait(seconds)
+        logger.warning(f"[{self.client_name}] FloodWait of {seconds} seconds for `{method_class.name}`, rate is now {bucket.rate:.4f} requests per second")
+
+    def get_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current rates and statistics of every method class.
+
+        Returns
+        -------
+        dict
+            Mapping of method class names to their statistics.
+        """
+        return {method_class.name: bucket.get_stats() for method_class, bucket in self.buckets.items()}
@@ -1,2 +1,2 @@
 from .forward_messages import forward_messages
-from .search_messages import search_messages
+from .search_messages import search_messages, search_message_pages
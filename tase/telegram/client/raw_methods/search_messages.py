@@ -1,8 +1,13 @@
-from typing import List, Union, AsyncGenerator, Optional
+import asyncio
+import functools
+from typing import List, Union, AsyncGenerator, Optional, TYPE_CHECKING
 
 import pyrogram
 from pyrogram import raw, types, utils
 
+if TYPE_CHECKING:
+    from tase.telegram.client.rate_limiting import TelegramRateLimiter
+
 
 class Filters:
     EMPTY = raw.types.InputMessagesFilterEmpty()
@@ -76,6 +81,47 @@ async def get_chunk(
     return await utils.parse_messages(client, r)
 
 
+async def search_message_pages(
+    client: pyrogram.Client,
+    chat_id: Union[int, str],
+    query: str = "",
+    offset: int = 0,
+    offset_id: int = 0,
+    filter: str = "empty",
+    limit: int = 0,
+    from_user: Union[int, str] = None,
+    only_newer_messages: bool = True,
+    rate_limiter: Optional["TelegramRateLimiter"] = None,
+    prefetch: int = 0,
+) -> Optional[AsyncGenerator[List[pyrogram.types.Message], None]]:
+    """Search for text and media messages inside a specific chat and yield them page by page.
+    Parameters are the same as :meth:`search_messages`, with the addition of:
+        prefetch (``int``, *optional*):
+            Number of pages to request ahead of the consumer. While the consumer is processing a page, the next pages
+            are fetched into a buffer of this size in the background.
+            Defaults to 0 (no read-ahead).
+    Returns:
+        ``Generator``: A generator yielding lists of :obj:`~pyrogram.types.Message` objects.
+    """
+    pages = _iter_pages(
+        client=client,
+        chat_id=chat_id,
+        query=query,
+        offset=offset,
+        offset_id=offset_id,
+        filter=filter,
+        limit=limit,
+        from_user=from_user,
+        only_newer_messages=only_newer_messages,
+        rate_limiter=rate_limiter,
+    )
+    if prefetch > 0:
+        pages = _prefetch_pages(pages, prefetch)
+
+    async for page in pages:
+        yield page
+
+
 async def search_messages(
     client: pyrogram.Client,
     chat_id: Union[int, str],
@@ -86,6 +132,8 @@ async def search_messages(
     limit: int = 0,
     from_user: Union[int, str] = None,
     only_newer_messages: bool = True,
+    rate_limiter: Optional["TelegramRateLimiter"] = None,
+    prefetch: int = 0,
 ) -> Optional[AsyncGenerator[pyrogram.types.Message, None]]:
     """Search for text and media messages inside a specific chat.
     If you want to get the messages count only, see :meth:`~pyrogram.Client.search_messages_count`.
@@ -126,6 +174,11 @@ async def search_messages(
             By default, no limit is applied and all messages are returned.
         from_user (``int`` | ``str``, *optional*):
             Unique identifier (int) or username (str) of the target user you want to search for messages from.
+        rate_limiter (``TelegramRateLimiter``, *optional*):
+            Rate limiter of the client. If given, every chunk of messages is requested through it.
+        prefetch (``int``, *optional*):
+            Number of pages of messages to request ahead of the consumer.
+            Defaults to 0 (no read-ahead).
     Returns:
         ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects.
     Example:
@@ -140,6 +193,35 @@ async def search_messages(
             for message in app.search_messages(chat, "hello", from_user="me"):
                 print(message.text)
     """
+    async for messages in search_message_pages(
+        client=client,
+        chat_id=chat_id,
+        query=query,
+        offset=offset,
+        offset_id=offset_id,
+        filter=filter,
+        limit=limit,
+        from_user=from_user,
+        only_newer_messages=only_newer_messages,
+        rate_limiter=rate_limiter,
+        prefetch=prefetch,
+    ):
+        for message in messages:
+            yield message
+
+
+async def _iter_pages(
+    client: pyrogram.Client,
+    chat_id: Union[int, str],
+    query: str = "",
+    offset: int = 0,
+    offset_id: int = 0,
+    filter: str = "empty",
+    limit: int = 0,
+    from_user: Union[int, str] = None,
+    only_newer_messages: bool = True,
+    rate_limiter: Optional["TelegramRateLimiter"] = None,
+) -> AsyncGenerator[List[pyrogram.types.Message], None]:
     current = 0
     total = abs(limit) or (1 << 31) - 1
     limit = min(100, total)
@@ -150,8 +232,15 @@ async def search_messages(
 
     last_offset_id = -1
 
+    if rate_limiter is not None:
+        from tase.telegram.client.rate_limiting import TelegramMethodClass
+
+        fetch_chunk = functools.partial(rate_limiter.call, TelegramMethodClass.HISTORY, get_chunk)
+    else:
+        fetch_chunk = get_chunk
+
     while True:
-        messages = await get_chunk(
+        messages = await fetch_chunk(
             client=client,
             chat_id=chat_id,
             query=query,
@@ -182,10 +271,44 @@ async def search_messages(
         else:
             offset_id = 0
 
-        for message in messages:
-            yield message
+        if current + len(messages) >= total:
+            yield messages[: total - current]
+            return
+
+        current += len(messages)
+        yield messages
+
+
+async def _prefetch_pages(
+    pages: AsyncGenerator[List[pyrogram.types.Message], None],
+    buffer_size: int,
+) -> AsyncGenerator[List[pyrogram.types.Message], None]:
+    """
+    Consume the given pages in a background task and buffer up to `buffer_size` of them ahead of the consumer.
+    Exceptions raised while fetching the pages are re-raised to the consumer in order.
+    """
+    buffer = asyncio.Queue(maxsize=buffer_size)
+    end = object()
 
-            current += 1
+    async def fetch() -> None:
+        try:
+            async for page in pages:
+                await buffer.put(page)
+        except Exception as e:
+            await buffer.put(e)
+        else:
+            await buffer.put(end)
 
-            if current >= total:
+    task = asyncio.create_task(fetch())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is end:
                 return
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+    finally:
+        # stop fetching when the consumer stops early
+        task.cancel()
@@ -11,7 +11,8 @@ from pyrogram.handlers.handler import Handler
 
 from tase.configs import ClientConfig, ClientTypes, ArchiveChannelInfo
 from tase.my_logger import logger
-from tase.telegram.client.raw_methods import search_messages, forward_messages
+from tase.telegram.client.rate_limiting import TelegramMethodClass, TelegramRateLimiter
+from tase.telegram.client.raw_methods import search_messages, search_message_pages, forward_messages
 
 if TYPE_CHECKING:
     from tase.telegram.update_handlers.base import BaseHandler
@@ -53,6 +54,8 @@ class TelegramClient:
     client_type: ClientTypes
     _me: Optional[pyrogram.types.User] = None
 
+    rate_limiter: TelegramRateLimiter
+
     archive_channel_info: Optional[ArchiveChannelInfo]
     thumbnail_archive_channel_info: Optional[ArchiveChannelInfo]
 
@@ -146,11 +149,103 @@ class TelegramClient:
             self._me = await self._client.get_me()
         return self._me
 
+    def get_rate_limits(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current rates of the telegram calls made by this client for every method class.
+        """
+        return self.rate_limiter.get_rates()
+
     async def get_chat(
         self,
         chat_id: Union[int, str],
     ) -> Union[pyrogram.types.Chat, pyrogram.types.ChatPreview]:
-        return await self._client.get_chat(chat_id=chat_id)
+        return await self.rate_limiter.call(
+            TelegramMethodClass.CHAT,
+            self._client.get_chat,
+            chat_id=chat_id,
+        )
+
+    async def get_chat_history_count(
+        self,
+        chat_id: Union[int, str],
+    ) -> int:
+        return await self.rate_limiter.call(
+            TelegramMethodClass.HISTORY,
+            self._client.get_chat_history_count,
+            chat_id=chat_id,
+        )
+
+    async def search_messages_count(
+        self,
+        chat_id: Union[int, str],
+        query: str = "",
+        filter: pyrogram.enums.MessagesFilter = pyrogram.enums.MessagesFilter.EMPTY,
+    ) -> int:
+        return await self.rate_limiter.call(
+            TelegramMethodClass.HISTORY,
+            self._client.search_messages_count,
+            chat_id=chat_id,
+            query=query,
+            filter=filter,
+        )
+
+    async def download_media(
+        self,
+        message: Union[pyrogram.types.Message, str],
+        file_name: str = "downloads/",
+        in_memory: bool = False,
+        block: bool = True,
+    ):
+        return await self.rate_limiter.call(
+            TelegramMethodClass.DOWNLOAD,
+            self._client.download_media,
+            message,
+            file_name=file_name,
+            in_memory=in_memory,
+            block=block,
+        )
+
+    async def send_photo(
+        self,
+        chat_id: Union[int, str],
+        photo: str,
+        caption: str = "",
+    ) -> Optional[pyrogram.types.Message]:
+        return await self.rate_limiter.call(
+            TelegramMethodClass.UPLOAD,
+            self._client.send_photo,
+            chat_id=chat_id,
+            photo=photo,
+            caption=caption,
+        )
+
+    async def send_audio(
+        self,
+        chat_id: Union[int, str],
+        audio: str,
+        caption: str = "",
+    ) -> Optional[pyrogram.types.Message]:
+        return await self.rate_limiter.call(
+            TelegramMethodClass.FORWARD,
+            self._client.send_audio,
+            chat_id=chat_id,
+            audio=audio,
+            caption=caption,
+        )
+
+    async def send_document(
+        self,
+        chat_id: Union[int, str],
+        document: str,
+        caption: str = "",
+    ) -> Optional[pyrogram.types.Message]:
+        return await self.rate_limiter.call(
+            TelegramMethodClass.FORWARD,
+            self._client.send_document,
+            chat_id=chat_id,
+            document=document,
+            caption=caption,
+        )
 
     async def forward_messages(
         self,
@@ -163,7 +258,9 @@ class TelegramClient:
         drop_media_captions: Optional[bool] = False,
         drop_author: Optional[bool] = False,
     ) -> Union[pyrogram.types.Message, List[pyrogram.types.Message]]:
-        return await forward_messages(
+        return await self.rate_limiter.call(
+            TelegramMethodClass.FORWARD,
+            forward_messages,
             self._client,
             chat_id=chat_id,
             from_chat_id=from_chat_id,
@@ -211,6 +308,7 @@ class TelegramClient:
         offset_id: int = 0,
         only_newer_messages: bool = True,
         filter: str = "empty",
+        prefetch: int = 0,
     ) -> Optional[AsyncGenerator[pyrogram.types.Message, None]]:
         return search_messages(
             client=self._client,
@@ -220,6 +318,34 @@ class TelegramClient:
             offset_id=offset_id,
             only_newer_messages=only_newer_messages,
             filter=filter,
+            rate_limiter=self.rate_limiter,
+            prefetch=prefetch,
+        )
+
+    def iter_message_pages(
+        self,
+        chat_id: Union[str, int],
+        query: str = "",
+        offset: int = 0,
+        offset_id: int = 0,
+        only_newer_messages: bool = True,
+        filter: str = "empty",
+        prefetch: int = 1,
+    ) -> Optional[AsyncGenerator[List[pyrogram.types.Message], None]]:
+        """
+        Iterate over the messages of a chat page by page. The next `prefetch` pages are requested while the current
+        page is being processed.
+        """
+        return search_message_pages(
+            client=self._client,
+            chat_id=chat_id,
+            query=query,
+            offset=offset,
+            offset_id=offset_id,
+            only_newer_messages=only_newer_messages,
+            filter=filter,
+            rate_limiter=self.rate_limiter,
+            prefetch=prefetch,
         )
 
     @classmethod
@@ -251,7 +377,9 @@ class TelegramClient:
             return []
 
         try:
-            messages = await self._client.get_messages(
+            messages = await self.rate_limiter.call(
+                TelegramMethodClass.HISTORY,
+                self._client.get_messages,
                 chat_id=chat_id,
                 message_ids=message_ids,
             )
@@ -287,6 +415,7 @@ class UserTelegramClient(TelegramClient):
         self.api_id = client_config.api_id
         self.api_hash = client_config.api_hash
         self.role = UserClientRoles._parse(client_config.role)  # todo: check for unknown roles
+        self.rate_limiter = TelegramRateLimiter(self.name)
 
     def init_client(self):
         self._client = pyrogram.Client(
@@ -320,6 +449,7 @@ class BotTelegramClient(TelegramClient):
         self.api_hash = client_config.api_hash
         self.token = client_config.bot_token
         self.role = BotClientRoles._parse(client_config.role)  # todo: check for unknown roles
+        self.rate_limiter = TelegramRateLimiter(self.name)
 
     def init_client(self):
         self._client = pyrogram.Client(
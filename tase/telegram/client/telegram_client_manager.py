@@ -12,7 +12,7 @@ from tase.db import DatabaseClient
 from tase.my_logger import logger
 from tase.telegram.client import TelegramClient, UserTelegramClient
 from tase.telegram.client.client_worker import TelegramClientConsumer
-from tase.telegram.update_handlers.base import ClientDisconnectHandler
+from tase.telegram.update_handlers.base import ClientDisconnectHandler, MessageUpdateBuffer
 from tase.telegram.update_handlers.bots import BotDeletedMessagesHandler, BotMessageHandler, CallbackQueryHandler, ChosenInlineQueryHandler, InlineQueryHandler
 from tase.telegram.update_handlers.users import UserChatMemberUpdatedHandler, UserDeletedMessagesHandler, UserMessageHandler
 
@@ -32,6 +32,7 @@ class TelegramClientManager(mp.Process):
         self.clients: List[TelegramClient] = []
         self.users: List[TelegramClient] = []
         self.bots: List[TelegramClient] = []
+        self.update_buffers: List[MessageUpdateBuffer] = []
 
     def run(self) -> None:
         logger.info(f"process: {mp.current_process().name}, thread: {threading.current_thread()}")
@@ -90,6 +91,8 @@ class TelegramClientManager(mp.Process):
         await self.rabbitmq_consumer.init_rabbitmq_consumer(self.users, self.bots)
 
         await idle()
+        for update_buffer in self.update_buffers:
+            await update_buffer.close()
         for client in self.clients:
             await client.stop()
 
@@ -99,6 +102,13 @@ class TelegramClientManager(mp.Process):
         self,
         telegram_client: TelegramClient,
     ):
+        user_message_handler = UserMessageHandler(
+            db=self.db,
+            telegram_client=telegram_client,
+        )
+        if isinstance(telegram_client, UserTelegramClient):
+            self.update_buffers.append(user_message_handler.update_buffer)
+
         self.user_update_handlers = [
             UserChatMemberUpdatedHandler(
                 db=self.db,
@@ -107,11 +117,9 @@ class TelegramClientManager(mp.Process):
             UserDeletedMessagesHandler(
                 db=self.db,
                 telegram_client=telegram_client,
+                update_buffer=user_message_handler.update_buffer,
             ),
-            UserMessageHandler(
-                db=self.db,
-                telegram_client=telegram_client,
-            ),
+            user_message_handler,
             # UserRawUpdateHandler(
             #     db=self.db,
             #     telegram_client=telegram_client
@@ -0,0 +1,11 @@
+from .audio_indexing_coordinator import AudioIndexingCoordinator
+from .channel_indexing_progress import ChannelIndexingProgress
+from .channel_indexing_status import ChannelIndexingStatus
+from .client_indexing_quota import ClientIndexingQuota
+
+__all__ = [
+    "AudioIndexingCoordinator",
+    "ChannelIndexingProgress",
+    "ChannelIndexingStatus",
+    "ClientIndexingQuota",
+]
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+from typing import AsyncGenerator, Deque, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
+
+from pyrogram.enums import MessagesFilter
+from pyrogram.errors import FloodWait
+
+from tase.common.utils import get_now_timestamp
+from tase.db.arangodb.graph.vertices import Chat
+from tase.my_logger import logger
+from .channel_indexing_progress import ChannelIndexingProgress
+from .channel_indexing_status import ChannelIndexingStatus
+from .client_indexing_quota import ClientIndexingQuota
+
+if TYPE_CHECKING:
+    from tase.db import DatabaseClient
+    from tase.telegram.client import TelegramClient
+
+
+class AudioIndexingCoordinator:
+    """
+    Index audio files of many channels in parallel using all the available telegram user clients.
+
+    Channels are split across the clients by their estimated number of remaining messages, every client indexes
+    several channels at the same time, and clients that run out of channels take the remaining channels of the other
+    clients. Each client keeps its own `ClientIndexingQuota` which adapts the delay between pages of messages to the
+    `FloodWait` errors the client receives.
+    """
+
+    # Chats that have been indexed in this period are not indexed again.
+    reindex_interval: int = 14 * 24 * 60 * 60 * 1000
+
+    # Estimation used for chats whose number of remaining messages could not be retrieved.
+    default_estimated_remaining_messages: int = 1000
+
+    # Number of times a failed channel is retried on another client.
+    max_channel_attempts: int = 2
+
+    def __init__(
+        self,
+        db: DatabaseClient,
+        telegram_clients: List[TelegramClient],
+        max_channels_per_client: int = 3,
+        flood_wait_budget: int = 15 * 60,
+        progress_report_interval: int = 60,
+    ):
+        self.db = db
+        self.telegram_clients: Dict[str, TelegramClient] = {telegram_client.name: telegram_client for telegram_client in telegram_clients}
+        self.max_channels_per_client = max(max_channels_per_client, 1)
+        self.progress_report_interval = progress_report_interval
+
+        self.quotas: Dict[str, ClientIndexingQuota] = {
+            name: ClientIndexingQuota(
+                client_name=name,
+                flood_wait_budget=flood_wait_budget,
+            )
+            for name in self.telegram_clients.keys()
+        }
+        self.channels: Dict[str, ChannelIndexingProgress] = collections.OrderedDict()
+
+        self._chats: Dict[str, Chat] = {}
+        self._queues: Dict[str, Deque[ChannelIndexingProgress]] = {name: collections.deque() for name in self.telegram_clients.keys()}
+        self._lanes: Deque[asyncio.Task] = collections.deque()
+        self._lane_counts: Dict[str, int] = {name: 0 for name in self.telegram_clients.keys()}
+
+    async def run(
+        self,
+        *chats: Union[Iterable[Chat], AsyncGenerator[Chat, None]],
+    ) -> bool:
+        """
+        Index the given chats and return whether all of them were indexed successfully or not.
+
+        Parameters
+        ----------
+        chats : iterable of Chat or async generator of Chat
+            Sources of the chats to index. Chats are deduplicated by their key.
+
+        Returns
+        -------
+        bool
+            Whether all the chats were indexed successfully or not.
+        """
+        if not self.telegram_clients:
+            logger.error("There is no telegram client available for indexing audio files")
+            return False
+
+        for chats_ in chats:
+            await self.collect_chats(chats_)
+
+        if not self.channels:
+            logger.info("There are no chats to index")
+            return True
+
+        await self.estimate_remaining_messages()
+        self.distribute_channels()
+        logger.info(f"Started indexing {len(self.channels)} chats using {len(self.telegram_clients)} clients")
+
+        reporter = asyncio.create_task(self._report_progress_periodically())
+        try:
+            for name in self.telegram_clients.keys():
+                for _ in range(self.max_channels_per_client):
+                    self._start_lane(name)
+
+            # lanes are restarted for the clients that get a reassigned channel after all of their lanes have exited
+            while self._lanes:
+                lanes = list(self._lanes)
+                self._lanes.clear()
+                await asyncio.gather(*lanes)
+        finally:
+            reporter.cancel()
+
+        logger.info(f"Finished indexing chats:\n{self.get_progress_report()}")
+
+        # channels that are still pending were left in the queue of an exhausted client and are not indexed
+        return all(progress.status in (ChannelIndexingStatus.DONE, ChannelIndexingStatus.SKIPPED) for progress in self.channels.values())
+
+    async def collect_chats(
+        self,
+        chats: Union[Iterable[Chat], AsyncGenerator[Chat, None]],
+    ) -> None:
+        """
+        Collect the chats that need to be indexed.
+        """
+
+        def add(chat_: Chat) -> None:
+            if not chat_ or not chat_.is_valid or chat_.key in self.channels:
+                return
+
+            if chat_.audio_indexer_metadata is not None and get_now_timestamp() - chat_.audio_indexer_metadata.last_run_at <= self.reindex_interval:
+                return
+
+            self._chats[chat_.key] = chat_
+            self.channels[chat_.key] = ChannelIndexingProgress(
+                chat_key=chat_.key,
+                title=chat_.title,
+            )
+
+        if hasattr(chats, "__aiter__"):
+            async for chat in chats:
+                add(chat)
+        else:
+            for chat in chats:
+                add(chat)
+
+    async def estimate_remaining_messages(self) -> None:
+        """
+        Estimate the number of audio messages that are not indexed yet for every collected chat. The estimations are
+        spread across the clients so that every client is used for at most `max_channels_per_client` requests at the
+        same time.
+        """
+        names = list(self.telegram_clients.keys())
+        semaphores = {name: asyncio.Semaphore(self.max_channels_per_client) for name in names}
+
+        async def estimate(
+            name: str,
+            progress: ChannelIndexingProgress,
+        ) -> None:
+            chat = self._chats[progress.chat_key]
+            async with semaphores[name]:
+                quota = self.quotas[name]
+                try:
+                    audio_count = await self.telegram_clients[name].search_messages_count(
+                        chat.username if chat.username else chat.chat_id,
+                        filter=MessagesFilter.AUDIO,
+                    )
+                except FloodWait as e:
+                    quota.on_flood_wait(e.value)
+                    audio_count = None
+                except Exception as e:
+                    logger.error(f"Could not estimate remaining messages of chat `{chat.title}`: {e}")
+                    audio_count = None
+
+            if audio_count is None:
+                progress.estimated_remaining_messages = self.default_estimated_remaining_messages
+            else:
+                indexed_count = chat.audio_indexer_metadata.message_count if chat.audio_indexer_metadata else 0
+                progress.estimated_remaining_messages = max(audio_count - indexed_count, 0)
+
+        await asyncio.gather(*[estimate(names[idx % len(names)], progress) for idx, progress in enumerate(self.channels.values())])
+
+    def distribute_channels(self) -> None:
+        """
+        Split the channels across the clients so that every client gets about the same number of messages to index.
+        Channels with more remaining messages are assigned first, each one to the client with the least load.
+        """
+        for progress in sorted(self.channels.values(), key=lambda p: p.estimated_remaining_messages, reverse=True):
+            name = min(self.quotas.values(), key=lambda q: (q.assigned_message_count, len(self._queues[q.client_name]))).client_name
+            self._assign(name, progress)
+
+    def _assign(
+        self,
+        name: str,
+        progress: ChannelIndexingProgress,
+    ) -> None:
+        self._queues[name].append(progress)
+        self.quotas[name].assigned_message_count += progress.estimated_remaining_messages
+
+    def _next_channel(
+        self,
+        name: str,
+    ) -> Optional[ChannelIndexingProgress]:
+        """
+        Get the next channel for the given client. If the client has no channels left, take the smallest channel from the
+        client with the most remaining work.
+        """
+        if self.quotas[name].is_exhausted:
+            return None
+
+        queue = self._queues[name]
+        if queue:
+            return queue.popleft()
+
+        candidates = [other for other in self._queues.keys() if other != name and self._queues[other]]
+        if not candidates:
+            return None
+
+        victim = max(candidates, key=lambda other: sum(p.estimated_remaining_messages for p in self._queues[other]))
+        progress = self._queues[victim].pop()
+        self.quotas[victim].assigned_message_count -= progress.estimated_remaining_messages
+        self.quotas[name].assigned_message_count += progress.estimated_remaining_messages
+
+        return progress
+
+    def _start_lane(
+        self,
+        name: str,
+    ) -> None:
+        self._lane_counts[name] += 1
+        self._lanes.append(asyncio.create_task(self._run_lane(name)))
+
+    async def _run_lane(
+        self,
+        name: str,
+    ) -> None:
+        try:
+            while True:
+                progress = self._next_channel(name)
+                if progress is None:
+                    break
+
+                await self._index_channel(name, progress)
+        finally:
+            self._lane_counts[name] -= 1
+
+    async def _index_channel(
+        self,
+        name: str,
+        progress: ChannelIndexingProgress,
+    ) -> None:
+        from tase.telegram.tasks import IndexAudiosTask
+
+        telegram_client = self.telegram_clients[name]
+        quota = self.quotas[name]
+
+        progress.start(name)
+        quota.active_channel_count += 1
+        flood_wait_count = quota.flood_wait_count
+
+        task = IndexAudiosTask(kwargs={"chat_key": progress.chat_key})
+        try:
+            await quota.pace()
+            chat = await task.get_updated_chat(
+                telegram_client,
+                self.db,
+                self._chats[progress.chat_key],
+                pacer=quota,
+            )
+            if chat is None:
+                status = ChannelIndexingStatus.FAILED
+            else:
+                self._chats[progress.chat_key] = chat
+                progress.title = chat.title
+
+                success = await task.index_audios(self.db, telegram_client, chat, index_audio=True, pacer=quota, progress=progress)
+                if success:
+                    success = await task.index_audios(self.db, telegram_client, chat, index_audio=False, pacer=quota, progress=progress)
+
+                status = ChannelIndexingStatus.DONE if success else ChannelIndexingStatus.FAILED
+        except Exception as e:
+            logger.exception(e)
+            status = ChannelIndexingStatus.FAILED
+        finally:
+            quota.active_channel_count -= 1
+
+        if status == ChannelIndexingStatus.FAILED and quota.flood_wait_count > flood_wait_count and progress.attempts < self.max_channel_attempts:
+            # The channel failed because of a `FloodWait`, give it to another client.
+            others = [other for other in self.quotas.values() if other.client_name != name and not other.is_exhausted]
+            if others:
+                other = min(others, key=lambda q: (q.is_blocked, q.assigned_message_count))
+                progress.status = ChannelIndexingStatus.PENDING
+                quota.assigned_message_count -= progress.estimated_remaining_messages
+                self._assign(other.client_name, progress)
+                if not self._lane_counts[other.client_name]:
+                    self._start_lane(other.client_name)
+                logger.info(f"Reassigned chat `{progress.title}` from `{name}` to `{other.client_name}`")
+                return
+
+        progress.finish(status)
+        if status == ChannelIndexingStatus.DONE:
+            quota.finished_channel_count += 1
+        else:
+            quota.failed_channel_count += 1
+
+    def get_progress_report(self) -> str:
+        """
+        Get a human-readable report of the indexing progress per client and per channel.
+        """
+        finished_count = sum(1 for progress in self.channels.values() if progress.status.is_finished())
+
+        lines = [f"Indexed {finished_count}/{len(self.channels)} chats"]
+        lines.extend(f"  {quota}" for quota in self.quotas.values())
+        lines.extend(f"    {progress}" for progress in self.channels.values() if progress.status == ChannelIndexingStatus.RUNNING)
+
+        return "\n".join(lines)
+
+    async def _report_progress_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_report_interval)
+            logger.info(self.get_progress_report())
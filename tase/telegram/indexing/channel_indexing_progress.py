@@ -0,0 +1,64 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from tase.common.utils import get_now_timestamp
+from .channel_indexing_status import ChannelIndexingStatus
+
+
+class ChannelIndexingProgress(BaseModel):
+    """
+    Progress of indexing a single channel by the `AudioIndexingCoordinator`.
+    """
+
+    chat_key: str
+    title: Optional[str]
+
+    client_name: Optional[str]
+    status: ChannelIndexingStatus = Field(default=ChannelIndexingStatus.PENDING)
+    attempts: int = Field(default=0)
+
+    estimated_remaining_messages: int = Field(default=0)
+    indexed_message_count: int = Field(default=0)
+
+    started_at: Optional[int]
+    finished_at: Optional[int]
+
+    def start(
+        self,
+        client_name: str,
+    ) -> None:
+        self.client_name = client_name
+        self.status = ChannelIndexingStatus.RUNNING
+        self.attempts += 1
+        self.started_at = get_now_timestamp()
+        self.finished_at = None
+
+    def finish(
+        self,
+        status: ChannelIndexingStatus,
+    ) -> None:
+        self.status = status
+        self.finished_at = get_now_timestamp()
+
+    def on_message_indexed(self) -> None:
+        self.indexed_message_count += 1
+
+    @property
+    def percent(self) -> float:
+        """
+        Estimated percentage of the channel messages that have been indexed so far.
+        """
+        if self.status == ChannelIndexingStatus.DONE:
+            return 100.0
+
+        if self.estimated_remaining_messages <= 0:
+            return 0.0
+
+        return min(100.0, self.indexed_message_count * 100 / self.estimated_remaining_messages)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.title or self.chat_key} [{self.status.name}] @ {self.client_name or '-'} : "
+            f"{self.indexed_message_count}/~{self.estimated_remaining_messages} ({self.percent:.1f}%)"
+        )
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class ChannelIndexingStatus(Enum):
+    UNKNOWN = 0
+    PENDING = 1
+    RUNNING = 2
+    DONE = 3
+    FAILED = 4
+    SKIPPED = 5
+
+    def is_finished(self) -> bool:
+        return self in (
+            ChannelIndexingStatus.DONE,
+            ChannelIndexingStatus.FAILED,
+            ChannelIndexingStatus.SKIPPED,
+        )
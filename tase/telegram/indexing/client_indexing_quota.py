@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from pydantic import BaseModel, Field
+
+from tase.my_logger import logger
+
+
+class ClientIndexingQuota(BaseModel):
+    """
+    Tracks the `FloodWait` budget and the adaptive delay of a telegram client while indexing channels.
+
+    Every page of messages that is fetched successfully lowers the delay between pages and every `FloodWait` error
+    raises it and blocks the client until the wait is over. Once a client has waited more than its `flood_wait_budget`
+    seconds in a single run, it does not take any new channels.
+    """
+
+    client_name: str
+
+    flood_wait_budget: int = Field(default=15 * 60)
+    flood_wait_seconds: int = Field(default=0)
+    flood_wait_count: int = Field(default=0)
+
+    delay: float = Field(default=1.0)
+    min_delay: float = Field(default=0.2)
+    max_delay: float = Field(default=30.0)
+    delay_decrease_factor: float = Field(default=0.9)
+    delay_increase_factor: float = Field(default=2.0)
+
+    blocked_until: float = Field(default=0.0)
+
+    assigned_message_count: int = Field(default=0)
+    indexed_message_count: int = Field(default=0)
+    active_channel_count: int = Field(default=0)
+    finished_channel_count: int = Field(default=0)
+    failed_channel_count: int = Field(default=0)
+
+    @property
+    def is_exhausted(self) -> bool:
+        """
+        Whether this client has used up its `FloodWait` budget or not.
+        """
+        return self.flood_wait_seconds >= self.flood_wait_budget
+
+    @property
+    def is_blocked(self) -> bool:
+        return self.blocked_until > time.monotonic()
+
+    async def pace(self) -> None:
+        """
+        Wait before requesting the next page of messages. The wait is at least the current adaptive delay and lasts
+        until the client is not blocked by a `FloodWait` anymore.
+        """
+        sleep_time = max(self.delay, self.blocked_until - time.monotonic())
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+    def on_success(self) -> None:
+        self.delay = max(self.min_delay, self.delay * self.delay_decrease_factor)
+
+    def on_flood_wait(
+        self,
+        seconds: int,
+    ) -> None:
+        seconds = max(int(seconds or 0), 0)
+
+        self.flood_wait_count += 1
+        self.flood_wait_seconds += seconds
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.delay = min(self.max_delay, max(self.delay, self.min_delay) * self.delay_increase_factor)
+
+        logger.warning(
+            f"Client `{self.client_name}` got a FloodWait of {seconds} seconds, delay is now {self.delay:.2f} seconds "
+            f"({self.flood_wait_seconds}/{self.flood_wait_budget} seconds of the budget is used)"
+        )
+
+    def on_message_indexed(self) -> None:
+        self.indexed_message_count += 1
+
+    def __str__(self) -> str:
+        return (
+            f"{self.client_name} : active={self.active_channel_count} finished={self.finished_channel_count} failed={self.failed_channel_count} "
+            f"messages={self.indexed_message_count}/~{self.assigned_message_count} delay={self.delay:.2f}s "
+            f"flood_wait={self.flood_wait_seconds}/{self.flood_wait_budget}s{' (exhausted)' if self.is_exhausted else ''}"
+        )
@@ -1,19 +1,23 @@
 from .add_channel_task import AddChannelTask
+from .calculate_channel_scores_task import CalculateChannelScoresTask
 from .check_usernames_task import CheckUsernameTask
 from .dummy_task import DummyTask
 from .extract_usernames_task import ExtractUsernamesTask
 from .forward_message_task import ForwardMessageTask
 from .index_audios_task import IndexAudiosTask
+from .index_channels_task import IndexChannelsTask
 from .reindex_audios_task import ReindexAudiosTask
 from .upload_audio_thumbnail_task import UploadAudioThumbnailTask
 
 __all__ = [
     "AddChannelTask",
+    "CalculateChannelScoresTask",
     "CheckUsernameTask",
     "DummyTask",
     "ExtractUsernamesTask",
     "ForwardMessageTask",
     "IndexAudiosTask",
+    "IndexChannelsTask",
     "ReindexAudiosTask",
     "UploadAudioThumbnailTask",
 ]
@@ -1,6 +1,3 @@
-import asyncio
-import random
-
 from pyrogram.enums import ChatType
 from pyrogram.errors import UsernameNotOccupied, FloodWait, ChannelInvalid
 
@@ -37,9 +34,10 @@ class AddChannelTask(BaseTask):
                         telegram_client,
                         chat.chat_id,
                         chat.members_count,
+                        chat=chat,
                     )
                     logger.debug(f"Channel {chat.username} score: {score}")
-                    updated = chat.update_audio_indexer_score(score)
+                    updated = await chat.update_audio_indexer_score(score)
 
                     await self.task_done(db)
                 else:
@@ -64,16 +62,7 @@ class AddChannelTask(BaseTask):
         except FloodWait as e:
             await self.task_failed(db)
             logger.exception(e)
-
-            sleep_time = e.value + random.randint(5, 15)
-            logger.info(f"Sleeping for {sleep_time} seconds...")
-            await asyncio.sleep(sleep_time)
-            logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
         except Exception as e:
             # this is an unexpected error
             logger.exception(e)
             await self.task_failed(db)
-        finally:
-            # sleep for a while before adding another channel
-            await asyncio.sleep(random.randint(15, 25))
@@ -0,0 +1,48 @@
+from tase.db import DatabaseClient
+from tase.db.arangodb.enums import RabbitMQTaskType
+from tase.my_logger import logger
+from tase.task_distribution import BaseTask, TargetWorkerType
+from tase.telegram.channel_analyzer import ChannelAnalyzer
+from tase.telegram.client import TelegramClient
+from tase.telegram.client.client_worker import RabbitMQConsumer
+
+
+class CalculateChannelScoresTask(BaseTask):
+    """
+    Calculate the scores of all the indexed public channels using every user client of the worker that receives this
+    task.
+    """
+
+    target_worker_type = TargetWorkerType.ANY_TELEGRAM_CLIENTS_CONSUMER_WORK
+    type = RabbitMQTaskType.CALCULATE_CHANNEL_SCORES_TASK
+    priority = 3
+
+    async def run(
+        self,
+        consumer: RabbitMQConsumer,
+        db: DatabaseClient,
+        telegram_client: TelegramClient = None,
+    ):
+        await self.task_in_worker(db)
+
+        telegram_clients = list(getattr(consumer, "users", {}).values())
+        if not telegram_clients:
+            logger.error("There are no telegram user clients available for calculating channel scores")
+            await self.task_failed(db)
+            return
+
+        try:
+            chats = [chat async for chat in db.graph.get_chats_sorted_by_audio_indexer_score(only_include_indexed_chats=True) if chat.is_public]
+
+            logger.info(f"Started calculating scores of {len(chats)} channels using {len(telegram_clients)} clients")
+            scores = await ChannelAnalyzer.calculate_scores(
+                telegram_clients,
+                chats,
+                max_chats_per_client=self.kwargs.get("max_chats_per_client", 3),
+            )
+            logger.info(f"Finished calculating scores of {len(scores)} out of {len(chats)} channels")
+        except Exception as e:
+            logger.exception(e)
+            await self.task_failed(db)
+        else:
+            await self.task_done(db)
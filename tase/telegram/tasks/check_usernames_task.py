@@ -1,6 +1,3 @@
-import asyncio
-import random
-
 from pyrogram.errors import UsernameNotOccupied, UsernameInvalid, FloodWait, ChannelInvalid
 
 from tase.common.utils import get_now_timestamp
@@ -52,14 +49,8 @@ class CheckUsernameTask(BaseTask):
             await self.task_done(db)
 
         except FloodWait as e:
-            # fixme: find a solution for this
+            # the `FloodWait` is already recorded by the rate limiter of the client
             await self.task_failed(db)
-
-            # sleep_time = e.value + random.randint(5, 15)
-            # logger.info(f"Sleeping for {sleep_time} seconds...")
-            # await asyncio.sleep(sleep_time)
-            # logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
         except Exception as e:
             logger.exception(e)
             await self.task_failed(db)
@@ -80,13 +71,11 @@ class CheckUsernameTask(BaseTask):
                     )
 
                     if mentioned_chat.chat_type == ChatType.CHANNEL and mentioned_chat.is_public:
-                        # wait for a while
-                        await asyncio.sleep(5)
-
                         score = await ChannelAnalyzer.calculate_score(
                             telegram_client,
                             mentioned_chat.chat_id,
                             mentioned_chat.members_count,
+                            chat=mentioned_chat,
                         )
                         updated = await mentioned_chat.update_audio_indexer_score(score)
                         logger.debug(f"Channel {mentioned_chat.username} score: {score}")
@@ -100,8 +89,3 @@ class CheckUsernameTask(BaseTask):
                 # fixme: this must not happen
                 await self.task_failed(db)
                 raise Exception("Unexpected error")
-
-        finally:
-            # this is necessary to avoid flood errors
-            # todo: is this one good enough?
-            await asyncio.sleep(random.randint(20, 30))
@@ -1,5 +1,3 @@
-import asyncio
-import random
 from typing import List, Optional, Union
 
 import pyrogram
@@ -85,7 +83,6 @@ class ExtractUsernamesTask(BaseTask):
                 self.metadata = chat.username_extractor_metadata.copy()
 
             if self.metadata is None:
-                await self.wait()
                 await self.task_failed(db)
                 return
 
@@ -102,23 +99,11 @@ class ExtractUsernamesTask(BaseTask):
             logger.info(f"Metadata: {prettify(self.metadata)}")
             await self.chat.update_username_extractor_metadata(self.metadata)
 
-            await self.wait()
             await self.task_done(db)
         else:
             logger.error(f"Error occurred: `{title}`")
-            await self.wait()
             await self.task_failed(db)
 
-    @classmethod
-    async def wait(
-        cls,
-        sleep_time: int = random.randint(15, 25),
-    ):
-        # wait for a while before starting to index a new channel
-        logger.info(f"Sleeping for {sleep_time} seconds...")
-        await asyncio.sleep(sleep_time)
-        logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
     async def get_updated_chat(
         self,
         telegram_client: TelegramClient,
@@ -153,7 +138,6 @@ class ExtractUsernamesTask(BaseTask):
             except FloodWait as e:
                 await self.task_failed(db)
                 logger.exception(e)
-                # self.wait(e.value + random.randint(5, 15))
             except Exception as e:
                 await self.task_failed(db)
                 logger.exception(e)
@@ -176,11 +160,11 @@ class ExtractUsernamesTask(BaseTask):
         chat_id: Union[str, int],
         telegram_client: TelegramClient,
     ):
-        idx = 0
         async for message in telegram_client.iter_messages(
             chat_id=chat_id,
             offset_id=self.metadata.last_message_offset_id,
             only_newer_messages=True,
+            prefetch=1,
         ):
             message: pyrogram.types.Message = message
 
@@ -282,11 +266,6 @@ class ExtractUsernamesTask(BaseTask):
                 self.metadata.last_message_offset_id = message.id
                 self.metadata.last_message_offset_date = datetime_to_timestamp(message.date)
 
-            if idx % 500 == 0:
-                await self.wait(random.randint(3, 10))
-
-            idx += 1
-
     async def find_usernames_in_text(
         self,
         text: Union[str, List[Union[str, None]]],
@@ -1,6 +1,5 @@
 import asyncio
 import collections
-import random
 from typing import List, Tuple, Deque, Dict, Set
 
 import pyrogram.types
@@ -102,9 +101,6 @@ class ForwardMessageTask(BaseTask):
                 await self.task_failed(db)
                 return
 
-            # sleep for a while before forwarding messages
-            await asyncio.sleep(random.randint(5, 15))
-
             # forward the forwardable messages
             successful, forwarded_messages = await self.forward_messages(
                 telegram_client,
@@ -145,18 +141,10 @@ class ForwardMessageTask(BaseTask):
         except FloodWait as e:
             await self.task_failed(db)
             logger.error(e)
-
-            sleep_time = e.value + random.randint(5, 15)
-            logger.info(f"Sleeping for {sleep_time} seconds...")
-            await asyncio.sleep(sleep_time)
-            logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
         except Exception as e:
             # this is an unexpected error
             logger.exception(e)
             await self.task_failed(db)
-        finally:
-            await asyncio.sleep(random.randint(20, 30))
 
     async def check_failed_forwarded_messages(
         self,
@@ -276,13 +264,13 @@ class ForwardMessageTask(BaseTask):
                 for msg in forwardable_messages:
                     if msg.has_protected_content:
                         if msg.audio:
-                            forwarded_message = await telegram_client._client.send_audio(
+                            forwarded_message = await telegram_client.send_audio(
                                 chat_id=telegram_client.archive_channel_info.chat_id,
                                 audio=msg.audio.file_id,
                                 caption=msg.caption,
                             )
                         elif msg.document:
-                            forwarded_message = await telegram_client._client.send_document(
+                            forwarded_message = await telegram_client.send_document(
                                 chat_id=telegram_client.archive_channel_info.chat_id,
                                 document=msg.audio.file_id,
                                 caption=msg.caption,
@@ -292,9 +280,6 @@ class ForwardMessageTask(BaseTask):
 
                         if forwarded_message:
                             forwarded_messages.append(forwarded_message)
-
-                            # sleep before sending any more messages to avoid `floodwait` errors
-                            await asyncio.sleep(random.randint(5, 15))  # todo: is it enough?
                     else:
                         remainder.append(msg)
 
@@ -434,7 +419,6 @@ class ForwardMessageTask(BaseTask):
                 logger.exception(e)
             else:
                 db_chat = await db.graph.update_or_create_chat(tg_chat)
-                await asyncio.sleep(30)
         else:
             caught_exception = False
 
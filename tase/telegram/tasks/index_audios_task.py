@@ -1,6 +1,4 @@
-import asyncio
-import random
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from pyrogram.errors import FloodWait, ChannelInvalid, UsernameNotOccupied
 
@@ -17,6 +15,9 @@ from tase.telegram.channel_analyzer import ChannelAnalyzer
 from tase.telegram.client import TelegramClient
 from tase.telegram.client.client_worker import RabbitMQConsumer
 
+if TYPE_CHECKING:
+    from tase.telegram.indexing import ChannelIndexingProgress, ClientIndexingQuota
+
 
 class IndexAudiosTask(BaseTask):
     target_worker_type = TargetWorkerType.ANY_TELEGRAM_CLIENTS_CONSUMER_WORK
@@ -45,31 +46,20 @@ class IndexAudiosTask(BaseTask):
 
                 success = await self.index_audios(db, telegram_client, chat, index_audio=True)
                 if success:
-                    await self.wait()
                     await self.index_audios(db, telegram_client, chat, index_audio=False)
 
                 logger.info(f"Finished indexing audio files from `{chat.title}`")
-                await self.wait()
                 await self.task_done(db)
         else:
             logger.info(f"Cancelled indexing of {chat.title}")
             await self.task_failed(db)
 
-    @classmethod
-    async def wait(
-        cls,
-        sleep_time: int = random.randint(15, 25),
-    ):
-        # wait for a while before starting to index a new channel
-        logger.info(f"Sleeping for {sleep_time} seconds...")
-        await asyncio.sleep(sleep_time)
-        logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
     async def get_updated_chat(
         self,
         telegram_client: TelegramClient,
         db: DatabaseClient,
         chat: Chat,
+        pacer: Optional["ClientIndexingQuota"] = None,
     ) -> Optional[Chat]:
         extra_check = True if chat.audio_indexer_metadata is None else get_now_timestamp() - chat.audio_indexer_metadata.last_run_at > 14 * 24 * 60 * 60 * 1000
         successful = False
@@ -89,14 +79,16 @@ class IndexAudiosTask(BaseTask):
             except FloodWait as e:
                 await self.task_failed(db)
                 logger.exception(e)
-                await self.wait()
-                # self.wait(e.value + random.randint(5, 15))
+                if pacer is not None:
+                    pacer.on_flood_wait(e.value)
             except Exception as e:
                 await self.task_failed(db)
                 logger.exception(e)
             else:
                 new_chat = await db.graph.update_or_create_chat(tg_chat)
-                await self.wait()
+                if pacer is not None:
+                    pacer.on_success()
+                    await pacer.pace()
                 if not new_chat:
                     await self.task_failed(db)
                 else:
@@ -115,7 +107,33 @@ class IndexAudiosTask(BaseTask):
         telegram_client: TelegramClient,
         chat: graph_models.vertices.Chat,
         index_audio: bool = True,
+        pacer: Optional["ClientIndexingQuota"] = None,
+        progress: Optional["ChannelIndexingProgress"] = None,
     ) -> bool:
+        """
+        Index audio files (or audio documents) of the given chat starting from the last indexed message.
+
+        Parameters
+        ----------
+        db : DatabaseClient
+            Database client to store the audio files in.
+        telegram_client : TelegramClient
+            Telegram client to iterate over the chat messages with.
+        chat : graph_models.vertices.Chat
+            Chat to index its audio files.
+        index_audio : bool, default : True
+            Whether to index audio messages or audio files sent as documents.
+        pacer : ClientIndexingQuota, optional
+            Quota of the telegram client. If given, the client waits for its adaptive delay after each page of messages,
+            and the `FloodWait` errors are reported to it.
+        progress : ChannelIndexingProgress, optional
+            Progress of indexing this chat to be updated after each indexed message.
+
+        Returns
+        -------
+        bool
+            Whether the indexing was successful or not.
+        """
         calculate_score = False
         if index_audio:
             if chat.audio_indexer_metadata is not None:
@@ -136,49 +154,57 @@ class IndexAudiosTask(BaseTask):
         metadata.reset_counters()
 
         try:
-            idx = 0
-            async for message in telegram_client.iter_messages(
+            # the next page of messages is fetched while the current one is being stored
+            async for messages in telegram_client.iter_message_pages(
                 chat_id=chat.chat_id,
                 offset_id=metadata.last_message_offset_id,
                 only_newer_messages=True,
                 filter="audio" if index_audio else "document",
+                prefetch=1,
             ):
-                if not index_audio:
-                    audio, audio_type = get_telegram_message_media_type(message)
-                    if audio is None or audio_type == TelegramAudioType.NON_AUDIO:
-                        continue
-
-                successful = await db.update_or_create_audio(
-                    message,
-                    telegram_client.telegram_id,
-                    chat.chat_id,
-                    AudioType.NOT_ARCHIVED,
-                    chat.get_chat_scores(),
-                )
-                if successful:
-                    await download_audio_thumbnails(db, telegram_client, message)
-                    metadata.message_count += 1
-
-                if message.id > metadata.last_message_offset_id:
-                    metadata.last_message_offset_id = message.id
-                    metadata.last_message_offset_date = datetime_to_timestamp(message.date)
-
-                if idx + 1 % 500 == 0:
-                    await self.wait(random.randint(3, 10))
-
-                idx += 1
+                for message in messages:
+                    if not index_audio:
+                        audio, audio_type = get_telegram_message_media_type(message)
+                        if audio is None or audio_type == TelegramAudioType.NON_AUDIO:
+                            continue
+
+                    successful = await db.update_or_create_audio(
+                        message,
+                        telegram_client.telegram_id,
+                        chat.chat_id,
+                        AudioType.NOT_ARCHIVED,
+                        chat.get_chat_scores(),
+                    )
+                    if successful:
+                        await download_audio_thumbnails(db, telegram_client, message)
+                        metadata.message_count += 1
+
+                        if progress is not None:
+                            progress.on_message_indexed()
+                        if pacer is not None:
+                            pacer.on_message_indexed()
+
+                    if message.id > metadata.last_message_offset_id:
+                        metadata.last_message_offset_id = message.id
+                        metadata.last_message_offset_date = datetime_to_timestamp(message.date)
+
+                if pacer is not None:
+                    # a page of messages is processed, wait before processing the next one
+                    pacer.on_success()
+                    await pacer.pace()
 
             if index_audio:
                 await chat.update_audio_indexer_metadata(metadata)
 
                 if calculate_score and chat.chat_type == ChatType.CHANNEL and chat.is_public:
-                    # sleep for a while
-                    await self.wait(5)
+                    if pacer is not None:
+                        await pacer.pace()
 
                     score = await ChannelAnalyzer.calculate_score(
                         telegram_client,
                         chat.chat_id,
                         chat.members_count,
+                        chat=chat,
                     )
                     updated = await chat.update_audio_indexer_score(score)
                     logger.info(f"Channel {chat.username} score: {score}")
@@ -186,6 +212,13 @@ class IndexAudiosTask(BaseTask):
                 await chat.update_audio_doc_indexer_metadata(metadata)
 
             logger.info(f"{prettify(metadata)}")
+        except FloodWait as e:
+            await self.task_failed(db)
+            logger.error(f"Got a FloodWait of {e.value} seconds while indexing chat `{chat.title}`")
+            if pacer is not None:
+                pacer.on_flood_wait(e.value)
+
+            return False
         except Exception as e:
             await self.task_failed(db)
             logger.error("Got an exception")
@@ -0,0 +1,52 @@
+from tase.db import DatabaseClient
+from tase.db.arangodb.enums import RabbitMQTaskType
+from tase.my_logger import logger
+from tase.task_distribution import BaseTask, TargetWorkerType
+from tase.telegram.client import TelegramClient
+from tase.telegram.client.client_worker import RabbitMQConsumer
+from tase.telegram.indexing import AudioIndexingCoordinator
+
+
+class IndexChannelsTask(BaseTask):
+    """
+    Index audio files of all the channels in parallel using every user client of the worker that receives this task.
+    """
+
+    target_worker_type = TargetWorkerType.ANY_TELEGRAM_CLIENTS_CONSUMER_WORK
+    type = RabbitMQTaskType.INDEX_CHANNELS_TASK
+    priority = 3
+
+    async def run(
+        self,
+        consumer: RabbitMQConsumer,
+        db: DatabaseClient,
+        telegram_client: TelegramClient = None,
+    ):
+        await self.task_in_worker(db)
+
+        telegram_clients = list(getattr(consumer, "users", {}).values())
+        if not telegram_clients:
+            logger.error("There are no telegram user clients available for indexing channels")
+            await self.task_failed(db)
+            return
+
+        coordinator = AudioIndexingCoordinator(
+            db,
+            telegram_clients,
+            max_channels_per_client=self.kwargs.get("max_channels_per_client", 3),
+            flood_wait_budget=self.kwargs.get("flood_wait_budget", 15 * 60),
+        )
+
+        try:
+            successful = await coordinator.run(
+                db.graph.get_chats_sorted_by_audio_indexer_score(only_include_indexed_chats=True),
+                db.graph.get_chats_sorted_by_audio_indexer_score(only_include_indexed_chats=False),
+            )
+        except Exception as e:
+            logger.exception(e)
+            successful = False
+
+        if successful:
+            await self.task_done(db)
+        else:
+            await self.task_failed(db)
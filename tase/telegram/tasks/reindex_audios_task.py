@@ -1,5 +1,3 @@
-import asyncio
-import random
 from typing import Optional
 
 from pyrogram.errors import FloodWait, ChannelInvalid, UsernameNotOccupied
@@ -44,26 +42,14 @@ class ReindexAudiosTask(BaseTask):
 
                 success = await self.index_audios(db, telegram_client, chat, index_audio=True)
                 if success:
-                    await self.wait()
                     await self.index_audios(db, telegram_client, chat, index_audio=False)
 
                 logger.info(f"Finished reindexing audio files from `{chat.title}`")
-                await self.wait()
                 await self.task_done(db)
         else:
             logger.info(f"Cancelled reindexing of {chat.title}")
             await self.task_failed(db)
 
-    @classmethod
-    async def wait(
-        cls,
-        sleep_time: int = random.randint(15, 25),
-    ):
-        # wait for a while before starting to index a new channel
-        logger.info(f"Sleeping for {sleep_time} seconds...")
-        await asyncio.sleep(sleep_time)
-        logger.info(f"Waking up after sleeping for {sleep_time} seconds...")
-
     async def get_updated_chat(
         self,
         telegram_client: TelegramClient,
@@ -88,14 +74,11 @@ class ReindexAudiosTask(BaseTask):
             except FloodWait as e:
                 await self.task_failed(db)
                 logger.exception(e)
-                await self.wait()
-                # self.wait(e.value + random.randint(5, 15))
             except Exception as e:
                 await self.task_failed(db)
                 logger.exception(e)
             else:
                 new_chat = await db.graph.update_or_create_chat(tg_chat)
-                await self.wait()
                 if not new_chat:
                     await self.task_failed(db)
                 else:
@@ -142,9 +125,6 @@ class ReindexAudiosTask(BaseTask):
                 )
                 await download_audio_thumbnails(db, telegram_client, message)
 
-                if idx + 1 % 500 == 0:
-                    await self.wait(random.randint(3, 10))
-
                 idx += 1
                 if idx >= metadata.last_message_offset_id:
                     # stop indexing after reaching the last indexed message
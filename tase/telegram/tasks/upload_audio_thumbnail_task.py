@@ -1,6 +1,4 @@
-import asyncio
 import os
-import random
 
 from tase.db import DatabaseClient
 from tase.db.arangodb.enums import RabbitMQTaskType
@@ -49,7 +47,7 @@ class UploadAudioThumbnailTask(BaseTask):
             return
 
         try:
-            uploaded_photo_message = await telegram_client._client.send_photo(
+            uploaded_photo_message = await telegram_client.send_photo(
                 telegram_client.thumbnail_archive_channel_info.chat_id,
                 downloaded_thumb_file_path,
                 caption=downloaded_thumbnail_file_doc.file_hash,
@@ -74,7 +72,3 @@ class UploadAudioThumbnailTask(BaseTask):
                 await self.task_done(db)
             else:
                 await self.task_failed(db)
-
-            wait_time = random.randint(4, 10)
-            logger.debug(f"Sleeping for {wait_time} seconds after uploading thumbnail photo...")
-            await asyncio.sleep(wait_time)
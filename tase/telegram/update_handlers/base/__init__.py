@@ -1,9 +1,12 @@
 from .base_handler import BaseHandler
 from .client_disconnect_handler import ClientDisconnectHandler
 from .handler_metadata import HandlerMetadata
+from .message_update_buffer import MessageUpdateBuffer, MessageUpdateType
 
 __all__ = [
     "BaseHandler",
     "ClientDisconnectHandler",
     "HandlerMetadata",
+    "MessageUpdateBuffer",
+    "MessageUpdateType",
 ]
@@ -10,6 +10,7 @@ from pyrogram.errors import ChannelInvalid, UsernameNotOccupied
 
 from tase.common.utils import _trans, async_timed, download_audio_thumbnails
 from tase.db.arangodb import graph as graph_models, document as document_models
+from tase.db.arangodb.base import arangodb_batch
 from tase.db.arangodb.enums import TelegramAudioType, ChatType, AudioType, AudioInteractionType, PlaylistInteractionType, HitMetadataType
 from tase.db.arangodb.helpers import AudioKeyboardStatus
 from tase.db.database_client import DatabaseClient
@@ -65,10 +66,14 @@ class BaseHandler(BaseModel):
         chats_dict: Dict[int, graph_models.vertices.Chat] = {}
         invalid_audio_keys = collections.deque()
 
-        cache_checks = await asyncio.gather(
-            *(self.db.document.has_audio_by_key(db_audio.get_doc_cache_key(self.telegram_client.telegram_id)) for db_audio in db_audios)
-        )
-        db_chats = await asyncio.gather(*(self.db.graph.get_chat_by_telegram_chat_id(db_audio.chat_id) for db_audio in db_audios))
+        # the cache checks and chat lookups are independent, so they are sent to the database in a single batch request.
+        async with arangodb_batch():
+            cache_checks, db_chats = await asyncio.gather(
+                asyncio.gather(
+                    *(self.db.document.has_audio_by_key(db_audio.get_doc_cache_key(self.telegram_client.telegram_id)) for db_audio in db_audios)
+                ),
+                asyncio.gather(*(self.db.graph.get_chat_by_telegram_chat_id(db_audio.chat_id) for db_audio in db_audios)),
+            )
 
         for cache_check, db_audio in zip(cache_checks, db_audios):
             if not cache_check and not isinstance(cache_check, BaseException):
@@ -259,8 +264,9 @@ class BaseHandler(BaseModel):
             return
 
         # todo: handle errors for invalid messages
-        hit = await self.db.graph.find_hit_by_download_url(hit_download_url)
-        if not hit:
+        # the audio, the user who made the query and the link sender are all read from the resolver of the download URL.
+        resolver = await self.db.graph.resolve_hit_download_url(hit_download_url)
+        if not resolver:
             await message.reply_text(
                 "This `download_url` is no valid!",
                 quote=True,
@@ -269,13 +275,15 @@ class BaseHandler(BaseModel):
             )
             return
 
-        audio_vertex = await self.db.graph.get_audio_from_hit_download_url(hit_download_url)
+        audio_vertex = await self.db.graph.get_audio_by_key(resolver.audio_key) if resolver.audio_key else None
 
         if not await self.validate_audio_vertex(audio_vertex, client, from_user.user_id, ChatType.BOT):
             return
 
         if from_deep_link:
-            sender_user_vertex = await self.db.graph.get_audio_link_sender(hit_download_url)
+            sender_user_vertex = (
+                await self.db.graph.get_user_by_key(resolver.link_sender_user_key) if resolver.link_sender_user_key else None
+            )
             if sender_user_vertex:
                 if from_user.user_id != sender_user_vertex.user_id:
                     # The user requesting this audio is not the user who has queried the audio in the first place, thus, it can be inferred that the audio
@@ -294,7 +302,7 @@ class BaseHandler(BaseModel):
                 pass
         else:
             # Check whether the user requesting this audio has initiated the search query earlier.
-            if not await self.db.graph.user_has_initiated_query(from_user, hit_download_url):
+            if resolver.query_user_key != from_user.key:
                 await message.reply_text(
                     "This `download_url` is no valid for you!",
                     quote=True,
@@ -324,7 +332,7 @@ class BaseHandler(BaseModel):
         status = await AudioKeyboardStatus.get_status(
             self.db,
             from_user,
-            hit_download_url=hit_download_url,
+            audio_vertex_key=audio_vertex.key,
         )
 
         markup_keyboard = get_audio_markup_keyboard(
@@ -333,7 +341,7 @@ class BaseHandler(BaseModel):
             from_user.chosen_language_code,
             hit_download_url,
             status,
-            hit.metadata.playlist_vertex_key if hit.metadata else None,
+            resolver.hit_metadata.playlist_vertex_key if resolver.hit_metadata else None,
         )
 
         if audio_vertex.audio_type == TelegramAudioType.AUDIO_FILE:
@@ -351,12 +359,12 @@ class BaseHandler(BaseModel):
                 reply_markup=markup_keyboard,
             )
 
-        if not hit.metadata:
+        if not resolver.hit_metadata:
             # the hit doesn't have metadata, consider it as inline/non-inline search
-            if await self.db.graph.get_audio_interaction_by_user(
+            if await self.db.graph.audio_is_interacted_by_user(
                 from_user,
-                hit_download_url,
                 AudioInteractionType.DOWNLOAD_AUDIO,
+                audio_vertex_key=audio_vertex.key,
             ):
                 audio_int_type = AudioInteractionType.REDOWNLOAD_AUDIO
             else:
@@ -375,18 +383,18 @@ class BaseHandler(BaseModel):
         audio_int_type = None
         playlist_int_type = None
 
-        if hit.metadata.type_ == HitMetadataType.AUDIO:
+        if resolver.hit_metadata.type_ == HitMetadataType.AUDIO:
             # link came from an inline/non-inline search
-            if await self.db.graph.get_audio_interaction_by_user(
+            if await self.db.graph.audio_is_interacted_by_user(
                 from_user,
-                hit_download_url,
                 AudioInteractionType.DOWNLOAD_AUDIO,
+                audio_vertex_key=audio_vertex.key,
             ):
                 audio_int_type = AudioInteractionType.REDOWNLOAD_AUDIO
             else:
                 audio_int_type = AudioInteractionType.DOWNLOAD_AUDIO
-        elif hit.metadata.type_ == HitMetadataType.PLAYLIST_AUDIO:
-            playlist = await self.db.graph.get_playlist_by_key(hit.metadata.playlist_key)
+        elif resolver.hit_metadata.type_ == HitMetadataType.PLAYLIST_AUDIO:
+            playlist = await self.db.graph.get_playlist_by_key(resolver.hit_metadata.playlist_key)
             if playlist and await self.db.graph.audio_is_or_was_in_playlist(audio_vertex.key, playlist.key):
                 if await self.db.graph.get_playlist_audio_interaction_by_user(
                     from_user,
@@ -398,10 +406,10 @@ class BaseHandler(BaseModel):
                 else:
                     playlist_int_type = PlaylistInteractionType.DOWNLOAD_AUDIO
 
-                if await self.db.graph.get_audio_interaction_by_user(
+                if await self.db.graph.audio_is_interacted_by_user(
                     from_user,
-                    hit_download_url,
                     AudioInteractionType.DOWNLOAD_AUDIO,
+                    audio_vertex_key=audio_vertex.key,
                 ):
                     audio_int_type = AudioInteractionType.REDOWNLOAD_AUDIO
                 else:
@@ -424,7 +432,7 @@ class BaseHandler(BaseModel):
                 self.telegram_client.telegram_id,
                 playlist_int_type,
                 ChatType.BOT,
-                hit.metadata.playlist_key,
+                resolver.hit_metadata.playlist_key,
                 audio_hit_download_url=hit_download_url,
             )
 
@@ -554,3 +562,36 @@ class BaseHandler(BaseModel):
             )
             if not audio_doc:
                 logger.error(f"Error in creating audio doc for message ID `{message.id}` in client `{self.telegram_client.name}`")
+
+    async def update_audio_docs_coming_in_from_archive_channel(
+        self,
+        messages: List[pyrogram.types.Message],
+    ) -> List[pyrogram.types.Message]:
+        archive_chat_id = self.telegram_client.archive_channel_info.chat_id
+        messages = [message for message in messages if message.chat and message.chat.id == archive_chat_id]
+        if not messages:
+            return []
+
+        failed_messages = await self.db.document.update_or_create_audios(
+            messages,
+            telegram_client_id=self.telegram_client.telegram_id,
+            chat_id=archive_chat_id,
+        )
+        for message in failed_messages:
+            logger.error(f"Error in creating audio doc for message ID `{message.id}` in client `{self.telegram_client.name}`")
+
+        return failed_messages
+
+    async def delete_audio_docs_deleted_from_archive_channel(
+        self,
+        deleted_messages: Dict[int, List[int]],
+    ) -> None:
+        archive_chat_id = self.telegram_client.archive_channel_info.chat_id
+        message_ids = deleted_messages.get(archive_chat_id, None)
+        if not message_ids:
+            return
+
+        await self.db.document.delete_audio_caches(
+            chat_id=archive_chat_id,
+            message_ids=message_ids,
+        )
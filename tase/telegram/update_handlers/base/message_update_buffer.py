@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import pyrogram
+
+from tase.my_logger import logger
+
+
+class MessageUpdateType(Enum):
+    NEW = 1
+    EDITED = 2
+    DELETED = 3
+
+
+class PendingMessageUpdate:
+    __slots__ = (
+        "type",
+        "message",
+        "due_at",
+    )
+
+    def __init__(
+        self,
+        type_: MessageUpdateType,
+        message: Optional[pyrogram.types.Message],
+        due_at: float,
+    ):
+        self.type = type_
+        self.message = message
+        self.due_at = due_at
+
+
+class MessageUpdateBuffer:
+    """
+    Buffer incoming message updates of a telegram client and write them to the database in batches.
+
+    Updates are coalesced per `(chat_id, message_id)`, so only the latest state of every message is written. Edits are
+    debounced, a message that is edited several times in a row is written once after it has not been edited for
+    `edit_debounce` seconds. Deletions replace any pending write of the same message. Pending updates are flushed every
+    `flush_interval` seconds, or as soon as the buffer holds `max_pending_updates` updates.
+
+    The callbacks return the messages that could not be written, or raise if the whole write failed, and those updates
+    are retried on the next flush.
+    """
+
+    def __init__(
+        self,
+        on_messages: Callable[[List[pyrogram.types.Message]], Awaitable[Optional[List[pyrogram.types.Message]]]],
+        on_deleted_messages: Callable[[Dict[int, List[int]]], Awaitable[None]],
+        flush_interval: float = 2.0,
+        edit_debounce: float = 5.0,
+        max_pending_updates: int = 1000,
+    ):
+        self.on_messages = on_messages
+        self.on_deleted_messages = on_deleted_messages
+        self.flush_interval = flush_interval
+        self.edit_debounce = edit_debounce
+        self.max_pending_updates = max_pending_updates
+
+        self._pending: Dict[Tuple[int, int], PendingMessageUpdate] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._forced_flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.received_update_count = 0
+        self.written_update_count = 0
+
+    @property
+    def pending_update_count(self) -> int:
+        return len(self._pending)
+
+    def add_message(
+        self,
+        message: pyrogram.types.Message,
+        edited: bool = False,
+    ) -> None:
+        """
+        Add a new or edited message to the buffer.
+
+        Parameters
+        ----------
+        message : pyrogram.types.Message
+            Message to add.
+        edited : bool, default : False
+            Whether the message is an edit of a previous message or not.
+        """
+        if message is None or message.chat is None:
+            return
+
+        key = (message.chat.id, message.id)
+        now = time.monotonic()
+        self.received_update_count += 1
+
+        pending = self._pending.get(key, None)
+        if pending is None:
+            self._pending[key] = PendingMessageUpdate(
+                MessageUpdateType.EDITED if edited else MessageUpdateType.NEW,
+                message,
+                now + self.edit_debounce if edited else now,
+            )
+        elif pending.type != MessageUpdateType.DELETED:
+            # keep the latest state of the message and wait for more edits before writing it
+            pending.message = message
+            if edited:
+                pending.due_at = now + self.edit_debounce
+
+        self._on_update_added()
+
+    def add_deleted_message(
+        self,
+        chat_id: int,
+        message_id: int,
+    ) -> None:
+        """
+        Add a deleted message to the buffer. Any pending write of this message is dropped.
+
+        Parameters
+        ----------
+        chat_id : int
+            ID of the chat the message was deleted from.
+        message_id : int
+            ID of the deleted message.
+        """
+        if chat_id is None or message_id is None:
+            return
+
+        self.received_update_count += 1
+        self._pending[(chat_id, message_id)] = PendingMessageUpdate(
+            MessageUpdateType.DELETED,
+            None,
+            time.monotonic(),
+        )
+
+        self._on_update_added()
+
+    def _on_update_added(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+        if len(self._pending) >= self.max_pending_updates and (self._forced_flush_task is None or self._forced_flush_task.done()):
+            self._forced_flush_task = asyncio.create_task(self.flush(force=True))
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(e)
+
+    async def flush(
+        self,
+        force: bool = False,
+    ) -> None:
+        """
+        Write the pending updates that are due to the database. The updates of a failed write are put back in the
+        buffer and retried on the next flush, unless a newer update of the same message has arrived in the meantime.
+
+        Parameters
+        ----------
+        force : bool, default : False
+            Whether to write all the pending updates, including the edits that are still being debounced.
+        """
+        async with self._flush_lock:
+            now = time.monotonic()
+            due_keys = [key for key, pending in self._pending.items() if force or pending.due_at <= now]
+            if not due_keys:
+                return
+
+            messages: List[pyrogram.types.Message] = []
+            deleted_messages: Dict[int, List[int]] = {}
+            popped_messages: Dict[Tuple[int, int], PendingMessageUpdate] = {}
+            popped_deleted_messages: Dict[Tuple[int, int], PendingMessageUpdate] = {}
+            for key in due_keys:
+                pending = self._pending.pop(key)
+                if pending.type == MessageUpdateType.DELETED:
+                    deleted_messages.setdefault(key[0], []).append(key[1])
+                    popped_deleted_messages[key] = pending
+                else:
+                    messages.append(pending.message)
+                    popped_messages[key] = pending
+
+            if deleted_messages:
+                await self._write(self.on_deleted_messages, deleted_messages, popped_deleted_messages)
+            if messages:
+                await self._write(self.on_messages, messages, popped_messages)
+
+    async def _write(
+        self,
+        callback: Callable[[Any], Awaitable[Optional[List[pyrogram.types.Message]]]],
+        updates: Union[List[pyrogram.types.Message], Dict[int, List[int]]],
+        popped: Dict[Tuple[int, int], PendingMessageUpdate],
+    ) -> None:
+        try:
+            failed_messages = await callback(updates)
+        except Exception as e:
+            logger.exception(e)
+            failed_keys = list(popped.keys())
+        else:
+            failed_keys = [(message.chat.id, message.id) for message in failed_messages or [] if message.chat is not None]
+
+        self.written_update_count += len(popped) - len(failed_keys)
+        if not failed_keys:
+            return
+
+        logger.error(f"Failed to write `{len(failed_keys)}` message updates, they are retried on the next flush")
+
+        retry_at = time.monotonic() + self.flush_interval
+        for key in failed_keys:
+            pending = popped.get(key, None)
+            # a newer update of the same message that has arrived during the write replaces the failed one
+            if pending is not None and key not in self._pending:
+                pending.due_at = retry_at
+                self._pending[key] = pending
+
+    async def close(self) -> None:
+        """
+        Stop the periodic flushes and write all the pending updates.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        await self.flush(force=True)
@@ -69,10 +69,10 @@ class ChosenInlineQueryHandler(BaseHandler):
 
             if inline_item_info.inline_query_type == InlineQueryType.AUDIO_COMMAND:
                 if inline_item_info.chat_type == ChatType.BOT:
-                    if await self.db.graph.get_audio_interaction_by_user(
+                    if await self.db.graph.audio_is_interacted_by_user(
                         from_user,
-                        inline_item_info.hit_download_url,
                         AudioInteractionType.DOWNLOAD_AUDIO,
+                        hit_download_url=inline_item_info.hit_download_url,
                     ):
                         type_ = AudioInteractionType.REDOWNLOAD_AUDIO
                     else:
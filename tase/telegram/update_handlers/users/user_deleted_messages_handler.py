@@ -1,15 +1,17 @@
-from typing import List
+from typing import List, Optional
 
-import arrow
 import pyrogram
 from pyrogram import handlers
 
 from tase.common.utils import async_exception_handler
 from tase.my_logger import logger
-from tase.telegram.update_handlers.base import BaseHandler, HandlerMetadata
+from tase.telegram.update_handlers.base import BaseHandler, HandlerMetadata, MessageUpdateBuffer
 
 
 class UserDeletedMessagesHandler(BaseHandler):
+    # Buffer of the `UserMessageHandler` of the same client.
+    update_buffer: Optional[MessageUpdateBuffer]
+
     def init_handlers(self) -> List[HandlerMetadata]:
         return [
             HandlerMetadata(
@@ -27,13 +29,12 @@ class UserDeletedMessagesHandler(BaseHandler):
         messages: List[pyrogram.types.Message],
     ):
         logger.debug(f"user_deleted_messages_handler: {messages}")
-        estimate_date_of_deletion = arrow.utcnow().timestamp()
+        if self.update_buffer is None:
+            return
+
         for message in messages:
             if message.chat is None:
-                # deleted message is from `saved messages`
-                message_id = message.id
-            else:
-                # deleted message if from other chats
-                message_id = message.id
-                chat_id: int = message.chat.id
-                chat_type: str = message.chat.type.name
+                # deleted message is from `saved messages` or a private chat, telegram does not send its chat ID
+                continue
+
+            self.update_buffer.add_deleted_message(message.chat.id, message.id)
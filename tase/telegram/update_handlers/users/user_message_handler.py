@@ -1,25 +1,58 @@
-from typing import List
+from typing import List, Optional
 
 import pyrogram
 from pyrogram import handlers
 
 from tase.common.utils import async_exception_handler
-from tase.telegram.update_handlers.base import BaseHandler, HandlerMetadata
+from tase.telegram.update_handlers.base import BaseHandler, HandlerMetadata, MessageUpdateBuffer
 
 
 class UserMessageHandler(BaseHandler):
+    # Buffer that new and edited messages are written to the database through. It is shared with the deleted messages
+    # handler of the same client, so that the updates of a message are coalesced.
+    update_buffer: Optional[MessageUpdateBuffer]
+
+    def __init__(self, **data):
+        super().__init__(**data)
+
+        if self.update_buffer is None:
+            self.update_buffer = MessageUpdateBuffer(
+                on_messages=self.update_audio_docs_coming_in_from_archive_channel,
+                on_deleted_messages=self.delete_audio_docs_deleted_from_archive_channel,
+            )
+
     def init_handlers(self) -> List[HandlerMetadata]:
         return [
             HandlerMetadata(
                 cls=handlers.MessageHandler,
                 callback=self.user_message_handler,
-            )
+            ),
+            HandlerMetadata(
+                cls=handlers.EditedMessageHandler,
+                callback=self.user_edited_message_handler,
+            ),
         ]
 
+    def is_from_archive_channel(
+        self,
+        message: pyrogram.types.Message,
+    ) -> bool:
+        return message.chat is not None and message.chat.id == self.telegram_client.archive_channel_info.chat_id
+
     @async_exception_handler()
     async def user_message_handler(
         self,
         client: pyrogram.Client,
         message: pyrogram.types.Message,
     ):
-        await self.update_audio_doc_coming_in_from_archive_channel(message)
+        if self.is_from_archive_channel(message):
+            self.update_buffer.add_message(message)
+
+    @async_exception_handler()
+    async def user_edited_message_handler(
+        self,
+        client: pyrogram.Client,
+        message: pyrogram.types.Message,
+    ):
+        if self.is_from_archive_channel(message):
+            self.update_buffer.add_message(message, edited=True)